@@ -16,10 +16,11 @@ from urllib.parse import urlparse
 import os
 import structlog
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
 
+from .. import metrics
 from ..schemas.tasks import TaskInput, TaskOutput, TaskStatus, AgentCard
 
 logger = structlog.get_logger(__name__)
@@ -43,6 +44,7 @@ class A2ATaskServer:
     - Task status tracking (GET /a2a/tasks/{task_id}/status)
     - Agent card for capability discovery (GET /.well-known/agent.json)
     - Health checks (GET /health, GET /ready)
+    - Prometheus metrics (GET /metrics)
     """
 
     def __init__(
@@ -74,6 +76,7 @@ class A2ATaskServer:
         self.supported_task_types = supported_task_types
         self.capabilities = capabilities or []
         self.tags = tags or []
+        metrics.set_agent_name(agent_name)
 
         # Task tracking (bounded to prevent memory leaks)
         self._max_stored_tasks = 1000
@@ -125,6 +128,39 @@ class A2ATaskServer:
         if not hmac.compare_digest(token, self._a2a_secret):
             raise HTTPException(status_code=401, detail="Invalid or missing A2A token")
 
+    def _output(
+        self,
+        task: TaskInput,
+        status: TaskStatus,
+        started_at: datetime,
+        **fields: Any,
+    ) -> TaskOutput:
+        """
+        Build a TaskOutput without validation.
+
+        Every field comes from this server or the already validated task,
+        so the output is constructed directly instead of re-validated.
+        """
+        return TaskOutput.model_construct(
+            task_id=task.task_id,
+            task_type=task.task_type,
+            status=status,
+            agent_name=self.agent_name,
+            agent_version=self.agent_version,
+            started_at=started_at,
+            **fields,
+        )
+
+    @staticmethod
+    def _json_response(output: BaseModel) -> Response:
+        """
+        Serialize a model in one pass.
+
+        Returning a model makes FastAPI dump it, validate it again against
+        response_model and JSON-encode the result; this skips both steps.
+        """
+        return Response(content=output.model_dump_json(), media_type="application/json")
+
     def _register_routes(self, app: FastAPI) -> None:
         """Register all API routes"""
         server = self  # capture for closures
@@ -148,6 +184,12 @@ class A2ATaskServer:
                 raise HTTPException(status_code=503, detail="Not ready")
             return {"status": "ready"}
 
+        @app.get("/metrics")
+        async def prometheus_metrics():
+            """Prometheus scrape endpoint (node, task and outbound call latency)"""
+            payload, content_type = metrics.render_latest()
+            return Response(content=payload, media_type=content_type)
+
         # ============== A2A Discovery ==============
 
         @app.get("/.well-known/agent.json", response_model=AgentCard)
@@ -187,6 +229,7 @@ class A2ATaskServer:
 
             # Execute workflow
             started_at = datetime.now(timezone.utc)
+            timings, timings_token = metrics.start_task_timings()
             try:
                 result = await asyncio.wait_for(
                     self.workflow_executor(
@@ -202,20 +245,18 @@ class A2ATaskServer:
                 completed_at = datetime.now(timezone.utc)
                 duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
-                output = TaskOutput(
-                    task_id=task.task_id,
-                    task_type=task.task_type,
-                    status=TaskStatus(
+                output = self._output(
+                    task,
+                    TaskStatus(
                         state="completed",
                         progress=100,
                         message="Task completed successfully",
                     ),
+                    started_at,
                     result=result,
-                    agent_name=self.agent_name,
-                    agent_version=self.agent_version,
-                    started_at=started_at,
                     completed_at=completed_at,
                     duration_ms=duration_ms,
+                    timings=timings.as_dict(),
                 )
 
                 # Store for status queries (with eviction)
@@ -226,21 +267,18 @@ class A2ATaskServer:
                     task_id=task.task_id,
                     duration_ms=duration_ms,
                 )
-                return output
+                return self._json_response(output)
 
             except asyncio.TimeoutError:
                 logger.error("Task timed out", task_id=task.task_id)
-                output = TaskOutput(
-                    task_id=task.task_id,
-                    task_type=task.task_type,
-                    status=TaskStatus(
+                output = self._output(
+                    task,
+                    TaskStatus(
                         state="failed",
                         message=f"Task timed out after {task.timeout_seconds}s",
                     ),
+                    started_at,
                     error=f"Timeout after {task.timeout_seconds} seconds",
-                    agent_name=self.agent_name,
-                    agent_version=self.agent_version,
-                    started_at=started_at,
                     completed_at=datetime.now(timezone.utc),
                 )
                 self._tasks[task.task_id] = output
@@ -248,22 +286,22 @@ class A2ATaskServer:
 
             except Exception as e:
                 logger.exception("Task failed", task_id=task.task_id, error=str(e))
-                output = TaskOutput(
-                    task_id=task.task_id,
-                    task_type=task.task_type,
-                    status=TaskStatus(
+                output = self._output(
+                    task,
+                    TaskStatus(
                         state="failed",
                         message=str(e),
                     ),
+                    started_at,
                     error=str(e),
-                    agent_name=self.agent_name,
-                    agent_version=self.agent_version,
-                    started_at=started_at,
                     completed_at=datetime.now(timezone.utc),
                 )
                 self._tasks[task.task_id] = output
                 raise HTTPException(status_code=500, detail="Internal task execution error")
 
+            finally:
+                metrics.end_task_timings(timings_token)
+
         @app.post("/a2a/tasks/async")
         async def execute_task_async(
             task: TaskInput,
@@ -287,14 +325,9 @@ class A2ATaskServer:
 
             # Store as pending
             self._pending_tasks[task.task_id] = task
-            self._tasks[task.task_id] = TaskOutput(
-                task_id=task.task_id,
-                task_type=task.task_type,
-                status=TaskStatus(state="pending"),
-                agent_name=self.agent_name,
-                agent_version=self.agent_version,
-                started_at=datetime.now(timezone.utc),
-                completed_at=datetime.now(timezone.utc),
+            now = datetime.now(timezone.utc)
+            self._tasks[task.task_id] = self._output(
+                task, TaskStatus(state="pending"), now, completed_at=now
             )
 
             # Schedule background execution
@@ -316,20 +349,18 @@ class A2ATaskServer:
             await server._verify_a2a_token(request)
             if task_id not in self._tasks:
                 raise HTTPException(status_code=404, detail="Task not found")
-            return self._tasks[task_id]
+            return self._json_response(self._tasks[task_id])
 
     async def _execute_async_task(self, task: TaskInput) -> None:
         """Execute task in background and handle callback"""
         started_at = datetime.now(timezone.utc)
+        timings, timings_token = metrics.start_task_timings()
 
         # Update status to running
-        self._tasks[task.task_id] = TaskOutput(
-            task_id=task.task_id,
-            task_type=task.task_type,
-            status=TaskStatus(state="running", progress=0),
-            agent_name=self.agent_name,
-            agent_version=self.agent_version,
-            started_at=started_at,
+        self._tasks[task.task_id] = self._output(
+            task,
+            TaskStatus(state="running", progress=0),
+            started_at,
             completed_at=datetime.now(timezone.utc),
         )
 
@@ -345,16 +376,14 @@ class A2ATaskServer:
             completed_at = datetime.now(timezone.utc)
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
-            output = TaskOutput(
-                task_id=task.task_id,
-                task_type=task.task_type,
-                status=TaskStatus(state="completed", progress=100),
+            output = self._output(
+                task,
+                TaskStatus(state="completed", progress=100),
+                started_at,
                 result=result,
-                agent_name=self.agent_name,
-                agent_version=self.agent_version,
-                started_at=started_at,
                 completed_at=completed_at,
                 duration_ms=duration_ms,
+                timings=timings.as_dict(),
             )
             self._tasks[task.task_id] = output
 
@@ -364,14 +393,11 @@ class A2ATaskServer:
 
         except Exception as e:
             logger.exception("Async task failed", task_id=task.task_id)
-            output = TaskOutput(
-                task_id=task.task_id,
-                task_type=task.task_type,
-                status=TaskStatus(state="failed", message=str(e)),
+            output = self._output(
+                task,
+                TaskStatus(state="failed", message=str(e)),
+                started_at,
                 error=str(e),
-                agent_name=self.agent_name,
-                agent_version=self.agent_version,
-                started_at=started_at,
                 completed_at=datetime.now(timezone.utc),
             )
             self._tasks[task.task_id] = output
@@ -382,6 +408,7 @@ class A2ATaskServer:
         finally:
             # Clean up pending
             self._pending_tasks.pop(task.task_id, None)
+            metrics.end_task_timings(timings_token)
 
     def _evict_old_tasks(self) -> None:
         """Evict oldest completed tasks when storage limit is reached."""
@@ -435,7 +462,8 @@ class A2ATaskServer:
             if self._a2a_secret:
                 headers["X-Agent-Token"] = self._a2a_secret
             async with httpx.AsyncClient() as client:
-                await client.post(url, json=output.model_dump(mode="json"), headers=headers)
+                headers["Content-Type"] = "application/json"
+                await client.post(url, content=output.model_dump_json(), headers=headers)
                 logger.info("Sent callback", url=url, task_id=output.task_id)
         except Exception as e:
             logger.error("Failed to send callback", url=url, error=str(e))
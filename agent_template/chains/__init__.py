@@ -11,6 +11,7 @@ from .prompts import (
     A2A_TASK_PROMPT,
 )
 from .llm_factory import get_llm, LLMConfig
+from .llm_cache import LLMResponseCache, get_llm_cache, fingerprint
 
 __all__ = [
     "CHECKLIST_GENERATION_PROMPT",
@@ -19,4 +20,7 @@ __all__ = [
     "A2A_TASK_PROMPT",
     "get_llm",
     "LLMConfig",
+    "LLMResponseCache",
+    "get_llm_cache",
+    "fingerprint",
 ]
@@ -0,0 +1,186 @@
+"""
+LLM Response Cache
+
+Wraps LLM calls whose inputs repeat across incidents (e.g. escalation
+analysis during an alarm storm):
+
+- Responses are cached per caller-supplied fingerprint for a TTL
+- Concurrent calls with the same fingerprint share one in-flight call
+- Calls per provider are bounded by a semaphore
+- Callers wait at most a latency budget, then get a rule-based fallback;
+  the shared call keeps running and fills the cache for later callers
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import structlog
+
+from ..metrics import observe_call
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Stable cache key from normalized prompt inputs.
+
+    Callers normalize first (sort sets, bucket numbers); parts must be
+    JSON-serializable or have a meaningful str().
+    """
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class LLMResponseCache:
+    """
+    TTL cache with single-flight, per-provider concurrency limit and a
+    latency budget around LLM calls.
+
+    Environment variables:
+        LLM_CACHE_TTL_SECONDS: How long a response is reused (default 300)
+        LLM_CACHE_MAX_ENTRIES: Cached responses kept, oldest evicted first (default 512)
+        LLM_MAX_CONCURRENCY: Concurrent LLM calls per provider (default 4)
+        LLM_LATENCY_BUDGET_SECONDS: Longest a caller waits before falling back (default 15)
+        LLM_CALL_TIMEOUT_SECONDS: Hard limit of one LLM call (default 60)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        latency_budget_seconds: Optional[float] = None,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("LLM_CACHE_TTL_SECONDS", "300")
+        )
+        self.max_entries = max_entries or int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        self.latency_budget_seconds = latency_budget_seconds or float(
+            os.getenv("LLM_LATENCY_BUDGET_SECONDS", "15")
+        )
+        self.call_timeout_seconds = float(os.getenv("LLM_CALL_TIMEOUT_SECONDS", "60"))
+
+        # key -> (value, cached_at)
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _cached(self, key: str) -> Optional[tuple[Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return (entry[0],)
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[T]],
+        fallback: Optional[Callable[[], T]] = None,
+        provider: Optional[str] = None,
+        budget_seconds: Optional[float] = None,
+    ) -> tuple[T, str]:
+        """
+        Return the cached value for key, or call the LLM once for all
+        concurrent callers with the same key.
+
+        Args:
+            key: Fingerprint of the prompt inputs (see fingerprint())
+            call: Coroutine function making the LLM call; its result is cached
+            fallback: Rule-based result used when the call fails or exceeds
+                the latency budget; not cached. Without one, errors propagate.
+            provider: Concurrency-limit bucket (default LLM_PROVIDER)
+            budget_seconds: Override of the latency budget
+
+        Returns:
+            (value, source) where source is cache | llm | shared | fallback
+        """
+        provider = provider or os.getenv("LLM_PROVIDER", "bedrock")
+
+        hit = self._cached(key)
+        if hit is not None:
+            observe_call("llm", provider, "invoke", "cache_hit", 0.0)
+            return hit[0], "cache"
+
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.create_task(self._call(key, call, provider))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._call_done(key, t))
+
+        budget = budget_seconds if budget_seconds is not None else self.latency_budget_seconds
+        try:
+            value = await asyncio.wait_for(asyncio.shield(task), timeout=budget)
+            return value, "shared" if shared else "llm"
+        except asyncio.TimeoutError:
+            if fallback is None:
+                raise
+            logger.warning("LLM latency budget exceeded, using fallback", provider=provider, budget_seconds=budget)
+        except Exception as e:
+            if fallback is None:
+                raise
+            logger.warning("LLM call failed, using fallback", provider=provider, error=str(e))
+        return fallback(), "fallback"
+
+    async def _call(self, key: str, call: Callable[[], Awaitable[Any]], provider: str) -> Any:
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = self._semaphores[provider] = asyncio.Semaphore(self.max_concurrency)
+
+        async with semaphore:
+            start = time.perf_counter()
+            outcome = "ok"
+            try:
+                value = await asyncio.wait_for(call(), timeout=self.call_timeout_seconds)
+            except BaseException as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                observe_call("llm", provider, "invoke", outcome, time.perf_counter() - start)
+
+        self._store(key, value)
+        return value
+
+    def _call_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Every waiter may have fallen back already; retrieve the error so it is not reported as lost
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Shared LLM call failed", error=str(task.exception()))
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+        }
+
+
+# Singleton instance
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get singleton LLM response cache"""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
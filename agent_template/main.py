@@ -18,7 +18,6 @@ from .api.server import A2ATaskServer, create_app
 from .workflow import BaseWorkflow
 from .tools.mcp_client import MCPToolClient
 from .tools.a2a_client import A2AClient, configure_a2a_client
-from .chains.llm_factory import get_llm, LLMConfig
 
 # Load environment variables
 load_dotenv()
@@ -119,6 +118,11 @@ class AgentRunner:
 
         logger.info("Agent initialized successfully")
 
+    async def shutdown(self) -> None:
+        """Release components on server shutdown"""
+        if self._mcp_client:
+            await self._mcp_client.close()
+
     async def execute_workflow(
         self,
         task_id: str,
@@ -169,17 +173,19 @@ class AgentRunner:
 
         runner = self  # capture for closure
 
+        # Create server (before lifespan attaches)
+        server = self.create_server()
+        server_lifespan = server.app.router.lifespan_context
+
         @asynccontextmanager
         async def lifespan(app):
             """Initialize agent components in the same event loop as uvicorn."""
             await runner.initialize()
-            yield
-            # Cleanup on shutdown
-            if runner._mcp_client:
-                await runner._mcp_client.close()
+            # The server's own lifespan marks /ready only once initialization is done
+            async with server_lifespan(app):
+                yield
+            await runner.shutdown()
 
-        # Create server (before lifespan attaches)
-        server = self.create_server()
         server.app.router.lifespan_context = lifespan
 
         # Run with uvicorn — initialization happens inside lifespan
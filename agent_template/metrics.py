@@ -0,0 +1,369 @@
+"""
+Latency Instrumentation and Prometheus Metrics
+
+Shared by every agent built on the template:
+- Node timing: BaseWorkflow wraps each node added in build_graph().
+- Outbound call timing: A2A client, httpx event hooks for CNC clients,
+  and an execute_command wrapper for Redis clients.
+- Per-task breakdown: node and call timings collected for the current task
+  and attached to TaskOutput.timings by A2ATaskServer.
+- Stream consumers: records processed and per-partition consumer lag.
+- Load shedding: events dropped by bounded in-process buffers.
+
+Histograms are exported on GET /metrics. prometheus_client is optional; when
+it is not installed, timings are still collected per task but nothing is
+exported.
+"""
+
+import functools
+import inspect
+import re
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Buckets tuned for time-to-protect: sub-ms Redis up to 30 s NSO commits
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+try:
+    from prometheus_client import (  # type: ignore
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+    )
+
+    NODE_DURATION = Histogram(
+        "workflow_node_duration_seconds",
+        "Workflow node execution time",
+        ["agent", "node", "outcome"],
+        buckets=LATENCY_BUCKETS,
+    )
+    TASK_DURATION = Histogram(
+        "workflow_task_duration_seconds",
+        "End-to-end workflow execution time",
+        ["agent", "task_type", "outcome"],
+        buckets=LATENCY_BUCKETS,
+    )
+    CALL_DURATION = Histogram(
+        "outbound_call_duration_seconds",
+        "Outbound call time from an agent (A2A, CNC, Redis)",
+        ["agent", "client", "target", "operation", "outcome"],
+        buckets=LATENCY_BUCKETS,
+    )
+    CONSUMER_RECORDS = Counter(
+        "stream_consumer_records_total",
+        "Records handled by a stream consumer (Kafka)",
+        ["agent", "topic", "outcome"],
+    )
+    CONSUMER_LAG = Gauge(
+        "stream_consumer_lag_records",
+        "Records between the partition high watermark and the committed position",
+        ["agent", "topic", "partition"],
+    )
+    SHED_EVENTS = Counter(
+        "shed_events_total",
+        "Events dropped by a bounded in-process pipeline instead of delivered",
+        ["agent", "component", "reason"],
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    NODE_DURATION = TASK_DURATION = CALL_DURATION = None
+    CONSUMER_RECORDS = CONSUMER_LAG = SHED_EVENTS = None
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    PROMETHEUS_AVAILABLE = False
+
+# Agent label for metrics recorded outside a workflow (clients)
+_agent_name = "unknown"
+
+
+def set_agent_name(agent_name: str) -> None:
+    """Set the agent label used for outbound call metrics in this process"""
+    global _agent_name
+    _agent_name = agent_name
+
+
+# ============== Per-task timings ==============
+
+# Individual node/call entries kept per task; the totals cover all of them
+MAX_TIMING_ENTRIES = 100
+
+
+@dataclass
+class TaskTimings:
+    """Latency breakdown for one task"""
+
+    started: float = field(default_factory=time.perf_counter)
+    nodes: list[dict[str, Any]] = field(default_factory=list)
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    node_totals: dict[str, float] = field(default_factory=dict)
+    call_totals: dict[str, dict[str, float]] = field(default_factory=dict)
+    dropped: int = 0
+
+    def add_node(self, node: str, ms: float, outcome: str) -> None:
+        self.node_totals[node] = self.node_totals.get(node, 0.0) + ms
+        if len(self.nodes) < MAX_TIMING_ENTRIES:
+            self.nodes.append({"node": node, "ms": ms, "outcome": outcome})
+        else:
+            self.dropped += 1
+
+    def add_call(self, client: str, target: str, operation: str, ms: float, outcome: str) -> None:
+        totals = self.call_totals.setdefault(target, {"count": 0, "ms": 0.0})
+        totals["count"] += 1
+        totals["ms"] += ms
+        if len(self.calls) < MAX_TIMING_ENTRIES:
+            self.calls.append({
+                "client": client,
+                "target": target,
+                "operation": operation,
+                "ms": ms,
+                "outcome": outcome,
+            })
+        else:
+            self.dropped += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "nodes_ms": {k: round(v, 3) for k, v in self.node_totals.items()},
+            "calls_ms": {
+                k: {"count": int(v["count"]), "ms": round(v["ms"], 3)}
+                for k, v in self.call_totals.items()
+            },
+            "nodes": self.nodes,
+            "calls": self.calls,
+            "entries_dropped": self.dropped,
+        }
+
+
+_current_timings: ContextVar[Optional[TaskTimings]] = ContextVar(
+    "cx_task_timings", default=None
+)
+
+
+def start_task_timings() -> tuple[TaskTimings, Optional[Token]]:
+    """
+    Start collecting timings for the current task.
+
+    Reuses an active collector so the server and the workflow share one.
+    Child tasks (LangGraph node tasks, asyncio.wait_for) inherit it through
+    the copied context.
+
+    Returns:
+        (collector, token). Pass the token to end_task_timings(); it is None
+        when an outer caller owns the collector.
+    """
+    timings = _current_timings.get()
+    if timings is not None:
+        return timings, None
+    timings = TaskTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_task_timings(token: Optional[Token]) -> None:
+    """Stop collecting if this caller started the collector"""
+    if token is not None:
+        _current_timings.reset(token)
+
+
+def current_task_timings() -> Optional[TaskTimings]:
+    """Collector for the current task, if any"""
+    return _current_timings.get()
+
+
+# ============== Recording ==============
+
+
+def observe_node(agent: str, node: str, outcome: str, seconds: float) -> None:
+    if NODE_DURATION is not None:
+        NODE_DURATION.labels(agent, node, outcome).observe(seconds)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_node(node, round(seconds * 1000, 3), outcome)
+
+
+def observe_task(agent: str, task_type: str, outcome: str, seconds: float) -> None:
+    if TASK_DURATION is not None:
+        TASK_DURATION.labels(agent, task_type, outcome).observe(seconds)
+
+
+def observe_call(client: str, target: str, operation: str, outcome: str, seconds: float) -> None:
+    if CALL_DURATION is not None:
+        CALL_DURATION.labels(_agent_name, client, target, operation, outcome).observe(seconds)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_call(client, target, operation, round(seconds * 1000, 3), outcome)
+
+
+def observe_consumer_records(topic: str, outcome: str, count: int = 1) -> None:
+    if CONSUMER_RECORDS is not None and count:
+        CONSUMER_RECORDS.labels(_agent_name, topic, outcome).inc(count)
+
+
+def observe_consumer_lag(topic: str, partition: int, lag: int) -> None:
+    if CONSUMER_LAG is not None:
+        CONSUMER_LAG.labels(_agent_name, topic, str(partition)).set(lag)
+
+
+def observe_shed(component: str, reason: str, count: int = 1) -> None:
+    if SHED_EVENTS is not None and count:
+        SHED_EVENTS.labels(_agent_name, component, reason).inc(count)
+
+
+@asynccontextmanager
+async def timed_call(client: str, target: str, operation: str) -> AsyncIterator[None]:
+    """Time an outbound call; outcome is "ok" or the exception class name"""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        observe_call(client, target, operation, outcome, time.perf_counter() - start)
+
+
+# ============== Instrumentation helpers ==============
+
+
+def _node_outcome(result: Any) -> str:
+    if isinstance(result, dict) and result.get("error"):
+        return "error"
+    return "ok"
+
+
+def instrument_node(agent: str, node: str, action: Callable) -> Callable:
+    """
+    Wrap a LangGraph node function with timing.
+
+    functools.wraps keeps the original signature visible, so LangGraph still
+    passes config/store kwargs and infers the input schema as before.
+    """
+    if inspect.iscoroutinefunction(action):
+
+        @functools.wraps(action)
+        async def async_wrapper(state, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await action(state, *args, **kwargs)
+            except BaseException:
+                observe_node(agent, node, "exception", time.perf_counter() - start)
+                raise
+            observe_node(agent, node, _node_outcome(result), time.perf_counter() - start)
+            return result
+
+        return async_wrapper
+
+    if inspect.isfunction(action) or inspect.ismethod(action):
+
+        @functools.wraps(action)
+        def sync_wrapper(state, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = action(state, *args, **kwargs)
+            except BaseException:
+                observe_node(agent, node, "exception", time.perf_counter() - start)
+                raise
+            observe_node(agent, node, _node_outcome(result), time.perf_counter() - start)
+            return result
+
+        return sync_wrapper
+
+    # Runnables (ToolNode, subgraphs) are left as-is
+    return action
+
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+"
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,})$"
+)
+
+
+def _endpoint_label(path: str) -> str:
+    """
+    Collapse IDs in a URL path so the label stays low-cardinality.
+
+    Only numeric, UUID and long hex segments count as IDs; names that merely
+    contain a digit (l3vpn, srv6, v1) are kept.
+    """
+    parts = []
+    for segment in path.strip("/").split("/"):
+        if _ID_SEGMENT.match(segment) or len(segment) > 32:
+            parts.append("{id}")
+        else:
+            parts.append(segment)
+    return "/" + "/".join(parts[-4:])
+
+
+def httpx_event_hooks(client: str) -> dict[str, list[Callable]]:
+    """
+    httpx event hooks that time every request of an AsyncClient.
+
+    Usage: httpx.AsyncClient(..., event_hooks=httpx_event_hooks("cnc"))
+    """
+
+    async def on_request(request) -> None:
+        request.extensions["cx_started"] = time.perf_counter()
+
+    async def on_response(response) -> None:
+        request = response.request
+        started = request.extensions.get("cx_started")
+        if started is None:
+            return
+        observe_call(
+            client,
+            request.url.host or "",
+            f"{request.method} {_endpoint_label(request.url.path)}",
+            f"{response.status_code // 100}xx",
+            time.perf_counter() - started,
+        )
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def instrument_redis(redis_client: Any, target: str = "redis") -> Any:
+    """
+    Time every command sent by a redis.asyncio client.
+
+    Wraps the instance's execute_command, which all command methods use.
+    target names the component using the client (e.g. "state_manager").
+    """
+    if getattr(redis_client, "_cx_instrumented", False):
+        return redis_client
+    execute_command = redis_client.execute_command
+
+    async def timed_execute_command(*args, **options):
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            return await execute_command(*args, **options)
+        except BaseException as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            operation = str(args[0]).upper() if args else "UNKNOWN"
+            observe_call("redis", target, operation, outcome, time.perf_counter() - start)
+
+    redis_client.execute_command = timed_execute_command
+    redis_client._cx_instrumented = True
+    return redis_client
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Prometheus exposition payload and content type"""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client not installed\n", CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
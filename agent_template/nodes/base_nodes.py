@@ -30,7 +30,7 @@ async def initialize_node(state: dict) -> dict:
 
     return {
         "current_node": "initialize",
-        "nodes_executed": state.get("nodes_executed", []) + ["initialize"],
+        "nodes_executed": ["initialize"],
         "started_at": state.get("started_at") or datetime.now(timezone.utc).isoformat(),
         "status": "running",
     }
@@ -86,9 +86,9 @@ User Request: {user_prompt}
 
         return {
             "raw_result": response,
-            "mcp_tools_used": state.get("mcp_tools_used", []) + tool_calls,
+            "mcp_tools_used": tool_calls,
             "current_node": "tool_execution",
-            "nodes_executed": state.get("nodes_executed", []) + ["tool_execution"],
+            "nodes_executed": ["tool_execution"],
         }
 
     except Exception as e:
@@ -97,7 +97,7 @@ User Request: {user_prompt}
             "error": str(e),
             "status": "failed",
             "current_node": "tool_execution",
-            "nodes_executed": state.get("nodes_executed", []) + ["tool_execution"],
+            "nodes_executed": ["tool_execution"],
         }
 
 
@@ -139,7 +139,7 @@ async def analysis_node(
         return {
             "analysis_result": analysis,
             "current_node": "analysis",
-            "nodes_executed": state.get("nodes_executed", []) + ["analysis"],
+            "nodes_executed": ["analysis"],
         }
 
     except Exception as e:
@@ -193,7 +193,7 @@ async def evaluation_node(
             "evaluation": evaluation,
             "iteration_count": iteration + 1,
             "current_node": "evaluation",
-            "nodes_executed": state.get("nodes_executed", []) + ["evaluation"],
+            "nodes_executed": ["evaluation"],
         }
 
     except Exception as e:
@@ -227,7 +227,7 @@ async def finalize_node(state: dict) -> dict:
             "result": {"error": error},
             "final_output": f"Workflow failed: {error}",
             "current_node": "finalize",
-            "nodes_executed": state.get("nodes_executed", []) + ["finalize"],
+            "nodes_executed": ["finalize"],
         }
 
     # Build result
@@ -244,7 +244,7 @@ async def finalize_node(state: dict) -> dict:
         "result": result,
         "final_output": analysis,
         "current_node": "finalize",
-        "nodes_executed": state.get("nodes_executed", []) + ["finalize"],
+        "nodes_executed": ["finalize"],
     }
 
 
@@ -273,5 +273,5 @@ async def error_handler_node(state: dict) -> dict:
         },
         "final_output": f"Error: {error}",
         "current_node": "error_handler",
-        "nodes_executed": state.get("nodes_executed", []) + ["error_handler"],
+        "nodes_executed": ["error_handler"],
     }
@@ -74,7 +74,7 @@ async def generate_checklist_node(
             "remaining_checklist": checklist.copy(),
             "resolved_checklist": [],
             "current_node": "generate_checklist",
-            "nodes_executed": state.get("nodes_executed", []) + ["generate_checklist"],
+            "nodes_executed": ["generate_checklist"],
         }
 
     except Exception as e:
@@ -105,7 +105,6 @@ async def process_checklist_item_node(
     task_id = state.get("task_id", "unknown")
     remaining = state.get("remaining_checklist", [])
     resolved = state.get("resolved_checklist", [])
-    tool_outputs = state.get("tool_outputs", [])
 
     if not remaining:
         logger.info("No items remaining", task_id=task_id)
@@ -150,10 +149,10 @@ async def process_checklist_item_node(
         return {
             "remaining_checklist": new_remaining,
             "resolved_checklist": new_resolved,
-            "tool_outputs": tool_outputs + [output],
-            "mcp_tools_used": state.get("mcp_tools_used", []) + new_tool_calls,
+            "tool_outputs": [output],
+            "mcp_tools_used": new_tool_calls,
             "current_node": "process_checklist_item",
-            "nodes_executed": state.get("nodes_executed", []) + ["process_checklist_item"],
+            "nodes_executed": ["process_checklist_item"],
         }
 
     except Exception as e:
@@ -2,7 +2,7 @@
 Pydantic schemas for agent input/output and A2A task definitions.
 """
 
-from .state import WorkflowState
+from .state import WorkflowState, append_items, append_history, append_unbounded, merge_dicts
 from .tasks import (
     TaskInput,
     TaskOutput,
@@ -19,6 +19,10 @@ from .models import (
 
 __all__ = [
     "WorkflowState",
+    "append_items",
+    "append_history",
+    "append_unbounded",
+    "merge_dicts",
     "TaskInput",
     "TaskOutput",
     "TaskStatus",
@@ -5,9 +5,44 @@ This module defines the TypedDict that flows through all LangGraph nodes.
 Customize per agent while maintaining common fields.
 """
 
-from typing import Any, TypedDict, Optional
+import os
+from typing import Annotated, Any, Callable, TypedDict, Optional
 from datetime import datetime
 
+# Items kept in capped history fields (nodes_executed, a2a_tasks_sent, ...)
+HISTORY_LIMIT = int(os.getenv("WORKFLOW_HISTORY_LIMIT", "256"))
+
+
+# ============== Reducers ==============
+# Nodes return only what they add to these fields; LangGraph folds it into
+# the current value, so a step no longer copies the whole accumulated list.
+
+def append_items(limit: Optional[int] = None) -> Callable[[Optional[list], Optional[list]], list]:
+    """
+    Reducer for append-only list fields.
+
+    Returns a new list with the update appended; with a limit, only the
+    last `limit` items are kept so memory stays bounded. The current value
+    is never modified, as LangGraph hands channel values in by reference.
+    """
+
+    def reducer(current: Optional[list], update: Optional[list]) -> list:
+        merged = (current or []) + (update or [])
+        if limit is not None and len(merged) > limit:
+            return merged[-limit:]
+        return merged
+
+    return reducer
+
+
+def merge_dicts(current: Optional[dict], update: Optional[dict]) -> dict:
+    """Reducer for dict fields: nodes return only the keys they set."""
+    return {**(current or {}), **(update or {})}
+
+
+append_history = append_items(HISTORY_LIMIT)
+append_unbounded = append_items()
+
 
 class WorkflowState(TypedDict, total=False):
     """
@@ -36,7 +71,7 @@ class WorkflowState(TypedDict, total=False):
     max_iterations: int                   # Maximum allowed iterations
     current_node: str                     # Currently executing node name
     started_at: str                       # ISO timestamp of start
-    nodes_executed: list[str]             # List of executed node names
+    nodes_executed: Annotated[list[str], append_history]  # Executed node names (capped)
 
     # ============== Checklist Pattern (from BGP template) ==============
     checklist: list[str]                  # Full checklist of items
@@ -45,16 +80,16 @@ class WorkflowState(TypedDict, total=False):
 
     # ============== Tool Execution ==============
     raw_result: Any                       # Raw tool execution results
-    tool_outputs: list[dict[str, Any]]    # Collected tool outputs
-    mcp_tools_used: list[str]             # Names of MCP tools called
+    tool_outputs: Annotated[list[dict[str, Any]], append_history]  # Collected tool outputs (capped)
+    mcp_tools_used: Annotated[list[str], append_history]  # Names of MCP tools called (capped)
 
     # ============== Analysis ==============
     analysis_result: str                  # LLM analysis of tool outputs
     evaluation: dict[str, Any]            # Evaluation chain results
 
     # ============== A2A Inter-Agent Communication ==============
-    a2a_tasks_sent: list[dict[str, Any]]  # Tasks sent to other agents
-    a2a_responses: dict[str, Any]         # Responses from other agents
+    a2a_tasks_sent: Annotated[list[dict[str, Any]], append_history]  # Tasks sent to other agents (capped)
+    a2a_responses: Annotated[dict[str, Any], merge_dicts]  # Responses from other agents, by agent
 
     # ============== Final Results ==============
     result: dict[str, Any]                # Structured result for A2A response
@@ -87,6 +87,9 @@ class TaskOutput(BaseModel):
     completed_at: datetime = Field(default_factory=datetime.utcnow)
     duration_ms: Optional[int] = None
 
+    # Per-task latency breakdown (node and outbound call timings)
+    timings: Optional[dict[str, Any]] = None
+
     class Config:
         json_schema_extra = {
             "example": {
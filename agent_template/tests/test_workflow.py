@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from langgraph.graph import StateGraph, START, END
 
+from .. import metrics
 from ..workflow import BaseWorkflow
 from ..schemas.state import WorkflowState
 
@@ -63,6 +64,24 @@ class TestBaseWorkflow:
         assert result is not None
         assert result.get("test") == "success"
 
+    @pytest.mark.asyncio
+    async def test_execute_records_node_timings(self, workflow):
+        """Test node latencies are collected for the current task"""
+        timings, token = metrics.start_task_timings()
+        try:
+            await workflow.execute(
+                task_id="test-123",
+                task_type="test",
+                payload={"key": "value"},
+            )
+        finally:
+            metrics.end_task_timings(token)
+
+        breakdown = timings.as_dict()
+        assert [n["node"] for n in breakdown["nodes"]] == ["test"]
+        assert breakdown["nodes"][0]["outcome"] == "ok"
+        assert "test" in breakdown["nodes_ms"]
+
     def test_get_initial_state(self, workflow):
         """Test initial state creation"""
         state = workflow.get_initial_state(
@@ -125,3 +144,58 @@ class TestErrorCheck:
 
         # Has error
         assert check({"error": "Something failed"}) == "error"
+
+
+class TestStateReducers:
+    """Tests for append-only state reducers"""
+
+    def test_append_items_caps_history(self):
+        from ..schemas.state import append_items
+
+        reducer = append_items(limit=3)
+        history = None
+        for i in range(10):
+            history = reducer(history, [i])
+
+        assert history == [7, 8, 9]
+
+    def test_reducers_do_not_modify_current(self):
+        from ..schemas.state import append_items, merge_dicts
+
+        current = ["a"]
+        assert append_items()(current, ["b"]) == ["a", "b"]
+        assert current == ["a"]
+
+        responses = {"a": 1}
+        assert merge_dicts(responses, {"b": 2}) == {"a": 1, "b": 2}
+        assert responses == {"a": 1}
+
+    def test_merge_dicts(self):
+        from ..schemas.state import merge_dicts
+
+        responses = merge_dicts({}, {"a": 1})
+        responses = merge_dicts(responses, {"b": 2})
+        responses = merge_dicts(responses, {"a": 3})
+
+        assert responses == {"a": 3, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_loop_appends_node_names(self):
+        async def loop_node(state: dict) -> dict:
+            return {
+                "nodes_executed": ["loop"],
+                "iteration_count": state.get("iteration_count", 0) + 1,
+            }
+
+        graph = StateGraph(WorkflowState)
+        graph.add_node("loop", loop_node)
+        graph.add_edge(START, "loop")
+        graph.add_conditional_edges(
+            "loop",
+            lambda state: "done" if state["iteration_count"] >= 5 else "again",
+            {"again": "loop", "done": END},
+        )
+
+        final_state = await graph.compile().ainvoke({"nodes_executed": [], "iteration_count": 0})
+
+        assert final_state["nodes_executed"] == ["loop"] * 5
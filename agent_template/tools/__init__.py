@@ -5,11 +5,13 @@ Provides:
 - MCP client for tool execution
 - A2A client for inter-agent communication
 - IO Agent client for human UI updates
+- Protection tunnel registry for tunnel reuse across incidents
 """
 
 from .mcp_client import MCPToolClient, get_mcp_tools, get_filtered_tools
 from .a2a_client import A2AClient, get_a2a_client
 from .io_agent_client import IOAgentClient, get_io_client, configure_io_client
+from .tunnel_registry import TunnelRegistry, get_tunnel_registry
 
 __all__ = [
     "MCPToolClient",
@@ -20,4 +22,6 @@ __all__ = [
     "IOAgentClient",
     "get_io_client",
     "configure_io_client",
+    "TunnelRegistry",
+    "get_tunnel_registry",
 ]
@@ -15,10 +15,14 @@ import httpx
 import structlog
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from ..schemas.tasks import TaskInput, TaskOutput, TaskStatus, AgentCard
+from ...metrics import timed_call
+from ...schemas.tasks import TaskInput, TaskOutput, TaskStatus, AgentCard
 
 logger = structlog.get_logger(__name__)
 
+# Task bodies are serialized with model_dump_json() and sent as raw content
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class A2AClientError(Exception):
     """Base exception for A2A client errors"""
@@ -190,14 +194,17 @@ class A2AClient:
         )
 
         try:
-            response = await client.post(
-                f"{base_url}/a2a/tasks",
-                json=task_input.model_dump(mode="json"),
-                timeout=timeout or self.default_timeout,
-            )
-            response.raise_for_status()
-
-            output = TaskOutput(**response.json())
+            async with timed_call("a2a", agent_name, task_type):
+                response = await client.post(
+                    f"{base_url}/a2a/tasks",
+                    content=task_input.model_dump_json(),
+                    headers=JSON_HEADERS,
+                    timeout=timeout or self.default_timeout,
+                )
+                response.raise_for_status()
+
+            # Parse and validate in one pass, without an intermediate dict
+            output = TaskOutput.model_validate_json(response.content)
             logger.info(
                 "Received A2A response",
                 target_agent=agent_name,
@@ -257,11 +264,13 @@ class A2AClient:
         )
 
         try:
-            response = await client.post(
-                f"{base_url}/a2a/tasks/async",
-                json=task_input.model_dump(mode="json"),
-            )
-            response.raise_for_status()
+            async with timed_call("a2a", agent_name, f"{task_type}:async"):
+                response = await client.post(
+                    f"{base_url}/a2a/tasks/async",
+                    content=task_input.model_dump_json(),
+                    headers=JSON_HEADERS,
+                )
+                response.raise_for_status()
             return task_input.task_id
         except Exception as e:
             logger.error("Failed to send async task", error=str(e))
@@ -7,11 +7,14 @@ Supports tool filtering by stage, sanitization, and caching.
 
 import os
 import re
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import structlog
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain_core.tools import BaseTool
+
+if TYPE_CHECKING:
+    # Imported on first get_tools(); agents that never fetch MCP tools skip the SDK at startup
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langchain_core.tools import BaseTool
 
 logger = structlog.get_logger(__name__)
 
@@ -48,8 +51,8 @@ class MCPToolClient:
         self.timeout = timeout
         self.blocked_tools = set(blocked_tools or [])
 
-        self._client: Optional[MultiServerMCPClient] = None
-        self._tools_cache: Optional[list[BaseTool]] = None
+        self._client: Optional["MultiServerMCPClient"] = None
+        self._tools_cache: Optional[list["BaseTool"]] = None
         self._original_names: dict[str, str] = {}  # sanitized -> original
 
     def _get_mcp_config(self) -> dict:
@@ -75,7 +78,7 @@ class MCPToolClient:
         sanitized = sanitized.strip("_")
         return sanitized
 
-    async def get_tools(self, refresh: bool = False) -> list[BaseTool]:
+    async def get_tools(self, refresh: bool = False) -> list["BaseTool"]:
         """
         Get all available MCP tools.
 
@@ -90,6 +93,13 @@ class MCPToolClient:
 
         logger.info("Fetching MCP tools", server_url=self.server_url)
 
+        try:
+            from langchain_mcp_adapters.client import MultiServerMCPClient
+        except ImportError as exc:
+            raise ImportError(
+                "langchain-mcp-adapters not installed. Install with: pip install langchain-mcp-adapters"
+            ) from exc
+
         try:
             self._client = MultiServerMCPClient(self._get_mcp_config())
             raw_tools = await self._client.get_tools()
@@ -132,7 +142,7 @@ class MCPToolClient:
         allowed_tools: list[str] = None,
         excluded_tools: list[str] = None,
         tool_prefix: str = None,
-    ) -> list[BaseTool]:
+    ) -> list["BaseTool"]:
         """
         Get filtered subset of MCP tools.
 
@@ -178,7 +188,7 @@ class MCPToolClient:
         self,
         stage_config: dict[str, list[str]],
         stage_name: str,
-    ) -> list[BaseTool]:
+    ) -> list["BaseTool"]:
         """
         Get tools for a specific workflow stage.
 
@@ -217,7 +227,7 @@ class MCPToolClient:
 async def get_mcp_tools(
     server_url: Optional[str] = None,
     blocked_tools: list[str] = None,
-) -> list[BaseTool]:
+) -> list["BaseTool"]:
     """
     Get all MCP tools (convenience function).
 
@@ -236,7 +246,7 @@ async def get_filtered_tools(
     allowed_tools: list[str] = None,
     excluded_tools: list[str] = None,
     server_url: Optional[str] = None,
-) -> list[BaseTool]:
+) -> list["BaseTool"]:
     """
     Get filtered MCP tools (convenience function).
 
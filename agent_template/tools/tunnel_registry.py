@@ -0,0 +1,300 @@
+"""
+Protection Tunnel Registry - Shared tunnels across incidents
+
+DESIGN.md Phase 1 protects an affected path with a shared tunnel. The
+registry records every protection tunnel in Redis, indexed by
+(head-end, endpoint), together with the links/SRLGs it avoids, its TE
+type, its remaining bandwidth and the incidents referencing it:
+
+- Orchestrator compute claims an existing tunnel that satisfies a new
+  incident's constraints and steers onto it, skipping provisioning
+- Orchestrator provision registers each new tunnel with its incident as
+  the first reference
+- Orchestrator monitor refreshes the entry's TTL while the incident uses
+  the tunnel
+- Restoration releases the incident's reference and deletes the tunnel
+  only when the last reference is gone
+
+Claim and release are single Lua scripts, so concurrent incidents on
+any agent replica see consistent reference counts and bandwidth.
+"""
+
+import json
+import os
+from typing import Any, Iterable, Optional
+from datetime import datetime, timezone
+import structlog
+import redis.asyncio as redis
+
+from ..metrics import instrument_redis
+
+logger = structlog.get_logger(__name__)
+
+# KEYS: (head-end, endpoint) index
+# ARGV: tunnel key prefix, TE type ('' = any), avoided links/SRLGs (JSON),
+#       bandwidth (Mbps), incident ID, TTL
+# Returns [tunnel_id, field, value, ...] of the claimed tunnel, or nil
+CLAIM_SCRIPT = """
+local wanted = cjson.decode(ARGV[3])
+local bandwidth = tonumber(ARGV[4])
+for _, tunnel_id in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    local key = ARGV[1] .. tunnel_id
+    local fields = redis.call('HMGET', key, 'te_type', 'avoids', 'remaining_mbps')
+    if not fields[2] then
+        redis.call('SREM', KEYS[1], tunnel_id)
+    elseif ARGV[2] == '' or fields[1] == ARGV[2] then
+        local avoids = {}
+        for _, item in ipairs(cjson.decode(fields[2])) do
+            avoids[item] = true
+        end
+        local covered = true
+        for _, item in ipairs(wanted) do
+            if not avoids[item] then
+                covered = false
+                break
+            end
+        end
+        local remaining = tonumber(fields[3])
+        local referenced = redis.call('HEXISTS', key .. ':refs', ARGV[5]) == 1
+        if covered and (referenced or remaining < 0 or remaining >= bandwidth) then
+            if not referenced then
+                if remaining >= 0 then
+                    redis.call('HINCRBYFLOAT', key, 'remaining_mbps', -bandwidth)
+                end
+                redis.call('HSET', key .. ':refs', ARGV[5], bandwidth)
+            end
+            redis.call('EXPIRE', key, ARGV[6])
+            redis.call('EXPIRE', key .. ':refs', ARGV[6])
+            local result = redis.call('HGETALL', key)
+            table.insert(result, 1, tunnel_id)
+            return result
+        end
+    end
+end
+return false
+"""
+
+# KEYS: tunnel, tunnel refs; ARGV: incident ID, index key prefix, tunnel ID
+# Returns references left (0 = tunnel can be deleted), -1 if unknown
+RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local bandwidth = redis.call('HGET', KEYS[2], ARGV[1])
+if bandwidth then
+    redis.call('HDEL', KEYS[2], ARGV[1])
+    if tonumber(redis.call('HGET', KEYS[1], 'remaining_mbps')) >= 0 then
+        redis.call('HINCRBYFLOAT', KEYS[1], 'remaining_mbps', bandwidth)
+    end
+end
+local refs = redis.call('HLEN', KEYS[2])
+if refs == 0 then
+    local ends = redis.call('HMGET', KEYS[1], 'head_end', 'end_point')
+    redis.call('SREM', ARGV[2] .. ends[1] .. '|' .. ends[2], ARGV[3])
+    redis.call('DEL', KEYS[1])
+end
+return refs
+"""
+
+
+class TunnelRegistry:
+    """
+    Reference-counted registry of shared protection tunnels.
+
+    Environment variables:
+        TUNNEL_REUSE_ENABLED: Share protection tunnels across incidents (default true)
+        TUNNEL_REGISTRY_TTL_SECONDS: Entry expiry, refreshed on every claim and
+            by refresh() while an incident uses the tunnel (default 86400)
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        key_prefix: str = "tunnel_registry:",
+        ttl_seconds: Optional[int] = None,
+    ):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds or int(os.getenv("TUNNEL_REGISTRY_TTL_SECONDS", "86400"))
+        self._client: Optional[redis.Redis] = None
+        self._scripts: dict[str, Any] = {}
+
+    async def _get_client(self) -> redis.Redis:
+        """Get or create Redis client"""
+        if self._client is None:
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="tunnel_registry"
+            )
+            self._scripts = {
+                "claim": self._client.register_script(CLAIM_SCRIPT),
+                "release": self._client.register_script(RELEASE_SCRIPT),
+            }
+        return self._client
+
+    def _tunnel_key(self, tunnel_id: str) -> str:
+        return f"{self.key_prefix}tunnel:{tunnel_id}"
+
+    def _index_key(self, head_end: str, end_point: str) -> str:
+        return f"{self.key_prefix}index:{head_end}|{end_point}"
+
+    async def claim(
+        self,
+        incident_id: str,
+        head_end: str,
+        end_point: str,
+        te_type: Optional[str] = None,
+        avoid: Iterable[str] = (),
+        bandwidth_mbps: float = 0.0,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Reference an existing tunnel that satisfies the constraints.
+
+        Args:
+            incident_id: Incident taking the reference
+            head_end: Tunnel head-end PE
+            end_point: Tunnel endpoint PE
+            te_type: Required TE type (None = any)
+            avoid: Links/SRLGs the tunnel must avoid
+            bandwidth_mbps: Bandwidth the incident's traffic needs
+
+        Returns:
+            {tunnel_id, binding_sid, te_type, path, refs} or None if no
+            registered tunnel fits
+        """
+        await self._get_client()
+        result = await self._scripts["claim"](
+            keys=[self._index_key(head_end, end_point)],
+            args=[
+                self._tunnel_key(""),
+                te_type or "",
+                json.dumps(sorted(set(avoid))),
+                bandwidth_mbps,
+                incident_id,
+                self.ttl_seconds,
+            ],
+        )
+        if not result:
+            return None
+
+        tunnel_id, values = result[0], result[1:]
+        fields = dict(zip(values[::2], values[1::2]))
+        tunnel = {
+            "tunnel_id": tunnel_id,
+            "binding_sid": json.loads(fields.get("binding_sid", "null")),
+            "te_type": fields.get("te_type"),
+            "path": json.loads(fields.get("path", "null")),
+        }
+        logger.info(
+            "Reusing shared protection tunnel",
+            incident_id=incident_id,
+            tunnel_id=tunnel_id,
+            head_end=head_end,
+            end_point=end_point,
+        )
+        return tunnel
+
+    async def register(
+        self,
+        tunnel_id: str,
+        incident_id: str,
+        head_end: str,
+        end_point: str,
+        te_type: str,
+        avoid: Iterable[str] = (),
+        capacity_mbps: Optional[float] = None,
+        bandwidth_mbps: float = 0.0,
+        binding_sid: Optional[int] = None,
+        path: Optional[dict] = None,
+    ) -> None:
+        """
+        Record a newly provisioned tunnel with incident_id as its first reference.
+
+        Args:
+            capacity_mbps: Bandwidth the tunnel's path can carry (None = unbounded)
+            bandwidth_mbps: Bandwidth taken by incident_id's traffic
+        """
+        client = await self._get_client()
+        key = self._tunnel_key(tunnel_id)
+        remaining = -1 if not capacity_mbps else max(capacity_mbps - bandwidth_mbps, 0.0)
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={
+                "head_end": head_end,
+                "end_point": end_point,
+                "te_type": te_type,
+                "avoids": json.dumps(sorted(set(avoid))),
+                "remaining_mbps": remaining,
+                "binding_sid": json.dumps(binding_sid),
+                "path": json.dumps(path),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            })
+            pipe.hset(f"{key}:refs", incident_id, bandwidth_mbps)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.expire(f"{key}:refs", self.ttl_seconds)
+            pipe.sadd(self._index_key(head_end, end_point), tunnel_id)
+            await pipe.execute()
+
+        logger.info(
+            "Registered protection tunnel",
+            tunnel_id=tunnel_id,
+            incident_id=incident_id,
+            head_end=head_end,
+            end_point=end_point,
+            te_type=te_type,
+        )
+
+    async def refresh(self, tunnel_id: str) -> bool:
+        """
+        Extend a tunnel's entry while incidents still reference it, so a
+        long-lived shared tunnel does not lose its reference counts.
+
+        Returns:
+            False if the tunnel is not in the registry
+        """
+        client = await self._get_client()
+        key = self._tunnel_key(tunnel_id)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.expire(key, self.ttl_seconds)
+            pipe.expire(f"{key}:refs", self.ttl_seconds)
+            found, _ = await pipe.execute()
+        return bool(found)
+
+    async def release(self, tunnel_id: str, incident_id: str) -> Optional[int]:
+        """
+        Drop incident_id's reference to a tunnel.
+
+        Returns:
+            References left (0 = last one gone, delete the tunnel), or
+            None if the tunnel is not in the registry
+        """
+        await self._get_client()
+        key = self._tunnel_key(tunnel_id)
+        refs = await self._scripts["release"](
+            keys=[key, f"{key}:refs"],
+            args=[incident_id, f"{self.key_prefix}index:", tunnel_id],
+        )
+        if refs < 0:
+            return None
+
+        logger.info("Released protection tunnel reference", tunnel_id=tunnel_id, incident_id=incident_id, refs=refs)
+        return refs
+
+    async def close(self) -> None:
+        """Close Redis connection"""
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+
+# Singleton instance
+_tunnel_registry: Optional[TunnelRegistry] = None
+
+
+def get_tunnel_registry() -> Optional[TunnelRegistry]:
+    """Process-wide tunnel registry, or None when TUNNEL_REUSE_ENABLED=false"""
+    global _tunnel_registry
+    if _tunnel_registry is None:
+        if os.getenv("TUNNEL_REUSE_ENABLED", "true").lower() != "true":
+            return None
+        _tunnel_registry = TunnelRegistry()
+    return _tunnel_registry
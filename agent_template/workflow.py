@@ -8,18 +8,22 @@ Customize by:
 3. Configuring the graph edges
 """
 
-from typing import Any, Optional, Callable, TypeVar
+import time
+from typing import TYPE_CHECKING, Any, Optional, Callable, TypeVar
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 
 import structlog
 from langgraph.graph import StateGraph, START, END
-from langgraph.prebuilt import ToolNode
 
+from . import metrics
 from .schemas.state import WorkflowState
 from .tools.mcp_client import MCPToolClient
 from .tools.a2a_client import A2AClient
 
+if TYPE_CHECKING:
+    from langgraph.prebuilt import ToolNode
+
 logger = structlog.get_logger(__name__)
 
 # Type variable for state
@@ -34,6 +38,11 @@ class BaseWorkflow(ABC):
     Override the abstract methods to customize behavior.
     """
 
+    # Compiled graphs shared by every instance of a workflow class in this
+    # process, keyed by (class, agent_name) since node timings are labelled
+    # with the agent name. build_graph() must not depend on instance state.
+    _compiled_graphs: dict[tuple[type, str], Any] = {}
+
     def __init__(
         self,
         agent_name: str,
@@ -64,6 +73,21 @@ class BaseWorkflow(ABC):
         self._graph: Optional[StateGraph] = None
         self._compiled = None
 
+        # Fields that are the same for every task; get_initial_state() copies it
+        self._state_template: dict[str, Any] = {
+            "iteration_count": 0,
+            "max_iterations": max_iterations,
+            "current_node": "start",
+            "nodes_executed": [],
+            "tool_outputs": [],
+            "mcp_tools_used": [],
+            "a2a_tasks_sent": [],
+            "a2a_responses": {},
+            "status": "running",
+        }
+
+        metrics.set_agent_name(agent_name)
+
     @abstractmethod
     def get_state_class(self) -> type:
         """Return the TypedDict class for this workflow's state"""
@@ -92,42 +116,61 @@ class BaseWorkflow(ABC):
 
         Override to add agent-specific initial state.
         """
-        return {
-            "task_id": task_id,
-            "incident_id": incident_id,
-            "correlation_id": correlation_id,
-            "input_payload": payload or {},
-            "iteration_count": 0,
-            "max_iterations": self.max_iterations,
-            "current_node": "start",
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "nodes_executed": [],
-            "tool_outputs": [],
-            "mcp_tools_used": [],
-            "a2a_tasks_sent": [],
-            "a2a_responses": {},
-            "status": "running",
-        }
+        state = self._state_template.copy()
+        state["task_id"] = task_id
+        state["incident_id"] = incident_id
+        state["correlation_id"] = correlation_id
+        state["input_payload"] = payload or {}
+        state["started_at"] = datetime.now(timezone.utc).isoformat()
+        return state
 
     def compile(self) -> Any:
         """
         Compile the workflow graph.
 
-        Returns the compiled LangGraph application.
+        Returns the compiled LangGraph application, built once per workflow
+        class and agent name and shared by all instances in the process.
         """
         if self._compiled:
             return self._compiled
 
-        state_class = self.get_state_class()
-        self._graph = StateGraph(state_class)
+        key = (type(self), self.agent_name)
+        compiled = BaseWorkflow._compiled_graphs.get(key)
+        if compiled is None:
+            state_class = self.get_state_class()
+            self._graph = StateGraph(state_class)
+            self._instrument_nodes(self._graph)
+
+            # Let subclass build the graph
+            self.build_graph(self._graph)
+
+            # Compile
+            compiled = BaseWorkflow._compiled_graphs[key] = self._graph.compile()
+            logger.info("Compiled workflow", agent=self.agent_name)
 
-        # Let subclass build the graph
-        self.build_graph(self._graph)
+        self._compiled = compiled
+        return compiled
 
-        # Compile
-        self._compiled = self._graph.compile()
-        logger.info("Compiled workflow", agent=self.agent_name)
-        return self._compiled
+    def _instrument_nodes(self, graph: StateGraph) -> None:
+        """
+        Time every node the subclass adds in build_graph().
+
+        Wraps graph.add_node on this instance so node functions are recorded
+        in the workflow_node_duration_seconds histogram and the per-task
+        latency breakdown.
+        """
+        add_node = graph.add_node
+        agent_name = self.agent_name
+
+        def instrumented_add_node(node, action=None, **kwargs):
+            if action is None and callable(node):
+                name = getattr(node, "name", None) or getattr(node, "__name__", str(node))
+                return add_node(name, metrics.instrument_node(agent_name, name, node), **kwargs)
+            if action is not None:
+                action = metrics.instrument_node(agent_name, node, action)
+            return add_node(node, action, **kwargs)
+
+        graph.add_node = instrumented_add_node
 
     async def execute(
         self,
@@ -167,6 +210,10 @@ class BaseWorkflow(ABC):
             task_type=task_type,
         )
 
+        timings, timings_token = metrics.start_task_timings()
+        started = time.perf_counter()
+        outcome = "exception"
+
         try:
             final_state = await app.ainvoke(initial_state)
 
@@ -175,16 +222,19 @@ class BaseWorkflow(ABC):
             error = final_state.get("error")
 
             if error:
+                outcome = "error"
                 logger.error(
                     "Workflow failed",
                     task_id=task_id,
                     error=error,
                 )
             else:
+                outcome = "ok"
                 logger.info(
                     "Workflow completed",
                     task_id=task_id,
                     nodes_executed=final_state.get("nodes_executed", []),
+                    nodes_ms=timings.as_dict()["nodes_ms"],
                 )
 
             return result
@@ -193,12 +243,21 @@ class BaseWorkflow(ABC):
             logger.exception("Workflow exception", task_id=task_id)
             raise
 
+        finally:
+            metrics.observe_task(
+                self.agent_name, task_type, outcome, time.perf_counter() - started
+            )
+            metrics.end_task_timings(timings_token)
+
 
 # ============== Common Node Implementations ==============
 
 
-def create_tool_node(tools: list) -> ToolNode:
+def create_tool_node(tools: list) -> "ToolNode":
     """Create a LangGraph ToolNode with given tools"""
+    # langgraph.prebuilt pulls in langchain_core tooling; only agents using tool nodes pay for it
+    from langgraph.prebuilt import ToolNode
+
     return ToolNode(tools)
 
 
@@ -261,9 +320,8 @@ async def increment_iteration(state: dict) -> dict:
 
 async def track_node_execution(state: dict, node_name: str) -> dict:
     """Track node execution in state"""
-    nodes = state.get("nodes_executed", [])
     return {
-        "nodes_executed": nodes + [node_name],
+        "nodes_executed": [node_name],
         "current_node": node_name,
     }
 
@@ -1,5 +1,4 @@
 """Audit Agent Main Entry Point - Port 8008"""
-import asyncio
 import os
 import sys
 from typing import Any, Optional
@@ -14,6 +13,13 @@ from agent_template.api.server import A2ATaskServer
 from agent_template.tools.mcp_client import MCPToolClient
 from agent_template.tools.a2a_client import A2AClient, configure_a2a_client
 from .workflow import AuditWorkflow
+from .tools import (
+    get_audit_log_shipper,
+    get_audit_writer,
+    get_elasticsearch_client,
+    get_es_bulk_indexer,
+    get_local_audit_log,
+)
 
 load_dotenv()
 
@@ -65,8 +71,32 @@ class AuditRunner:
         )
         self._workflow.compile()
 
+        # Background audit pipelines, started up front so spilled events are
+        # replayed before the first task and flushed by shutdown()
+        if self._local_log_enabled:
+            await get_audit_log_shipper().start()
+        else:
+            if os.getenv("AUDIT_WRITE_BEHIND", "true").lower() == "true":
+                await get_audit_writer().start()
+            if get_elasticsearch_client().enabled and os.getenv("ES_BULK_ENABLED", "true").lower() == "true":
+                await get_es_bulk_indexer().start()
+
         logger.info("Audit agent initialized")
 
+    @property
+    def _local_log_enabled(self) -> bool:
+        return os.getenv("AUDIT_LOCAL_LOG_ENABLED", "false").lower() == "true"
+
+    async def shutdown(self) -> None:
+        """Flush buffered audit events before the process exits"""
+        if self._local_log_enabled:
+            await get_audit_log_shipper().stop()
+            get_local_audit_log().close()
+        else:
+            await get_audit_writer().stop()
+            await get_es_bulk_indexer().stop()
+        logger.info("Audit agent shut down")
+
     async def execute_workflow(
         self,
         task_id: str,
@@ -97,8 +127,23 @@ class AuditRunner:
 
     def run(self) -> None:
         """Run the audit agent"""
-        asyncio.run(self.initialize())
+        from contextlib import asynccontextmanager
+
+        runner = self
         server = self.create_server()
+        server_lifespan = server.app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app):
+            """Initialize in uvicorn's event loop so the audit pipelines run there"""
+            await runner.initialize()
+            try:
+                async with server_lifespan(app):
+                    yield
+            finally:
+                await runner.shutdown()
+
+        server.app.router.lifespan_context = lifespan
 
         logger.info(
             "Starting Audit A2A server",
@@ -1,10 +1,12 @@
 """Index Async Node - From DESIGN.md"""
 import asyncio
+import os
 from datetime import datetime, timezone
 from typing import Any
 import structlog
 
 from ..tools.elasticsearch_client import get_elasticsearch_client
+from ..tools.es_bulk_indexer import get_es_bulk_indexer
 
 logger = structlog.get_logger(__name__)
 
@@ -14,6 +16,11 @@ async def index_async_node(state: dict[str, Any]) -> dict[str, Any]:
     INDEX_ASYNC Node - From DESIGN.md
     Updates search indices in Elasticsearch (async, non-blocking).
 
+    With ES_BULK_ENABLED=true (default) the event is handed to the bulk
+    indexer and the node returns once it is buffered. If the buffer stays
+    full for ES_BULK_ENQUEUE_TIMEOUT_SECONDS the event is not indexed; it is
+    already stored in PostgreSQL.
+
     Input: Formatted log and storage confirmation
     Output: Indexing status
     """
@@ -58,6 +65,32 @@ async def index_async_node(state: dict[str, Any]) -> dict[str, Any]:
 
     formatted_log = state.get("formatted_log", {})
 
+    if os.getenv("AUDIT_LOCAL_LOG_ENABLED", "false").lower() == "true":
+        # AuditLogShipper indexes from the local audit log
+        return {
+            "stage": "index_async",
+            "indexed": True,
+            "es_enabled": True,
+        }
+
+    if os.getenv("ES_BULK_ENABLED", "true").lower() == "true":
+        buffered = await get_es_bulk_indexer().index(
+            formatted_log,
+            timeout=float(os.getenv("ES_BULK_ENQUEUE_TIMEOUT_SECONDS", "0.05")),
+        )
+        if buffered:
+            return {
+                "stage": "index_async",
+                "indexed": True,
+                "es_enabled": True,
+            }
+        return {
+            "stage": "index_async",
+            "indexed": False,
+            "es_enabled": True,
+            "index_error": "Elasticsearch bulk buffer full",
+        }
+
     # Parse timestamp
     timestamp_str = formatted_log.get("timestamp", state.get("timestamp"))
     try:
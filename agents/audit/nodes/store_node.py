@@ -1,9 +1,13 @@
 """Store DB Node - From DESIGN.md"""
+import os
 from datetime import datetime, timezone
 from typing import Any
 import structlog
 
 from ..tools.postgresql_client import get_postgresql_client
+from ..tools.audit_writer import get_audit_writer
+from ..tools.local_audit_log import get_local_audit_log
+from ..tools.audit_log_shipper import get_audit_log_shipper
 
 logger = structlog.get_logger(__name__)
 
@@ -11,7 +15,14 @@ logger = structlog.get_logger(__name__)
 async def store_db_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     STORE_DB Node - From DESIGN.md
-    Writes audit event to PostgreSQL (sync for durability).
+    Writes audit event to PostgreSQL.
+
+    With AUDIT_LOCAL_LOG_ENABLED=true the event is appended to the local
+    segmented audit log and shipped to PostgreSQL/Elasticsearch in the
+    background; timelines are then served from the local log. Otherwise,
+    with AUDIT_WRITE_BEHIND=true (default) the event goes through the batched
+    AuditWriter, which acks per its durability mode, or else it is a single
+    synchronous INSERT.
 
     Input: Formatted log from format_log
     Output: Storage confirmation
@@ -38,7 +49,11 @@ async def store_db_node(state: dict[str, Any]) -> dict[str, Any]:
                 "timeline_count": 0,
             }
 
-        events = await pg_client.get_incident_timeline(incident_id)
+        local_log = get_local_audit_log() if _local_log_enabled() else None
+        if local_log is not None and local_log.has_incident(incident_id):
+            events = local_log.get_incident_timeline(incident_id)
+        else:
+            events = await pg_client.get_incident_timeline(incident_id)
 
         logger.info(
             "Timeline retrieved",
@@ -66,11 +81,14 @@ async def store_db_node(state: dict[str, Any]) -> dict[str, Any]:
             start_date = datetime.now(timezone.utc).replace(day=1)
             end_date = datetime.now(timezone.utc)
 
-        report_data = await pg_client.generate_compliance_report(
-            start_date=start_date,
-            end_date=end_date,
-            include_llm_decisions=True,
-        )
+        if _local_log_enabled() and not pg_client.connected:
+            report_data = get_local_audit_log().compliance_summary(start_date, end_date)
+        else:
+            report_data = await pg_client.generate_compliance_report(
+                start_date=start_date,
+                end_date=end_date,
+                include_llm_decisions=True,
+            )
 
         logger.info(
             "Compliance report generated",
@@ -96,6 +114,40 @@ async def store_db_node(state: dict[str, Any]) -> dict[str, Any]:
                 "db_store_error": "No formatted log to store",
             }
 
+        if _local_log_enabled():
+            try:
+                local_log = get_local_audit_log()
+                seq = local_log.append(formatted_log)
+                if local_log.fsync == "always":
+                    await local_log.sync(seq)
+            except Exception as e:
+                logger.error("Local audit log append failed", error=str(e))
+                return {
+                    "stage": "store_db",
+                    "db_stored": False,
+                    "db_store_error": f"Local audit log append failed: {e}",
+                }
+            shipper = get_audit_log_shipper()
+            await shipper.start()
+            shipper.notify()
+            return {
+                "stage": "store_db",
+                "db_stored": True,
+            }
+
+        if os.getenv("AUDIT_WRITE_BEHIND", "true").lower() == "true":
+            stored = await get_audit_writer().write(formatted_log)
+            if stored:
+                return {
+                    "stage": "store_db",
+                    "db_stored": True,
+                }
+            return {
+                "stage": "store_db",
+                "db_stored": False,
+                "db_store_error": "Failed to write audit event batch to PostgreSQL",
+            }
+
         # Parse timestamp
         timestamp_str = formatted_log.get("timestamp")
         try:
@@ -133,3 +185,7 @@ async def store_db_node(state: dict[str, Any]) -> dict[str, Any]:
                 "db_stored": False,
                 "db_store_error": "Failed to insert into PostgreSQL",
             }
+
+
+def _local_log_enabled() -> bool:
+    return os.getenv("AUDIT_LOCAL_LOG_ENABLED", "false").lower() == "true"
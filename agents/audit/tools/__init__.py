@@ -1,10 +1,22 @@
 """Audit Agent Tools - Port 8008"""
 from .postgresql_client import PostgreSQLClient, get_postgresql_client
 from .elasticsearch_client import ElasticsearchClient, get_elasticsearch_client
+from .audit_writer import AuditWriter, get_audit_writer
+from .es_bulk_indexer import ElasticsearchBulkIndexer, get_es_bulk_indexer
+from .local_audit_log import LocalAuditLog, get_local_audit_log
+from .audit_log_shipper import AuditLogShipper, get_audit_log_shipper
 
 __all__ = [
     "PostgreSQLClient",
     "get_postgresql_client",
     "ElasticsearchClient",
     "get_elasticsearch_client",
+    "AuditWriter",
+    "get_audit_writer",
+    "ElasticsearchBulkIndexer",
+    "get_es_bulk_indexer",
+    "LocalAuditLog",
+    "get_local_audit_log",
+    "AuditLogShipper",
+    "get_audit_log_shipper",
 ]
@@ -0,0 +1,179 @@
+"""
+Audit Log Shipper
+
+Drains the LocalAuditLog into PostgreSQL and Elasticsearch. Each sink has
+its own cursor in the log, so one store being down does not hold back the
+other, and events are re-sent after a restart until they are committed.
+Both sinks are idempotent on event_id (ON CONFLICT DO NOTHING / bulk _id).
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+import structlog
+
+from .elasticsearch_client import ElasticsearchClient, get_elasticsearch_client
+from .local_audit_log import LocalAuditLog, get_local_audit_log
+from .postgresql_client import PostgreSQLClient, get_postgresql_client
+
+logger = structlog.get_logger(__name__)
+
+
+class AuditLogShipper:
+    """Background task shipping local audit log records to PostgreSQL/ES"""
+
+    def __init__(
+        self,
+        audit_log: Optional[LocalAuditLog] = None,
+        pg_client: Optional[PostgreSQLClient] = None,
+        es_client: Optional[ElasticsearchClient] = None,
+        batch_size: Optional[int] = None,
+        interval_seconds: Optional[float] = None,
+        compact_interval_seconds: float = 300.0,
+        es_max_attempts: Optional[int] = None,
+    ):
+        self._log = audit_log or get_local_audit_log()
+        self._pg = pg_client or get_postgresql_client()
+        self._es = es_client or get_elasticsearch_client()
+        self.batch_size = batch_size or int(os.getenv("AUDIT_SHIP_BATCH_SIZE", "1000"))
+        self.interval_seconds = interval_seconds or float(
+            os.getenv("AUDIT_SHIP_INTERVAL_SECONDS", "0.25")
+        )
+        self.compact_interval_seconds = compact_interval_seconds
+        self.es_max_attempts = es_max_attempts or int(
+            os.getenv("AUDIT_SHIP_ES_MAX_ATTEMPTS", "5")
+        )
+        self.es_events_dropped = 0
+
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._wakeup = asyncio.Event()
+
+    @property
+    def sinks(self) -> tuple[str, ...]:
+        return ("postgresql", "elasticsearch") if self._es.enabled else ("postgresql",)
+
+    async def start(self) -> None:
+        """Start the shipping loop"""
+        if self._running:
+            return
+        self._running = True
+
+        try:
+            await self._pg.connect()
+        except Exception as e:
+            logger.warning("Audit shipper starting without PostgreSQL", error=str(e))
+        await self._es.connect()
+
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit log shipper started", sinks=self.sinks)
+
+    async def stop(self) -> None:
+        """Ship what is pending and stop"""
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            await self._task
+            self._task = None
+        logger.info("Audit log shipper stopped")
+
+    def notify(self) -> None:
+        """Wake the loop early after an append"""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_compaction = loop.time() + self.compact_interval_seconds
+
+        while True:
+            shipped = 0
+            for sink in self.sinks:
+                shipped += await self._ship(sink)
+
+            if self._log.fsync == "never":
+                await self._log.sync()
+
+            if loop.time() >= next_compaction:
+                self._log.compact(self.sinks)
+                next_compaction = loop.time() + self.compact_interval_seconds
+
+            if not self._running and shipped == 0:
+                return
+            if shipped:
+                continue  # Backlog - keep draining without sleeping
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _ship(self, sink: str) -> int:
+        """Ship one batch to a sink; returns events committed"""
+        events, last_seq = self._log.read_after(sink, self.batch_size)
+        if not events:
+            return 0
+
+        try:
+            if sink == "postgresql":
+                if not self._pg.connected:
+                    await self._pg.connect()
+                await self._pg.insert_audit_events(events)
+            else:
+                await self._ship_es(events)
+        except Exception as e:
+            logger.warning(
+                "Audit log shipping failed, will retry",
+                sink=sink,
+                batch_size=len(events),
+                lag=self._log.lag(sink),
+                error=str(e),
+            )
+            return 0
+
+        self._log.commit(sink, last_seq)
+        return len(events)
+
+    async def _ship_es(self, events: list[dict]) -> None:
+        """
+        Bulk index events, resending only the items ES rejected as
+        retryable (429/5xx) with backoff. Items still rejected after
+        es_max_attempts are dropped so one bad item cannot stall the sink.
+        """
+        pending = events
+        delay = 0.5
+        for attempt in range(1, self.es_max_attempts + 1):
+            _, pending, _ = await self._es.bulk_index(pending)
+            if not pending:
+                return
+            if attempt < self.es_max_attempts:
+                logger.warning(
+                    "Elasticsearch rejected shipped events, retrying them",
+                    retryable=len(pending),
+                    attempt=attempt,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 5.0)
+
+        self.es_events_dropped += len(pending)
+        logger.error(
+            "Elasticsearch kept rejecting shipped events, skipping them",
+            dropped=len(pending),
+            attempts=self.es_max_attempts,
+            event_ids=[e.get("event_id") for e in pending[:10]],
+        )
+
+
+# Singleton instance
+_audit_log_shipper: Optional[AuditLogShipper] = None
+
+
+def get_audit_log_shipper() -> AuditLogShipper:
+    """Get singleton audit log shipper instance"""
+    global _audit_log_shipper
+    if _audit_log_shipper is None:
+        _audit_log_shipper = AuditLogShipper()
+    return _audit_log_shipper
@@ -0,0 +1,330 @@
+"""
+Write-behind Audit Writer
+
+Buffers audit events in a bounded queue and flushes them to PostgreSQL in
+batches (binary COPY via PostgreSQLClient.insert_audit_events) when either
+the batch size or the flush interval is reached.
+
+Durability modes:
+- "flush":   write() returns only after the event's batch is committed.
+- "enqueue": write() returns once the event is appended to a local spill
+             file. Spill files are replayed on start, so events accepted
+             before a crash or database outage are not lost. Concurrent
+             writers share one fsync (group commit), run off the event loop.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+import structlog
+
+from .postgresql_client import PostgreSQLClient, get_postgresql_client
+
+logger = structlog.get_logger(__name__)
+
+DurabilityMode = Literal["flush", "enqueue"]
+
+
+class AuditWriter:
+    """
+    Write-behind batched audit persistence.
+
+    Producers call write(); a single background task drains the queue and
+    writes batches. When the queue is full, write() waits, which pushes back
+    on producers instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        pg_client: Optional[PostgreSQLClient] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        durability: Optional[DurabilityMode] = None,
+        spill_dir: Optional[str] = None,
+        max_retries: int = 5,
+        spill_rotate_bytes: int = 16 * 1024 * 1024,
+    ):
+        self._pg = pg_client or get_postgresql_client()
+        self.batch_size = batch_size or int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+        self.flush_interval_seconds = flush_interval_seconds or float(
+            os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "0.2")
+        )
+        self.max_queue_size = max_queue_size or int(os.getenv("AUDIT_MAX_QUEUE_SIZE", "10000"))
+        self.durability: DurabilityMode = durability or os.getenv(  # type: ignore[assignment]
+            "AUDIT_DURABILITY", "flush"
+        )
+        if self.durability not in ("flush", "enqueue"):
+            raise ValueError(f"Unknown audit durability mode: {self.durability}")
+        self.spill_dir = Path(spill_dir or os.getenv("AUDIT_SPILL_DIR", "data/audit/spill"))
+        self.max_retries = max_retries
+        self.spill_rotate_bytes = spill_rotate_bytes
+
+        # Queue items: (event, spill generation or None, ack future or None)
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # Spill file state (enqueue mode only)
+        self._spill_generation = 0
+        self._spill_file = None
+        self._spill_pending: dict[int, int] = {}
+        self._spill_lock = asyncio.Lock()
+        self._spill_written = 0
+        self._spill_synced = 0
+
+        # Counters
+        self.events_written = 0
+        self.batches_written = 0
+        self.flush_failures = 0
+
+    # ============== Lifecycle ==============
+
+    async def start(self) -> None:
+        """Start the background flush task and replay any spilled events"""
+        if self._running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._running = True
+
+        try:
+            await self._pg.connect()
+        except Exception as e:
+            # Flushes retry the connection - events stay queued/spilled meanwhile
+            logger.warning("Audit writer starting without PostgreSQL", error=str(e))
+
+        if self.durability == "enqueue":
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            await self._replay_spill_files()
+            self._open_spill_file()
+
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "Audit writer started",
+            durability=self.durability,
+            batch_size=self.batch_size,
+            flush_interval_seconds=self.flush_interval_seconds,
+            max_queue_size=self.max_queue_size,
+        )
+
+    async def stop(self) -> None:
+        """Drain the queue, flush remaining events and stop"""
+        if not self._running:
+            return
+        self._running = False
+
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+            if self._spill_pending.get(self._spill_generation) == 0:
+                self._spill_path(self._spill_generation).unlink(missing_ok=True)
+
+        logger.info(
+            "Audit writer stopped",
+            events_written=self.events_written,
+            batches_written=self.batches_written,
+        )
+
+    # ============== Producer API ==============
+
+    async def write(self, event: dict[str, Any]) -> bool:
+        """
+        Submit a formatted audit event.
+
+        Returns:
+            True once the event is durable per the configured mode
+            (committed for "flush", spilled to disk for "enqueue").
+        """
+        if not self._running:
+            await self.start()
+
+        if self.durability == "enqueue":
+            generation = await self._spill(event)
+            await self._queue.put((event, generation, None))
+            return True
+
+        ack: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, None, ack))
+        return await ack
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be flushed"""
+        return self._queue.qsize() if self._queue else 0
+
+    # ============== Flushing ==============
+
+    async def _flush_loop(self) -> None:
+        """Collect batches by size or time and flush them"""
+        loop = asyncio.get_running_loop()
+
+        while self._running or not self._queue.empty():
+            batch: list[tuple] = []
+            deadline = loop.time() + self.flush_interval_seconds
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Pick up anything already queued without waiting again
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            if batch:
+                await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple]) -> None:
+        """Write one batch with retries, then ack producers"""
+        events = [item[0] for item in batch]
+        delay = 0.1
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                if not self._pg.connected:
+                    await self._pg.connect()
+                await self._pg.insert_audit_events(events)
+                self.events_written += len(events)
+                self.batches_written += 1
+                self._complete(batch, True)
+                return
+            except Exception as e:
+                self.flush_failures += 1
+                logger.warning(
+                    "Audit batch flush failed",
+                    attempt=attempt,
+                    batch_size=len(events),
+                    error=str(e),
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 5.0)
+
+        logger.error(
+            "Audit batch dropped from memory after retries",
+            batch_size=len(events),
+            durability=self.durability,
+            spilled=self.durability == "enqueue",
+        )
+        self._complete(batch, False)
+
+    def _complete(self, batch: list[tuple], success: bool) -> None:
+        """Resolve ack futures and release spill files that are fully flushed"""
+        for _, generation, ack in batch:
+            if ack is not None and not ack.done():
+                ack.set_result(success)
+            # Failed spilled events stay on disk and are replayed on next start
+            if generation is not None and success:
+                self._spill_pending[generation] -= 1
+
+        if self.durability == "enqueue":
+            self._release_spill_files()
+
+    # ============== Spill files (enqueue mode) ==============
+
+    def _spill_path(self, generation: int) -> Path:
+        return self.spill_dir / f"audit-spill-{generation:010d}.jsonl"
+
+    def _open_spill_file(self) -> None:
+        existing = sorted(self.spill_dir.glob("audit-spill-*.jsonl"))
+        if existing:
+            self._spill_generation = int(existing[-1].stem.rsplit("-", 1)[1]) + 1
+        self._spill_file = open(self._spill_path(self._spill_generation), "a", encoding="utf-8")
+        self._spill_pending[self._spill_generation] = 0
+
+    async def _spill(self, event: dict[str, Any]) -> int:
+        """Append event to the active spill file and return its generation once synced"""
+        self._spill_file.write(json.dumps(event, default=str) + "\n")
+        generation = self._spill_generation
+        self._spill_pending[generation] += 1
+        self._spill_written += 1
+        await self._sync_spill(self._spill_written)
+        return generation
+
+    async def _sync_spill(self, seq: int) -> None:
+        """
+        fsync the spill file up to write number seq.
+
+        One fsync covers every event written before it started, so writers
+        that queue on the lock behind it usually find their event synced.
+        """
+        async with self._spill_lock:
+            if self._spill_synced >= seq:
+                return
+
+            spill_file = self._spill_file
+            upto = self._spill_written
+            if spill_file.tell() >= self.spill_rotate_bytes:
+                # Later writes go to the new file; this one is synced and closed
+                self._spill_generation += 1
+                self._spill_file = open(
+                    self._spill_path(self._spill_generation), "a", encoding="utf-8"
+                )
+                self._spill_pending[self._spill_generation] = 0
+
+            spill_file.flush()
+            await asyncio.to_thread(os.fsync, spill_file.fileno())
+            self._spill_synced = upto
+            if spill_file is not self._spill_file:
+                spill_file.close()
+
+    def _release_spill_files(self) -> None:
+        """Delete rotated spill files whose events are all committed"""
+        for generation, pending in list(self._spill_pending.items()):
+            if generation == self._spill_generation or pending > 0:
+                continue
+            self._spill_path(generation).unlink(missing_ok=True)
+            del self._spill_pending[generation]
+
+    async def _replay_spill_files(self) -> None:
+        """Re-submit events left in spill files by a previous run"""
+        for path in sorted(self.spill_dir.glob("audit-spill-*.jsonl")):
+            events = []
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Torn final write from a crash
+                        logger.warning("Skipping corrupt spill record", path=str(path))
+
+            try:
+                for start in range(0, len(events), self.batch_size):
+                    await self._pg.insert_audit_events(events[start:start + self.batch_size])
+            except Exception as e:
+                logger.error(
+                    "Spill replay failed, keeping file for next start",
+                    path=str(path),
+                    error=str(e),
+                )
+                return
+
+            path.unlink(missing_ok=True)
+            logger.info("Replayed audit spill file", path=str(path), events=len(events))
+
+
+# Singleton instance
+_audit_writer: Optional[AuditWriter] = None
+
+
+def get_audit_writer() -> AuditWriter:
+    """Get singleton audit writer instance"""
+    global _audit_writer
+    if _audit_writer is None:
+        _audit_writer = AuditWriter()
+    return _audit_writer
@@ -1,11 +1,22 @@
 """Elasticsearch Client for Audit Indexing - From DESIGN.md"""
+import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Any
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Bulk item statuses worth retrying (throttling / transient cluster errors)
+RETRYABLE_BULK_STATUS = {429, 502, 503, 504}
+
+def _json_default(value: Any) -> str:
+    # Match the ES client serializer for dates nested in payloads
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
 # Singleton instance
 _elasticsearch_client: Optional["ElasticsearchClient"] = None
 
@@ -39,15 +50,25 @@ class ElasticsearchClient:
             logger.info("Elasticsearch indexing disabled")
             return
 
+        if self._client is not None:
+            return
+
         try:
-            # In production, use elasticsearch-py async client:
-            # from elasticsearch import AsyncElasticsearch
-            # self._client = AsyncElasticsearch(
-            #     hosts=self.hosts,
-            #     basic_auth=(self.username, self.password) if self.username else None,
-            # )
+            from elasticsearch import AsyncElasticsearch  # type: ignore
+        except ImportError:
+            logger.warning(
+                "elasticsearch not installed - indexing simulated. "
+                "Install with: pip install elasticsearch"
+            )
+            return
+
+        try:
+            self._client = AsyncElasticsearch(
+                hosts=self.hosts,
+                basic_auth=(self.username, self.password) if self.username else None,
+            )
             logger.info(
-                "Elasticsearch connection simulated",
+                "Elasticsearch client created",
                 hosts=self.hosts,
                 index_prefix=self.index_prefix,
             )
@@ -59,8 +80,114 @@ class ElasticsearchClient:
         """Close Elasticsearch connection"""
         if self._client:
             await self._client.close()
+            self._client = None
             logger.info("Elasticsearch connection closed")
 
+    def index_name(self, timestamp: datetime) -> str:
+        """Date-suffixed index name for time-based indices"""
+        return f"{self.index_prefix}-{timestamp.strftime('%Y.%m.%d')}"
+
+    @staticmethod
+    def build_document(event: dict[str, Any]) -> dict[str, Any]:
+        """Build the ES document from a formatted audit event dict"""
+        timestamp = event.get("timestamp")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        return {
+            "event_id": event.get("event_id"),
+            "@timestamp": timestamp,
+            "incident_id": event.get("incident_id"),
+            "agent_name": event.get("agent_name", "unknown"),
+            "node_name": event.get("node_name"),
+            "event_type": event.get("event_type", "state_change"),
+            "payload": event.get("payload", {}),
+            "previous_state": event.get("previous_state"),
+            "new_state": event.get("new_state"),
+            "decision_type": event.get("decision_type"),
+            "decision_reasoning": event.get("decision_reasoning"),
+            "actor": event.get("actor", "system"),
+        }
+
+    def bulk_operation(self, event: dict[str, Any]) -> bytes:
+        """Serialized _bulk action and document lines for one audit event"""
+        timestamp = event.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                timestamp = datetime.fromisoformat(timestamp)
+            except ValueError:
+                timestamp = None
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        action = {"index": {"_index": self.index_name(timestamp), "_id": event.get("event_id")}}
+        return (
+            json.dumps(action, separators=(",", ":"))
+            + "\n"
+            + json.dumps(self.build_document(event), separators=(",", ":"), default=_json_default)
+        ).encode("utf-8")
+
+    async def bulk_index(
+        self,
+        events: list[dict[str, Any]],
+        operations: Optional[list[bytes]] = None,
+    ) -> tuple[int, list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Index a batch of audit events through the _bulk API.
+
+        Documents use event_id as _id, so retried items are idempotent.
+
+        Args:
+            events: Formatted audit event dicts
+            operations: bulk_operation() bytes of each event, if the caller
+                already serialized them (sent as-is)
+
+        Returns:
+            (indexed_count, retryable_events, failed_events). Retryable events
+            were rejected with a transient status (429/5xx) and can be resent;
+            failed events were rejected permanently (e.g. mapping errors).
+
+        Raises:
+            Exception: On transport errors, so the caller can retry the batch
+        """
+        if not events:
+            return 0, [], []
+
+        if self._client is None:
+            logger.info(
+                "Audit event batch indexed to Elasticsearch (simulated)",
+                count=len(events),
+            )
+            return len(events), [], []
+
+        if operations is None:
+            operations = [self.bulk_operation(event) for event in events]
+
+        # Pre-serialized NDJSON lines are passed through by the serializer
+        response = await self._client.bulk(operations=operations)
+
+        if not response.get("errors"):
+            return len(events), [], []
+
+        indexed = 0
+        retryable: list[dict[str, Any]] = []
+        failed: list[dict[str, Any]] = []
+        for event, item in zip(events, response.get("items", [])):
+            result = item.get("index", {})
+            status = result.get("status", 500)
+            if status < 300:
+                indexed += 1
+            elif status in RETRYABLE_BULK_STATUS:
+                retryable.append(event)
+            else:
+                failed.append(event)
+                logger.error(
+                    "Elasticsearch rejected audit event",
+                    event_id=event.get("event_id"),
+                    status=status,
+                    error=result.get("error"),
+                )
+
+        return indexed, retryable, failed
+
     async def index_audit_event(
         self,
         event_id: str,
@@ -85,8 +212,7 @@ class ElasticsearchClient:
 
         try:
             # Build index name with date suffix for time-based indices
-            date_suffix = timestamp.strftime("%Y.%m.%d")
-            index_name = f"{self.index_prefix}-{date_suffix}"
+            index_name = self.index_name(timestamp)
 
             document = {
                 "event_id": event_id,
@@ -103,12 +229,18 @@ class ElasticsearchClient:
                 "actor": actor,
             }
 
-            # In production:
-            # await self._client.index(
-            #     index=index_name,
-            #     id=event_id,
-            #     document=document,
-            # )
+            if self._client is not None:
+                await self._client.index(
+                    index=index_name,
+                    id=event_id,
+                    document=document,
+                )
+                logger.info(
+                    "Audit event indexed to Elasticsearch",
+                    event_id=event_id,
+                    index=index_name,
+                )
+                return True
 
             logger.info(
                 "Audit event indexed to Elasticsearch (simulated)",
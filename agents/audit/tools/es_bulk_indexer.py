@@ -0,0 +1,238 @@
+"""
+Elasticsearch Bulk Indexer for Audit Events
+
+Buffers audit events and flushes them through the _bulk API when a batch
+reaches max_batch_events / max_batch_bytes or flush_interval_seconds passes.
+Items rejected with a transient status (429/5xx) are retried with backoff;
+permanent rejections are logged and dropped.
+
+Backpressure: the buffer is a bounded queue and at most max_in_flight bulk
+requests run at once. When the cluster slows down, the queue fills and
+index() waits (up to the caller's timeout) instead of growing memory. The
+audit workflow uses a short timeout - PostgreSQL already holds the event, so
+a saturated indexer sheds ES work rather than delaying audit acks. Shed and
+dropped events are counted in shed_events_total (agent_template.metrics).
+
+Each event is serialized once, when it is batched; the same bytes size the
+batch and form the bulk body, including on retries.
+"""
+
+import asyncio
+import os
+from typing import Any, Optional
+
+import structlog
+
+from agent_template.metrics import observe_shed
+
+from .elasticsearch_client import ElasticsearchClient, get_elasticsearch_client
+
+logger = structlog.get_logger(__name__)
+
+
+class ElasticsearchBulkIndexer:
+    """Buffered, backpressured _bulk indexing pipeline"""
+
+    def __init__(
+        self,
+        es_client: Optional[ElasticsearchClient] = None,
+        max_batch_events: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 5,
+    ):
+        self._es = es_client or get_elasticsearch_client()
+        self.max_batch_events = max_batch_events or int(os.getenv("ES_BULK_MAX_EVENTS", "1000"))
+        self.max_batch_bytes = max_batch_bytes or int(
+            os.getenv("ES_BULK_MAX_BYTES", str(5 * 1024 * 1024))
+        )
+        self.flush_interval_seconds = flush_interval_seconds or float(
+            os.getenv("ES_BULK_FLUSH_INTERVAL_SECONDS", "1.0")
+        )
+        self.max_queue_size = max_queue_size or int(os.getenv("ES_BULK_MAX_QUEUE_SIZE", "20000"))
+        self.max_in_flight = max_in_flight or int(os.getenv("ES_BULK_MAX_IN_FLIGHT", "2"))
+        self.max_retries = max_retries
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._bulk_tasks: set[asyncio.Task] = set()
+        self._running = False
+
+        # Counters
+        self.events_indexed = 0
+        self.events_failed = 0
+        self.events_shed = 0
+        self.bulk_requests = 0
+
+    # ============== Lifecycle ==============
+
+    async def start(self) -> None:
+        """Connect to Elasticsearch and start the flush task"""
+        if self._running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._running = True
+
+        await self._es.connect()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "Elasticsearch bulk indexer started",
+            max_batch_events=self.max_batch_events,
+            max_batch_bytes=self.max_batch_bytes,
+            flush_interval_seconds=self.flush_interval_seconds,
+            max_in_flight=self.max_in_flight,
+        )
+
+    async def stop(self) -> None:
+        """Flush buffered events and wait for in-flight bulk requests"""
+        if not self._running:
+            return
+        self._running = False
+
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+        if self._bulk_tasks:
+            await asyncio.gather(*self._bulk_tasks, return_exceptions=True)
+
+        logger.info(
+            "Elasticsearch bulk indexer stopped",
+            events_indexed=self.events_indexed,
+            events_failed=self.events_failed,
+            events_shed=self.events_shed,
+        )
+
+    # ============== Producer API ==============
+
+    async def index(self, event: dict[str, Any], timeout: Optional[float] = None) -> bool:
+        """
+        Buffer an audit event for bulk indexing.
+
+        Args:
+            event: Formatted audit event dict
+            timeout: Max seconds to wait for buffer space. None waits
+                indefinitely (full backpressure); 0 never waits.
+
+        Returns:
+            True if buffered, False if the buffer stayed full (event shed)
+        """
+        if not self._running:
+            await self.start()
+
+        try:
+            if timeout == 0:
+                self._queue.put_nowait(event)
+            else:
+                await asyncio.wait_for(self._queue.put(event), timeout)
+            return True
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            self.events_shed += 1
+            observe_shed("es_bulk_indexer", "queue_full")
+            logger.warning(
+                "Elasticsearch bulk buffer full, event not indexed",
+                event_id=event.get("event_id"),
+                queue_depth=self._queue.qsize(),
+            )
+            return False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be indexed"""
+        return self._queue.qsize() if self._queue else 0
+
+    # ============== Flushing ==============
+
+    async def _flush_loop(self) -> None:
+        """Cut batches by count, bytes or time and dispatch bulk requests"""
+        loop = asyncio.get_running_loop()
+
+        while self._running or not self._queue.empty():
+            batch: list[dict[str, Any]] = []
+            operations: list[bytes] = []
+            batch_bytes = 0
+            deadline = loop.time() + self.flush_interval_seconds
+
+            while len(batch) < self.max_batch_events and batch_bytes < self.max_batch_bytes:
+                timeout = deadline - loop.time()
+                if timeout <= 0 and self._queue.empty():
+                    break
+                try:
+                    if self._queue.empty():
+                        event = await asyncio.wait_for(self._queue.get(), timeout)
+                    else:
+                        event = self._queue.get_nowait()
+                except asyncio.TimeoutError:
+                    break
+                operation = self._es.bulk_operation(event)
+                batch.append(event)
+                operations.append(operation)
+                batch_bytes += len(operation)
+
+            if not batch:
+                continue
+
+            # Waiting for a free slot here is what propagates backpressure:
+            # while ES is slow the loop stops draining and the queue fills.
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._send(batch, operations))
+            self._bulk_tasks.add(task)
+            task.add_done_callback(self._bulk_tasks.discard)
+
+    async def _send(self, batch: list[dict[str, Any]], operations: list[bytes]) -> None:
+        """Send one bulk request, retrying transient item failures"""
+        operation_of = {id(event): op for event, op in zip(batch, operations)}
+        pending = batch
+        delay = 0.5
+
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    indexed, retryable, failed = await self._es.bulk_index(
+                        pending, [operation_of[id(event)] for event in pending]
+                    )
+                    self.bulk_requests += 1
+                except Exception as e:
+                    logger.warning(
+                        "Elasticsearch bulk request failed",
+                        attempt=attempt,
+                        batch_size=len(pending),
+                        error=str(e),
+                    )
+                    indexed, retryable, failed = 0, pending, []
+
+                self.events_indexed += indexed
+                self.events_failed += len(failed)
+                observe_shed("es_bulk_indexer", "rejected", len(failed))
+                if not retryable:
+                    return
+
+                pending = retryable
+                if attempt < self.max_retries:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+
+            self.events_failed += len(pending)
+            observe_shed("es_bulk_indexer", "retries_exhausted", len(pending))
+            logger.error(
+                "Elasticsearch bulk items dropped after retries",
+                count=len(pending),
+            )
+        finally:
+            self._in_flight.release()
+
+
+# Singleton instance
+_es_bulk_indexer: Optional[ElasticsearchBulkIndexer] = None
+
+
+def get_es_bulk_indexer() -> ElasticsearchBulkIndexer:
+    """Get singleton Elasticsearch bulk indexer instance"""
+    global _es_bulk_indexer
+    if _es_bulk_indexer is None:
+        _es_bulk_indexer = ElasticsearchBulkIndexer()
+    return _es_bulk_indexer
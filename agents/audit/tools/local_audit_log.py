@@ -0,0 +1,584 @@
+"""
+Segmented Local Audit Log
+
+Append-only, memory-mapped binary log of audit events kept on the audit
+agent's local disk. It is the first place an event is written, so audit
+keeps working (and timelines stay queryable) while PostgreSQL or
+Elasticsearch are down; AuditLogShipper drains it to both stores.
+
+On-disk layout (one directory):
+    <base_seq:020d>.seg   preallocated segment, records back to back
+    <base_seq:020d>.idx   per-incident offset index of a sealed segment
+    cursors.json          last shipped sequence per sink
+
+Record framing (little endian):
+    u32 length | u32 crc32(payload) | u64 sequence | payload (JSON bytes)
+
+A zero length marks the end of written data in the preallocated segment.
+Timeline reads slice the mapping with memoryview and hand the slice
+straight to orjson, so no intermediate copy of the record is made.
+"""
+
+import asyncio
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator, Literal, Optional
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RECORD_HEADER = struct.Struct("<IIQ")
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+CURSORS_FILE = "cursors.json"
+
+FsyncPolicy = Literal["always", "never"]
+
+
+class _Segment:
+    """One segment file and its mapping"""
+
+    def __init__(self, path: Path, base_seq: int, writable: bool, size: int = 0):
+        self.path = path
+        self.base_seq = base_seq
+        self.writable = writable
+
+        if writable and not path.exists():
+            with open(path, "wb") as f:
+                f.truncate(size)
+
+        self._file = open(path, "r+b" if writable else "rb")
+        file_size = os.fstat(self._file.fileno()).st_size
+        self.mm: Optional[mmap.mmap] = None
+        if file_size:
+            self.mm = mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+        self.capacity = file_size
+        self.write_pos = 0
+        self.last_seq = base_seq - 1
+
+    def scan(self) -> Iterator[tuple[int, int, memoryview]]:
+        """Yield (offset, sequence, payload view) for every valid record"""
+        if self.mm is None:
+            return
+        view = memoryview(self.mm)
+        pos = 0
+        while pos + RECORD_HEADER.size <= self.capacity:
+            length, crc, seq = RECORD_HEADER.unpack_from(self.mm, pos)
+            end = pos + RECORD_HEADER.size + length
+            if length == 0 or end > self.capacity:
+                break
+            payload = view[pos + RECORD_HEADER.size:end]
+            if zlib.crc32(payload) != crc:
+                # Torn write at the tail after a crash - stop here
+                logger.warning("Audit log record CRC mismatch", segment=self.path.name, offset=pos)
+                break
+            yield pos, seq, payload
+            pos = end
+
+    def read(self, offset: int) -> memoryview:
+        """Payload view of the record at offset (zero-copy)"""
+        length, _, _ = RECORD_HEADER.unpack_from(self.mm, offset)
+        start = offset + RECORD_HEADER.size
+        return memoryview(self.mm)[start:start + length]
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def append(self, seq: int, payload: bytes) -> Optional[int]:
+        """Write a record; returns its offset or None if the segment is full"""
+        end = self.write_pos + RECORD_HEADER.size + len(payload)
+        # Keep room for a zero terminator header after the last record
+        if end + RECORD_HEADER.size > self.capacity:
+            return None
+
+        offset = self.write_pos
+        RECORD_HEADER.pack_into(self.mm, offset, len(payload), zlib.crc32(payload), seq)
+        self.mm[offset + RECORD_HEADER.size:end] = payload
+        self.write_pos = end
+        self.last_seq = seq
+        return offset
+
+    def seal(self) -> None:
+        """Shrink the file to its written length and reopen read-only"""
+        if self.mm is not None:
+            self.mm.flush()
+            self.mm.close()
+        self._file.truncate(self.write_pos)
+        self._file.close()
+
+        self._file = open(self.path, "rb")
+        self.capacity = self.write_pos
+        self.mm = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.write_pos
+            else None
+        )
+        self.writable = False
+
+    def close(self) -> None:
+        if self.mm is not None:
+            if self.writable:
+                self.mm.flush()
+            self.mm.close()
+            self.mm = None
+        self._file.close()
+
+
+class LocalAuditLog:
+    """
+    Append-only segmented audit log with a per-incident offset index.
+
+    Not thread-safe; intended for use from the audit agent's event loop.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_bytes: Optional[int] = None,
+        fsync: Optional[FsyncPolicy] = None,
+        retention_hours: Optional[float] = None,
+    ):
+        self.directory = Path(directory or os.getenv("AUDIT_LOG_DIR", "data/audit/log"))
+        self.segment_bytes = segment_bytes or int(
+            os.getenv("AUDIT_LOG_SEGMENT_BYTES", str(64 * 1024 * 1024))
+        )
+        self.fsync: FsyncPolicy = fsync or os.getenv("AUDIT_LOG_FSYNC", "always")  # type: ignore[assignment]
+        self.retention_hours = retention_hours or float(
+            os.getenv("AUDIT_LOG_RETENTION_HOURS", "72")
+        )
+
+        self._segments: dict[int, _Segment] = {}
+        self._active: Optional[_Segment] = None
+        self._next_seq = 0
+
+        # incident_id -> [(segment base_seq, offset)] in append order
+        self._index: dict[str, list[tuple[int, int]]] = {}
+        self._cursors: dict[str, int] = {}
+        # sink -> (sequence, segment base_seq, offset) of the last read record
+        self._read_hints: dict[str, tuple[int, int, int]] = {}
+
+        self._sync_lock = asyncio.Lock()
+        self._synced_seq = -1
+
+        self._open()
+
+    # ============== Open / recovery ==============
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        bases = sorted(int(p.stem) for p in self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        for i, base in enumerate(bases):
+            is_last = i == len(bases) - 1
+            segment = _Segment(self._segment_path(base), base, writable=is_last)
+            self._segments[base] = segment
+
+            index_path = self._index_path(base)
+            if not is_last and index_path.exists():
+                self._load_segment_index(segment, index_path)
+            else:
+                self._scan_into_index(segment)
+
+            self._next_seq = max(self._next_seq, segment.last_seq + 1)
+            if is_last:
+                self._active = segment
+
+        if self._active is None or self._active.capacity < self.segment_bytes:
+            # Last segment was sealed (or none exist) - start a fresh one
+            self._roll()
+
+        cursors_path = self.directory / CURSORS_FILE
+        if cursors_path.exists():
+            self._cursors = orjson.loads(cursors_path.read_bytes())
+
+        logger.info(
+            "Local audit log opened",
+            directory=str(self.directory),
+            segments=len(self._segments),
+            next_seq=self._next_seq,
+            incidents=len(self._index),
+        )
+
+    def _scan_into_index(self, segment: _Segment) -> None:
+        for offset, seq, payload in segment.scan():
+            incident_id = orjson.loads(payload).get("incident_id")
+            if incident_id:
+                self._index.setdefault(incident_id, []).append((segment.base_seq, offset))
+            segment.write_pos = offset + RECORD_HEADER.size + len(payload)
+            segment.last_seq = seq
+
+    def _load_segment_index(self, segment: _Segment, index_path: Path) -> None:
+        data = orjson.loads(index_path.read_bytes())
+        for incident_id, offsets in data["incidents"].items():
+            self._index.setdefault(incident_id, []).extend(
+                (segment.base_seq, offset) for offset in offsets
+            )
+        segment.write_pos = segment.capacity
+        segment.last_seq = data["last_seq"]
+
+    def _write_segment_index(self, segment: _Segment) -> None:
+        incidents: dict[str, list[int]] = {}
+        for incident_id, entries in self._index.items():
+            offsets = [offset for base, offset in entries if base == segment.base_seq]
+            if offsets:
+                incidents[incident_id] = offsets
+        tmp = self._index_path(segment.base_seq).with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps({"last_seq": segment.last_seq, "incidents": incidents}))
+        os.replace(tmp, self._index_path(segment.base_seq))
+
+    def _segment_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{INDEX_SUFFIX}"
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one"""
+        if self._active is not None and self._active.writable:
+            self._active.seal()
+            self._write_segment_index(self._active)
+            if self._active.write_pos == 0:
+                self._drop_segment(self._active.base_seq)
+
+        segment = _Segment(
+            self._segment_path(self._next_seq),
+            self._next_seq,
+            writable=True,
+            size=self.segment_bytes,
+        )
+        self._segments[segment.base_seq] = segment
+        self._active = segment
+
+    # ============== Append ==============
+
+    def append(self, event: dict[str, Any]) -> int:
+        """
+        Append an audit event.
+
+        Returns:
+            The event's sequence number
+        """
+        payload = orjson.dumps(event, default=str)
+        if RECORD_HEADER.size * 2 + len(payload) > self.segment_bytes:
+            raise ValueError(f"Audit event too large for segment: {len(payload)} bytes")
+
+        seq = self._next_seq
+        offset = self._active.append(seq, payload)
+        if offset is None:
+            self._roll()
+            offset = self._active.append(seq, payload)
+        self._next_seq += 1
+
+        incident_id = event.get("incident_id")
+        if incident_id:
+            self._index.setdefault(incident_id, []).append((self._active.base_seq, offset))
+        return seq
+
+    async def sync(self, seq: Optional[int] = None) -> None:
+        """
+        Make records up to seq (default: all appended) durable.
+
+        Group commit: one fsync of the active segment, run in a worker
+        thread, covers every record appended before it started. Sealed
+        segments are already flushed by _roll. The fd is duplicated so a
+        roll on the event loop cannot close it under the thread.
+        """
+        if seq is None:
+            seq = self._next_seq - 1
+        async with self._sync_lock:
+            if self._synced_seq >= seq or self._active is None:
+                return
+            upto = self._next_seq - 1
+            fd = os.dup(self._active.fileno())
+            try:
+                await asyncio.to_thread(os.fsync, fd)
+            finally:
+                os.close(fd)
+            self._synced_seq = upto
+
+    # ============== Queries ==============
+
+    def iter_incident_payloads(self, incident_id: str) -> Iterator[memoryview]:
+        """Yield raw JSON payload views for an incident, in append order"""
+        for base, offset in self._index.get(incident_id, ()):
+            segment = self._segments.get(base)
+            if segment is not None:
+                yield segment.read(offset)
+
+    def get_incident_timeline(self, incident_id: str) -> list[dict[str, Any]]:
+        """Chronological events for an incident (same shape as PostgreSQL rows)"""
+        return [orjson.loads(view) for view in self.iter_incident_payloads(incident_id)]
+
+    def has_incident(self, incident_id: str) -> bool:
+        return incident_id in self._index
+
+    def compliance_summary(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+        """
+        Compliance summary computed from local events.
+
+        Used when PostgreSQL is unavailable. Durations are first-to-last
+        event per incident, since the incidents table is not mirrored here.
+        """
+        incidents: list[dict[str, Any]] = []
+        llm_total = 0
+        error_total = 0
+
+        for incident_id in self._index:
+            events = self.get_incident_timeline(incident_id)
+            timestamps = [_parse_ts(e.get("timestamp")) for e in events]
+            timestamps = [t for t in timestamps if t is not None]
+            if not timestamps or not (start_date <= min(timestamps) <= end_date):
+                continue
+
+            llm = sum(1 for e in events if e.get("decision_type") == "llm_assisted")
+            errors = sum(1 for e in events if e.get("event_type") == "error")
+            llm_total += llm
+            error_total += errors
+            incidents.append({
+                "incident_id": incident_id,
+                "created_at": min(timestamps).isoformat(),
+                "total_duration_seconds": int((max(timestamps) - min(timestamps)).total_seconds()),
+                "final_outcome": events[-1].get("new_state"),
+                "event_count": len(events),
+                "llm_decisions": llm,
+                "error_count": errors,
+            })
+
+        durations = [i["total_duration_seconds"] for i in incidents]
+        return {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "incident_count": len(incidents),
+            "avg_resolution_time_seconds": sum(durations) / len(durations) if durations else 0.0,
+            "llm_decisions_count": llm_total,
+            "error_count": error_total,
+            "incidents": incidents,
+            "source": "local_audit_log",
+        }
+
+    # ============== Shipping cursors ==============
+
+    def read_after(self, sink: str, limit: int) -> tuple[list[dict[str, Any]], int]:
+        """
+        Read up to limit events after the sink's committed cursor.
+
+        Returns:
+            (events, last sequence read). Commit that sequence with
+            commit() once the events are stored in the sink.
+        """
+        after = self._cursors.get(sink, -1)
+        hint = self._read_hints.get(sink)
+
+        events: list[dict[str, Any]] = []
+        last_seq = after
+        for base in sorted(self._segments):
+            segment = self._segments[base]
+            if segment.last_seq <= after:
+                continue
+            start = 0
+            if hint and hint[0] == after and hint[1] == base:
+                # Resume right after the last record handed out
+                start = hint[2]
+            for offset, seq, payload in _scan_from(segment, start):
+                if seq <= after:
+                    continue
+                events.append(orjson.loads(payload))
+                last_seq = seq
+                self._read_hints[sink] = (seq, base, offset + RECORD_HEADER.size + len(payload))
+                if len(events) >= limit:
+                    return events, last_seq
+        return events, last_seq
+
+    def commit(self, sink: str, seq: int) -> None:
+        """Persist the last sequence stored by a sink"""
+        self._cursors[sink] = seq
+        tmp = self.directory / f"{CURSORS_FILE}.tmp"
+        tmp.write_bytes(orjson.dumps(self._cursors))
+        os.replace(tmp, self.directory / CURSORS_FILE)
+
+    def lag(self, sink: str) -> int:
+        """Events appended but not yet committed by a sink"""
+        return self._next_seq - 1 - self._cursors.get(sink, -1)
+
+    # ============== Compaction ==============
+
+    def compact(self, sinks: tuple[str, ...] = ("postgresql", "elasticsearch")) -> int:
+        """
+        Compact sealed segments that every sink has shipped.
+
+        Incidents are dropped whole, once their newest record is older than
+        retention_hours, so a timeline served from the local log is never
+        truncated. Records without an incident_id are dropped by their own
+        timestamp. Remaining records keep their sequence numbers and are
+        rewritten into a smaller segment.
+
+        Returns:
+            Number of records removed
+        """
+        shipped = min((self._cursors.get(s, -1) for s in sinks), default=-1)
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.retention_hours)
+        removed = 0
+
+        compactable = {
+            base
+            for base, segment in self._segments.items()
+            if segment is not self._active and segment.last_seq <= shipped
+        }
+        # An incident with records in a segment that stays as-is (active or
+        # not yet shipped) is kept whole until that segment is compactable
+        expired = {
+            incident_id
+            for incident_id, entries in self._index.items()
+            if all(base in compactable for base, _ in entries)
+            and self._record_expired(*entries[-1], cutoff)
+        }
+
+        for base in sorted(compactable):
+            segment = self._segments[base]
+
+            total, kept = _surviving_records(segment, cutoff, expired)
+            if len(kept) == total:
+                continue
+            removed += total - len(kept)
+            self._rewrite_segment(segment, kept)
+
+        if removed:
+            logger.info("Local audit log compacted", records_removed=removed)
+        return removed
+
+    def _record_expired(self, base: int, offset: int, cutoff: datetime) -> bool:
+        segment = self._segments.get(base)
+        if segment is None:
+            return True
+        ts = _parse_ts(orjson.loads(segment.read(offset)).get("timestamp"))
+        return ts is not None and ts < cutoff
+
+    def _rewrite_segment(self, segment: _Segment, records: list[tuple[int, bytes]]) -> None:
+        base = segment.base_seq
+        last_seq = segment.last_seq
+        self._index = {
+            incident_id: [(b, o) for b, o in entries if b != base]
+            for incident_id, entries in self._index.items()
+        }
+        self._index = {k: v for k, v in self._index.items() if v}
+        self._read_hints.clear()
+
+        if not records:
+            self._drop_segment(base)
+            return
+
+        # Build the replacement next to the original and swap it in atomically
+        self._segments.pop(base).close()
+
+        size = sum(RECORD_HEADER.size + len(p) for _, p in records) + RECORD_HEADER.size
+        tmp_path = self.directory / f"{base:020d}.compact"
+        rewritten = _Segment(tmp_path, base, writable=True, size=size)
+        for seq, payload in records:
+            offset = rewritten.append(seq, payload)
+            incident_id = orjson.loads(payload).get("incident_id")
+            if incident_id:
+                self._index.setdefault(incident_id, []).append((base, offset))
+        rewritten.last_seq = last_seq
+        rewritten.seal()
+        rewritten.close()
+        os.replace(tmp_path, self._segment_path(base))
+
+        # Re-sort so timelines stay in append order across segments
+        for entries in self._index.values():
+            entries.sort()
+
+        segment = _Segment(self._segment_path(base), base, writable=False)
+        segment.write_pos = segment.capacity
+        segment.last_seq = last_seq
+        self._segments[base] = segment
+        self._write_segment_index(segment)
+
+    def _drop_segment(self, base: int) -> None:
+        segment = self._segments.pop(base, None)
+        if segment is not None:
+            segment.close()
+        self._segment_path(base).unlink(missing_ok=True)
+        self._index_path(base).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+        self._active = None
+
+
+def _surviving_records(
+    segment: _Segment, cutoff: datetime, expired: set[str]
+) -> tuple[int, list[tuple[int, bytes]]]:
+    """
+    Copy out records that are not part of an expired incident (or, without
+    an incident_id, are newer than cutoff).
+
+    Kept in its own frame so no memoryview into the mapping outlives the
+    scan - the segment is closed right after.
+    """
+    kept = []
+    total = 0
+    for _, seq, payload in segment.scan():
+        total += 1
+        event = orjson.loads(payload)
+        incident_id = event.get("incident_id")
+        if incident_id:
+            if incident_id in expired:
+                continue
+        else:
+            ts = _parse_ts(event.get("timestamp"))
+            if ts is not None and ts < cutoff:
+                continue
+        kept.append((seq, bytes(payload)))
+    return total, kept
+
+
+def _scan_from(segment: _Segment, start: int) -> Iterator[tuple[int, int, memoryview]]:
+    """Scan a segment starting at a known record boundary"""
+    if start == 0:
+        yield from segment.scan()
+        return
+    if segment.mm is None:
+        return
+    view = memoryview(segment.mm)
+    pos = start
+    while pos + RECORD_HEADER.size <= segment.capacity:
+        length, _, seq = RECORD_HEADER.unpack_from(segment.mm, pos)
+        end = pos + RECORD_HEADER.size + length
+        if length == 0 or end > segment.capacity:
+            break
+        yield pos, seq, view[pos + RECORD_HEADER.size:end]
+        pos = end
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+# Singleton instance
+_local_audit_log: Optional[LocalAuditLog] = None
+
+
+def get_local_audit_log() -> LocalAuditLog:
+    """Get singleton local audit log instance"""
+    global _local_audit_log
+    if _local_audit_log is None:
+        _local_audit_log = LocalAuditLog()
+    return _local_audit_log
@@ -1,12 +1,38 @@
 """PostgreSQL Client for Audit Storage - From DESIGN.md"""
+import json
 import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Any
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid4, uuid5
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Column order used by both the single INSERT and the batched COPY path
+AUDIT_EVENT_COLUMNS = (
+    "event_id",
+    "timestamp",
+    "incident_id",
+    "agent_name",
+    "node_name",
+    "event_type",
+    "payload",
+    "previous_state",
+    "new_state",
+    "decision_type",
+    "decision_reasoning",
+    "actor",
+)
+
+INSERT_AUDIT_EVENT_SQL = """
+    INSERT INTO audit_events (
+        event_id, timestamp, incident_id, agent_name, node_name,
+        event_type, payload, previous_state, new_state,
+        decision_type, decision_reasoning, actor
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7::jsonb, $8, $9, $10, $11, $12)
+    ON CONFLICT (event_id) DO NOTHING
+"""
+
 # Singleton instance
 _postgresql_client: Optional["PostgreSQLClient"] = None
 
@@ -34,22 +60,41 @@ class PostgreSQLClient:
         self.pool_size = pool_size
         self._pool = None
 
+    @property
+    def connected(self) -> bool:
+        """True when an asyncpg pool is available"""
+        return self._pool is not None
+
     async def connect(self) -> None:
-        """Initialize connection pool"""
+        """
+        Initialize asyncpg connection pool.
+
+        Falls back to simulated storage when asyncpg is not installed.
+        """
+        if self._pool is not None:
+            return
+
+        try:
+            import asyncpg  # type: ignore
+        except ImportError:
+            logger.warning(
+                "asyncpg not installed - PostgreSQL storage simulated. "
+                "Install with: pip install asyncpg"
+            )
+            return
+
         try:
-            # In production, use asyncpg pool
-            # import asyncpg
-            # self._pool = await asyncpg.create_pool(
-            #     host=self.host,
-            #     port=self.port,
-            #     database=self.database,
-            #     user=self.user,
-            #     password=self.password,
-            #     min_size=1,
-            #     max_size=self.pool_size,
-            # )
+            self._pool = await asyncpg.create_pool(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                min_size=1,
+                max_size=self.pool_size,
+            )
             logger.info(
-                "PostgreSQL connection simulated",
+                "PostgreSQL connection pool created",
                 host=self.host,
                 port=self.port,
                 database=self.database,
@@ -62,6 +107,7 @@ class PostgreSQLClient:
         """Close connection pool"""
         if self._pool:
             await self._pool.close()
+            self._pool = None
             logger.info("PostgreSQL connection closed")
 
     async def insert_audit_event(
@@ -90,17 +136,21 @@ class PostgreSQLClient:
         ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
         """
         try:
-            # In production:
-            # async with self._pool.acquire() as conn:
-            #     await conn.execute("""
-            #         INSERT INTO audit_events (
-            #             event_id, timestamp, incident_id, agent_name, node_name,
-            #             event_type, payload, previous_state, new_state,
-            #             decision_type, decision_reasoning, actor
-            #         ) VALUES ($1, $2, $3, $4, $5, $6, $7::jsonb, $8, $9, $10, $11, $12)
-            #     """, event_id, timestamp, incident_id, agent_name, node_name,
-            #         event_type, json.dumps(payload), previous_state, new_state,
-            #         decision_type, decision_reasoning, actor)
+            if self._pool is not None:
+                async with self._pool.acquire() as conn:
+                    await conn.execute(
+                        INSERT_AUDIT_EVENT_SQL,
+                        event_id, timestamp, incident_id, agent_name, node_name,
+                        event_type, json.dumps(payload), previous_state, new_state,
+                        decision_type, decision_reasoning, actor,
+                    )
+                logger.info(
+                    "Audit event stored to PostgreSQL",
+                    event_id=event_id,
+                    event_type=event_type,
+                    incident_id=incident_id,
+                )
+                return True
 
             logger.info(
                 "Audit event stored to PostgreSQL (simulated)",
@@ -119,6 +169,54 @@ class PostgreSQLClient:
             )
             return False
 
+    async def insert_audit_events(self, events: list[dict[str, Any]]) -> int:
+        """
+        Insert a batch of audit events in one round-trip.
+
+        Uses binary COPY into audit_events. If COPY is rejected (for example a
+        duplicate event_id after a spill-file replay), falls back to an
+        executemany INSERT ... ON CONFLICT DO NOTHING so the batch stays
+        idempotent.
+
+        Args:
+            events: Formatted audit event dicts (as produced by format_log)
+
+        Returns:
+            Number of events written
+
+        Raises:
+            Exception: On database errors, so the caller can retry the batch
+        """
+        if not events:
+            return 0
+
+        records = [_to_record(event) for event in events]
+
+        if self._pool is None:
+            logger.info(
+                "Audit event batch stored to PostgreSQL (simulated)",
+                count=len(records),
+            )
+            return len(records)
+
+        async with self._pool.acquire() as conn:
+            try:
+                await conn.copy_records_to_table(
+                    "audit_events",
+                    records=records,
+                    columns=AUDIT_EVENT_COLUMNS,
+                )
+            except Exception as e:
+                logger.warning(
+                    "COPY into audit_events failed, retrying with executemany",
+                    count=len(records),
+                    error=str(e),
+                )
+                await conn.executemany(INSERT_AUDIT_EVENT_SQL, records)
+
+        logger.info("Audit event batch stored to PostgreSQL", count=len(records))
+        return len(records)
+
     async def get_incident_timeline(
         self, incident_id: str
     ) -> list[dict[str, Any]]:
@@ -280,6 +378,42 @@ class PostgreSQLClient:
             return False
 
 
+def _event_id(event: dict[str, Any]) -> str:
+    """
+    Deterministic id for an event that has none, derived from its content,
+    so a replayed spill file hits ON CONFLICT instead of inserting twice.
+    """
+    canonical = json.dumps(event, sort_keys=True, default=str)
+    return str(uuid5(NAMESPACE_URL, f"audit-event:{canonical}"))
+
+
+def _to_record(event: dict[str, Any]) -> tuple:
+    """Convert a formatted audit event dict to a row tuple in column order"""
+    timestamp = event.get("timestamp")
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp)
+        except ValueError:
+            timestamp = None
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc)
+
+    return (
+        event.get("event_id") or _event_id(event),
+        timestamp,
+        event.get("incident_id"),
+        event.get("agent_name", "unknown"),
+        event.get("node_name"),
+        event.get("event_type", "state_change"),
+        json.dumps(event.get("payload", {})),
+        event.get("previous_state"),
+        event.get("new_state"),
+        event.get("decision_type"),
+        event.get("decision_reasoning"),
+        event.get("actor", "system"),
+    )
+
+
 def get_postgresql_client() -> PostgreSQLClient:
     """Get singleton PostgreSQL client instance"""
     global _postgresql_client
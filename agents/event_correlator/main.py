@@ -23,7 +23,8 @@ from agent_template.tools.mcp_client import MCPToolClient
 from agent_template.tools.a2a_client import A2AClient, configure_a2a_client
 
 from .workflow import EventCorrelatorWorkflow
-from .tools.cnc_notification_subscriber import CNCNotificationSubscriber
+from .tools.cnc_notification_subscriber import create_notification_subscriber
+from .tools.alert_recorder import get_alert_recorder
 
 # Load environment variables
 load_dotenv()
@@ -141,6 +142,11 @@ class EventCorrelatorRunner:
         if self._workflow is None:
             raise RuntimeError("Workflow not initialized")
 
+        # PCA alerts arrive over A2A; CNC/DPM are recorded at their consumers
+        recorder = get_alert_recorder()
+        if recorder is not None and payload and payload.get("source") == "pca":
+            recorder.record("pca", payload.get("alert", {}))
+
         return await self._workflow.execute(
             task_id=task_id,
             task_type=task_type,
@@ -181,7 +187,7 @@ class EventCorrelatorRunner:
         # background event loop, so it runs concurrently with request handling.
         # The subscriber's own reconnect loop keeps it alive for the process
         # lifetime; uvicorn shutdown will cancel it naturally.
-        _subscriber = CNCNotificationSubscriber()
+        _subscriber = create_notification_subscriber()
 
         @server.app.on_event("startup")
         async def _start_cnc_subscriber() -> None:
@@ -192,6 +198,9 @@ class EventCorrelatorRunner:
         async def _stop_cnc_subscriber() -> None:
             logger.info("Closing CNC notification subscriber")
             await _subscriber.close()
+            recorder = get_alert_recorder()
+            if recorder is not None:
+                await recorder.close()
 
         uvicorn.run(
             server.app,
@@ -56,7 +56,7 @@ async def correlate_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "correlate",
-        "nodes_executed": state.get("nodes_executed", []) + ["correlate"],
+        "nodes_executed": ["correlate"],
         "incident_id": result.get("incident_id"),
         "is_new_incident": result.get("is_new_incident", True),
         "correlated_alerts": result.get("correlated_alerts", [alert_id]),
@@ -50,7 +50,7 @@ async def dedup_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "dedup",
-            "nodes_executed": state.get("nodes_executed", []) + ["dedup"],
+            "nodes_executed": ["dedup"],
             "is_duplicate": True,
             "duplicate_of": duplicate_of,
         }
@@ -65,7 +65,7 @@ async def dedup_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "dedup",
-        "nodes_executed": state.get("nodes_executed", []) + ["dedup"],
+        "nodes_executed": ["dedup"],
         "is_duplicate": False,
         "duplicate_of": None,
     }
@@ -55,7 +55,7 @@ async def discard_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "discard",
-        "nodes_executed": state.get("nodes_executed", []) + ["discard"],
+        "nodes_executed": ["discard"],
         "discarded": True,
         "discard_reason": "duplicate",
         "discard_record": discard_record,
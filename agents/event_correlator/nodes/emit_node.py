@@ -93,7 +93,7 @@ async def emit_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "emit",
-        "nodes_executed": state.get("nodes_executed", []) + ["emit"],
+        "nodes_executed": ["emit"],
         "emitted": True,
         "incident_payload": incident_payload,
         "workflow_status": "completed",
@@ -51,7 +51,7 @@ async def flap_detect_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "flap_detect",
-            "nodes_executed": state.get("nodes_executed", []) + ["flap_detect"],
+            "nodes_executed": ["flap_detect"],
             "is_flapping": False,
             "flap_count": 0,
             "dampen_seconds": 0,
@@ -76,7 +76,7 @@ async def flap_detect_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "flap_detect",
-            "nodes_executed": state.get("nodes_executed", []) + ["flap_detect"],
+            "nodes_executed": ["flap_detect"],
             "is_flapping": True,
             "flap_count": flap_count,
             "dampen_seconds": dampen_seconds,
@@ -90,7 +90,7 @@ async def flap_detect_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "flap_detect",
-        "nodes_executed": state.get("nodes_executed", []) + ["flap_detect"],
+        "nodes_executed": ["flap_detect"],
         "is_flapping": False,
         "flap_count": 0,
         "dampen_seconds": 0,
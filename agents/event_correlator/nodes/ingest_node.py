@@ -61,7 +61,7 @@ async def ingest_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "ingest",
-        "nodes_executed": state.get("nodes_executed", []) + ["ingest"],
+        "nodes_executed": ["ingest"],
         "normalized_alert": normalized,
     }
 
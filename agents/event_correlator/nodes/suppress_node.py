@@ -69,7 +69,7 @@ async def suppress_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "suppress",
-        "nodes_executed": state.get("nodes_executed", []) + ["suppress"],
+        "nodes_executed": ["suppress"],
         "suppressed": True,
         "suppression_reason": "flapping",
         "suppression_record": suppression_record,
@@ -4,7 +4,9 @@ Event Correlator Agent State Schema
 Based on DESIGN.md - EventCorrelatorState.
 """
 
-from typing import Any, TypedDict, Optional, List
+from typing import Annotated, Any, TypedDict, Optional, List
+
+from agent_template.schemas.state import append_history
 
 
 class EventCorrelatorState(TypedDict, total=False):
@@ -45,7 +47,7 @@ class EventCorrelatorState(TypedDict, total=False):
 
     # ============== Execution Tracking ==============
     current_node: str
-    nodes_executed: List[str]
+    nodes_executed: Annotated[List[str], append_history]  # Nodes return only their own name
     started_at: str
 
     # ============== Result ==============
@@ -5,9 +5,15 @@ Event Correlator Agent Tools
 from .flap_detector import FlapDetector, check_flapping
 from .dedup_checker import DedupChecker, check_duplicate
 from .correlator import AlertCorrelator, correlate_alerts
-from .cnc_notification_subscriber import CNCNotificationSubscriber, run_subscriber
+from .cnc_notification_subscriber import (
+    CNCNotificationSubscriber,
+    create_notification_subscriber,
+    run_subscriber,
+)
+from .cnc_grpc_subscriber import CNCGrpcNotificationSubscriber
 from .dpm_client import DPMKafkaConsumer, DPMRestClient, get_dpm_rest_client
 from .pca_session_mapper import PCASessionMapper, get_pca_session_mapper
+from .alert_recorder import AlertRecorder, get_alert_recorder, read_recording, to_correlate_payload
 
 __all__ = [
     "FlapDetector",
@@ -17,10 +23,16 @@ __all__ = [
     "AlertCorrelator",
     "correlate_alerts",
     "CNCNotificationSubscriber",
+    "CNCGrpcNotificationSubscriber",
+    "create_notification_subscriber",
     "run_subscriber",
     "DPMKafkaConsumer",
     "DPMRestClient",
     "get_dpm_rest_client",
     "PCASessionMapper",
     "get_pca_session_mapper",
+    "AlertRecorder",
+    "get_alert_recorder",
+    "read_recording",
+    "to_correlate_payload",
 ]
@@ -0,0 +1,207 @@
+"""
+Alert Recorder
+
+Captures raw inputs as they reach the Event Correlator (CNC SSE events,
+DPM TCA messages, PCA alerts) into a compressed append-only file, so
+production storms can be replayed against the correlator with
+benchmarks/alert_replay.py.
+
+File format: concatenated gzip members, each holding JSON lines of
+    {"ts": <epoch seconds>, "source": "cnc_sse"|"dpm_tca"|"pca", "data": {...}}
+A member is written per flush, so a crash loses at most one buffer and
+the file stays readable with plain `zcat`. Compression and the file write
+run in a worker thread, off the event loop.
+
+Recording is off unless ALERT_RECORD_PATH is set.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from typing import Any, Iterator, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SOURCES = ("cnc_sse", "dpm_tca", "pca")
+
+
+class AlertRecorder:
+    """
+    Buffered, compressed, append-only recorder of raw alert inputs.
+
+    Environment variables:
+        ALERT_RECORD_PATH: Recording file (recording disabled if unset)
+        ALERT_RECORD_FLUSH_RECORDS: Records buffered before a flush (default 500)
+        ALERT_RECORD_FLUSH_SECONDS: Max age of buffered records (default 1.0)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_records: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ):
+        self.path = path
+        self.flush_records = flush_records or int(os.getenv("ALERT_RECORD_FLUSH_RECORDS", "500"))
+        self.flush_seconds = (
+            flush_seconds
+            if flush_seconds is not None
+            else float(os.getenv("ALERT_RECORD_FLUSH_SECONDS", "1.0"))
+        )
+        self._buffer: list[str] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._writes: set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()
+        self.recorded = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, source: str, data: dict[str, Any]) -> None:
+        """
+        Buffer one raw input.
+
+        The buffer is written when it is full, or by a timer flush_seconds
+        after its first record, so a quiet input still lands on disk.
+        """
+        self._buffer.append(
+            json.dumps({"ts": time.time(), "source": source, "data": data}, separators=(",", ":"), default=str)
+        )
+        self.recorded += 1
+        if len(self._buffer) >= self.flush_records:
+            self._start_write()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.flush_seconds, self._start_write
+            )
+
+    def _start_write(self) -> None:
+        """Hand the buffer to a background write"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        task = asyncio.get_running_loop().create_task(self._write(lines))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(self, lines: list[str]) -> None:
+        # Lock keeps members in capture order
+        async with self._write_lock:
+            await asyncio.to_thread(self._append_member, lines)
+
+    def _append_member(self, lines: list[str]) -> None:
+        """Append records as one gzip member (runs in a worker thread)"""
+        chunk = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        try:
+            with open(self.path, "ab") as f:
+                f.write(chunk)
+        except OSError as e:
+            logger.warning("Failed to write alert recording", path=self.path, error=str(e))
+
+    async def flush(self) -> None:
+        """Write buffered records and wait for pending writes"""
+        self._start_write()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+    async def close(self) -> None:
+        await self.flush()
+        logger.info("Alert recorder closed", path=self.path, recorded=self.recorded)
+
+
+def read_recording(path: str, sources: Optional[set[str]] = None) -> Iterator[dict[str, Any]]:
+    """
+    Iterate records from a recording file in capture order.
+
+    A truncated final member (process killed mid-write) ends iteration
+    instead of raising.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if sources is None or record.get("source") in sources:
+                    yield record
+        except EOFError:
+            logger.warning("Recording ends with a truncated block", path=path)
+
+
+def _cnc_severity(symptom_list: list) -> str:
+    from .cnc_notification_subscriber import CNCNotificationSubscriber
+
+    return CNCNotificationSubscriber._infer_severity(symptom_list)
+
+
+def to_correlate_payload(record: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """
+    correlate_alert payload for a recorded input, applying the same
+    filtering the live subscriber/consumer applies (None = not forwarded).
+    """
+    source = record.get("source")
+    data = record.get("data") or {}
+
+    if source == "pca":
+        return {"source": "pca", "alert": data}
+
+    if source == "cnc_sse":
+        symptom_list = data.get("symptom_list", [])
+        is_degraded = "degraded" in data.get("type", "").lower()
+        has_violation = any("violation" in str(s).lower() for s in symptom_list)
+        if not (is_degraded or has_violation):
+            return None
+        return {
+            "source": "cnc",
+            "alert": {
+                "resource_id": data.get("service_id", "unknown"),
+                "service_name": data.get("name", "unknown"),
+                "symptom_list": symptom_list,
+                "alert_type": data.get("type", "unknown"),
+                "severity": _cnc_severity(symptom_list),
+                "timestamp": data.get("timestamp"),
+            },
+        }
+
+    if source == "dpm_tca":
+        metric = data.get("metric", "")
+        value = float(data.get("value", 0.0))
+        if metric not in ("packet_loss_pct", "error_rate") or value <= float(data.get("threshold", 0.0)):
+            return None
+        return {
+            "source": "dpm_tca",
+            "alert": {
+                "link_id": data.get("link_id")
+                or f"{data.get('device_id', 'unknown')}:{data.get('interface', 'unknown')}",
+                "packet_loss_pct": value if metric == "packet_loss_pct" else None,
+                "violated_thresholds": [metric],
+                "severity": "major",
+                "timestamp": data.get("timestamp"),
+            },
+        }
+
+    return None
+
+
+# Singleton instance
+_alert_recorder: Optional[AlertRecorder] = None
+
+
+def get_alert_recorder() -> Optional[AlertRecorder]:
+    """Process-wide recorder, or None when ALERT_RECORD_PATH is not set"""
+    global _alert_recorder
+    if _alert_recorder is None:
+        path = os.getenv("ALERT_RECORD_PATH")
+        if not path:
+            return None
+        _alert_recorder = AlertRecorder(path)
+        logger.info("Recording Event Correlator inputs", path=path)
+    return _alert_recorder
@@ -10,21 +10,126 @@ Based on Krishnan Thirukonda's (CNC product team) guidance:
 - Parse symptom_list from service health notifications
 - Forward to event_correlator A2A for processing
 
-CNC v8.0: GRPC notification (not yet implemented here)
+The SSE reader never waits on forwarding: qualifying events go into a
+bounded priority buffer, and a worker pool drains it in batches through
+one pooled client as correlate_alert_batch tasks. When the buffer is full,
+events are merged per service_id or the lowest-severity pending event is
+dropped. The last SSE event id is sent as Last-Event-ID on reconnect.
+
+CNC v8.0: GRPC notification (cnc_grpc_subscriber.py, CNC_NOTIFICATION_TRANSPORT=grpc)
 CNC v8.1: Kafka for Service Health (roadmap)
 """
 
 import asyncio
 import json
 import os
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 import structlog
 
+from agent_template.metrics import httpx_event_hooks
+
+from .alert_recorder import get_alert_recorder, to_correlate_payload
+
 logger = structlog.get_logger(__name__)
 
+# Highest priority first
+SEVERITY_ORDER = ("critical", "major", "minor")
+
+
+class AlertBuffer:
+    """
+    Bounded buffer of correlate_alert payloads, one entry per service_id.
+
+    take() returns the most severe, oldest entries first. An event for a
+    service that is already pending is merged into that entry. Otherwise,
+    when full, offer() evicts the oldest pending entry of lower severity,
+    or drops the new event if there is none.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._pending: dict[str, OrderedDict] = {s: OrderedDict() for s in SEVERITY_ORDER}
+        self._size = 0
+        self._ready = asyncio.Event()
+        self.merged = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _merge(older: dict[str, Any], newer: dict[str, Any]) -> dict[str, Any]:
+        symptoms = list(dict.fromkeys(older["alert"].get("symptom_list", []) + newer["alert"].get("symptom_list", [])))
+        severity = min(older["alert"]["severity"], newer["alert"]["severity"], key=SEVERITY_ORDER.index)
+        return {**newer, "alert": {**newer["alert"], "symptom_list": symptoms, "severity": severity}}
+
+    def _find(self, service_id: str) -> Optional[str]:
+        for severity, entries in self._pending.items():
+            if service_id in entries:
+                return severity
+        return None
+
+    def offer(self, payload: dict[str, Any]) -> bool:
+        """Buffer a payload without blocking; False if it was dropped"""
+        service_id = payload["alert"]["resource_id"]
+        severity = payload["alert"]["severity"]
+
+        pending_severity = self._find(service_id)
+        if pending_severity is not None:
+            merged = self._merge(self._pending[pending_severity][service_id], payload)
+            if merged["alert"]["severity"] != pending_severity:
+                del self._pending[pending_severity][service_id]
+            self._pending[merged["alert"]["severity"]][service_id] = merged
+            self.merged += 1
+            return True
+
+        if self._size >= self.max_size:
+            for lower in reversed(SEVERITY_ORDER[SEVERITY_ORDER.index(severity) + 1:]):
+                if self._pending[lower]:
+                    evicted, _ = self._pending[lower].popitem(last=False)
+                    self._size -= 1
+                    self.dropped += 1
+                    logger.warning("CNC alert buffer full, evicted lower-severity alert",
+                                   evicted_service_id=evicted, severity=lower)
+                    break
+            else:
+                self.dropped += 1
+                logger.warning("CNC alert buffer full, alert dropped", service_id=service_id, severity=severity)
+                return False
+
+        self._pending[severity][service_id] = payload
+        self._size += 1
+        self._ready.set()
+        return True
+
+    async def take(self, max_items: int, exclude: set[str]) -> list[dict[str, Any]]:
+        """
+        Wait for entries, then pop up to max_items whose service is not in
+        exclude (being forwarded by another worker, so its order is kept).
+        """
+        while True:
+            await self._ready.wait()
+            batch = []
+            for entries in self._pending.values():
+                for service_id in [sid for sid in entries if sid not in exclude][: max_items - len(batch)]:
+                    batch.append(entries.pop(service_id))
+            self._size -= len(batch)
+            if batch:
+                if not self._size:
+                    self._ready.clear()
+                return batch
+            # Everything pending is in flight elsewhere; wake() resumes us
+            self._ready.clear()
+
+    def wake(self) -> None:
+        """Re-check pending entries after an in-flight service is released"""
+        if self._size:
+            self._ready.set()
+
 
 class CNCNotificationSubscriber:
     """
@@ -41,6 +146,9 @@ class CNCNotificationSubscriber:
         CNC_PASSWORD: CNC login password
         EVENT_CORRELATOR_URL: Base URL of this agent's A2A server
         NOTIFICATION_RECONNECT_DELAY: Seconds to wait between reconnect attempts
+        CNC_SSE_BUFFER_SIZE: Pending alerts before merging/dropping (default 1000)
+        CNC_SSE_FORWARD_WORKERS: Concurrent forwarding workers (default 4)
+        CNC_SSE_BATCH_SIZE: Alerts per correlate_alert_batch task (default 50)
     """
 
     def __init__(self) -> None:
@@ -71,10 +179,23 @@ class CNCNotificationSubscriber:
         # Seconds to sleep between reconnect attempts on error or disconnect
         self.reconnect_delay: int = int(os.getenv("NOTIFICATION_RECONNECT_DELAY", "30"))
 
+        # Forwarding pipeline
+        self.workers: int = int(os.getenv("CNC_SSE_FORWARD_WORKERS", "4"))
+        self.batch_size: int = int(os.getenv("CNC_SSE_BATCH_SIZE", "50"))
+        self._buffer = AlertBuffer(int(os.getenv("CNC_SSE_BUFFER_SIZE", "1000")))
+        self._in_flight: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+
+        # SSE resume point, sent as Last-Event-ID on reconnect
+        self.last_event_id: Optional[str] = None
+
         # JWT token cache
         self._jwt_token: Optional[str] = None
         self._jwt_expires_at: Optional[datetime] = None
 
+        # Raw event capture for replay (ALERT_RECORD_PATH)
+        self._recorder = get_alert_recorder()
+
         # Shared httpx client (no timeout for the streaming connection)
         ca_cert = os.getenv("CA_CERT_PATH")
         self._client: httpx.AsyncClient = httpx.AsyncClient(
@@ -82,6 +203,13 @@ class CNCNotificationSubscriber:
             verify=ca_cert if ca_cert else True,
         )
 
+        # Pooled client for forwarding batches to the Event Correlator
+        self._forward_client: httpx.AsyncClient = httpx.AsyncClient(
+            event_hooks=httpx_event_hooks("a2a"),
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=self.workers, max_keepalive_connections=self.workers),
+        )
+
     async def _get_jwt_token(self) -> str:
         """
         Obtain a JWT token via TGT→JWT exchange, reusing a cached token when
@@ -143,53 +271,44 @@ class CNCNotificationSubscriber:
                 return "major"
         return "minor"
 
-    async def _forward_alert(self, event: dict) -> None:
+    async def _forward_worker(self) -> None:
+        """Drain the alert buffer in batches, one batch in flight per worker"""
+        while True:
+            batch = await self._buffer.take(self.batch_size, self._in_flight)
+            service_ids = {payload["alert"]["resource_id"] for payload in batch}
+            self._in_flight |= service_ids
+            try:
+                await self._forward_batch(batch)
+            finally:
+                self._in_flight -= service_ids
+                self._buffer.wake()
+
+    async def _forward_batch(self, batch: list[dict[str, Any]]) -> None:
         """
-        Build an A2A payload from a CNC notification event and POST it to
-        the Event Correlator's /a2a/tasks endpoint.
+        POST a correlate_alert_batch task to the Event Correlator's
+        /a2a/tasks endpoint.
 
         Args:
-            event: Parsed JSON dict from a CNC SSE data line.
+            batch: correlate_alert payloads, at most one per service_id.
         """
-        service_id: str = event.get("service_id", "unknown")
-        name: str = event.get("name", "unknown")
-        symptom_list: list = event.get("symptom_list", [])
-        alert_type: str = event.get("type", "unknown")
-        severity: str = self._infer_severity(symptom_list)
-
-        a2a_payload = {
-            "task_type": "correlate_alert",
-            "payload": {
-                "alert_source": "cnc",
-                "raw_alert": {
-                    "resource_id": service_id,
-                    "service_name": name,
-                    "symptom_list": symptom_list,
-                    "alert_type": alert_type,
-                    "severity": severity,
-                },
-            },
-        }
-
         target_url = f"{self.event_correlator_url}/a2a/tasks"
         try:
-            # Use a short-timeout client for the forwarding POST so it does
-            # not block the SSE read loop indefinitely.
-            async with httpx.AsyncClient(timeout=10.0) as post_client:
-                response = await post_client.post(target_url, json=a2a_payload)
-                response.raise_for_status()
-                logger.info(
-                    "CNC alert forwarded to Event Correlator",
-                    service_id=service_id,
-                    service_name=name,
-                    severity=severity,
-                    alert_type=alert_type,
-                    status_code=response.status_code,
-                )
+            response = await self._forward_client.post(
+                target_url,
+                json={"task_type": "correlate_alert_batch", "payload": {"alerts": batch}},
+            )
+            response.raise_for_status()
+            logger.info(
+                "CNC alerts forwarded to Event Correlator",
+                alerts=len(batch),
+                pending=len(self._buffer),
+                status_code=response.status_code,
+            )
         except Exception as exc:
             logger.warning(
-                "Failed to forward CNC alert to Event Correlator",
-                service_id=service_id,
+                "Failed to forward CNC alerts to Event Correlator",
+                alerts=len(batch),
+                service_ids=[payload["alert"]["resource_id"] for payload in batch],
                 error=str(exc),
                 target_url=target_url,
             )
@@ -200,29 +319,35 @@ class CNCNotificationSubscriber:
 
         Loop steps:
         1. Obtain a JWT token.
-        2. Issue a streaming GET to CNC_NOTIFICATION_URL.
-        3. Iterate over response lines; lines beginning with "data:" carry a
-           JSON payload.
+        2. Issue a streaming GET to CNC_NOTIFICATION_URL, resuming from the
+           last seen event id (Last-Event-ID) after a reconnect.
+        3. Iterate over response lines; "id:" lines update the resume point
+           and lines beginning with "data:" carry a JSON payload.
         4. For each event whose type contains "degraded", or whose
-           symptom_list contains "violation", build an A2A payload and POST
-           it to the Event Correlator.
+           symptom_list contains "violation", buffer a correlate_alert
+           payload for the forwarding workers (never waits on forwarding).
         5. On any connection error or disconnect, log a warning and re-raise
            so that `start()` can apply the reconnect delay.
         """
         token = await self._get_jwt_token()
 
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "text/event-stream",
+        }
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+
         logger.info(
             "Opening CNC notification stream",
             url=self.notification_url,
+            last_event_id=self.last_event_id,
         )
 
         async with self._client.stream(
             "GET",
             self.notification_url,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Accept": "text/event-stream",
-            },
+            headers=headers,
         ) as response:
             response.raise_for_status()
             logger.info(
@@ -232,6 +357,10 @@ class CNCNotificationSubscriber:
             )
 
             async for line in response.aiter_lines():
+                if line.startswith("id:"):
+                    self.last_event_id = line[len("id:"):].strip() or None
+                    continue
+
                 if not line.startswith("data:"):
                     # SSE lines that do not carry data (comments, event:,
                     # retry:, blank keep-alive lines) are silently skipped.
@@ -251,27 +380,35 @@ class CNCNotificationSubscriber:
                     )
                     continue
 
-                event_type: str = event.get("type", "")
-                symptom_list: list = event.get("symptom_list", [])
-                symptoms_lower = [str(s).lower() for s in symptom_list]
+                self._handle_event(event)
 
-                is_degraded = "degraded" in event_type.lower()
-                has_violation = any("violation" in s for s in symptoms_lower)
+    def _handle_event(self, event: dict[str, Any]) -> None:
+        """
+        Record a CNC notification and buffer it for forwarding if it is a
+        degradation. Shared by the SSE and gRPC transports.
 
-                if is_degraded or has_violation:
-                    logger.debug(
-                        "Qualifying CNC notification received",
-                        event_type=event_type,
-                        service_id=event.get("service_id"),
-                        symptom_count=len(symptom_list),
-                    )
-                    await self._forward_alert(event)
-                else:
-                    logger.debug(
-                        "Skipping non-degradation CNC notification",
-                        event_type=event_type,
-                        service_id=event.get("service_id"),
-                    )
+        Args:
+            event: Notification dict (service_id, name, type, symptom_list).
+        """
+        if self._recorder is not None:
+            self._recorder.record("cnc_sse", event)
+
+        # Same filter and payload the alert replay uses
+        payload = to_correlate_payload({"source": "cnc_sse", "data": event})
+        if payload is not None:
+            logger.debug(
+                "Qualifying CNC notification received",
+                event_type=event.get("type", ""),
+                service_id=event.get("service_id"),
+                symptom_count=len(payload["alert"]["symptom_list"]),
+            )
+            self._buffer.offer(payload)
+        else:
+            logger.debug(
+                "Skipping non-degradation CNC notification",
+                event_type=event.get("type", ""),
+                service_id=event.get("service_id"),
+            )
 
     async def start(self) -> None:
         """
@@ -286,8 +423,12 @@ class CNCNotificationSubscriber:
             notification_url=self.notification_url,
             event_correlator_url=self.event_correlator_url,
             reconnect_delay=self.reconnect_delay,
+            forward_workers=self.workers,
         )
 
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._forward_worker()) for _ in range(self.workers)]
+
         while True:
             try:
                 await self.subscribe_and_forward()
@@ -321,26 +462,52 @@ class CNCNotificationSubscriber:
 
     async def close(self) -> None:
         """
-        Close the shared httpx client, releasing any open connections.
+        Stop the forwarding workers and close the httpx clients, releasing
+        any open connections.
 
         Call this when the application is shutting down.
         """
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
         await self._client.aclose()
-        logger.info("CNC notification subscriber closed")
+        await self._forward_client.aclose()
+        logger.info(
+            "CNC notification subscriber closed",
+            unforwarded=len(self._buffer),
+            merged=self._buffer.merged,
+            dropped=self._buffer.dropped,
+        )
+
+
+def create_notification_subscriber() -> CNCNotificationSubscriber:
+    """
+    Subscriber for the transport selected by CNC_NOTIFICATION_TRANSPORT:
+    "sse" (default) or "grpc" (CNC v8.0+, see cnc_grpc_subscriber.py).
+    """
+    transport = os.getenv("CNC_NOTIFICATION_TRANSPORT", "sse").lower()
+    if transport == "grpc":
+        from .cnc_grpc_subscriber import CNCGrpcNotificationSubscriber
+
+        return CNCGrpcNotificationSubscriber()
+    if transport != "sse":
+        logger.warning("Unknown CNC notification transport, using SSE", transport=transport)
+    return CNCNotificationSubscriber()
 
 
 async def run_subscriber() -> None:
     """
     Module-level convenience coroutine.
 
-    Creates a CNCNotificationSubscriber and runs it until cancelled.
-    Ensures the client is closed on exit.
+    Creates the configured CNC notification subscriber and runs it until
+    cancelled. Ensures the client is closed on exit.
 
     Usage::
 
         asyncio.run(run_subscriber())
     """
-    subscriber = CNCNotificationSubscriber()
+    subscriber = create_notification_subscriber()
     try:
         await subscriber.start()
     finally:
@@ -13,6 +13,8 @@ from uuid import uuid4
 import structlog
 import redis.asyncio as redis
 
+from agent_template.metrics import instrument_redis
+
 logger = structlog.get_logger(__name__)
 
 # Correlation rules from DESIGN.md
@@ -67,7 +69,9 @@ class AlertCorrelator:
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client"""
         if self._client is None:
-            self._client = redis.from_url(self.redis_url, decode_responses=True)
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="correlator"
+            )
         return self._client
 
     async def correlate(self, alert: dict) -> Dict[str, Any]:
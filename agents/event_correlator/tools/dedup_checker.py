@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 import structlog
 import redis.asyncio as redis
 
+from agent_template.metrics import instrument_redis
+
 logger = structlog.get_logger(__name__)
 
 
@@ -52,7 +54,9 @@ class DedupChecker:
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client"""
         if self._client is None:
-            self._client = redis.from_url(self.redis_url, decode_responses=True)
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="dedup_checker"
+            )
         return self._client
 
     def _compute_hash(self, alert: dict) -> str:
@@ -7,19 +7,50 @@ DPM Kafka is available in CNC today (unlike Service Health Kafka which is v8.1 r
 Krishnan Thirukonda (CNC product team, 2026-03-05):
 "All interface counters are constantly collected and streamed via Kafka.
  You can set thresholds and get TCAs. Use this to find which P-to-P link is dropping."
+
+DPM streams every interface counter, so start_consuming_batched() is the
+high-throughput mode: getmany() batch fetches, orjson decoding, callbacks
+run in parallel lanes keyed by link_id (ordered per link), and offsets
+committed manually once processing has finished.
 """
 
-import json
+import asyncio
 import os
+from collections import deque
 from typing import Any, Callable, Coroutine, Dict, Optional
 from datetime import datetime, timedelta, timezone
 
+import orjson
 import structlog
 import httpx
 
+from agent_template.metrics import httpx_event_hooks, observe_consumer_lag, observe_consumer_records
+
+from .alert_recorder import get_alert_recorder
+
 logger = structlog.get_logger(__name__)
 
 
+class _PartitionProgress:
+    """Committable position of one partition; lanes finish offsets out of order"""
+
+    def __init__(self) -> None:
+        self.pending: deque[int] = deque()
+        self.done: set[int] = set()
+        self.position: Optional[int] = None  # Next offset to commit
+        self.committed: Optional[int] = None
+
+    def add(self, offset: int) -> None:
+        self.pending.append(offset)
+
+    def finish(self, offset: int) -> None:
+        self.done.add(offset)
+        while self.pending and self.pending[0] in self.done:
+            finished = self.pending.popleft()
+            self.done.discard(finished)
+            self.position = finished + 1
+
+
 class DPMKafkaConsumer:
     """
     Consumes DPM TCA (Threshold Crossing Alert) events from CNC Kafka.
@@ -38,6 +69,14 @@ class DPMKafkaConsumer:
             "timestamp": str,       # ISO-8601
             "link_id": str          # optional, CNC topology link_id if available
         }
+
+    Batched mode environment variables:
+        DPM_KAFKA_MAX_POLL_RECORDS: Records per getmany() fetch (default 2000)
+        DPM_KAFKA_FETCH_TIMEOUT_MS: getmany() wait when no records are buffered (default 100)
+        DPM_KAFKA_LANES: Parallel processing lanes, keyed by link_id (default 32)
+        DPM_KAFKA_MAX_IN_FLIGHT: Events dispatched but not yet processed (default 10000)
+        DPM_KAFKA_COMMIT_INTERVAL_SECONDS: Offset commit / lag report interval (default 1)
+        DPM_KAFKA_MAX_RETRIES: Callback retries before an event is skipped (default 2)
     """
 
     def __init__(self) -> None:
@@ -47,8 +86,42 @@ class DPMKafkaConsumer:
         self.packet_loss_threshold_pct: float = float(
             os.getenv("DPM_PACKET_LOSS_THRESHOLD_PCT", "0.1")
         )
+        self.max_poll_records: int = int(os.getenv("DPM_KAFKA_MAX_POLL_RECORDS", "2000"))
+        self.fetch_timeout_ms: int = int(os.getenv("DPM_KAFKA_FETCH_TIMEOUT_MS", "100"))
+        self.lanes: int = int(os.getenv("DPM_KAFKA_LANES", "32"))
+        self.max_in_flight: int = int(os.getenv("DPM_KAFKA_MAX_IN_FLIGHT", "10000"))
+        self.commit_interval_seconds: float = float(os.getenv("DPM_KAFKA_COMMIT_INTERVAL_SECONDS", "1"))
+        self.max_retries: int = int(os.getenv("DPM_KAFKA_MAX_RETRIES", "2"))
         self._consumer = None
         self._running: bool = False
+        self._progress: Dict[Any, _PartitionProgress] = {}
+        self._batched_done: Optional[asyncio.Event] = None
+
+    def _to_tca_event(self, msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize a DPM message; None unless it is a loss/error TCA over threshold"""
+        metric: str = msg.get("metric", "")
+        if metric not in ("packet_loss_pct", "error_rate"):
+            return None
+
+        value: float = float(msg.get("value", 0.0))
+        threshold: float = float(msg.get("threshold", 0.0))
+        if value <= threshold:
+            return None
+
+        link_id: str = msg.get("link_id") or (
+            f"{msg.get('device_id', 'unknown')}:{msg.get('interface', 'unknown')}"
+        )
+
+        return {
+            "source": "dpm_tca",
+            "link_id": link_id,
+            "device_id": msg.get("device_id"),
+            "interface": msg.get("interface"),
+            "metric": metric,
+            "value": value,
+            "threshold": threshold,
+            "timestamp": msg.get("timestamp"),
+        }
 
     async def start_consuming(
         self,
@@ -88,11 +161,12 @@ class DPMKafkaConsumer:
             group_id=self.group_id,
             auto_offset_reset="latest",
             enable_auto_commit=True,
-            value_deserializer=lambda m: json.loads(m.decode("utf-8")),
+            value_deserializer=orjson.loads,
         )
 
         await self._consumer.start()
         self._running = True
+        recorder = get_alert_recorder()
 
         try:
             async for message in self._consumer:
@@ -100,38 +174,23 @@ class DPMKafkaConsumer:
                     break
 
                 msg: Dict[str, Any] = message.value
+                if recorder is not None:
+                    recorder.record("dpm_tca", msg)
 
-                metric: str = msg.get("metric", "")
-                value: float = float(msg.get("value", 0.0))
-                threshold: float = float(msg.get("threshold", 0.0))
-
-                if metric not in ("packet_loss_pct", "error_rate"):
+                try:
+                    tca_event = self._to_tca_event(msg)
+                except (TypeError, ValueError, AttributeError) as e:
+                    logger.warning("Invalid DPM message skipped", error=str(e))
                     continue
-
-                if value <= threshold:
+                if tca_event is None:
                     continue
 
-                link_id: str = msg.get("link_id") or (
-                    f"{msg.get('device_id', 'unknown')}:{msg.get('interface', 'unknown')}"
-                )
-
-                tca_event: Dict[str, Any] = {
-                    "source": "dpm_tca",
-                    "link_id": link_id,
-                    "device_id": msg.get("device_id"),
-                    "interface": msg.get("interface"),
-                    "metric": metric,
-                    "value": value,
-                    "threshold": threshold,
-                    "timestamp": msg.get("timestamp"),
-                }
-
                 logger.info(
                     "DPM TCA received",
-                    link_id=link_id,
-                    metric=metric,
-                    value=value,
-                    threshold=threshold,
+                    link_id=tca_event["link_id"],
+                    metric=tca_event["metric"],
+                    value=tca_event["value"],
+                    threshold=tca_event["threshold"],
                 )
 
                 await callback(tca_event)
@@ -141,9 +200,210 @@ class DPMKafkaConsumer:
             self._running = False
             logger.info("DPM Kafka consumer stopped")
 
+    async def start_consuming_batched(
+        self,
+        callback: Callable[[Dict[str, Any]], Coroutine[Any, Any, None]],
+    ) -> None:
+        """
+        Consume TCA events with batched fetches and parallel processing.
+
+        Qualifying events are dispatched to lanes by link_id: events of one
+        link are processed in order, different links in parallel, whatever
+        partition they arrive on. At most DPM_KAFKA_MAX_IN_FLIGHT events are
+        outstanding; beyond that fetching pauses. A partition's offset is
+        committed only up to the first event still being processed, so a
+        crash or rebalance redelivers unfinished events (at-least-once;
+        the dedup checker absorbs repeats).
+
+        Args:
+            callback: Async callable invoked with each qualifying TCA event dict.
+
+        Raises:
+            ImportError: If aiokafka is not installed.
+        """
+        try:
+            from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener  # type: ignore
+        except ImportError as exc:
+            raise ImportError(
+                "aiokafka not installed. Install with: pip install aiokafka"
+            ) from exc
+
+        owner = self
+
+        class _CommitOnRevoke(ConsumerRebalanceListener):
+            async def on_partitions_revoked(self, revoked):
+                # Last chance to commit finished work before another member owns it
+                await owner._commit(set(revoked))
+                for tp in revoked:
+                    owner._progress.pop(tp, None)
+
+            async def on_partitions_assigned(self, assigned):
+                pass
+
+        logger.info(
+            "Starting batched DPM Kafka consumer",
+            brokers=self.brokers,
+            topic=self.topic,
+            group_id=self.group_id,
+            lanes=self.lanes,
+            max_in_flight=self.max_in_flight,
+        )
+
+        self._consumer = AIOKafkaConsumer(
+            bootstrap_servers=self.brokers,
+            group_id=self.group_id,
+            auto_offset_reset="latest",
+            enable_auto_commit=False,
+            max_poll_records=self.max_poll_records,
+        )
+        self._consumer.subscribe([self.topic], listener=_CommitOnRevoke())
+
+        await self._consumer.start()
+        self._running = True
+        self._batched_done = asyncio.Event()
+        self._progress = {}
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        lanes = [asyncio.Queue() for _ in range(self.lanes)]
+        workers = [asyncio.create_task(self._lane_worker(lane, callback, in_flight)) for lane in lanes]
+        committer = asyncio.create_task(self._commit_loop())
+        recorder = get_alert_recorder()
+
+        try:
+            while self._running:
+                batches = await self._consumer.getmany(
+                    timeout_ms=self.fetch_timeout_ms,
+                    max_records=self.max_poll_records,
+                )
+                for tp, messages in batches.items():
+                    progress = self._progress.setdefault(tp, _PartitionProgress())
+                    skipped = invalid = 0
+                    for message in messages:
+                        progress.add(message.offset)
+                        try:
+                            msg = orjson.loads(message.value)
+                        except orjson.JSONDecodeError:
+                            invalid += 1
+                            progress.finish(message.offset)
+                            continue
+                        if recorder is not None:
+                            recorder.record("dpm_tca", msg)
+
+                        try:
+                            tca_event = self._to_tca_event(msg)
+                        except (TypeError, ValueError, AttributeError):
+                            # Non-object payload or non-numeric value/threshold
+                            invalid += 1
+                            progress.finish(message.offset)
+                            continue
+                        if tca_event is None:
+                            skipped += 1
+                            progress.finish(message.offset)
+                            continue
+
+                        await in_flight.acquire()
+                        lane = lanes[hash(tca_event["link_id"]) % len(lanes)]
+                        lane.put_nowait((tp, message.offset, tca_event))
+
+                    observe_consumer_records(self.topic, "filtered", skipped)
+                    observe_consumer_records(self.topic, "invalid", invalid)
+        finally:
+            self._running = False
+            committer.cancel()
+            # Let dispatched events finish so their offsets can be committed
+            try:
+                await asyncio.wait_for(asyncio.gather(*(lane.join() for lane in lanes)), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning("DPM events still in flight at shutdown; they will be redelivered")
+            for task in workers + [committer]:
+                task.cancel()
+            await asyncio.gather(*workers, committer, return_exceptions=True)
+            await self._commit()
+            await self._consumer.stop()
+            self._consumer = None
+            self._batched_done.set()
+            logger.info("Batched DPM Kafka consumer stopped")
+
+    async def _lane_worker(
+        self,
+        lane: asyncio.Queue,
+        callback: Callable[[Dict[str, Any]], Coroutine[Any, Any, None]],
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        while True:
+            tp, offset, tca_event = await lane.get()
+            try:
+                await self._process(tca_event, callback)
+            finally:
+                # Partition may have been revoked meanwhile
+                progress = self._progress.get(tp)
+                if progress is not None:
+                    progress.finish(offset)
+                in_flight.release()
+                lane.task_done()
+
+    async def _process(
+        self,
+        tca_event: Dict[str, Any],
+        callback: Callable[[Dict[str, Any]], Coroutine[Any, Any, None]],
+    ) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await callback(tca_event)
+                observe_consumer_records(self.topic, "ok")
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    # Skipping keeps the partition's committed offset moving
+                    logger.error(
+                        "DPM TCA processing failed, skipping",
+                        link_id=tca_event["link_id"],
+                        attempts=attempt + 1,
+                        error=str(e),
+                    )
+                    observe_consumer_records(self.topic, "failed")
+                    return
+                await asyncio.sleep(0.1 * (attempt + 1))
+
+    async def _commit_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.commit_interval_seconds)
+            await self._commit()
+            for tp, progress in self._progress.items():
+                highwater = self._consumer.highwater(tp)
+                if highwater is not None and progress.position is not None:
+                    observe_consumer_lag(self.topic, tp.partition, highwater - progress.position)
+
+    async def _commit(self, partitions: Optional[set] = None) -> None:
+        """Commit finished positions (all partitions, or only the given ones)"""
+        if self._consumer is None:
+            return
+        offsets = {
+            tp: progress.position
+            for tp, progress in self._progress.items()
+            if (partitions is None or tp in partitions)
+            and progress.position is not None
+            and progress.position != progress.committed
+        }
+        if not offsets:
+            return
+        try:
+            await self._consumer.commit(offsets)
+        except Exception as e:
+            logger.warning("DPM offset commit failed", partitions=len(offsets), error=str(e))
+            return
+        for tp, position in offsets.items():
+            if tp in self._progress:
+                self._progress[tp].committed = position
+
     async def stop(self) -> None:
         """Stop the Kafka consumer gracefully."""
         self._running = False
+        if self._batched_done is not None:
+            # The batched loop drains, commits and stops the consumer itself
+            await self._batched_done.wait()
+            self._batched_done = None
+            logger.info("DPM Kafka consumer stop requested")
+            return
         if self._consumer is not None:
             await self._consumer.stop()
             self._consumer = None
@@ -185,6 +445,7 @@ class DPMRestClient:
         if self._client is None:
             ca_cert = os.getenv("CA_CERT_PATH")
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=ca_cert if ca_cert else True,
             )
@@ -11,6 +11,8 @@ from datetime import datetime, timedelta, timezone
 import structlog
 import redis.asyncio as redis
 
+from agent_template.metrics import instrument_redis
+
 logger = structlog.get_logger(__name__)
 
 
@@ -47,7 +49,9 @@ class FlapDetector:
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client"""
         if self._client is None:
-            self._client = redis.from_url(self.redis_url, decode_responses=True)
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="flap_detector"
+            )
         return self._client
 
     async def check_flapping(self, link_id: str) -> Tuple[bool, int]:
@@ -5,6 +5,7 @@ LangGraph workflow implementing alert correlation, dedup, and flap detection.
 From DESIGN.md: INGEST -> DEDUP -> CORRELATE -> FLAP_DETECT -> EMIT | SUPPRESS | DISCARD
 """
 
+import asyncio
 from typing import Any, Optional
 
 import structlog
@@ -66,6 +67,53 @@ class EventCorrelatorWorkflow(BaseWorkflow):
             stage_tools=stage_tools,
         )
 
+        # Alerts of one batch correlated concurrently
+        self.batch_concurrency = int(os.getenv("CORRELATE_BATCH_CONCURRENCY", "16"))
+
+    async def execute(
+        self,
+        task_id: str,
+        task_type: str,
+        incident_id: Optional[str] = None,
+        payload: dict[str, Any] = None,
+        correlation_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Execute the workflow.
+
+        correlate_alert_batch runs each alert in payload["alerts"] through the
+        graph as a correlate_alert task: alerts of the same resource in
+        order, different resources concurrently.
+        """
+        if task_type != "correlate_alert_batch":
+            return await super().execute(task_id, task_type, incident_id, payload, correlation_id)
+
+        alerts = (payload or {}).get("alerts", [])
+        by_resource: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        for i, alert_payload in enumerate(alerts):
+            alert = alert_payload.get("alert", {})
+            key = alert.get("resource_id") or alert.get("link_id") or f"#{i}"
+            by_resource.setdefault(key, []).append((i, alert_payload))
+
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+        failed = 0
+
+        async def run_resource(items: list[tuple[int, dict[str, Any]]]) -> None:
+            nonlocal failed
+            async with semaphore:
+                for i, alert_payload in items:
+                    try:
+                        await super(EventCorrelatorWorkflow, self).execute(
+                            f"{task_id}-{i}", "correlate_alert", incident_id, alert_payload, correlation_id
+                        )
+                    except Exception:
+                        failed += 1
+
+        await asyncio.gather(*(run_resource(items) for items in by_resource.values()))
+
+        logger.info("Alert batch correlated", task_id=task_id, alerts=len(alerts), failed=failed)
+        return {"success": failed == 0, "alerts": len(alerts), "failed": failed}
+
     def get_state_class(self) -> type:
         """Return EventCorrelatorState TypedDict"""
         return EventCorrelatorState
@@ -3,7 +3,7 @@ from typing import Any, List
 import asyncio
 import structlog
 
-from ..schemas.notification import ChannelResult
+from ..schemas.notification import ChannelResult, UpdateSNOWIncidentInput
 from ..tools.webex_client import get_webex_client
 from ..tools.servicenow_client import get_servicenow_client
 from ..tools.email_client import get_email_client
@@ -18,6 +18,11 @@ SEVERITY_MAP = {
     "low": "low",
 }
 
+# ServiceNow incident state set by follow-up events (None = work note only)
+SNOW_STATE_BY_EVENT = {
+    "restoration_complete": 6,  # Resolved
+}
+
 
 async def send_parallel_node(state: dict[str, Any]) -> dict[str, Any]:
     """
@@ -28,6 +33,7 @@ async def send_parallel_node(state: dict[str, Any]) -> dict[str, Any]:
     message_subject = state.get("message_subject", "Notification")
     message_body = state.get("message_body", "No message content")
     incident_id = state.get("incident_id", "UNKNOWN")
+    event_type = state.get("event_type", "incident_detected")
     severity = state.get("severity", "medium")
     webex_space = state.get("webex_space", "")
     servicenow_assignment = state.get("servicenow_assignment", "Network Operations")
@@ -45,7 +51,7 @@ async def send_parallel_node(state: dict[str, Any]) -> dict[str, Any]:
         tasks.append(("webex", _send_webex(webex_space, message_body)))
     if "servicenow" in selected_channels:
         tasks.append(("servicenow", _send_servicenow(
-            message_subject, message_body, severity, servicenow_assignment
+            incident_id, event_type, message_subject, message_body, severity, servicenow_assignment
         )))
     if "email" in selected_channels and email_recipients:
         tasks.append(("email", _send_email(email_recipients, message_subject, message_body)))
@@ -129,19 +135,44 @@ async def _send_webex(space_id: str, message: str) -> ChannelResult:
 
 
 async def _send_servicenow(
+    incident_id: str,
+    event_type: str,
     subject: str,
     description: str,
     severity: str,
     assignment_group: str,
 ) -> ChannelResult:
-    """Send to ServiceNow"""
+    """
+    Send to ServiceNow.
+
+    The first notification of an incident opens a ticket; follow-ups
+    (protection active, restored, escalated) update that ticket through the
+    client's batched update path.
+    """
     client = get_servicenow_client()
+
+    ticket = client.ticket_for(incident_id)
+    if ticket and event_type != "incident_detected":
+        update = await client.queue_update(UpdateSNOWIncidentInput(
+            incident_number=ticket,
+            work_notes=f"{subject}\n\n{description}",
+            state=SNOW_STATE_BY_EVENT.get(event_type),
+        ))
+        return ChannelResult(
+            channel="servicenow",
+            success=update.success,
+            ticket_number=ticket,
+            error=update.error,
+        )
+
     result = await client.create_incident(
         short_description=subject,
         description=description,
         severity=SEVERITY_MAP.get(severity, "medium"),
         assignment_group=assignment_group,
     )
+    if result.success and result.incident_number:
+        client.remember_ticket(incident_id, result.incident_number)
 
     return ChannelResult(
         channel="servicenow",
@@ -1,5 +1,11 @@
 """ServiceNow Client - From DESIGN.md ServiceNowClient"""
+import asyncio
+import base64
+import json
 import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Optional, Literal
 import httpx
 import structlog
@@ -21,6 +27,9 @@ SEVERITY_MAP = {
     "low": 4,
 }
 
+# HTTP status codes returned by instances that do not expose /api/now/v1/batch
+BATCH_UNSUPPORTED_STATUS = {404, 405, 501}
+
 
 class ServiceNowClient:
     """
@@ -33,12 +42,44 @@ class ServiceNowClient:
         instance_url: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        sys_id_cache_ttl_seconds: Optional[int] = None,
+        sys_id_cache_max_size: Optional[int] = None,
+        batch_enabled: Optional[bool] = None,
+        max_batch_size: int = 50,
+        batch_window_seconds: Optional[float] = None,
     ):
         self.instance_url = instance_url or os.getenv("SNOW_INSTANCE_URL", "https://example.service-now.com")
         self.username = username or os.getenv("SNOW_USERNAME")
         self.password = password or os.getenv("SNOW_PASSWORD")
         self._client: Optional[httpx.AsyncClient] = None
 
+        # incident number -> (sys_id, cached_at), oldest entry first
+        self._sys_id_cache: OrderedDict[str, tuple[str, datetime]] = OrderedDict()
+        if sys_id_cache_ttl_seconds is None:
+            sys_id_cache_ttl_seconds = int(os.getenv("SNOW_SYS_ID_CACHE_TTL", "86400"))
+        self._sys_id_cache_ttl_seconds = sys_id_cache_ttl_seconds
+        if sys_id_cache_max_size is None:
+            sys_id_cache_max_size = int(os.getenv("SNOW_SYS_ID_CACHE_MAX", "10000"))
+        self._sys_id_cache_max_size = sys_id_cache_max_size
+
+        # Platform incident_id -> ticket number, so follow-up notifications
+        # update the incident's ticket instead of opening a new one
+        self._tickets: OrderedDict[str, str] = OrderedDict()
+
+        # Batch API support - disabled automatically if the instance rejects it
+        if batch_enabled is None:
+            batch_enabled = os.getenv("SNOW_BATCH_API_ENABLED", "true").lower() == "true"
+        self._batch_supported = batch_enabled
+        self.max_batch_size = max_batch_size
+
+        # Updates queued by queue_update() and sent together by update_incidents()
+        if batch_window_seconds is None:
+            batch_window_seconds = float(os.getenv("SNOW_BATCH_WINDOW_SECONDS", "0.2"))
+        self.batch_window_seconds = batch_window_seconds
+        self._pending_updates: list[tuple[UpdateSNOWIncidentInput, asyncio.Future]] = []
+        self._batch_flush: Optional[asyncio.TimerHandle] = None
+        self._batch_sends: set[asyncio.Task] = set()
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client"""
         if self._client is None or self._client.is_closed:
@@ -53,6 +94,83 @@ class ServiceNowClient:
             )
         return self._client
 
+    def _get_cached_sys_id(self, incident_number: str) -> Optional[str]:
+        """Return cached sys_id if present and not expired."""
+        entry = self._sys_id_cache.get(incident_number)
+        if entry is None:
+            return None
+        sys_id, cached_at = entry
+        age = (datetime.now(timezone.utc) - cached_at).total_seconds()
+        if age > self._sys_id_cache_ttl_seconds:
+            del self._sys_id_cache[incident_number]
+            return None
+        self._sys_id_cache.move_to_end(incident_number)
+        return sys_id
+
+    def _store_cached_sys_id(self, incident_number: str, sys_id: str) -> None:
+        """Store a sys_id, evicting the least recently used entry when full."""
+        self._sys_id_cache[incident_number] = (sys_id, datetime.now(timezone.utc))
+        self._sys_id_cache.move_to_end(incident_number)
+        while len(self._sys_id_cache) > self._sys_id_cache_max_size:
+            self._sys_id_cache.popitem(last=False)
+
+    def _invalidate_sys_id(self, incident_number: str) -> None:
+        """Drop a cached sys_id (e.g. after the record was not found)."""
+        self._sys_id_cache.pop(incident_number, None)
+
+    def remember_ticket(self, incident_id: str, incident_number: str) -> None:
+        """Record the ticket opened for a platform incident (LRU-bounded)."""
+        self._tickets[incident_id] = incident_number
+        self._tickets.move_to_end(incident_id)
+        while len(self._tickets) > self._sys_id_cache_max_size:
+            self._tickets.popitem(last=False)
+
+    def ticket_for(self, incident_id: str) -> Optional[str]:
+        """Ticket number previously opened for a platform incident, if known."""
+        return self._tickets.get(incident_id)
+
+    async def _resolve_sys_ids(
+        self,
+        client: httpx.AsyncClient,
+        incident_numbers: list[str],
+    ) -> dict[str, str]:
+        """
+        Resolve incident numbers to sys_ids.
+
+        Served from the local cache where possible; all misses are looked up
+        with a single numberIN query.
+        """
+        resolved: dict[str, str] = {}
+        missing: list[str] = []
+        for number in incident_numbers:
+            sys_id = self._get_cached_sys_id(number)
+            if sys_id:
+                resolved[number] = sys_id
+            elif number not in missing:
+                missing.append(number)
+
+        if not missing:
+            return resolved
+
+        response = await client.get(
+            "/api/now/table/incident",
+            params={
+                "sysparm_query": f"numberIN{','.join(missing)}",
+                "sysparm_fields": "sys_id,number",
+                "sysparm_limit": len(missing),
+            },
+        )
+        response.raise_for_status()
+
+        for record in response.json().get("result", []):
+            number = record.get("number")
+            sys_id = record.get("sys_id")
+            if number and sys_id:
+                self._store_cached_sys_id(number, sys_id)
+                resolved[number] = sys_id
+
+        return resolved
+
     async def create_incident(
         self,
         short_description: str,
@@ -102,6 +220,9 @@ class ServiceNowClient:
 
             data = response.json()
             incident_number = data.get("result", {}).get("number")
+            sys_id = data.get("result", {}).get("sys_id")
+            if incident_number and sys_id:
+                self._store_cached_sys_id(incident_number, sys_id)
 
             logger.info("ServiceNow incident created", incident_number=incident_number)
 
@@ -141,32 +262,31 @@ class ServiceNowClient:
         try:
             client = await self._get_client()
 
-            # First get sys_id from incident number
-            query_response = await client.get(
-                "/api/now/table/incident",
-                params={"sysparm_query": f"number={incident_number}"},
-            )
-            query_response.raise_for_status()
-
-            results = query_response.json().get("result", [])
-            if not results:
-                return UpdateSNOWIncidentOutput(
-                    success=False,
-                    error=f"Incident {incident_number} not found",
-                )
-
-            sys_id = results[0].get("sys_id")
-
-            # Update the incident
             payload = {"work_notes": work_notes}
             if state:
                 payload["state"] = state
 
-            response = await client.put(
-                f"/api/now/table/incident/{sys_id}",
-                json=payload,
-            )
-            response.raise_for_status()
+            # sys_id comes from the local cache in the common case, so the
+            # update is a single PUT. A stale entry is retried once after a
+            # fresh lookup.
+            for attempt in range(2):
+                resolved = await self._resolve_sys_ids(client, [incident_number])
+                sys_id = resolved.get(incident_number)
+                if not sys_id:
+                    return UpdateSNOWIncidentOutput(
+                        success=False,
+                        error=f"Incident {incident_number} not found",
+                    )
+
+                response = await client.put(
+                    f"/api/now/table/incident/{sys_id}",
+                    json=payload,
+                )
+                if response.status_code == 404 and attempt == 0:
+                    self._invalidate_sys_id(incident_number)
+                    continue
+                response.raise_for_status()
+                break
 
             logger.info("ServiceNow incident updated", incident_number=incident_number)
             return UpdateSNOWIncidentOutput(success=True)
@@ -175,6 +295,219 @@ class ServiceNowClient:
             logger.error("ServiceNow API update failed", error=str(e))
             return UpdateSNOWIncidentOutput(success=False, error=f"ServiceNow API error: {e}")
 
+    async def update_incidents(
+        self,
+        updates: list[UpdateSNOWIncidentInput],
+    ) -> list[UpdateSNOWIncidentOutput]:
+        """
+        Update several ServiceNow incidents.
+
+        Updates are grouped into ServiceNow Batch API requests
+        (POST /api/now/v1/batch) of up to max_batch_size. If the instance does
+        not support the Batch API, falls back to concurrent single updates.
+        Results are returned in the same order as the inputs.
+        """
+        if not updates:
+            return []
+
+        if not self.username or not self.password:
+            logger.warning("ServiceNow credentials not configured — cannot update incidents")
+            return [
+                UpdateSNOWIncidentOutput(success=False, error="ServiceNow credentials not configured")
+                for _ in updates
+            ]
+
+        logger.info("Updating ServiceNow incidents", count=len(updates))
+
+        if not self._batch_supported:
+            return await self._update_incidents_individually(updates)
+
+        try:
+            client = await self._get_client()
+            resolved = await self._resolve_sys_ids(
+                client, [u.incident_number for u in updates]
+            )
+        except httpx.HTTPError as e:
+            logger.error("ServiceNow sys_id lookup failed", error=str(e))
+            return [
+                UpdateSNOWIncidentOutput(success=False, error=f"ServiceNow API error: {e}")
+                for _ in updates
+            ]
+
+        results: list[Optional[UpdateSNOWIncidentOutput]] = [None] * len(updates)
+        batchable: list[tuple[int, UpdateSNOWIncidentInput, str]] = []
+        for idx, update in enumerate(updates):
+            sys_id = resolved.get(update.incident_number)
+            if sys_id:
+                batchable.append((idx, update, sys_id))
+            else:
+                results[idx] = UpdateSNOWIncidentOutput(
+                    success=False,
+                    error=f"Incident {update.incident_number} not found",
+                )
+
+        for start in range(0, len(batchable), self.max_batch_size):
+            chunk = batchable[start:start + self.max_batch_size]
+            chunk_results = await self._send_batch(client, chunk)
+            if chunk_results is None:
+                # Instance rejected the Batch API - send the rest one by one
+                remaining = batchable[start:]
+                fallback = await self._update_incidents_individually(
+                    [update for _, update, _ in remaining]
+                )
+                for (idx, _, _), result in zip(remaining, fallback):
+                    results[idx] = result
+                break
+            for idx, result in chunk_results.items():
+                results[idx] = result
+
+        return [
+            r or UpdateSNOWIncidentOutput(success=False, error="No result from ServiceNow")
+            for r in results
+        ]
+
+    async def queue_update(self, update: UpdateSNOWIncidentInput) -> UpdateSNOWIncidentOutput:
+        """
+        Update an incident as part of a batch.
+
+        Updates queued within batch_window_seconds (or until max_batch_size
+        are waiting) are sent together through update_incidents(), so an
+        alarm storm costs one Batch API request per window, not one PUT per
+        incident.
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_updates.append((update, future))
+        if len(self._pending_updates) >= self.max_batch_size:
+            self._flush_pending_updates()
+        elif self._batch_flush is None:
+            self._batch_flush = asyncio.get_running_loop().call_later(
+                self.batch_window_seconds, self._flush_pending_updates
+            )
+        return await future
+
+    def _flush_pending_updates(self) -> None:
+        if self._batch_flush is not None:
+            self._batch_flush.cancel()
+            self._batch_flush = None
+        pending, self._pending_updates = self._pending_updates, []
+        if pending:
+            task = asyncio.create_task(self._send_pending_updates(pending))
+            self._batch_sends.add(task)
+            task.add_done_callback(self._batch_sends.discard)
+
+    async def _send_pending_updates(
+        self,
+        pending: list[tuple[UpdateSNOWIncidentInput, asyncio.Future]],
+    ) -> None:
+        try:
+            results = await self.update_incidents([update for update, _ in pending])
+        except Exception as e:
+            logger.error("ServiceNow queued updates failed", count=len(pending), error=str(e))
+            results = [
+                UpdateSNOWIncidentOutput(success=False, error=f"ServiceNow API error: {e}")
+                for _ in pending
+            ]
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _send_batch(
+        self,
+        client: httpx.AsyncClient,
+        chunk: list[tuple[int, UpdateSNOWIncidentInput, str]],
+    ) -> Optional[dict[int, UpdateSNOWIncidentOutput]]:
+        """
+        Send one Batch API request.
+
+        Returns results keyed by input index, or None if the instance does not
+        support the Batch API.
+        """
+        rest_requests = []
+        for idx, update, sys_id in chunk:
+            payload = {"work_notes": update.work_notes}
+            if update.state:
+                payload["state"] = update.state
+            rest_requests.append({
+                "id": str(idx),
+                "method": "PUT",
+                "url": f"/api/now/table/incident/{sys_id}",
+                "headers": [
+                    {"name": "Content-Type", "value": "application/json"},
+                    {"name": "Accept", "value": "application/json"},
+                ],
+                "body": base64.b64encode(json.dumps(payload).encode()).decode(),
+            })
+
+        try:
+            response = await client.post(
+                "/api/now/v1/batch",
+                json={"batch_request_id": str(uuid.uuid4()), "rest_requests": rest_requests},
+            )
+            if response.status_code in BATCH_UNSUPPORTED_STATUS:
+                logger.warning(
+                    "ServiceNow Batch API not available, using single updates",
+                    status_code=response.status_code,
+                )
+                self._batch_supported = False
+                return None
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("ServiceNow batch update failed", error=str(e))
+            return {
+                idx: UpdateSNOWIncidentOutput(success=False, error=f"ServiceNow API error: {e}")
+                for idx, _, _ in chunk
+            }
+
+        data = response.json()
+        numbers = {str(idx): update.incident_number for idx, update, _ in chunk}
+        results: dict[int, UpdateSNOWIncidentOutput] = {}
+
+        for served in data.get("serviced_requests", []):
+            request_id = served.get("id")
+            if request_id not in numbers:
+                continue
+            status_code = served.get("status_code", 500)
+            if 200 <= status_code < 300:
+                results[int(request_id)] = UpdateSNOWIncidentOutput(success=True)
+            else:
+                if status_code == 404:
+                    self._invalidate_sys_id(numbers[request_id])
+                results[int(request_id)] = UpdateSNOWIncidentOutput(
+                    success=False,
+                    error=f"ServiceNow API error: HTTP {status_code}",
+                )
+
+        for request_id in data.get("unserviced_requests", []):
+            if request_id in numbers:
+                results[int(request_id)] = UpdateSNOWIncidentOutput(
+                    success=False,
+                    error="ServiceNow batch request not serviced",
+                )
+
+        logger.info(
+            "ServiceNow batch update sent",
+            count=len(chunk),
+            succeeded=sum(1 for r in results.values() if r.success),
+        )
+        return results
+
+    async def _update_incidents_individually(
+        self,
+        updates: list[UpdateSNOWIncidentInput],
+    ) -> list[UpdateSNOWIncidentOutput]:
+        """Concurrent single updates, bounded to max_batch_size in flight."""
+        semaphore = asyncio.Semaphore(self.max_batch_size)
+
+        async def _update(update: UpdateSNOWIncidentInput) -> UpdateSNOWIncidentOutput:
+            async with semaphore:
+                return await self.update_incident(
+                    incident_number=update.incident_number,
+                    work_notes=update.work_notes,
+                    state=update.state,
+                )
+
+        return list(await asyncio.gather(*[_update(u) for u in updates]))
+
     async def resolve_incident(
         self,
         incident_number: str,
@@ -188,7 +521,10 @@ class ServiceNowClient:
         )
 
     async def close(self):
-        """Close HTTP client"""
+        """Send queued updates, then close HTTP client"""
+        self._flush_pending_updates()
+        if self._batch_sends:
+            await asyncio.gather(*self._batch_sends, return_exceptions=True)
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -10,12 +10,27 @@ import sys
 # Add parent directory for agent_template imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from agent_template.main import run_agent
+from agent_template.main import AgentRunner
 from agent_template.config_loader import load_config
 
 from workflow import OrchestratorWorkflow
 
 
+class OrchestratorRunner(AgentRunner):
+    """Agent runner that also joins the replica ring in cluster mode and runs the outbox"""
+
+    async def initialize(self) -> None:
+        await super().initialize()
+        # Resumes delivery of side-channel events persisted before a restart
+        self._workflow.start_outbox()
+        await self._workflow.start_cluster()
+
+    async def shutdown(self) -> None:
+        await self._workflow.stop_cluster()
+        await self._workflow.stop_outbox()
+        await super().shutdown()
+
+
 def main():
     """Run the Orchestrator Agent"""
     # Load configuration
@@ -39,7 +54,7 @@ def main():
             )
 
     # Run the agent
-    run_agent(ConfiguredOrchestratorWorkflow, config_path)
+    OrchestratorRunner(ConfiguredOrchestratorWorkflow, config_path).run()
 
 
 if __name__ == "__main__":
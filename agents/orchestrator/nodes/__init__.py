@@ -19,6 +19,7 @@ from .escalate_node import escalate_node
 from .close_node import close_node
 
 from .conditions import (
+    check_resume,
     check_flapping,
     check_services_affected,
     check_path_found,
@@ -45,6 +46,7 @@ __all__ = [
     "escalate_node",
     "close_node",
     # Conditions
+    "check_resume",
     "check_flapping",
     "check_services_affected",
     "check_path_found",
@@ -9,7 +9,7 @@ from typing import Any
 import structlog
 
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change
 
 logger = structlog.get_logger(__name__)
@@ -53,7 +53,7 @@ async def assess_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A call
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.append({
         "agent": "service_impact",
         "task_type": "assess_impact",
@@ -62,7 +62,7 @@ async def assess_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates = {
         "current_node": "assess",
-        "nodes_executed": state.get("nodes_executed", []) + ["assess"],
+        "nodes_executed": ["assess"],
         "a2a_tasks_sent": a2a_tasks,
     }
 
@@ -73,7 +73,6 @@ async def assess_node(state: dict[str, Any]) -> dict[str, Any]:
         services_by_tier = result.get("services_by_tier", {})
 
         updates["a2a_responses"] = {
-            **state.get("a2a_responses", {}),
             "service_impact": result,
         }
 
@@ -99,10 +98,11 @@ async def assess_node(state: dict[str, Any]) -> dict[str, Any]:
         updates["services_by_tier"] = services_by_tier
 
         # Update Redis
-        await update_incident(
+        await transition_status(
             incident_id=incident_id,
+            to_status="assessing",
+            from_statuses=["detecting"],
             updates={
-                "status": "assessing",
                 "affected_services": all_affected_services,
                 "total_affected": total_affected,
                 "services_by_tier": services_by_tier,
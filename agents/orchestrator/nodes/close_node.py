@@ -9,8 +9,9 @@ from typing import Any
 from datetime import datetime, timezone
 import structlog
 
-from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..schemas.state import OPEN_STATUSES
+from ..tools.outbox import enqueue_agent_task
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_ticket_closed
 
 logger = structlog.get_logger(__name__)
@@ -75,10 +76,10 @@ async def close_node(state: dict[str, Any]) -> dict[str, Any]:
     }
 
     # Track A2A calls
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
 
     # Send closure notification
-    notify_result = await call_agent(
+    notify_result = enqueue_agent_task(
         agent_name="notification",
         task_type="send_notification",
         payload={
@@ -98,7 +99,7 @@ async def close_node(state: dict[str, Any]) -> dict[str, Any]:
     })
 
     # Log final audit event
-    audit_result = await call_agent(
+    audit_result = enqueue_agent_task(
         agent_name="audit",
         task_type="log_event",
         payload={
@@ -119,10 +120,11 @@ async def close_node(state: dict[str, Any]) -> dict[str, Any]:
     })
 
     # Update Redis with final state
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="closed",
+        from_statuses=[*OPEN_STATUSES, "escalated", "closed"],
         updates={
-            "status": "closed",
             "final_status": final_status,
             "close_reason": close_reason,
             "closed_at": datetime.now(timezone.utc).isoformat(),
@@ -149,7 +151,7 @@ async def close_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "close",
-        "nodes_executed": state.get("nodes_executed", []) + ["close"],
+        "nodes_executed": ["close"],
         "status": "closed",
         "final_status": final_status,
         "close_reason": close_reason,
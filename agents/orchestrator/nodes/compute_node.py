@@ -5,15 +5,21 @@ Call Path Computation Agent to find alternate path.
 From DESIGN.md: compute -> provision | escalate
 """
 
+import os
 from typing import Any
 import structlog
 
+from agent_template.tools.tunnel_registry import get_tunnel_registry
+
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change
 
 logger = structlog.get_logger(__name__)
 
+# Top-k candidate paths requested for dry-run screening at provision time
+CANDIDATE_PATHS = int(os.getenv("PROVISION_CANDIDATE_PATHS", "3"))
+
 
 async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
     """
@@ -21,9 +27,12 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
 
     Actions:
     1. Determine highest priority service (by SLA tier)
-    2. Call Path Computation Agent with constraints
-    3. If path found, route to provision
-    4. If no path, route to escalate
+    2. If a shared protection tunnel already avoids the degraded links,
+       reference it and route straight to steer
+    3. Otherwise call Path Computation Agent with constraints, asking for
+       the top-k candidate paths
+    4. If path found, route to provision
+    5. If no path, route to escalate
 
     Args:
         state: Current workflow state
@@ -56,7 +65,7 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "compute",
-            "nodes_executed": state.get("nodes_executed", []) + ["compute"],
+            "nodes_executed": ["compute"],
             "status": "escalated",
             "error_message": "No services to compute path for",
         }
@@ -64,6 +73,55 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
     # Use first (highest priority) service for path computation
     primary_service = sorted_services[0]
 
+    # Reuse a shared protection tunnel when one already fits
+    reused = None
+    registry = get_tunnel_registry()
+    if registry is not None:
+        try:
+            reused = await registry.claim(
+                incident_id=incident_id,
+                head_end=primary_service.get("source_pe"),
+                end_point=primary_service.get("destination_pe"),
+                te_type=primary_service.get("current_path_type"),
+                avoid=degraded_links,
+                bandwidth_mbps=primary_service.get("committed_bandwidth_mbps") or 0.0,
+            )
+        except Exception as e:
+            logger.warning("Tunnel registry lookup failed", incident_id=incident_id, error=str(e))
+
+    if reused:
+        await transition_status(
+            incident_id=incident_id,
+            to_status="steering",
+            from_statuses=["assessing"],
+            updates={
+                "primary_service": primary_service,
+                "alternate_path": reused["path"],
+                "tunnel_id": reused["tunnel_id"],
+                "binding_sid": reused["binding_sid"],
+                "te_type": reused["te_type"],
+                "tunnel_reused": True,
+            },
+        )
+        await notify_phase_change(
+            incident_id=incident_id,
+            status="computing",
+            message=f"Reusing shared protection tunnel {reused['tunnel_id']}, steering traffic",
+            details={"tunnel_id": reused["tunnel_id"], "binding_sid": reused["binding_sid"]},
+            correlation_id=state.get("correlation_id"),
+        )
+        return {
+            "current_node": "compute",
+            "nodes_executed": ["compute"],
+            "primary_service": primary_service,
+            "alternate_path": reused["path"],
+            "tunnel_id": reused["tunnel_id"],
+            "binding_sid": reused["binding_sid"],
+            "te_type": reused["te_type"],
+            "tunnel_reused": True,
+            "status": "steering",
+        }
+
     # Call Path Computation Agent
     compute_result = await call_agent(
         agent_name="path_computation",
@@ -75,13 +133,14 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
             "degraded_links": degraded_links,
             "service_sla_tier": primary_service.get("sla_tier"),
             "current_te_type": primary_service.get("current_path_type"),
+            "candidate_count": CANDIDATE_PATHS,
         },
         incident_id=incident_id,
         timeout=60.0,
     )
 
     # Track A2A call
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.append({
         "agent": "path_computation",
         "task_type": "compute_path",
@@ -90,7 +149,7 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates = {
         "current_node": "compute",
-        "nodes_executed": state.get("nodes_executed", []) + ["compute"],
+        "nodes_executed": ["compute"],
         "a2a_tasks_sent": a2a_tasks,
         "primary_service": primary_service,
     }
@@ -100,20 +159,22 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
         path_found = result.get("path_found", False)
 
         updates["a2a_responses"] = {
-            **state.get("a2a_responses", {}),
             "path_computation": result,
         }
 
         if path_found:
             alternate_path = result.get("path")
             updates["alternate_path"] = alternate_path
+            updates["candidate_paths"] = result.get("candidates") or []
             updates["status"] = "provisioning"
 
             # Update Redis
-            await update_incident(
+            await transition_status(
                 incident_id=incident_id,
+                to_status="provisioning",
+                from_statuses=["assessing"],
                 updates={
-                    "status": "provisioning",
+                    "primary_service": primary_service,
                     "alternate_path": alternate_path,
                 },
             )
@@ -142,10 +203,11 @@ async def compute_node(state: dict[str, Any]) -> dict[str, Any]:
             updates["status"] = "escalated"
             updates["escalate_reason"] = "no_alternate_path"
 
-            await update_incident(
+            await transition_status(
                 incident_id=incident_id,
+                to_status="escalated",
+                from_statuses=["assessing"],
                 updates={
-                    "status": "escalated",
                     "escalate_reason": "no_alternate_path",
                 },
             )
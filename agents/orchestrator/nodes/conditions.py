@@ -8,6 +8,38 @@ Based on DESIGN.md state transitions.
 from typing import Literal
 
 
+def check_resume(state: dict) -> Literal["start", "provision", "steer", "monitor", "escalate", "close"]:
+    """
+    Entry routing.
+
+    START -> start for a new incident. An incident taken over from a dead
+    replica resumes from its stored status, so a tunnel that was already
+    provisioned or steered onto is not provisioned again:
+    provisioning -> provision (steer if the tunnel exists), steering ->
+    steer, monitoring/restoring -> monitor (the Restoration Monitor owns
+    cutover progress), escalated -> escalate, closed -> close.
+    Earlier statuses changed nothing on the network and start over.
+    """
+    if not state.get("resumed"):
+        return "start"
+
+    status = state.get("status")
+    tunnel_id = state.get("tunnel_id")
+    if status == "provisioning":
+        if tunnel_id:
+            return "steer"
+        return "provision" if state.get("alternate_path") else "start"
+    if status == "steering" and tunnel_id:
+        return "monitor" if state.get("steering_active") else "steer"
+    if status in ("monitoring", "restoring") and tunnel_id:
+        return "monitor"
+    if status == "escalated":
+        return "escalate"
+    if status == "closed":
+        return "close"
+    return "start"
+
+
 def check_flapping(state: dict) -> Literal["dampen", "assess"]:
     """
     Check if link is flapping.
@@ -36,13 +68,16 @@ def check_services_affected(state: dict) -> Literal["compute", "close"]:
     return "compute"
 
 
-def check_path_found(state: dict) -> Literal["provision", "escalate"]:
+def check_path_found(state: dict) -> Literal["provision", "steer", "escalate"]:
     """
     Check if alternate path was found.
 
     compute -> escalate (if no path)
+    compute -> steer (if an existing shared tunnel was reused)
     compute -> provision (if path found)
     """
+    if state.get("tunnel_reused") and state.get("tunnel_id"):
+        return "steer"
     alternate_path = state.get("alternate_path")
     if alternate_path:
         return "provision"
@@ -10,7 +10,7 @@ from typing import Any
 from datetime import datetime, timedelta, timezone
 import structlog
 
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 
 logger = structlog.get_logger(__name__)
 
@@ -54,10 +54,11 @@ async def dampen_node(state: dict[str, Any]) -> dict[str, Any]:
 
     # Update Redis with dampen info
     dampen_until = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="dampening",
+        from_statuses=["detecting", "dampening"],
         updates={
-            "status": "dampening",
             "dampen_count": dampen_count + 1,
             "dampen_until": dampen_until.isoformat(),
         },
@@ -74,7 +75,7 @@ async def dampen_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "dampen",
-        "nodes_executed": state.get("nodes_executed", []) + ["dampen"],
+        "nodes_executed": ["dampen"],
         "status": "detecting",
         "dampen_count": dampen_count + 1,
         "dampen_until": None,  # Clear dampen
@@ -8,7 +8,7 @@ From DESIGN.md: detect -> assess | dampen
 from typing import Any
 import structlog
 
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change
 
 logger = structlog.get_logger(__name__)
@@ -42,10 +42,11 @@ async def detect_node(state: dict[str, Any]) -> dict[str, Any]:
     alert_count = correlator_response.get("alert_count", 1)
 
     # Update Redis state
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="detecting",
+        from_statuses=["detecting", "dampening"],
         updates={
-            "status": "detecting",
             "is_flapping": is_flapping,
             "alert_count": alert_count,
         },
@@ -53,7 +54,7 @@ async def detect_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates = {
         "current_node": "detect",
-        "nodes_executed": state.get("nodes_executed", []) + ["detect"],
+        "nodes_executed": ["detect"],
         "is_flapping": is_flapping,
         "alert_count": alert_count,
     }
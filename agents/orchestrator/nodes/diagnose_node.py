@@ -60,7 +60,7 @@ async def diagnose_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates: dict[str, Any] = {
         "current_node": "diagnose",
-        "nodes_executed": state.get("nodes_executed", []) + ["diagnose"],
+        "nodes_executed": ["diagnose"],
     }
 
     # --- Case 1: Link already known (P-to-P session, not overlay) ---
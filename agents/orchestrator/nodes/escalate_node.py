@@ -10,10 +10,11 @@ from typing import Any
 import structlog
 
 from agent_template.chains.llm_factory import get_llm
-from langchain_core.messages import HumanMessage
+from agent_template.chains.llm_cache import get_llm_cache, fingerprint
 
-from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..schemas.state import OPEN_STATUSES
+from ..tools.outbox import enqueue_agent_task
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change, notify_error
 
 # Import notification clients for direct team escalation (GAP 13)
@@ -39,7 +40,6 @@ LLM_TRIGGERS = [
 
 ESCALATE_PROMPT = """You are a network operations expert analyzing an incident that requires escalation.
 
-Incident ID: {incident_id}
 Escalation Reason: {escalate_reason}
 
 Current State:
@@ -67,6 +67,56 @@ REASONING: <your reasoning>
 CONFIDENCE: <level>
 """
 
+# Used when the LLM fails or exceeds its latency budget: (action, reasoning)
+RULE_BASED_DECISIONS = {
+    "no_alternate_path": ("MANUAL_INTERVENTION", "No alternate path exists; NOC must restore capacity."),
+    "cascading_failure": ("MANUAL_INTERVENTION", "Multiple dependent failures need operator triage."),
+    "tunnel_provision_failed_3x": ("MANUAL_INTERVENTION", "Provisioning failed repeatedly; check CNC/NSO."),
+    "conflicting_constraints": ("RETRY_DIFFERENT_PATH", "Constraints conflict; retry with relaxed constraints."),
+    "unknown_te_type": ("MANUAL_INTERVENTION", "TE type is not supported by automated protection."),
+}
+
+
+def _escalation_fingerprint(escalate_reason: str, state: dict[str, Any]) -> str:
+    """
+    Cache key of an escalation analysis. Incidents of one storm share the
+    reason, link set, severity, error and scale of impact, so they share one
+    LLM call. Covers every prompt field; the prompt carries no incident_id.
+    """
+    links = sorted({
+        link.get("link_id", str(link)) if isinstance(link, dict) else str(link)
+        for link in state.get("degraded_links", [])
+    })
+    severity = state.get("severity", "unknown")
+    severity_bucket = severity if severity in ("critical", "major") else "other"
+    retry_bucket = min(int(state.get("retry_count", 0) or 0), 3)
+    services = len(state.get("affected_services", []))
+    # 0, 1-9, 10-99, 100+
+    services_bucket = min(len(str(services)), 3) if services else 0
+    error_message = state.get("error_message", "") or ""
+    return fingerprint(
+        "escalate",
+        escalate_reason,
+        links,
+        severity_bucket,
+        retry_bucket,
+        services_bucket,
+        error_message,
+    )
+
+
+def _parse_decision(response_text: str) -> tuple[str, str, str]:
+    """(recommended_action, reasoning, confidence) from the LLM response"""
+    recommended_action, reasoning, confidence = "MANUAL_INTERVENTION", None, "medium"
+    for line in response_text.strip().split("\n"):
+        if line.startswith("DECISION:"):
+            recommended_action = line.replace("DECISION:", "").strip()
+        elif line.startswith("REASONING:"):
+            reasoning = line.replace("REASONING:", "").strip()
+        elif line.startswith("CONFIDENCE:"):
+            confidence = line.replace("CONFIDENCE:", "").strip().lower()
+    return recommended_action, reasoning, confidence
+
 
 async def _route_escalation_to_teams(state: dict[str, Any]) -> tuple[bool, list[str]]:
     """
@@ -280,52 +330,52 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
     recommended_action = "MANUAL_INTERVENTION"
     confidence = "medium"
 
+    analysis_source = None
+
     if use_llm:
-        try:
-            llm = get_llm()
+        prompt = ESCALATE_PROMPT.format(
+            escalate_reason=escalate_reason,
+            degraded_links=state.get("degraded_links", []),
+            affected_services_count=len(state.get("affected_services", [])),
+            severity=state.get("severity", "unknown"),
+            retry_count=state.get("retry_count", 0),
+            error_message=error_message,
+        )
 
-            prompt = ESCALATE_PROMPT.format(
-                incident_id=incident_id,
-                escalate_reason=escalate_reason,
-                degraded_links=state.get("degraded_links", []),
-                affected_services_count=len(state.get("affected_services", [])),
-                severity=state.get("severity", "unknown"),
-                retry_count=state.get("retry_count", 0),
-                error_message=error_message,
-            )
+        async def analyze() -> tuple[str, str, str]:
+            # Deferred: only escalations that reach the LLM load langchain
+            from langchain_core.messages import HumanMessage
 
-            response = await llm.ainvoke([HumanMessage(content=prompt)])
+            response = await get_llm().ainvoke([HumanMessage(content=prompt)])
             response_text = response.content if hasattr(response, "content") else str(response)
+            return _parse_decision(response_text)
 
-            # Parse LLM response
-            lines = response_text.strip().split("\n")
-            for line in lines:
-                if line.startswith("DECISION:"):
-                    recommended_action = line.replace("DECISION:", "").strip()
-                elif line.startswith("REASONING:"):
-                    llm_reasoning = line.replace("REASONING:", "").strip()
-                elif line.startswith("CONFIDENCE:"):
-                    confidence = line.replace("CONFIDENCE:", "").strip().lower()
-
-            logger.info(
-                "LLM escalation analysis complete",
-                incident_id=incident_id,
-                recommended_action=recommended_action,
-                confidence=confidence,
+        def rule_based() -> tuple[str, str, str]:
+            action, reasoning = RULE_BASED_DECISIONS.get(
+                escalate_reason, ("MANUAL_INTERVENTION", "No rule for this escalation reason.")
             )
+            return action, f"Rule-based fallback: {reasoning}", "low"
 
-        except Exception as e:
-            logger.exception(
-                "LLM analysis failed, defaulting to manual intervention",
-                incident_id=incident_id,
-            )
-            llm_reasoning = f"LLM analysis failed: {str(e)}"
+        # Incidents with the same fingerprint (e.g. one storm) share one LLM call
+        (recommended_action, llm_reasoning, confidence), analysis_source = await get_llm_cache().get_or_call(
+            _escalation_fingerprint(escalate_reason, state),
+            analyze,
+            fallback=rule_based,
+        )
+
+        logger.info(
+            "LLM escalation analysis complete",
+            incident_id=incident_id,
+            recommended_action=recommended_action,
+            confidence=confidence,
+            source=analysis_source,
+        )
 
     # GAP 13: Route escalation to optical team or CNC product team
     escalation_sent, escalation_channels = await _route_escalation_to_teams(state)
 
     # Notify about escalation
-    notify_result = await call_agent(
+    notify_result = enqueue_agent_task(
         agent_name="notification",
         task_type="send_notification",
         payload={
@@ -345,7 +395,7 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Log escalation event
-    audit_result = await call_agent(
+    audit_result = enqueue_agent_task(
         agent_name="audit",
         task_type="log_event",
         payload={
@@ -356,6 +406,7 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
                 "recommended_action": recommended_action,
                 "llm_reasoning": llm_reasoning,
                 "confidence": confidence,
+                "analysis_source": analysis_source,
             },
             "previous_state": state.get("status"),
             "new_state": "escalated",
@@ -365,7 +416,7 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A calls
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.extend([
         {
             "agent": "notification",
@@ -380,10 +431,11 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
     ])
 
     # Update Redis
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="escalated",
+        from_statuses=[*OPEN_STATUSES, "escalated"],
         updates={
-            "status": "escalated",
             "escalate_reason": escalate_reason,
             "recommended_action": recommended_action,
             "llm_reasoning": llm_reasoning,
@@ -393,7 +445,7 @@ async def escalate_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "escalate",
-        "nodes_executed": state.get("nodes_executed", []) + ["escalate"],
+        "nodes_executed": ["escalate"],
         "status": "escalated",
         "escalate_reason": escalate_reason,
         "recommended_action": recommended_action,
@@ -8,8 +8,9 @@ From DESIGN.md: monitor -> restore | monitor (continue)
 from typing import Any
 import structlog
 
+from agent_template.tools.tunnel_registry import get_tunnel_registry
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change, notify_error
 
 logger = structlog.get_logger(__name__)
@@ -20,10 +21,12 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
     Monitor Node - Call Restoration Monitor Agent.
 
     Actions:
-    1. Call Restoration Monitor Agent
-    2. Check if original path SLA has recovered
-    3. If recovered, route to restore
-    4. If not recovered, stay in monitor
+    1. Refresh the tunnel registry TTL so a shared tunnel outlives
+       incidents that monitor longer than the TTL
+    2. Call Restoration Monitor Agent
+    3. Check if original path SLA has recovered
+    4. If recovered, route to restore
+    5. If not recovered, stay in monitor
 
     Args:
         state: Current workflow state
@@ -51,6 +54,14 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
         details={"tunnel_id": tunnel_id, "cutover_mode": cutover_mode},
     )
 
+    registry = get_tunnel_registry()
+    if tunnel_id and registry is not None:
+        try:
+            if not await registry.refresh(tunnel_id):
+                logger.warning("Tunnel missing from registry", incident_id=incident_id, tunnel_id=tunnel_id)
+        except Exception as e:
+            logger.warning("Tunnel registry refresh failed", incident_id=incident_id, error=str(e))
+
     # Call Restoration Monitor Agent
     monitor_result = await call_agent(
         agent_name="restoration_monitor",
@@ -71,7 +82,7 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A call
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.append({
         "agent": "restoration_monitor",
         "task_type": "monitor_restoration",
@@ -80,7 +91,7 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates = {
         "current_node": "monitor",
-        "nodes_executed": state.get("nodes_executed", []) + ["monitor"],
+        "nodes_executed": ["monitor"],
         "a2a_tasks_sent": a2a_tasks,
     }
 
@@ -89,7 +100,6 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
         restored = result.get("restored", False)
 
         updates["a2a_responses"] = {
-            **state.get("a2a_responses", {}),
             "restoration_monitor": result,
         }
 
@@ -100,10 +110,11 @@ async def monitor_node(state: dict[str, Any]) -> dict[str, Any]:
             updates["cutover_mode"] = result.get("cutover_mode", cutover_mode)
 
             # Update Redis
-            await update_incident(
+            await transition_status(
                 incident_id=incident_id,
+                to_status="restoring",
+                from_statuses=["monitoring", "restoring"],
                 updates={
-                    "status": "restoring",
                     "sla_recovered": True,
                     "hold_timer_start": result.get("hold_timer_start"),
                 },
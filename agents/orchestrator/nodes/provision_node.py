@@ -8,9 +8,12 @@ From DESIGN.md: provision -> steer | escalate
 from typing import Any
 import structlog
 
+from agent_template.tools.tunnel_registry import get_tunnel_registry
+
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change, notify_error
+from .steer_node import steering_params
 
 logger = structlog.get_logger(__name__)
 
@@ -20,8 +23,10 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
     Provision Node - Call Tunnel Provisioning Agent.
 
     Actions:
-    1. Call Tunnel Provisioning Agent with computed path
-    2. If successful, get tunnel_id and binding_sid
+    1. Call Tunnel Provisioning Agent with the computed path and the top-k
+       candidates, which it dry-runs before committing the first that passes
+    2. If successful, get tunnel_id and binding_sid and register the
+       tunnel for reuse by later incidents
     3. If failed, check retry count and escalate if exceeded
 
     Args:
@@ -42,6 +47,15 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
         retry_count=retry_count,
     )
 
+    registry = get_tunnel_registry()
+
+    # Steering onto a reused tunnel failed: drop that reference first
+    if state.get("tunnel_reused") and state.get("tunnel_id") and registry is not None:
+        try:
+            await registry.release(state["tunnel_id"], incident_id)
+        except Exception as e:
+            logger.warning("Tunnel registry release failed", incident_id=incident_id, error=str(e))
+
     # Determine TE type from path or service
     te_type = alternate_path.get("path_type") or primary_service.get("current_path_type", "sr-mpls")
 
@@ -53,17 +67,18 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
             "incident_id": incident_id,
             "service_id": primary_service.get("service_id"),
             "te_type": te_type,
-            "head_end": primary_service.get("source_pe"),
-            "end_point": primary_service.get("destination_pe"),
             "computed_path": alternate_path,
+            "candidate_paths": state.get("candidate_paths") or [],
+            "bandwidth_mbps": primary_service.get("committed_bandwidth_mbps"),
             "path_type": "explicit",
+            **steering_params(state),
         },
         incident_id=incident_id,
         timeout=60.0,
     )
 
     # Track A2A call
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.append({
         "agent": "tunnel_provisioning",
         "task_type": "provision_tunnel",
@@ -72,8 +87,9 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
 
     updates = {
         "current_node": "provision",
-        "nodes_executed": state.get("nodes_executed", []) + ["provision"],
+        "nodes_executed": ["provision"],
         "a2a_tasks_sent": a2a_tasks,
+        "tunnel_reused": False,
     }
 
     if provision_result.get("success"):
@@ -81,30 +97,51 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
         provision_success = result.get("success", False)
 
         updates["a2a_responses"] = {
-            **state.get("a2a_responses", {}),
             "tunnel_provisioning": result,
         }
 
         if provision_success:
             tunnel_id = result.get("tunnel_id")
             binding_sid = result.get("binding_sid")
+            # The committed candidate may not be the best computed path
+            alternate_path = result.get("computed_path") or alternate_path
 
+            updates["alternate_path"] = alternate_path
             updates["tunnel_id"] = tunnel_id
             updates["binding_sid"] = binding_sid
             updates["te_type"] = result.get("te_type", te_type)
             updates["status"] = "steering"
 
             # Update Redis
-            await update_incident(
+            await transition_status(
                 incident_id=incident_id,
+                to_status="steering",
+                from_statuses=["provisioning", "steering"],
                 updates={
-                    "status": "steering",
                     "tunnel_id": tunnel_id,
                     "binding_sid": binding_sid,
                     "te_type": result.get("te_type", te_type),
+                    "alternate_path": alternate_path,
                 },
             )
 
+            if registry is not None and tunnel_id:
+                try:
+                    await registry.register(
+                        tunnel_id=tunnel_id,
+                        incident_id=incident_id,
+                        head_end=primary_service.get("source_pe"),
+                        end_point=primary_service.get("destination_pe"),
+                        te_type=result.get("te_type", te_type),
+                        avoid=state.get("degraded_links", []),
+                        capacity_mbps=(alternate_path.get("min_available_bandwidth_gbps") or 0.0) * 1000 or None,
+                        bandwidth_mbps=primary_service.get("committed_bandwidth_mbps") or 0.0,
+                        binding_sid=binding_sid,
+                        path=alternate_path,
+                    )
+                except Exception as e:
+                    logger.warning("Tunnel registry update failed", incident_id=incident_id, error=str(e))
+
             logger.info(
                 "Tunnel provisioned successfully",
                 incident_id=incident_id,
@@ -138,10 +175,11 @@ async def provision_node(state: dict[str, Any]) -> dict[str, Any]:
                 updates["status"] = "escalated"
                 updates["escalate_reason"] = "tunnel_provision_failed_3x"
 
-                await update_incident(
+                await transition_status(
                     incident_id=incident_id,
+                    to_status="escalated",
+                    from_statuses=["provisioning", "steering"],
                     updates={
-                        "status": "escalated",
                         "escalate_reason": "tunnel_provision_failed_3x",
                     },
                 )
@@ -8,8 +8,11 @@ From DESIGN.md: restore -> close
 from typing import Any
 import structlog
 
+from agent_template.tools.tunnel_registry import get_tunnel_registry
+
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.outbox import enqueue_agent_task
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change
 
 logger = structlog.get_logger(__name__)
@@ -21,7 +24,8 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
 
     Actions:
     1. Execute cutover (immediate or gradual)
-    2. Call Tunnel Provisioning to delete protection tunnel
+    2. Release the incident's tunnel reference; call Tunnel Provisioning
+       to delete the protection tunnel once no incident uses it
     3. Notify about restoration
     4. Route to close
 
@@ -52,7 +56,7 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A calls
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
 
     # If gradual cutover, check progress from restoration monitor
     restoration_response = state.get("a2a_responses", {}).get("restoration_monitor", {})
@@ -67,13 +71,29 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "restore",
-            "nodes_executed": state.get("nodes_executed", []) + ["restore"],
+            "nodes_executed": ["restore"],
             "status": "restoring",
             "cutover_progress": cutover_progress,
         }
 
-    # Cutover complete, delete protection tunnel
-    if tunnel_id:
+    # Cutover complete, delete protection tunnel unless other incidents share it
+    remaining_refs = None
+    registry = get_tunnel_registry()
+    if tunnel_id and registry is not None:
+        try:
+            remaining_refs = await registry.release(tunnel_id, incident_id)
+        except Exception as e:
+            logger.warning("Tunnel registry release failed", incident_id=incident_id, error=str(e))
+
+    tunnel_deleted = not remaining_refs
+    if remaining_refs:
+        logger.info(
+            "Protection tunnel still shared, keeping it",
+            incident_id=incident_id,
+            tunnel_id=tunnel_id,
+            remaining_refs=remaining_refs,
+        )
+    elif tunnel_id:
         delete_result = await call_agent(
             agent_name="tunnel_provisioning",
             task_type="delete_tunnel",
@@ -100,7 +120,7 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
             )
 
     # Notify about restoration
-    notify_result = await call_agent(
+    notify_result = enqueue_agent_task(
         agent_name="notification",
         task_type="send_notification",
         payload={
@@ -124,7 +144,7 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
     })
 
     # Log restoration event
-    audit_result = await call_agent(
+    audit_result = enqueue_agent_task(
         agent_name="audit",
         task_type="log_event",
         payload={
@@ -132,7 +152,7 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
             "event_type": "restoration_complete",
             "data": {
                 "tunnel_id": tunnel_id,
-                "tunnel_deleted": True,
+                "tunnel_deleted": tunnel_deleted,
                 "cutover_mode": cutover_mode,
             },
             "previous_state": "restoring",
@@ -149,11 +169,12 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
     })
 
     # Update Redis
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="closed",
+        from_statuses=["restoring"],
         updates={
-            "status": "closed",
-            "tunnel_deleted": True,
+            "tunnel_deleted": tunnel_deleted,
             "restoration_complete": True,
         },
     )
@@ -165,9 +186,9 @@ async def restore_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "restore",
-        "nodes_executed": state.get("nodes_executed", []) + ["restore"],
+        "nodes_executed": ["restore"],
         "status": "closed",
-        "tunnel_deleted": True,
+        "tunnel_deleted": tunnel_deleted,
         "restoration_complete": True,
         "cutover_progress": 100,
         "a2a_tasks_sent": a2a_tasks,
@@ -8,8 +8,9 @@ From DESIGN.md: start -> detect
 from typing import Any
 import structlog
 
+from ..schemas.state import OPEN_STATUSES
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.state_manager import transition_status
 
 logger = structlog.get_logger(__name__)
 
@@ -39,10 +40,11 @@ async def start_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Save initial state to Redis
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="detecting",
+        from_statuses=[None, *OPEN_STATUSES],
         updates={
-            "status": "detecting",
             "alert_type": state.get("alert_type"),
             "degraded_links": state.get("degraded_links"),
             "severity": state.get("severity"),
@@ -65,7 +67,7 @@ async def start_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A call
-    a2a_tasks = state.get("a2a_tasks_sent", [])
+    a2a_tasks = []
     a2a_tasks.append({
         "agent": "event_correlator",
         "task_type": "correlate_alert",
@@ -75,7 +77,7 @@ async def start_node(state: dict[str, Any]) -> dict[str, Any]:
     # Update state with correlation results
     updates = {
         "current_node": "start",
-        "nodes_executed": state.get("nodes_executed", []) + ["start"],
+        "nodes_executed": ["start"],
         "status": "detecting",
         "a2a_tasks_sent": a2a_tasks,
     }
@@ -83,7 +85,6 @@ async def start_node(state: dict[str, Any]) -> dict[str, Any]:
     if correlation_result.get("success"):
         result = correlation_result.get("result", {})
         updates["a2a_responses"] = {
-            **state.get("a2a_responses", {}),
             "event_correlator": result,
         }
         # Update degraded links from correlation if available
@@ -9,19 +9,44 @@ from typing import Any
 import structlog
 
 from ..tools.agent_caller import call_agent
-from ..tools.state_manager import update_incident
+from ..tools.outbox import enqueue_agent_task
+from ..tools.state_manager import transition_status
 from ..tools.io_notifier import notify_phase_change, notify_error
 
 logger = structlog.get_logger(__name__)
 
 
+def steering_params(state: dict[str, Any]) -> dict[str, Any]:
+    """
+    Tunnel Provisioning steering inputs for this incident: the tunnel ends
+    and the VRFs of affected services on the head-end (RSVP-TE steers them
+    explicitly; SR steers by color/ODN).
+    """
+    primary_service = state.get("primary_service") or {}
+    head_end = primary_service.get("source_pe")
+    end_point = primary_service.get("destination_pe")
+    vrfs = sorted({
+        s.get("vrf_name") or s.get("service_id")
+        for s in state.get("affected_services", [])
+        if s.get("source_pe", head_end) == head_end and (s.get("vrf_name") or s.get("service_id"))
+    })
+    return {
+        "head_end": head_end,
+        "end_point": end_point,
+        "affected_vrfs": vrfs,
+        "tunnel_endpoint_ip": primary_service.get("destination_pe_ip") or end_point,
+    }
+
+
 async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Steer Node - Activate traffic steering.
 
     Actions:
     1. Verify tunnel is operationally up
-    2. Activate traffic steering (BGP Color/ODN)
+    2. Activate traffic steering (BGP Color/ODN). A reused shared tunnel
+       was steered for the incident that provisioned it, so this
+       incident's VRFs are attached through Tunnel Provisioning first
     3. Notify about protection activation
     4. Route to monitor node
 
@@ -63,13 +88,58 @@ async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "steer",
-            "nodes_executed": state.get("nodes_executed", []) + ["steer"],
+            "nodes_executed": ["steer"],
             "status": "provisioning",  # Go back to provision
             "error_message": "No tunnel available for steering",
         }
 
+    a2a_tasks = []
+
+    if state.get("tunnel_reused"):
+        steer_result = await call_agent(
+            agent_name="tunnel_provisioning",
+            task_type="steer_traffic",
+            payload={
+                "incident_id": incident_id,
+                "tunnel_id": tunnel_id,
+                "te_type": state.get("te_type"),
+                **steering_params(state),
+            },
+            incident_id=incident_id,
+            timeout=30.0,
+        )
+        steered = steer_result.get("success") and steer_result.get("result", {}).get("traffic_steered")
+        a2a_tasks.append({
+            "agent": "tunnel_provisioning",
+            "task_type": "steer_traffic",
+            "success": bool(steered),
+        })
+        if not steered:
+            error = steer_result.get("error") or steer_result.get("result", {}).get("error")
+            logger.warning(
+                "Steering onto shared tunnel failed, provisioning a dedicated one",
+                incident_id=incident_id,
+                tunnel_id=tunnel_id,
+                error=error,
+            )
+            await notify_error(
+                incident_id=incident_id,
+                error_type="steering_failed",
+                error_message=f"Steering onto shared tunnel {tunnel_id} failed: {error}",
+                recoverable=True,
+            )
+            # provision releases the shared reference before provisioning
+            return {
+                "current_node": "steer",
+                "nodes_executed": ["steer"],
+                "status": "provisioning",
+                "steering_active": False,
+                "error_message": f"Steering onto shared tunnel failed: {error}",
+                "a2a_tasks_sent": a2a_tasks,
+            }
+
     # Call Notification Agent to inform about protection activation
-    notify_result = await call_agent(
+    notify_result = enqueue_agent_task(
         agent_name="notification",
         task_type="send_notification",
         payload={
@@ -88,7 +158,7 @@ async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Call Audit Agent to log the event
-    audit_result = await call_agent(
+    audit_result = enqueue_agent_task(
         agent_name="audit",
         task_type="log_event",
         payload={
@@ -107,7 +177,6 @@ async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     # Track A2A calls
-    a2a_tasks = state.get("a2a_tasks_sent", [])
     a2a_tasks.extend([
         {
             "agent": "notification",
@@ -122,10 +191,11 @@ async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
     ])
 
     # Update Redis
-    await update_incident(
+    await transition_status(
         incident_id=incident_id,
+        to_status="monitoring",
+        from_statuses=["provisioning", "steering"],
         updates={
-            "status": "monitoring",
             "steering_active": True,
         },
     )
@@ -138,7 +208,7 @@ async def steer_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "steer",
-        "nodes_executed": state.get("nodes_executed", []) + ["steer"],
+        "nodes_executed": ["steer"],
         "status": "monitoring",
         "steering_active": True,
         "a2a_tasks_sent": a2a_tasks,
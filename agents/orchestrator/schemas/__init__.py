@@ -2,11 +2,12 @@
 Orchestrator Agent Schemas
 """
 
-from .state import OrchestratorState, IncidentStatus, AlertType, Severity, CutoverMode
+from .state import OrchestratorState, IncidentStatus, OPEN_STATUSES, AlertType, Severity, CutoverMode
 
 __all__ = [
     "OrchestratorState",
     "IncidentStatus",
+    "OPEN_STATUSES",
     "AlertType",
     "Severity",
     "CutoverMode",
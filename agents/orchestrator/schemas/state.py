@@ -4,9 +4,11 @@ Orchestrator Agent State Schema
 Based on DESIGN.md - LangGraph State Schema for Orchestrator Agent.
 """
 
-from typing import Any, TypedDict, Optional, Literal, List
+from typing import Annotated, Any, TypedDict, Optional, Literal, List, get_args
 from enum import Enum
 
+from agent_template.schemas.state import append_history, merge_dicts
+
 
 # Status values as per DESIGN.md
 IncidentStatus = Literal[
@@ -22,6 +24,11 @@ IncidentStatus = Literal[
     "dampening",
 ]
 
+# Statuses an incident is in until it is escalated or closed
+OPEN_STATUSES: tuple[str, ...] = tuple(
+    status for status in get_args(IncidentStatus) if status not in ("closed", "escalated")
+)
+
 AlertType = Literal["pca_sla", "cnc_alarm", "proactive"]
 
 Severity = Literal["critical", "major", "minor", "warning"]
@@ -54,10 +61,15 @@ class OrchestratorState(TypedDict, total=False):
     affected_services: List[dict]
 
     # ============== Protection Path ==============
+    # Highest-tier affected service the path is computed for
+    primary_service: Optional[dict]
     # {path_id, segments, te_type, metrics}
     alternate_path: Optional[dict]
+    candidate_paths: List[dict]  # Top-k from Path Computation, best first
     tunnel_id: Optional[str]
     binding_sid: Optional[int]
+    tunnel_reused: bool  # Steering onto a shared tunnel from the registry
+    steering_active: bool
 
     # ============== Restoration ==============
     hold_timer_start: Optional[str]  # ISO timestamp
@@ -70,21 +82,43 @@ class OrchestratorState(TypedDict, total=False):
     max_retries: int
     error_message: Optional[str]
     llm_reasoning: Optional[str]  # For edge cases
+    resumed: bool  # Taken over from another replica; see check_resume
 
     # ============== Execution Tracking (from template) ==============
     current_node: str
-    nodes_executed: List[str]
+    # Reducer fields: nodes return only what they add. The monitor and
+    # restore loops can run hundreds of steps; history stays capped.
+    nodes_executed: Annotated[List[str], append_history]
     started_at: str
 
     # ============== A2A Communication ==============
-    a2a_tasks_sent: List[dict]
-    a2a_responses: dict
+    a2a_tasks_sent: Annotated[List[dict], append_history]
+    a2a_responses: Annotated[dict, merge_dicts]  # Latest response per agent
 
     # ============== Final Result ==============
     result: Optional[dict]
     final_status: str  # success, failed, escalated
 
 
+# Stored incident fields a taken-over incident resumes with
+RESUME_FIELDS = (
+    "status",
+    "degraded_links",
+    "severity",
+    "affected_services",
+    "total_affected",
+    "primary_service",
+    "alternate_path",
+    "tunnel_id",
+    "binding_sid",
+    "te_type",
+    "tunnel_reused",
+    "steering_active",
+    "escalate_reason",
+    "dampen_count",
+)
+
+
 def create_initial_state(
     task_id: str,
     incident_id: str,
@@ -124,8 +158,10 @@ def create_initial_state(
         affected_services=[],
         # Protection path (populated by compute/provision nodes)
         alternate_path=None,
+        candidate_paths=[],
         tunnel_id=None,
         binding_sid=None,
+        tunnel_reused=False,
         # Restoration
         hold_timer_start=None,
         sla_recovered=False,
@@ -136,6 +172,7 @@ def create_initial_state(
         max_retries=3,
         error_message=None,
         llm_reasoning=None,
+        resumed=False,
         # Execution tracking
         current_node="start",
         nodes_executed=[],
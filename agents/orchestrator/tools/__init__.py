@@ -1,15 +1,26 @@
 """
 Orchestrator Agent Tools
 
-Tools for A2A calls, Redis state management, and IO Agent notifications.
+Tools for A2A calls, Redis state management, and IO Agent notifications
+delivered through the side-channel outbox.
 """
 
 from .agent_caller import call_agent, AgentCallerTool
 from .state_manager import (
     get_incident,
     update_incident,
+    transition_status,
+    StatusConflictError,
     StateManagerTool,
 )
+from .incident_lease import (
+    HashRing,
+    IncidentCoordinator,
+    Lease,
+    LeaseLostError,
+    get_incident_coordinator,
+)
+from .outbox import SideChannelOutbox, get_outbox, enqueue_agent_task
 from .io_notifier import (
     notify_phase_change,
     notify_error,
@@ -21,7 +32,17 @@ __all__ = [
     "AgentCallerTool",
     "get_incident",
     "update_incident",
+    "transition_status",
+    "StatusConflictError",
     "StateManagerTool",
+    "HashRing",
+    "IncidentCoordinator",
+    "Lease",
+    "LeaseLostError",
+    "get_incident_coordinator",
+    "SideChannelOutbox",
+    "get_outbox",
+    "enqueue_agent_task",
     "notify_phase_change",
     "notify_error",
     "notify_ticket_closed",
@@ -0,0 +1,451 @@
+"""
+Incident Leases
+
+Lets several orchestrator replicas share the incident load:
+
+- Each replica heartbeats into a Redis registry; live replicas form a
+  consistent-hash ring and a new incident runs on the ring owner of its
+  incident_id (other replicas forward the handle_alert task there).
+- The replica running an incident holds a Redis lease on it, renewed while
+  the graph runs. Every acquisition bumps a per-incident fencing token and
+  StateManagerTool writes are rejected unless the writer still holds the
+  lease with that token, so a paused replica cannot clobber its successor.
+  A duplicate handle_alert for an incident already running on the replica
+  joins that run instead of re-acquiring the lease.
+- Incidents whose lease expired (replica died) are taken over by their
+  ring owner among the live replicas and resumed from the state stored in
+  orchestrator:incident:{id} (see check_resume).
+
+Disabled unless ORCHESTRATOR_CLUSTER_ENABLED=true; a single replica then
+runs every incident locally, as before.
+"""
+
+import asyncio
+import bisect
+import functools
+import hashlib
+import os
+import socket
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+import structlog
+import redis.asyncio as redis
+
+from agent_template.metrics import httpx_event_hooks, instrument_redis
+
+logger = structlog.get_logger(__name__)
+
+LEASE_PREFIX = "orchestrator:lease:"
+FENCE_PREFIX = "orchestrator:fence:"
+ACTIVE_KEY = "orchestrator:active"
+REPLICAS_KEY = "orchestrator:replicas"
+REPLICA_URLS_KEY = "orchestrator:replica_urls"
+
+# Acquire if free or already ours; the new fencing token is INCR'd atomically
+ACQUIRE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and string.sub(current, 1, string.len(ARGV[1]) + 1) ~= ARGV[1] .. ':' then
+    return 0
+end
+local token = redis.call('INCR', KEYS[2])
+redis.call('SET', KEYS[1], ARGV[1] .. ':' .. token, 'PX', ARGV[2])
+return token
+"""
+
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaseLostError(Exception):
+    """Raised when a write is fenced off because the lease moved"""
+
+
+@dataclass(frozen=True)
+class Lease:
+    incident_id: str
+    replica_id: str
+    token: int
+
+    @property
+    def key(self) -> str:
+        return f"{LEASE_PREFIX}{self.incident_id}"
+
+    @property
+    def value(self) -> str:
+        return f"{self.replica_id}:{self.token}"
+
+
+# Lease held by the incident coroutine running in this context
+current_lease: ContextVar[Optional[Lease]] = ContextVar("orchestrator_incident_lease", default=None)
+
+
+class HashRing:
+    """Consistent hashing of incident IDs onto replicas"""
+
+    def __init__(self, members: list[str], vnodes: int = 64):
+        self.members = sorted(members)
+        self._ring: list[tuple[int, str]] = sorted(
+            (self._hash(f"{member}#{i}"), member)
+            for member in self.members
+            for i in range(vnodes)
+        )
+        self._keys = [point for point, _ in self._ring]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+    def owner(self, incident_id: str) -> Optional[str]:
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._keys, self._hash(incident_id)) % len(self._ring)
+        return self._ring[index][1]
+
+
+class IncidentCoordinator:
+    """
+    Replica membership, incident leases and takeover for the orchestrator.
+
+    Environment variables:
+        ORCHESTRATOR_CLUSTER_ENABLED: Enable multi-replica mode (default false)
+        ORCHESTRATOR_REPLICA_ID: This replica's ID (default hostname)
+        ORCHESTRATOR_ADVERTISE_URL: A2A URL peers forward to (default http://<hostname>:8000)
+        ORCHESTRATOR_LEASE_TTL_SECONDS: Incident lease TTL (default 15)
+        ORCHESTRATOR_HEARTBEAT_SECONDS: Heartbeat / lease renewal interval (default 5)
+        ORCHESTRATOR_TAKEOVER_INTERVAL_SECONDS: Orphaned-incident scan interval (default 10)
+        ORCHESTRATOR_HASH_VNODES: Virtual nodes per replica on the ring (default 64)
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        replica_id: Optional[str] = None,
+        advertise_url: Optional[str] = None,
+        lease_ttl_seconds: Optional[float] = None,
+        heartbeat_seconds: Optional[float] = None,
+        takeover_interval_seconds: Optional[float] = None,
+    ):
+        hostname = socket.gethostname()
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
+        self.replica_id = replica_id or os.getenv("ORCHESTRATOR_REPLICA_ID", hostname)
+        self.advertise_url = advertise_url or os.getenv(
+            "ORCHESTRATOR_ADVERTISE_URL", f"http://{hostname}:8000"
+        )
+        self.lease_ttl = lease_ttl_seconds or float(os.getenv("ORCHESTRATOR_LEASE_TTL_SECONDS", "15"))
+        self.heartbeat_interval = heartbeat_seconds or float(
+            os.getenv("ORCHESTRATOR_HEARTBEAT_SECONDS", "5")
+        )
+        self.takeover_interval = takeover_interval_seconds or float(
+            os.getenv("ORCHESTRATOR_TAKEOVER_INTERVAL_SECONDS", "10")
+        )
+        self.vnodes = int(os.getenv("ORCHESTRATOR_HASH_VNODES", "64"))
+
+        self._client: Optional[redis.Redis] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._scripts: dict[str, Any] = {}
+        self._ring = HashRing([self.replica_id], self.vnodes)
+        self._held: dict[str, tuple[Lease, asyncio.Task]] = {}
+        # Leased run per incident on this replica; duplicates join it
+        self._runs: dict[str, asyncio.Task] = {}
+        self._lost: set[str] = set()
+        self._background: list[asyncio.Task] = []
+        # Strong references to takeover runs until they finish
+        self._takeovers: set[asyncio.Task] = set()
+        self._executor: Optional[Callable[..., Awaitable[dict[str, Any]]]] = None
+
+    async def _get_client(self) -> redis.Redis:
+        """Get or create Redis client"""
+        if self._client is None:
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="incident_lease"
+            )
+            self._scripts = {
+                "acquire": self._client.register_script(ACQUIRE_SCRIPT),
+                "renew": self._client.register_script(RENEW_SCRIPT),
+                "release": self._client.register_script(RELEASE_SCRIPT),
+            }
+        return self._client
+
+    # ============== Lifecycle ==============
+
+    async def start(self, executor: Callable[..., Awaitable[dict[str, Any]]]) -> None:
+        """
+        Join the replica ring and start heartbeat/takeover loops.
+
+        Args:
+            executor: Coroutine (task_id, task_type, incident_id, payload) used
+                to re-run incidents taken over from dead replicas
+        """
+        self._executor = executor
+        await self._heartbeat()
+        self._background = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._takeover_loop()),
+        ]
+        logger.info(
+            "Orchestrator replica joined",
+            replica_id=self.replica_id,
+            advertise_url=self.advertise_url,
+            replicas=self._ring.members,
+        )
+
+    async def stop(self) -> None:
+        tasks = self._background + list(self._takeovers)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._takeovers.clear()
+        client = await self._get_client()
+        await client.zrem(REPLICAS_KEY, self.replica_id)
+        await client.hdel(REPLICA_URLS_KEY, self.replica_id)
+        if self._http is not None:
+            await self._http.aclose()
+        await client.close()
+        self._client = None
+
+    # ============== Membership ==============
+
+    async def _heartbeat(self) -> None:
+        client = await self._get_client()
+        now = time.time()
+        pipe = client.pipeline(transaction=False)
+        pipe.zadd(REPLICAS_KEY, {self.replica_id: now})
+        pipe.hset(REPLICA_URLS_KEY, self.replica_id, self.advertise_url)
+        pipe.zrangebyscore(REPLICAS_KEY, now - self.lease_ttl, "+inf")
+        *_, live = await pipe.execute()
+        if sorted(live) != self._ring.members:
+            self._ring = HashRing(live, self.vnodes)
+            logger.info("Replica ring changed", replicas=self._ring.members)
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self._heartbeat()
+                await self._renew_all()
+            except Exception as e:
+                logger.warning("Replica heartbeat failed", error=str(e))
+
+    def owner_of(self, incident_id: str) -> Optional[str]:
+        return self._ring.owner(incident_id)
+
+    # ============== Leases ==============
+
+    async def acquire(self, incident_id: str) -> Optional[Lease]:
+        """Lease an incident, None if another replica holds it"""
+        await self._get_client()
+        token = await self._scripts["acquire"](
+            keys=[f"{LEASE_PREFIX}{incident_id}", f"{FENCE_PREFIX}{incident_id}"],
+            args=[self.replica_id, int(self.lease_ttl * 1000)],
+        )
+        if not token:
+            return None
+        return Lease(incident_id, self.replica_id, int(token))
+
+    async def renew(self, lease: Lease) -> bool:
+        await self._get_client()
+        return bool(
+            await self._scripts["renew"](keys=[lease.key], args=[lease.value, int(self.lease_ttl * 1000)])
+        )
+
+    async def release(self, lease: Lease) -> None:
+        await self._get_client()
+        await self._scripts["release"](keys=[lease.key], args=[lease.value])
+
+    async def _renew_all(self) -> None:
+        for incident_id, (lease, task) in list(self._held.items()):
+            if await self.renew(lease):
+                continue
+            # Another replica owns the incident now; stop our copy
+            logger.warning(
+                "Incident lease lost, cancelling local run",
+                incident_id=incident_id,
+                token=lease.token,
+            )
+            self._lost.add(incident_id)
+            task.cancel()
+
+    # ============== Incident execution ==============
+
+    async def _forward(self, owner: str, task: dict[str, Any]) -> dict[str, Any]:
+        client = await self._get_client()
+        url = await client.hget(REPLICA_URLS_KEY, owner)
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=10.0, event_hooks=httpx_event_hooks("a2a"))
+        headers = {}
+        secret = os.getenv("A2A_SHARED_SECRET", "")
+        if secret:
+            headers["X-Agent-Token"] = secret
+        response = await self._http.post(f"{url}/a2a/tasks/async", json=task, headers=headers)
+        response.raise_for_status()
+        logger.info("Incident forwarded to owner replica", incident_id=task["incident_id"], owner=owner)
+        return {"forwarded_to": owner, "incident_id": task["incident_id"]}
+
+    async def run(
+        self,
+        task_id: str,
+        incident_id: str,
+        payload: dict[str, Any],
+        execute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Run an incident's workflow on its owner replica under a lease"""
+        owner = self.owner_of(incident_id)
+        if owner not in (None, self.replica_id) and not payload.get("_forwarded"):
+            try:
+                return await self._forward(owner, {
+                    "task_id": task_id,
+                    "task_type": "handle_alert",
+                    "incident_id": incident_id,
+                    "payload": {**payload, "_forwarded": True},
+                    "priority": 1,
+                })
+            except Exception as e:
+                # Owner unreachable: run here rather than drop the incident
+                logger.warning("Forward to owner failed, running locally", owner=owner, error=str(e))
+
+        running = self._runs.get(incident_id)
+        if running is not None:
+            # Duplicate handle_alert (A2A retry, forwarded copy). Re-acquiring
+            # would bump the fencing token and fence off the live run.
+            logger.info("Incident already running on this replica, joining it", incident_id=incident_id)
+            return await asyncio.shield(running)
+
+        run = asyncio.create_task(self._run_leased(incident_id, execute))
+        self._runs[incident_id] = run
+        run.add_done_callback(functools.partial(self._run_done, incident_id))
+        return await run
+
+    def _run_done(self, incident_id: str, run: asyncio.Task) -> None:
+        if self._runs.get(incident_id) is run:
+            del self._runs[incident_id]
+
+    async def _run_leased(
+        self,
+        incident_id: str,
+        execute: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        lease = await self.acquire(incident_id)
+        if lease is None:
+            logger.info("Incident already leased by another replica", incident_id=incident_id)
+            return {"incident_id": incident_id, "status": "owned_elsewhere"}
+
+        client = await self._get_client()
+        await client.zadd(ACTIVE_KEY, {incident_id: time.time()})
+
+        token = current_lease.set(lease)
+        try:
+            task = asyncio.create_task(execute())
+        finally:
+            current_lease.reset(token)
+        self._held[incident_id] = (lease, task)
+
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if incident_id in self._lost:
+                return {"incident_id": incident_id, "status": "lease_lost"}
+            raise
+        except LeaseLostError as e:
+            logger.warning("Incident fenced off", incident_id=incident_id, error=str(e))
+            return {"incident_id": incident_id, "status": "lease_lost"}
+        except Exception:
+            # Failed runs are not retried by takeover
+            await self._finish(lease)
+            raise
+        finally:
+            self._held.pop(incident_id, None)
+            self._lost.discard(incident_id)
+
+        # Ran to completion (closed/escalated): nothing left to take over
+        await self._finish(lease)
+        return result
+
+    async def _finish(self, lease: Lease) -> None:
+        client = await self._get_client()
+        await client.zrem(ACTIVE_KEY, lease.incident_id)
+        await self.release(lease)
+
+    # ============== Takeover ==============
+
+    async def _takeover_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.takeover_interval)
+            try:
+                await self._take_over_orphans()
+            except Exception as e:
+                logger.warning("Incident takeover scan failed", error=str(e))
+
+    async def _take_over_orphans(self) -> None:
+        from .state_manager import get_state_manager
+
+        client = await self._get_client()
+        for incident_id in await client.zrange(ACTIVE_KEY, 0, -1):
+            if incident_id in self._runs or self.owner_of(incident_id) != self.replica_id:
+                continue
+            if await client.exists(f"{LEASE_PREFIX}{incident_id}"):
+                continue
+
+            incident = await get_state_manager().get_incident(incident_id)
+            if incident is None:
+                # Incident state expired; nothing to resume
+                await client.zrem(ACTIVE_KEY, incident_id)
+                continue
+            payload = {
+                "alert_type": incident.get("alert_type"),
+                "degraded_links": incident.get("degraded_links", []),
+                "severity": incident.get("severity"),
+                "_forwarded": True,
+                # Resume from the stored state rather than re-provisioning
+                "_resume": incident,
+            }
+            logger.warning(
+                "Taking over orphaned incident",
+                incident_id=incident_id,
+                last_status=incident.get("status"),
+            )
+            task = asyncio.create_task(
+                self._executor(
+                    task_id=f"takeover-{incident_id}-{int(time.time())}",
+                    task_type="handle_alert",
+                    incident_id=incident_id,
+                    payload=payload,
+                )
+            )
+            self._takeovers.add(task)
+            task.add_done_callback(self._takeovers.discard)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "replica_id": self.replica_id,
+            "replicas": self._ring.members,
+            "held_incidents": len(self._held),
+        }
+
+
+# Singleton instance
+_coordinator: Optional[IncidentCoordinator] = None
+
+
+def get_incident_coordinator() -> Optional[IncidentCoordinator]:
+    """Process-wide coordinator, or None when cluster mode is off"""
+    global _coordinator
+    if _coordinator is None:
+        if os.getenv("ORCHESTRATOR_CLUSTER_ENABLED", "false").lower() != "true":
+            return None
+        _coordinator = IncidentCoordinator()
+    return _coordinator
@@ -1,16 +1,15 @@
 """
 IO Agent Notifier - Sends status updates to IO Agent for human UI
 
-Provides helper functions for orchestrator nodes to send updates.
+Provides helper functions for orchestrator nodes to send updates. Updates
+go through the side-channel outbox (outbox.py): nodes never wait for the
+IO Agent, and updates reach it in order per incident.
 """
 
 from typing import Any, Optional
-import sys
-import os
 import structlog
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-from agent_template.tools.io_agent_client import get_io_client
+from .outbox import get_outbox
 
 logger = structlog.get_logger(__name__)
 
@@ -48,90 +47,74 @@ async def notify_phase_change(
         correlation_id: Correlation ID for tracing
 
     Returns:
-        True if notification sent successfully
+        True if the update was queued for delivery
     """
-    try:
-        io_client = get_io_client()
-
-        phase_info = PHASE_MAP.get(status, ("?", status))
-        phase_num = phase_info[0]
-        phase_name = phase_info[1]
-
-        await io_client.send_status_update(
-            incident_id=incident_id,
-            status=status,
-            phase=phase_num,
-            message=message or phase_name,
-            details=details or {},
-            source_agent="orchestrator",
-            correlation_id=correlation_id,
-        )
-
-        logger.debug(
-            "IO Agent notified of phase change",
-            incident_id=incident_id,
-            status=status,
-            phase=phase_num,
-        )
-        return True
-
-    except Exception as e:
-        logger.warning(
-            "Failed to notify IO Agent of phase change",
-            incident_id=incident_id,
-            status=status,
-            error=str(e),
-        )
-        return False
+    phase_num, phase_name = PHASE_MAP.get(status, ("?", status))
+
+    queued = get_outbox().enqueue(
+        incident_id,
+        "io_status",
+        {
+            "incident_id": incident_id,
+            "status": status,
+            "phase": phase_num,
+            "message": message or phase_name,
+            "details": details or {},
+            "source_agent": "orchestrator",
+            "correlation_id": correlation_id,
+        },
+    )
+    logger.debug(
+        "IO Agent phase change queued",
+        incident_id=incident_id,
+        status=status,
+        phase=phase_num,
+    )
+    return queued
 
 
 async def notify_error(
     incident_id: str,
-    error_type: str,
     error_message: str,
+    error_type: Optional[str] = None,
     recoverable: bool = True,
     correlation_id: Optional[str] = None,
+    node_name: Optional[str] = None,
 ) -> bool:
     """
     Notify IO Agent of an error.
 
     Args:
         incident_id: Incident ID
-        error_type: Type of error
         error_message: Human-readable error message
+        error_type: Type of error (default "<node_name>_failed")
         recoverable: Whether the error is recoverable
         correlation_id: Correlation ID for tracing
+        node_name: Node reporting the error
 
     Returns:
-        True if notification sent successfully
+        True if the error was queued for delivery
     """
-    try:
-        io_client = get_io_client()
-
-        await io_client.send_error(
-            incident_id=incident_id,
-            error_type=error_type,
-            error_message=error_message,
-            source_agent="orchestrator",
-            recoverable=recoverable,
-            correlation_id=correlation_id,
-        )
-
-        logger.debug(
-            "IO Agent notified of error",
-            incident_id=incident_id,
-            error_type=error_type,
-        )
-        return True
-
-    except Exception as e:
-        logger.warning(
-            "Failed to notify IO Agent of error",
-            incident_id=incident_id,
-            error_type=error_type,
-            error=str(e),
-        )
-        return False
+    error_type = error_type or f"{node_name or 'orchestrator'}_failed"
+
+    queued = get_outbox().enqueue(
+        incident_id,
+        "io_error",
+        {
+            "incident_id": incident_id,
+            "error_type": error_type,
+            "error_message": error_message,
+            "source_agent": "orchestrator",
+            "recoverable": recoverable,
+            "correlation_id": correlation_id,
+        },
+    )
+    logger.debug(
+        "IO Agent error queued",
+        incident_id=incident_id,
+        error_type=error_type,
+    )
+    return queued
 
 
 async def notify_ticket_closed(
@@ -154,32 +137,24 @@ async def notify_ticket_closed(
         correlation_id: Correlation ID for tracing
 
     Returns:
-        True if notification sent successfully
+        True if the notification was queued for delivery
     """
-    try:
-        io_client = get_io_client()
-
-        await io_client.notify_ticket_closed(
-            incident_id=incident_id,
-            resolution=resolution,
-            duration_seconds=duration_seconds,
-            summary=summary,
-            details=details or {},
-            source_agent="orchestrator",
-            correlation_id=correlation_id,
-        )
-
-        logger.debug(
-            "IO Agent notified of ticket closure",
-            incident_id=incident_id,
-            resolution=resolution,
-        )
-        return True
-
-    except Exception as e:
-        logger.warning(
-            "Failed to notify IO Agent of ticket closure",
-            incident_id=incident_id,
-            error=str(e),
-        )
-        return False
+    queued = get_outbox().enqueue(
+        incident_id,
+        "io_ticket_closed",
+        {
+            "incident_id": incident_id,
+            "resolution": resolution,
+            "duration_seconds": duration_seconds,
+            "summary": summary,
+            "details": details or {},
+            "source_agent": "orchestrator",
+            "correlation_id": correlation_id,
+        },
+    )
+    logger.debug(
+        "IO Agent ticket closure queued",
+        incident_id=incident_id,
+        resolution=resolution,
+    )
+    return queued
@@ -0,0 +1,333 @@
+"""
+Side-Channel Outbox
+
+IO Agent status updates, audit events and notifications leave the
+protection path through this outbox: nodes enqueue without waiting for
+delivery, and background workers deliver events to the IO Agent, Audit
+and Notification agents in order per incident, with retries.
+
+enqueue() only appends to a bounded in-process buffer (events are dropped
+with a warning when it is full, never blocking the caller). A writer task
+persists buffered events to Redis in pipelined batches:
+
+    orchestrator:outbox:events:{incident_id}  list of pending JSON events (FIFO)
+    orchestrator:outbox:ready                 zset incident_id -> next delivery time
+    orchestrator:outbox:claim:{incident_id}   delivery claim held by one worker
+
+Workers claim one incident at a time, so events of an incident are
+delivered in order even across replicas, and trim events from Redis only
+after delivery, so a restart resumes where delivery stopped.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+from typing import Any, Optional
+
+import structlog
+import redis.asyncio as redis
+
+from agent_template.metrics import instrument_redis
+
+logger = structlog.get_logger(__name__)
+
+EVENTS_PREFIX = "orchestrator:outbox:events:"
+READY_KEY = "orchestrator:outbox:ready"
+CLAIM_PREFIX = "orchestrator:outbox:claim:"
+
+# Claim the first due incident that no other worker is delivering
+CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 16)
+for _, incident_id in ipairs(due) do
+    if redis.call('SET', ARGV[4] .. incident_id, ARGV[2], 'NX', 'PX', ARGV[3]) then
+        redis.call('ZREM', KEYS[1], incident_id)
+        return incident_id
+    end
+end
+return false
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SideChannelOutbox:
+    """
+    Bounded, Redis-persisted outbox for side-channel events.
+
+    Environment variables:
+        OUTBOX_MAX_PENDING: In-process buffer size before events are dropped (default 10000)
+        OUTBOX_WORKERS: Concurrent delivery workers (default 4)
+        OUTBOX_BATCH_SIZE: Events read/persisted per Redis round-trip (default 50)
+        OUTBOX_MAX_ATTEMPTS: Delivery attempts before an event is dropped (default 5)
+        OUTBOX_RETRY_SECONDS: Base retry backoff, doubled per attempt (default 1)
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_pending: Optional[int] = None,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
+        self.max_pending = max_pending or int(os.getenv("OUTBOX_MAX_PENDING", "10000"))
+        self.workers = workers or int(os.getenv("OUTBOX_WORKERS", "4"))
+        self.batch_size = batch_size or int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+        self.max_attempts = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+        self.retry_seconds = float(os.getenv("OUTBOX_RETRY_SECONDS", "1"))
+        self.claim_ttl_ms = 60_000
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._buffer: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._client: Optional[redis.Redis] = None
+        self._scripts: dict[str, Any] = {}
+        self._background: list[asyncio.Task] = []
+        self.dropped = 0
+
+    async def _get_client(self) -> redis.Redis:
+        """Get or create Redis client"""
+        if self._client is None:
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="outbox"
+            )
+            self._scripts = {
+                "claim": self._client.register_script(CLAIM_SCRIPT),
+                "release": self._client.register_script(RELEASE_SCRIPT),
+            }
+        return self._client
+
+    # ============== Lifecycle ==============
+
+    def start(self) -> None:
+        """Start the writer and delivery workers (idempotent)"""
+        if self._background:
+            return
+        self._buffer = self._buffer or asyncio.Queue(maxsize=self.max_pending)
+        self._wakeup = asyncio.Event()
+        self._background = [asyncio.create_task(self._writer())] + [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info("Side-channel outbox started", workers=self.workers, max_pending=self.max_pending)
+
+    async def stop(self, flush_timeout: float = 5.0) -> None:
+        """Persist buffered events, then stop the background tasks"""
+        if self._buffer is not None and not self._buffer.empty() and self._background:
+            try:
+                await asyncio.wait_for(self._buffer.join(), timeout=flush_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Outbox events not persisted at shutdown", pending=self._buffer.qsize())
+        for task in self._background:
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        self._background = []
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    # ============== Enqueue ==============
+
+    def enqueue(self, incident_id: Optional[str], kind: str, args: dict[str, Any]) -> bool:
+        """
+        Queue an event for delivery without waiting on Redis or the target.
+
+        Args:
+            incident_id: Incident the event belongs to (delivery order key)
+            kind: io_status | io_error | io_ticket_closed | agent_task
+            args: Keyword arguments for the delivery call
+
+        Returns:
+            False if the outbox is full and the event was dropped
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("Outbox used outside an event loop, event dropped", kind=kind)
+            return False
+        self.start()
+
+        event = {
+            "incident_id": incident_id or "none",
+            "kind": kind,
+            "args": args,
+            "attempts": 0,
+            "enqueued_at": time.time(),
+        }
+        try:
+            self._buffer.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Outbox full, side-channel event dropped", incident_id=incident_id, kind=kind,
+                           dropped=self.dropped)
+            return False
+
+    async def _writer(self) -> None:
+        """Persist buffered events to Redis in pipelined batches"""
+        while True:
+            batch = [await self._buffer.get()]
+            while len(batch) < self.batch_size and not self._buffer.empty():
+                batch.append(self._buffer.get_nowait())
+
+            while True:
+                try:
+                    client = await self._get_client()
+                    async with client.pipeline(transaction=False) as pipe:
+                        now = time.time()
+                        for event in batch:
+                            pipe.rpush(f"{EVENTS_PREFIX}{event['incident_id']}", json.dumps(event, default=str))
+                            pipe.zadd(READY_KEY, {event["incident_id"]: now}, nx=True)
+                        await pipe.execute()
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Keep the batch (and its order) until Redis is back
+                    logger.warning("Outbox persist failed, retrying", events=len(batch), error=str(e))
+                    await asyncio.sleep(self.retry_seconds)
+
+            for _ in batch:
+                self._buffer.task_done()
+            self._wakeup.set()
+
+    # ============== Delivery ==============
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                client = await self._get_client()
+                incident_id = await self._scripts["claim"](
+                    keys=[READY_KEY],
+                    args=[time.time(), self.worker_id, self.claim_ttl_ms, CLAIM_PREFIX],
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Outbox claim failed", error=str(e))
+                await asyncio.sleep(self.retry_seconds)
+                continue
+
+            if not incident_id:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.retry_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._drain(client, incident_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Outbox delivery error", incident_id=incident_id, error=str(e))
+                await client.zadd(READY_KEY, {incident_id: time.time() + self.retry_seconds})
+            finally:
+                await self._scripts["release"](keys=[f"{CLAIM_PREFIX}{incident_id}"], args=[self.worker_id])
+
+    async def _drain(self, client: redis.Redis, incident_id: str) -> None:
+        """Deliver an incident's pending events in order, batch by batch"""
+        key = f"{EVENTS_PREFIX}{incident_id}"
+        while True:
+            raw = await client.lrange(key, 0, self.batch_size - 1)
+            if not raw:
+                return
+
+            for delivered, item in enumerate(raw):
+                event = json.loads(item)
+                if await self._deliver(event):
+                    # Slow targets must not let the claim lapse mid-batch
+                    await client.pexpire(f"{CLAIM_PREFIX}{incident_id}", self.claim_ttl_ms)
+                    continue
+
+                event["attempts"] += 1
+                await client.ltrim(key, delivered, -1)
+                if event["attempts"] >= self.max_attempts:
+                    logger.error("Outbox event dropped after retries", incident_id=incident_id,
+                                 kind=event["kind"], attempts=event["attempts"])
+                    await client.lpop(key)
+                    await client.zadd(READY_KEY, {incident_id: time.time()})
+                else:
+                    # Later events of this incident wait behind the failed one
+                    await client.lset(key, 0, json.dumps(event, default=str))
+                    delay = self.retry_seconds * 2 ** (event["attempts"] - 1)
+                    await client.zadd(READY_KEY, {incident_id: time.time() + delay})
+                return
+
+            await client.ltrim(key, len(raw), -1)
+            logger.debug("Outbox batch delivered", incident_id=incident_id, events=len(raw))
+
+    async def _deliver(self, event: dict[str, Any]) -> bool:
+        kind, args = event["kind"], event["args"]
+        try:
+            if kind == "agent_task":
+                from .agent_caller import call_agent
+                result = await call_agent(**args)
+                return bool(result.get("success"))
+
+            from agent_template.tools.io_agent_client import get_io_client
+            io_client = get_io_client()
+            if kind == "io_status":
+                return await io_client.send_status_update(**args)
+            if kind == "io_error":
+                return await io_client.send_error(**args)
+            if kind == "io_ticket_closed":
+                return await io_client.notify_ticket_closed(**args)
+        except Exception as e:
+            logger.warning("Side-channel delivery failed", kind=kind, incident_id=event["incident_id"], error=str(e))
+            return False
+
+        logger.error("Unknown outbox event kind, dropping", kind=kind)
+        return True
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "buffered": self._buffer.qsize() if self._buffer is not None else 0,
+            "dropped": self.dropped,
+            "workers": len(self._background) - 1 if self._background else 0,
+        }
+
+
+def enqueue_agent_task(
+    agent_name: str,
+    task_type: str,
+    payload: dict[str, Any],
+    incident_id: Optional[str] = None,
+    timeout: float = 30.0,
+) -> dict[str, Any]:
+    """
+    Queue a fire-and-forget A2A task (audit, notification) on the outbox.
+
+    Returns a call_agent-shaped dict; success means queued, not delivered.
+    """
+    queued = get_outbox().enqueue(
+        incident_id,
+        "agent_task",
+        {
+            "agent_name": agent_name,
+            "task_type": task_type,
+            "payload": payload,
+            "incident_id": incident_id,
+            "timeout": timeout,
+        },
+    )
+    return {"success": queued, "queued": True}
+
+
+# Singleton instance
+_outbox: Optional[SideChannelOutbox] = None
+
+
+def get_outbox() -> SideChannelOutbox:
+    """Get singleton outbox instance"""
+    global _outbox
+    if _outbox is None:
+        _outbox = SideChannelOutbox()
+    return _outbox
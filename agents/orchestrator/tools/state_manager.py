@@ -3,6 +3,11 @@ State Manager Tool
 
 Tool for Redis-based incident state management.
 Based on DESIGN.md - Tool 2: Redis State Management
+
+Each incident is a Redis hash (one JSON-encoded value per field), so an
+update writes only the fields it changes, in a single script call. Nodes
+move an incident's status with transition_status(), which only applies
+when the incident is still in one of the statuses the node expects.
 """
 
 import os
@@ -12,9 +17,48 @@ from datetime import datetime, timezone
 
 import structlog
 import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from agent_template.metrics import instrument_redis
+
+from .incident_lease import LeaseLostError, current_lease
 
 logger = structlog.get_logger(__name__)
 
+# Field-level update with optional lease fencing and status compare-and-set.
+# KEYS: incident, lease ('' when unfenced)
+# ARGV: ttl, lease value ('' = unfenced), incident id,
+#       allowed current statuses (JSON array, '' = any), created_at,
+#       field/value pairs...
+UPDATE_SCRIPT = """
+if ARGV[2] ~= '' and redis.call('GET', KEYS[2]) ~= ARGV[2] then
+    return -1
+end
+if ARGV[4] ~= '' then
+    local old_status = redis.call('HGET', KEYS[1], 'status')
+    local current = old_status and cjson.decode(old_status) or cjson.null
+    local allowed = false
+    for _, status in ipairs(cjson.decode(ARGV[4])) do
+        if status == current then
+            allowed = true
+        end
+    end
+    if not allowed then
+        return 0
+    end
+end
+
+redis.call('HSET', KEYS[1], unpack(ARGV, 6))
+redis.call('HSETNX', KEYS[1], 'incident_id', cjson.encode(ARGV[3]))
+redis.call('HSETNX', KEYS[1], 'created_at', ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class StatusConflictError(Exception):
+    """Raised when an incident is not in a status a node expects to move it from"""
+
 
 class StateManagerTool:
     """
@@ -40,17 +84,71 @@ class StateManagerTool:
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
         self.key_prefix = key_prefix
         self._client: Optional[redis.Redis] = None
+        self._scripts: dict[str, Any] = {}
 
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client"""
         if self._client is None:
-            self._client = redis.from_url(self.redis_url, decode_responses=True)
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="state_manager"
+            )
+            self._scripts = {"update": self._client.register_script(UPDATE_SCRIPT)}
         return self._client
 
     def _make_key(self, incident_id: str) -> str:
         """Create Redis key for incident"""
         return f"{self.key_prefix}{incident_id}"
 
+    def _update_call(
+        self,
+        incident_id: str,
+        fields: dict[str, Any],
+        ttl_seconds: int,
+        from_statuses: Optional[list[Optional[str]]] = None,
+    ) -> tuple[list[str], list[Any]]:
+        """Keys and args for UPDATE_SCRIPT, fenced by the context's incident lease"""
+        lease = current_lease.get()
+        args: list[Any] = [
+            ttl_seconds,
+            lease.value if lease else "",
+            incident_id,
+            json.dumps(from_statuses) if from_statuses is not None else "",
+            json.dumps(datetime.now(timezone.utc).isoformat()),
+        ]
+        for field, value in fields.items():
+            args.extend((field, json.dumps(value)))
+        return [self._make_key(incident_id), lease.key if lease else ""], args
+
+    async def _run_update(
+        self,
+        incident_id: str,
+        fields: dict[str, Any],
+        ttl_seconds: int,
+        from_statuses: Optional[list[Optional[str]]] = None,
+    ) -> bool:
+        keys, args = self._update_call(incident_id, fields, ttl_seconds, from_statuses)
+        try:
+            result = await self._scripts["update"](keys=keys, args=args)
+        except ResponseError as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            # Incident written as a JSON string by an older release
+            await self._migrate(incident_id)
+            result = await self._scripts["update"](keys=keys, args=args)
+        if result == -1:
+            raise LeaseLostError(f"Lease on {incident_id} no longer held")
+        return result == 1
+
+    async def _migrate(self, incident_id: str) -> None:
+        """Convert a legacy JSON-string incident into the hash layout"""
+        client = await self._get_client()
+        key = self._make_key(incident_id)
+        raw = await client.get(key)
+        ttl = await client.ttl(key)
+        await client.delete(key)
+        if raw:
+            await self._run_update(incident_id, json.loads(raw), ttl if ttl > 0 else 86400)
+
     async def get_incident(self, incident_id: str) -> Optional[dict[str, Any]]:
         """
         Get incident state from Redis.
@@ -65,10 +163,16 @@ class StateManagerTool:
         key = self._make_key(incident_id)
 
         try:
-            data = await client.get(key)
+            data = await client.hgetall(key)
             if data:
-                return json.loads(data)
+                return {field: json.loads(value) for field, value in data.items()}
             return None
+        except ResponseError as e:
+            if "WRONGTYPE" in str(e):
+                data = await client.get(key)
+                return json.loads(data) if data else None
+            logger.error("Failed to get incident", incident_id=incident_id, error=str(e))
+            raise
         except Exception as e:
             logger.error("Failed to get incident", incident_id=incident_id, error=str(e))
             raise
@@ -80,7 +184,11 @@ class StateManagerTool:
         ttl_seconds: int = 86400,  # 24 hours default
     ) -> dict[str, Any]:
         """
-        Update incident state in Redis.
+        Update incident fields in Redis.
+
+        Only the given fields are written (one round trip however many
+        fields change); concurrent updaters of different fields do not
+        overwrite each other.
 
         Args:
             incident_id: Incident identifier
@@ -88,23 +196,13 @@ class StateManagerTool:
             ttl_seconds: Time-to-live for the key
 
         Returns:
-            Updated incident state
+            Fields written (updates plus incident_id and updated_at)
         """
-        client = await self._get_client()
-        key = self._make_key(incident_id)
+        await self._get_client()
+        fields = {**updates, "updated_at": datetime.now(timezone.utc).isoformat()}
 
         try:
-            # Get existing state
-            existing = await self.get_incident(incident_id)
-            if existing is None:
-                existing = {"incident_id": incident_id, "created_at": datetime.now(timezone.utc).isoformat()}
-
-            # Merge updates
-            existing.update(updates)
-            existing["updated_at"] = datetime.now(timezone.utc).isoformat()
-
-            # Save back
-            await client.setex(key, ttl_seconds, json.dumps(existing))
+            await self._run_update(incident_id, fields, ttl_seconds)
 
             logger.info(
                 "Updated incident state",
@@ -112,12 +210,51 @@ class StateManagerTool:
                 updated_fields=list(updates.keys()),
             )
 
-            return existing
+            return {"incident_id": incident_id, **fields}
 
         except Exception as e:
             logger.error("Failed to update incident", incident_id=incident_id, error=str(e))
             raise
 
+    async def transition_status(
+        self,
+        incident_id: str,
+        to_status: str,
+        from_statuses: list[Optional[str]],
+        updates: Optional[dict[str, Any]] = None,
+        ttl_seconds: int = 86400,
+    ) -> bool:
+        """
+        Compare-and-set an incident's status.
+
+        Args:
+            incident_id: Incident identifier
+            to_status: New status
+            from_statuses: Statuses the incident must currently have
+                (None matches an incident with no status yet)
+            updates: Extra fields written together with the status
+            ttl_seconds: Time-to-live for the key
+
+        Returns:
+            True if the transition was applied, False if the current
+            status did not match
+        """
+        await self._get_client()
+        fields = {
+            **(updates or {}),
+            "status": to_status,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        applied = await self._run_update(incident_id, fields, ttl_seconds, from_statuses)
+        logger.info(
+            "Incident status transition",
+            incident_id=incident_id,
+            to_status=to_status,
+            applied=applied,
+        )
+        return applied
+
     async def create_incident(
         self,
         incident_id: str,
@@ -135,8 +272,7 @@ class StateManagerTool:
         Returns:
             Created incident state
         """
-        client = await self._get_client()
-        key = self._make_key(incident_id)
+        await self._get_client()
 
         state = {
             "incident_id": incident_id,
@@ -145,7 +281,7 @@ class StateManagerTool:
             **initial_state,
         }
 
-        await client.setex(key, ttl_seconds, json.dumps(state))
+        await self._run_update(incident_id, state, ttl_seconds)
 
         logger.info("Created incident state", incident_id=incident_id)
 
@@ -202,3 +338,23 @@ async def update_incident(
     """Update incident state (convenience function)"""
     manager = get_state_manager()
     return await manager.update_incident(incident_id, updates)
+
+
+async def transition_status(
+    incident_id: str,
+    to_status: str,
+    from_statuses: list[Optional[str]],
+    updates: Optional[dict[str, Any]] = None,
+) -> None:
+    """
+    Compare-and-set incident status (convenience function).
+
+    Raises:
+        StatusConflictError: The incident was not in any of from_statuses
+            (another writer moved it, e.g. an operator closed it)
+    """
+    manager = get_state_manager()
+    if not await manager.transition_status(incident_id, to_status, from_statuses, updates):
+        raise StatusConflictError(
+            f"Incident {incident_id} cannot move to {to_status} from its current status"
+        )
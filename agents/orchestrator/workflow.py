@@ -5,6 +5,7 @@ LangGraph workflow implementing the orchestrator state machine.
 Based on DESIGN.md state machine diagram.
 """
 
+import functools
 from typing import Any, Optional
 from datetime import datetime, timezone
 
@@ -14,7 +15,9 @@ from langgraph.graph import StateGraph, START, END
 from agent_template.workflow import BaseWorkflow
 from agent_template.tools.a2a_client import A2AClient, configure_a2a_client
 
-from .schemas.state import OrchestratorState, create_initial_state
+from .schemas.state import RESUME_FIELDS, OrchestratorState, create_initial_state
+from .tools.incident_lease import get_incident_coordinator
+from .tools.outbox import get_outbox
 from .nodes import (
     start_node,
     detect_node,
@@ -28,6 +31,7 @@ from .nodes import (
     dampen_node,
     escalate_node,
     close_node,
+    check_resume,
     check_flapping,
     check_services_affected,
     check_path_found,
@@ -106,8 +110,19 @@ class OrchestratorWorkflow(BaseWorkflow):
         graph.add_node("escalate", escalate_node)
         graph.add_node("close", close_node)
 
-        # Entry point
-        graph.add_edge(START, "start")
+        # Entry point: start, or the resume point of a taken-over incident
+        graph.add_conditional_edges(
+            START,
+            check_resume,
+            {
+                "start": "start",
+                "provision": "provision",
+                "steer": "steer",
+                "monitor": "monitor",
+                "escalate": "escalate",
+                "close": "close",
+            },
+        )
 
         # start -> detect
         graph.add_edge("start", "detect")
@@ -137,12 +152,13 @@ class OrchestratorWorkflow(BaseWorkflow):
             },
         )
 
-        # compute -> provision | escalate
+        # compute -> provision | steer (shared tunnel reused) | escalate
         graph.add_conditional_edges(
             "compute",
             check_path_found,
             {
                 "provision": "provision",
+                "steer": "steer",
                 "escalate": "escalate",
             },
         )
@@ -218,7 +234,8 @@ class OrchestratorWorkflow(BaseWorkflow):
             task_id: Task identifier
             task_type: Task type (handle_alert)
             incident_id: Incident identifier
-            payload: Alert payload with degraded_links, severity, alert_type
+            payload: Alert payload with degraded_links, severity, alert_type;
+                _resume carries the stored incident on takeover
             correlation_id: Correlation ID for tracing
 
         Returns:
@@ -226,7 +243,7 @@ class OrchestratorWorkflow(BaseWorkflow):
         """
         payload = payload or {}
 
-        return create_initial_state(
+        state = create_initial_state(
             task_id=task_id,
             incident_id=incident_id or f"INC-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}",
             alert_type=payload.get("alert_type", "pca_sla"),
@@ -234,3 +251,67 @@ class OrchestratorWorkflow(BaseWorkflow):
             severity=payload.get("severity", "major"),
             correlation_id=correlation_id,
         )
+
+        resume = payload.get("_resume")
+        if resume:
+            state.update({field: resume[field] for field in RESUME_FIELDS if resume.get(field) is not None})
+            state["resumed"] = True
+        return state
+
+    async def execute(
+        self,
+        task_id: str,
+        task_type: str,
+        incident_id: Optional[str] = None,
+        payload: dict[str, Any] = None,
+        correlation_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Execute the workflow.
+
+        In cluster mode handle_alert tasks run on the incident's owning
+        replica under a Redis lease (see tools/incident_lease.py).
+        """
+        coordinator = get_incident_coordinator()
+        if coordinator is None or task_type != "handle_alert":
+            return await super().execute(
+                task_id=task_id,
+                task_type=task_type,
+                incident_id=incident_id,
+                payload=payload,
+                correlation_id=correlation_id,
+            )
+
+        incident_id = incident_id or f"INC-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+        payload = payload or {}
+        return await coordinator.run(
+            task_id,
+            incident_id,
+            payload,
+            functools.partial(
+                super().execute,
+                task_id=task_id,
+                task_type=task_type,
+                incident_id=incident_id,
+                payload=payload,
+                correlation_id=correlation_id,
+            ),
+        )
+
+    async def start_cluster(self) -> None:
+        """Join the orchestrator replica ring (no-op unless cluster mode is enabled)"""
+        coordinator = get_incident_coordinator()
+        if coordinator is not None:
+            await coordinator.start(self.execute)
+
+    async def stop_cluster(self) -> None:
+        coordinator = get_incident_coordinator()
+        if coordinator is not None:
+            await coordinator.stop()
+
+    def start_outbox(self) -> None:
+        """Start side-channel outbox delivery (IO Agent, audit, notifications)"""
+        get_outbox().start()
+
+    async def stop_outbox(self) -> None:
+        await get_outbox().stop()
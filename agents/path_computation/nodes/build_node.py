@@ -65,7 +65,7 @@ async def build_constraints_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "build_constraints",
-        "nodes_executed": state.get("nodes_executed", []) + ["build_constraints"],
+        "nodes_executed": ["build_constraints"],
         "constraints": constraints_dict,
         "original_constraints": constraints_dict.copy(),
         "relaxation_level": 0,
@@ -51,11 +51,11 @@ async def query_kg_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "query_kg",
-            "nodes_executed": state.get("nodes_executed", []) + ["query_kg"],
+            "nodes_executed": ["query_kg"],
             "path_found": False,
             "computed_path": None,
             "query_attempts": query_attempts,
-            "query_errors": state.get("query_errors", []) + ["Missing source or destination PE"],
+            "query_errors": ["Missing source or destination PE"],
         }
 
     try:
@@ -132,11 +132,34 @@ async def query_kg_node(state: dict[str, Any]) -> dict[str, Any]:
                 delay_ms=path.total_delay_ms,
             )
 
+            # Top-k candidates for dry-run screening by Tunnel Provisioning
+            alternates = []
+            candidate_count = state.get("candidate_count", 1)
+            if candidate_count > 1:
+                try:
+                    alternates = await client.compute_alternates(
+                        source=source_pe,
+                        destination=destination_pe,
+                        constraints=constraints,
+                        first=path,
+                        count=candidate_count - 1,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Alternate candidate computation failed, returning best path only",
+                        incident_id=incident_id,
+                        error=str(e),
+                    )
+                for alternate in alternates:
+                    alternate.constraints_relaxed = path.constraints_relaxed
+                    alternate.relaxation_level = relaxation_level
+
             return {
                 "current_node": "query_kg",
-                "nodes_executed": state.get("nodes_executed", []) + ["query_kg"],
+                "nodes_executed": ["query_kg"],
                 "path_found": True,
                 "computed_path": path.model_dump(),
+                "candidate_paths": [alternate.model_dump() for alternate in alternates],
                 "query_attempts": query_attempts,
                 "topology_path_hint": topology_path_hint,
                 "srpm_metrics": srpm_metrics,
@@ -150,7 +173,7 @@ async def query_kg_node(state: dict[str, Any]) -> dict[str, Any]:
             )
             return {
                 "current_node": "query_kg",
-                "nodes_executed": state.get("nodes_executed", []) + ["query_kg"],
+                "nodes_executed": ["query_kg"],
                 "path_found": False,
                 "computed_path": None,
                 "query_attempts": query_attempts,
@@ -164,9 +187,9 @@ async def query_kg_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "query_kg",
-            "nodes_executed": state.get("nodes_executed", []) + ["query_kg"],
+            "nodes_executed": ["query_kg"],
             "path_found": False,
             "computed_path": None,
             "query_attempts": query_attempts,
-            "query_errors": state.get("query_errors", []) + [str(e)],
+            "query_errors": [str(e)],
         }
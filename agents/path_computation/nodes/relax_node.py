@@ -52,7 +52,7 @@ async def relax_constraints_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "relax_constraints",
-            "nodes_executed": state.get("nodes_executed", []) + ["relax_constraints"],
+            "nodes_executed": ["relax_constraints"],
             "relaxation_level": new_level,
             # Keep constraints unchanged
         }
@@ -74,7 +74,7 @@ async def relax_constraints_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "relax_constraints",
-        "nodes_executed": state.get("nodes_executed", []) + ["relax_constraints"],
+        "nodes_executed": ["relax_constraints"],
         "constraints": relaxed.model_dump(),
         "relaxation_level": new_level,
     }
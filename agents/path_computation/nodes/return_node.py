@@ -46,6 +46,8 @@ async def return_path_node(state: dict[str, Any]) -> dict[str, Any]:
             "incident_id": incident_id,
             "path_found": True,
             "path": computed_path,
+            # Best first; Tunnel Provisioning dry-runs these before committing
+            "candidates": [computed_path] + state.get("candidate_paths", []),
             "constraints_relaxed": relaxation_level > 0,
             "relaxation_level": relaxation_level,
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -99,7 +101,7 @@ async def return_path_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "return_path",
-        "nodes_executed": state.get("nodes_executed", []) + ["return_path"],
+        "nodes_executed": ["return_path"],
         "result": result,
         "status": status,
         "completed_at": datetime.now(timezone.utc).isoformat(),
@@ -45,7 +45,7 @@ async def validate_path_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "validate_path",
-            "nodes_executed": state.get("nodes_executed", []) + ["validate_path"],
+            "nodes_executed": ["validate_path"],
             "path_valid": False,
             "validation_violations": ["No path computed"],
         }
@@ -63,19 +63,32 @@ async def validate_path_node(state: dict[str, Any]) -> dict[str, Any]:
             max_hops=constraints.get("max_hops"),
         )
 
+        # Alternate candidates are only offered if they meet the SLA too
+        candidate_paths = [
+            candidate
+            for candidate in state.get("candidate_paths", [])
+            if validator.validate_path(
+                path=ComputedPath(**candidate),
+                required_sla=required_sla,
+                max_hops=constraints.get("max_hops"),
+            ).is_valid
+        ]
+
         logger.info(
             "Path validation complete",
             incident_id=incident_id,
             path_id=computed_path.path_id,
             is_valid=result.is_valid,
             violations=result.violations,
+            valid_alternates=len(candidate_paths),
         )
 
         return {
             "current_node": "validate_path",
-            "nodes_executed": state.get("nodes_executed", []) + ["validate_path"],
+            "nodes_executed": ["validate_path"],
             "path_valid": result.is_valid,
             "validation_violations": result.violations,
+            "candidate_paths": candidate_paths,
         }
 
     except Exception as e:
@@ -86,7 +99,7 @@ async def validate_path_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "validate_path",
-            "nodes_executed": state.get("nodes_executed", []) + ["validate_path"],
+            "nodes_executed": ["validate_path"],
             "path_valid": False,
             "validation_violations": [f"Validation error: {str(e)}"],
         }
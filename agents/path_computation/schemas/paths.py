@@ -73,6 +73,9 @@ class ComputedPath(BaseModel):
     constraints_relaxed: bool = False
     relaxation_level: int = 0
 
+    # KG topology version the path was computed on (if the KG reports one)
+    topology_version: Optional[str] = None
+
 
 class PathValidationResult(BaseModel):
     """Result of path validation against SLA requirements."""
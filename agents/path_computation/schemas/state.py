@@ -5,7 +5,9 @@ TypedDict for LangGraph workflow state.
 From DESIGN.md Path Computation Agent.
 """
 
-from typing import TypedDict, List, Optional, Literal, Any
+from typing import Annotated, TypedDict, List, Optional, Literal, Any
+
+from agent_template.schemas.state import append_history
 
 
 class PathComputationState(TypedDict, total=False):
@@ -32,6 +34,7 @@ class PathComputationState(TypedDict, total=False):
     current_te_type: str
     existing_policies: List[str]  # For disjointness
     required_sla: dict  # {max_delay_ms, min_bandwidth_gbps}
+    candidate_count: int  # Top-k candidates to return (1 = best path only)
     input_payload: dict
 
     # Constraints
@@ -42,8 +45,9 @@ class PathComputationState(TypedDict, total=False):
     # Query results
     path_found: bool
     computed_path: Optional[dict]
+    candidate_paths: List[dict]  # Alternates after computed_path, best first
     query_attempts: int
-    query_errors: List[str]
+    query_errors: Annotated[List[str], append_history]  # One per failed query attempt
 
     # Validation
     path_valid: bool
@@ -51,7 +55,7 @@ class PathComputationState(TypedDict, total=False):
 
     # Workflow control
     current_node: str
-    nodes_executed: List[str]
+    nodes_executed: Annotated[List[str], append_history]  # Nodes return only their own name
     iteration_count: int
     max_iterations: int
     status: Literal["running", "success", "failed", "no_path"]
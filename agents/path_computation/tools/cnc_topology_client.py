@@ -18,6 +18,8 @@ from datetime import datetime, timedelta, timezone
 import structlog
 import httpx
 
+from agent_template.metrics import httpx_event_hooks
+
 logger = structlog.get_logger(__name__)
 
 
@@ -62,6 +64,7 @@ class CNCTopologyClient:
         if self._client is None:
             ca_cert = os.getenv("CA_CERT_PATH")
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=ca_cert if ca_cert else True,
             )
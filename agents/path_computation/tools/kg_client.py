@@ -6,7 +6,7 @@ From DESIGN.md: KGDijkstraClient for alternate paths.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import uuid4
 
 import structlog
@@ -121,6 +121,7 @@ class KGDijkstraClient:
                     total_te_metric=data.get("total_te_metric", 0),
                     min_available_bandwidth_gbps=data.get("min_available_bandwidth_gbps", 0.0),
                     recommended_te_type=data.get("recommended_te_type", "sr-mpls"),
+                    topology_version=data.get("topology_version"),
                 )
                 logger.info(
                     "Path computed successfully",
@@ -159,6 +160,52 @@ class KGDijkstraClient:
                 return self._simulate_path(source, destination, constraints, te_type=os.getenv("DEFAULT_TE_TYPE", "rsvp-te"))
             return None
 
+    async def compute_alternates(
+        self,
+        source: str,
+        destination: str,
+        constraints: PathConstraints,
+        first: ComputedPath,
+        count: int,
+    ) -> List[ComputedPath]:
+        """
+        Compute up to count further candidates after the best path.
+
+        The KG Dijkstra API returns one path per query, so each further
+        candidate avoids the transit nodes of every candidate before it.
+
+        Args:
+            source: Source PE/node ID
+            destination: Destination PE/node ID
+            constraints: Path constraints used for the best path
+            first: Best path already computed with those constraints
+            count: Number of additional candidates wanted
+
+        Returns:
+            Alternate candidates in computation order (may be fewer than count)
+        """
+        candidates = [first]
+        avoid_nodes = list(constraints.avoid_nodes)
+        for _ in range(count):
+            avoid_nodes += [n for n in candidates[-1].segments[1:-1] if n not in avoid_nodes]
+            path = await self.compute_path(
+                source=source,
+                destination=destination,
+                constraints=constraints.model_copy(update={"avoid_nodes": avoid_nodes}),
+            )
+            if path is None or any(path.segments == c.segments for c in candidates):
+                break
+            candidates.append(path)
+
+        logger.info(
+            "Alternate candidates computed",
+            source=source,
+            destination=destination,
+            requested=count,
+            found=len(candidates) - 1,
+        )
+        return candidates[1:]
+
     def _simulate_path(
         self,
         source: str,
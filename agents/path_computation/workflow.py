@@ -99,12 +99,14 @@ class PathComputationWorkflow(BaseWorkflow):
             "current_te_type": payload.get("current_te_type", "sr-mpls"),
             "existing_policies": payload.get("existing_policies", []),
             "required_sla": payload.get("required_sla", {}),
+            "candidate_count": payload.get("candidate_count", 1),
             # Will be populated by nodes
             "constraints": {},
             "original_constraints": {},
             "relaxation_level": 0,
             "path_found": False,
             "computed_path": None,
+            "candidate_paths": [],
             "query_attempts": 0,
             "query_errors": [],
             "path_valid": False,
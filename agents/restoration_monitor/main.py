@@ -1,5 +1,4 @@
 """Restoration Monitor Agent Main Entry Point - Port 8005"""
-import asyncio
 import os
 import sys
 from typing import Any, Optional
@@ -14,6 +13,7 @@ from agent_template.api.server import A2ATaskServer
 from agent_template.tools.mcp_client import MCPToolClient
 from agent_template.tools.a2a_client import A2AClient, configure_a2a_client
 from .workflow import RestorationMonitorWorkflow
+from .tools.cutover_scheduler import get_cutover_scheduler
 
 load_dotenv()
 
@@ -65,8 +65,15 @@ class RestorationMonitorRunner:
         )
         self._workflow.compile()
 
+        # Resume gradual cutovers persisted by this or a dead replica
+        get_cutover_scheduler().start()
+
         logger.info("Restoration Monitor agent initialized")
 
+    async def shutdown(self) -> None:
+        """Stop the cutover scheduler; active cutovers resume from Redis"""
+        await get_cutover_scheduler().close()
+
     async def execute_workflow(
         self,
         task_id: str,
@@ -97,8 +104,23 @@ class RestorationMonitorRunner:
 
     def run(self) -> None:
         """Run the restoration monitor agent"""
-        asyncio.run(self.initialize())
+        from contextlib import asynccontextmanager
+
+        runner = self
         server = self.create_server()
+        server_lifespan = server.app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app):
+            """Initialize in uvicorn's event loop so the cutover scheduler runs there"""
+            await runner.initialize()
+            try:
+                async with server_lifespan(app):
+                    yield
+            finally:
+                await runner.shutdown()
+
+        server.app.router.lifespan_context = lifespan
 
         logger.info(
             "Starting Restoration Monitor A2A server",
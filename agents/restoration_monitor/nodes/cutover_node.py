@@ -4,7 +4,7 @@ from datetime import datetime
 import structlog
 
 from ..tools.cutover import get_cutover_manager
-from ..tools.pca_client import get_pca_client
+from ..tools.cutover_scheduler import get_cutover_scheduler
 
 logger = structlog.get_logger(__name__)
 
@@ -71,22 +71,16 @@ async def cutover_traffic_node(state: dict[str, Any]) -> dict[str, Any]:
                 }
 
         else:
-            # Gradual cutover - staged ECMP weight migration
-            pca_client = get_pca_client()
-
-            async def verify_sla():
-                """SLA verification callback for gradual cutover"""
-                result = await pca_client.get_path_sla(
-                    path_endpoints=(original_path_source, original_path_dest),
-                    sla_tier=sla_tier,
-                )
-                return result.meets_sla
-
-            success, stages = await cutover_manager.execute_gradual_cutover(
+            # Gradual cutover - staged ECMP weight migration, advanced with all
+            # other active cutovers by the shared scheduler tick
+            success, stages = await get_cutover_scheduler().run(
                 incident_id=incident_id,
                 protection_tunnel_id=protection_tunnel_id,
                 original_path_id=original_path_id,
-                verify_sla_func=verify_sla,
+                head_end=original_path_source,
+                source=original_path_source,
+                dest=original_path_dest,
+                sla_tier=sla_tier,
             )
 
             stages_completed = [
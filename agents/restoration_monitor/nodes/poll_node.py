@@ -3,7 +3,7 @@ from typing import Any
 from datetime import datetime
 import structlog
 
-from ..tools.pca_client import get_pca_client
+from ..tools.sla_poller import get_sla_poller
 
 logger = structlog.get_logger(__name__)
 
@@ -12,6 +12,9 @@ async def poll_sla_node(state: dict[str, Any]) -> dict[str, Any]:
     """
     Query PCA for current SLA metrics on original path.
     From DESIGN.md: poll_sla node queries PCA for SLA metrics
+
+    Reads the latest sample of the shared SLA poller, which polls each
+    unique path once per interval for all incidents.
     """
     incident_id = state.get("incident_id")
     source = state.get("original_path_source")
@@ -29,9 +32,10 @@ async def poll_sla_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     try:
-        pca_client = get_pca_client()
-        result = await pca_client.get_path_sla(
-            path_endpoints=(source, dest),
+        result = await get_sla_poller().latest(
+            incident_id=incident_id or state.get("task_id"),
+            source=source,
+            dest=dest,
             sla_tier=sla_tier,
         )
 
@@ -5,6 +5,7 @@ import structlog
 
 from ..schemas.restoration import RestorationResponse
 from ..tools.hold_timer import SLA_TIER_CONFIG
+from ..tools.sla_poller import get_sla_poller
 
 logger = structlog.get_logger(__name__)
 
@@ -22,6 +23,9 @@ async def return_restored_node(state: dict[str, Any]) -> dict[str, Any]:
     protection_start_time = state.get("protection_start_time")
     error = state.get("error")
 
+    # Stop sharing the original path's SLA polling (timeout also ends here)
+    get_sla_poller().release(incident_id or state.get("task_id"))
+
     # Calculate total protection duration
     total_duration = 0.0
     if protection_start_time:
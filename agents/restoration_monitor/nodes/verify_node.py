@@ -3,7 +3,7 @@ from typing import Any
 from datetime import datetime
 import structlog
 
-from ..tools.pca_client import get_pca_client
+from ..tools.sla_poller import get_sla_poller
 
 logger = structlog.get_logger(__name__)
 
@@ -29,11 +29,11 @@ async def verify_stability_node(state: dict[str, Any]) -> dict[str, Any]:
     )
 
     try:
-        pca_client = get_pca_client()
-
-        # Perform stability verification (3 consecutive checks)
-        is_stable = await pca_client.verify_stability(
-            path_endpoints=(source, dest),
+        # Stable if the last 3 shared-window samples (one per poll interval) meet SLA
+        is_stable = await get_sla_poller().is_stable(
+            incident_id=incident_id or state.get("task_id"),
+            source=source,
+            dest=dest,
             sla_tier=sla_tier,
             check_count=3,
         )
@@ -1,17 +1,23 @@
 """Restoration Monitor Agent Tools - Port 8005"""
 from .pca_client import PCASLAClient, get_pca_client
+from .sla_poller import SharedSLAPoller, get_sla_poller
 from .hold_timer import HoldTimerManager, get_hold_timer_manager
 from .cutover import GradualCutover, get_cutover_manager
+from .cutover_scheduler import CutoverScheduler, get_cutover_scheduler
 from .tunnel_deleter import TunnelDeleter, get_tunnel_deleter
 from .service_health_client import ServiceHealthClient, get_service_health_client
 
 __all__ = [
     "PCASLAClient",
     "get_pca_client",
+    "SharedSLAPoller",
+    "get_sla_poller",
     "HoldTimerManager",
     "get_hold_timer_manager",
     "GradualCutover",
     "get_cutover_manager",
+    "CutoverScheduler",
+    "get_cutover_scheduler",
     "TunnelDeleter",
     "get_tunnel_deleter",
     "ServiceHealthClient",
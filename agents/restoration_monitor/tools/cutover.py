@@ -6,6 +6,8 @@ from datetime import datetime
 import httpx
 import structlog
 
+from agent_template.metrics import httpx_event_hooks, instrument_redis
+
 from ..schemas.restoration import CutoverStage, UpdateWeightsInput, UpdateWeightsOutput
 
 logger = structlog.get_logger(__name__)
@@ -37,6 +39,8 @@ class GradualCutover:
         self.stage_interval = stage_interval
         self._client: Optional[httpx.AsyncClient] = None
         self._redis = None
+        # Cleared on the first 404/405 from the per-head-end batch endpoint
+        self._batch_supported = True
         # In-memory state for demo
         self._cutover_state: dict[str, dict] = {}
 
@@ -44,6 +48,7 @@ class GradualCutover:
         """Get or create HTTP client"""
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 base_url=self.cnc_base_url,
                 timeout=30,
             )
@@ -54,7 +59,9 @@ class GradualCutover:
         if self._redis is None:
             try:
                 import redis.asyncio as aioredis
-                self._redis = aioredis.from_url(self.redis_url)
+                self._redis = instrument_redis(
+                    aioredis.from_url(self.redis_url), target="cutover"
+                )
                 await self._redis.ping()
             except Exception:
                 self._redis = None
@@ -244,6 +251,84 @@ class GradualCutover:
                 message=f"CNC API error: {e}",
             )
 
+    async def update_weights_batch(
+        self,
+        head_end: str,
+        updates: List[dict],
+    ) -> List[UpdateWeightsOutput]:
+        """
+        Update ECMP weights of several tunnels on one head-end in one CNC request.
+
+        Args:
+            head_end: Head-end router the tunnels originate on
+            updates: Dicts with protection_tunnel_id, original_path_id,
+                protection_weight and original_weight
+
+        Returns:
+            One UpdateWeightsOutput per update, in order. Falls back to
+            concurrent per-tunnel updates if CNC has no batch endpoint.
+        """
+        if len(updates) == 1 or not self._batch_supported:
+            return list(await asyncio.gather(*(self.update_weights(**u) for u in updates)))
+
+        logger.info("Updating ECMP weights in batch", head_end=head_end, tunnels=len(updates))
+
+        try:
+            client = await self._get_client()
+            response = await client.put(
+                f"/api/v1/head-ends/{head_end}/weights",
+                json={
+                    "updates": [
+                        {
+                            "protection_tunnel_id": u["protection_tunnel_id"],
+                            "original_path_id": u["original_path_id"],
+                            "weights": {
+                                "protection": u["protection_weight"],
+                                "original": u["original_weight"],
+                            },
+                        }
+                        for u in updates
+                    ],
+                },
+            )
+            if response.status_code in (404, 405):
+                logger.info("CNC batch weights endpoint unavailable, using per-tunnel updates")
+                self._batch_supported = False
+                return await self.update_weights_batch(head_end, updates)
+            response.raise_for_status()
+
+            # Per-tunnel results if CNC reports them, else the request succeeded for all
+            results = {
+                r.get("protection_tunnel_id"): r
+                for r in response.json().get("results", [])
+                if isinstance(r, dict)
+            }
+            outputs = []
+            for u in updates:
+                r = results.get(u["protection_tunnel_id"], {})
+                success = r.get("success", True)
+                outputs.append(UpdateWeightsOutput(
+                    success=success,
+                    message=r.get("message") or (
+                        f"Weights updated: protection={u['protection_weight']}, original={u['original_weight']}"
+                        if success else "Weight update rejected by CNC"
+                    ),
+                ))
+            return outputs
+
+        except (httpx.HTTPError, ValueError) as e:
+            if os.getenv("SIMULATE_MODE", "false").lower() == "true":
+                logger.warning("CNC API unavailable, simulating batch weight update", error=str(e))
+                return [
+                    UpdateWeightsOutput(
+                        success=True,
+                        message=f"[Simulated] Weights updated: protection={u['protection_weight']}, original={u['original_weight']}",
+                    )
+                    for u in updates
+                ]
+            logger.error("CNC API unavailable — cannot update ECMP weights", head_end=head_end, error=str(e))
+            return [UpdateWeightsOutput(success=False, message=f"CNC API error: {e}") for _ in updates]
+
     async def _store_cutover_state(self, incident_id: str, state: dict):
         """Store cutover progress in Redis or memory"""
         key = f"cutover:{incident_id}"
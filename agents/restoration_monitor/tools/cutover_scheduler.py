@@ -0,0 +1,366 @@
+"""Cutover Scheduler - All active gradual cutovers advanced on one shared tick
+
+Each gradual cutover is a small state machine (stage index + next due time)
+instead of a coroutine sleeping between stages. One tick loop advances every
+due cutover: SLA of the cutovers mid-migration is checked concurrently (via
+the shared SLA poller, which must return a sample polled after the stage's
+weight shift), weight updates of all advancing cutovers are grouped
+per head-end into one CNC request, and only the cutovers whose SLA check
+failed roll back to their previous stage.
+
+Stage state lives in Redis, so a restarted (or surviving) replica resumes
+the cutovers of a dead one:
+
+    restoration:cutover:{incident_id}           hash with stage, next_at, owner, ...
+    restoration:cutover-scheduler:active        zset of active incident_ids
+    restoration:cutover-scheduler:lease:{owner} liveness of the owning replica
+"""
+import asyncio
+import json
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+import structlog
+
+from agent_template.metrics import instrument_redis
+
+from ..schemas.restoration import CutoverStage
+from .cutover import GradualCutover, get_cutover_manager
+from .sla_poller import get_sla_poller
+
+logger = structlog.get_logger(__name__)
+
+STATE_PREFIX = "restoration:cutover:"
+ACTIVE_KEY = "restoration:cutover-scheduler:active"
+LEASE_PREFIX = "restoration:cutover-scheduler:lease:"
+FINISHED_TTL_SECONDS = 86400
+
+# Take over active cutovers whose owner is this replica or no longer alive
+ADOPT_SCRIPT = """
+local adopted = {}
+for _, incident_id in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    local key = ARGV[1] .. incident_id
+    local owner = redis.call('HGET', key, 'owner')
+    if not owner then
+        redis.call('ZREM', KEYS[1], incident_id)
+    elseif owner == ARGV[3] or redis.call('EXISTS', ARGV[2] .. owner) == 0 then
+        redis.call('HSET', key, 'owner', ARGV[3])
+        table.insert(adopted, incident_id)
+    end
+end
+return adopted
+"""
+
+
+@dataclass
+class ActiveCutover:
+    """State machine of one incident's gradual cutover"""
+    incident_id: str
+    protection_tunnel_id: str
+    original_path_id: str
+    head_end: str
+    source: str
+    dest: str
+    sla_tier: str
+    stage: int = -1  # Last applied stage, -1 before the first
+    next_at: float = field(default_factory=time.time)  # Wall clock, survives restarts
+    stages: List[CutoverStage] = field(default_factory=list)
+    done: Optional[asyncio.Future] = None
+
+    def to_redis(self, owner: str) -> dict[str, str]:
+        return {
+            "protection_tunnel_id": self.protection_tunnel_id,
+            "original_path_id": self.original_path_id,
+            "head_end": self.head_end,
+            "source": self.source,
+            "dest": self.dest,
+            "sla_tier": self.sla_tier,
+            "stage": str(self.stage),
+            "next_at": str(self.next_at),
+            "stages": json.dumps([s.model_dump(mode="json") for s in self.stages]),
+            "owner": owner,
+            "status": "running",
+        }
+
+    @classmethod
+    def from_redis(cls, incident_id: str, data: dict[str, str]) -> "ActiveCutover":
+        return cls(
+            incident_id=incident_id,
+            protection_tunnel_id=data["protection_tunnel_id"],
+            original_path_id=data["original_path_id"],
+            head_end=data["head_end"],
+            source=data["source"],
+            dest=data["dest"],
+            sla_tier=data["sla_tier"],
+            stage=int(data["stage"]),
+            next_at=float(data["next_at"]),
+            stages=[CutoverStage(**s) for s in json.loads(data.get("stages", "[]"))],
+        )
+
+
+class CutoverScheduler:
+    """
+    Shared-tick scheduler of gradual cutovers across incidents.
+
+    Environment variables:
+        CUTOVER_TICK_SECONDS: How often due cutovers are advanced (default 1)
+        CUTOVER_STAGE_INTERVAL_SECONDS: Wait between stages (default 60)
+        CUTOVER_ADOPT_INTERVAL_SECONDS: Lease refresh and orphan adoption period (default 30)
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self.tick_seconds = float(os.getenv("CUTOVER_TICK_SECONDS", "1"))
+        self.stage_interval = float(os.getenv("CUTOVER_STAGE_INTERVAL_SECONDS", "60"))
+        self.adopt_interval = float(os.getenv("CUTOVER_ADOPT_INTERVAL_SECONDS", "30"))
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._redis = None
+        self._adopt_script = None
+        self._active: dict[str, ActiveCutover] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def _get_redis(self):
+        """Get Redis connection (lazy init); state stays in memory without it"""
+        if self._redis is None:
+            try:
+                import redis.asyncio as aioredis
+                self._redis = instrument_redis(
+                    aioredis.from_url(self.redis_url, decode_responses=True), target="cutover_scheduler"
+                )
+                await self._redis.ping()
+                self._adopt_script = self._redis.register_script(ADOPT_SCRIPT)
+            except Exception:
+                self._redis = None
+        return self._redis
+
+    def start(self) -> None:
+        """Start the tick loop (idempotent); its first pass resumes persisted cutovers"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def run(
+        self,
+        incident_id: str,
+        protection_tunnel_id: str,
+        original_path_id: str,
+        head_end: str,
+        source: str,
+        dest: str,
+        sla_tier: str,
+    ) -> Tuple[bool, List[CutoverStage]]:
+        """
+        Schedule a gradual cutover and wait for it to complete or roll back.
+
+        Joins the cutover already running for the incident, if any.
+
+        Returns:
+            (success, stages completed), as GradualCutover.execute_gradual_cutover
+        """
+        self.start()
+        cutover = self._active.get(incident_id)
+        if cutover is None:
+            cutover = ActiveCutover(
+                incident_id=incident_id,
+                protection_tunnel_id=protection_tunnel_id,
+                original_path_id=original_path_id,
+                head_end=head_end,
+                source=source,
+                dest=dest,
+                sla_tier=sla_tier,
+            )
+            self._active[incident_id] = cutover
+            await self._save([cutover], [])
+            logger.info("Gradual cutover scheduled", incident_id=incident_id, head_end=head_end,
+                        active=len(self._active))
+        if cutover.done is None:
+            cutover.done = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(cutover.done)
+
+    async def _run(self) -> None:
+        last_adopt = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_adopt >= self.adopt_interval:
+                    last_adopt = time.monotonic()
+                    await self._adopt()
+                await self._tick(time.time())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Cutover scheduler tick failed", error=str(e))
+            await asyncio.sleep(self.tick_seconds)
+
+    async def _adopt(self) -> None:
+        """Refresh this replica's lease and resume cutovers nobody is advancing"""
+        redis = await self._get_redis()
+        if redis is None:
+            return
+        await redis.set(f"{LEASE_PREFIX}{self.worker_id}", "1", px=int(self.adopt_interval * 3000))
+        adopted = await self._adopt_script(keys=[ACTIVE_KEY], args=[STATE_PREFIX, LEASE_PREFIX, self.worker_id])
+
+        resumed = 0
+        for incident_id in adopted:
+            if incident_id in self._active:
+                continue
+            data = await redis.hgetall(f"{STATE_PREFIX}{incident_id}")
+            try:
+                self._active[incident_id] = ActiveCutover.from_redis(incident_id, data)
+                resumed += 1
+            except (KeyError, ValueError) as e:
+                logger.warning("Dropping unreadable cutover state", incident_id=incident_id, error=str(e))
+                await redis.zrem(ACTIVE_KEY, incident_id)
+        if resumed:
+            logger.info("Resumed gradual cutovers", count=resumed, active=len(self._active))
+
+    async def _tick(self, now: float) -> None:
+        due = [c for c in self._active.values() if c.next_at <= now]
+        if not due:
+            return
+
+        # Cutovers with a stage applied verify SLA before the next one
+        checking = [c for c in due if c.stage >= 0]
+        verdicts = await asyncio.gather(*(self._verify(c) for c in checking))
+        degraded = {c.incident_id for c, ok in zip(checking, verdicts) if not ok}
+
+        finished: list[Tuple[ActiveCutover, bool]] = []
+        by_head_end: dict[str, list[Tuple[ActiveCutover, int]]] = {}
+        for cutover in due:
+            if cutover.incident_id in degraded:
+                logger.warning("SLA degraded during cutover, rolling back", incident_id=cutover.incident_id,
+                               stage=cutover.stage + 1)
+                if cutover.stage == 0:
+                    finished.append((cutover, False))
+                    continue
+                target = cutover.stage - 1
+            else:
+                target = cutover.stage + 1
+            by_head_end.setdefault(cutover.head_end, []).append((cutover, target))
+
+        head_ends = list(by_head_end)
+        results = await asyncio.gather(*(
+            get_cutover_manager().update_weights_batch(head_end, [
+                {
+                    "protection_tunnel_id": c.protection_tunnel_id,
+                    "original_path_id": c.original_path_id,
+                    "protection_weight": GradualCutover.STAGES[target]["protection"],
+                    "original_weight": GradualCutover.STAGES[target]["original"],
+                }
+                for c, target in by_head_end[head_end]
+            ])
+            for head_end in head_ends
+        ))
+
+        advanced: list[ActiveCutover] = []
+        final_stage = len(GradualCutover.STAGES) - 1
+        for head_end, outputs in zip(head_ends, results):
+            for (cutover, target), output in zip(by_head_end[head_end], outputs):
+                if cutover.incident_id in degraded:
+                    if not output.success:
+                        logger.error("Cutover rollback failed", incident_id=cutover.incident_id,
+                                     message=output.message)
+                    finished.append((cutover, False))
+                    continue
+                if not output.success:
+                    logger.error("Failed to update weights", incident_id=cutover.incident_id, stage=target + 1,
+                                 message=output.message)
+                    finished.append((cutover, False))
+                    continue
+
+                weights = GradualCutover.STAGES[target]
+                cutover.stage = target
+                cutover.stages.append(CutoverStage(
+                    stage_index=target,
+                    protection_weight=weights["protection"],
+                    original_weight=weights["original"],
+                    completed_at=datetime.now(),
+                    sla_verified=True,
+                ))
+                if target == final_stage:
+                    finished.append((cutover, True))
+                else:
+                    cutover.next_at = now + self.stage_interval
+                    advanced.append(cutover)
+
+        logger.info("Cutover tick", due=len(due), head_ends=len(head_ends), degraded=len(degraded),
+                    finished=len(finished), active=len(self._active) - len(finished))
+        await self._save(advanced, finished)
+        for cutover, success in finished:
+            self._finish(cutover, success)
+
+    async def _verify(self, cutover: ActiveCutover) -> bool:
+        """SLA of the current stage, judged only by a sample taken after its weight shift"""
+        completed_at = cutover.stages[-1].completed_at if cutover.stages else None
+        shifted_at = completed_at.timestamp() if completed_at else cutover.next_at - self.stage_interval
+        try:
+            sample = await get_sla_poller().sample_after(cutover.incident_id, cutover.source, cutover.dest,
+                                                         cutover.sla_tier, after=shifted_at)
+            return sample.meets_sla
+        except Exception as e:
+            logger.warning("Cutover SLA check failed", incident_id=cutover.incident_id, error=str(e))
+            return False
+
+    async def _save(self, running: list[ActiveCutover], finished: list[Tuple[ActiveCutover, bool]]) -> None:
+        """Persist stage progress of a whole tick in one pipeline"""
+        if not running and not finished:
+            return
+        redis = await self._get_redis()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for cutover in running:
+                    pipe.hset(f"{STATE_PREFIX}{cutover.incident_id}", mapping=cutover.to_redis(self.worker_id))
+                    pipe.zadd(ACTIVE_KEY, {cutover.incident_id: cutover.next_at})
+                for cutover, success in finished:
+                    key = f"{STATE_PREFIX}{cutover.incident_id}"
+                    pipe.hset(key, mapping={
+                        **cutover.to_redis(self.worker_id),
+                        "status": "complete" if success else "failed",
+                        "completed_at": datetime.now().isoformat(),
+                    })
+                    pipe.expire(key, FINISHED_TTL_SECONDS)
+                    pipe.zrem(ACTIVE_KEY, cutover.incident_id)
+                await pipe.execute()
+        except Exception as e:
+            # In-memory state stays authoritative; the next tick persists again
+            logger.warning("Cutover state persist failed", cutovers=len(running) + len(finished), error=str(e))
+
+    def _finish(self, cutover: ActiveCutover, success: bool) -> None:
+        self._active.pop(cutover.incident_id, None)
+        logger.info("Gradual cutover finished" if success else "Gradual cutover stopped",
+                    incident_id=cutover.incident_id, stages_completed=len(cutover.stages))
+        if cutover.done is not None:
+            if not cutover.done.done():
+                cutover.done.set_result((success, list(cutover.stages)))
+        else:
+            # Resumed after a restart: no workflow is left to release the SLA path
+            get_sla_poller().release(cutover.incident_id)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def summary(self) -> dict:
+        return {
+            "active": len(self._active),
+            "head_ends": len({c.head_end for c in self._active.values()}),
+        }
+
+
+_cutover_scheduler: Optional[CutoverScheduler] = None
+
+
+def get_cutover_scheduler() -> CutoverScheduler:
+    """Get or create cutover scheduler singleton"""
+    global _cutover_scheduler
+    if _cutover_scheduler is None:
+        _cutover_scheduler = CutoverScheduler()
+    return _cutover_scheduler
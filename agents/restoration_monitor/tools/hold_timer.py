@@ -4,6 +4,8 @@ from typing import Optional
 from datetime import datetime, timedelta
 import structlog
 
+from agent_template.metrics import instrument_redis
+
 logger = structlog.get_logger(__name__)
 
 # SLA tier hold timer configuration - From DESIGN.md
@@ -32,7 +34,9 @@ class HoldTimerManager:
         if self._redis is None:
             try:
                 import redis.asyncio as aioredis
-                self._redis = aioredis.from_url(self.redis_url)
+                self._redis = instrument_redis(
+                    aioredis.from_url(self.redis_url), target="hold_timer"
+                )
                 await self._redis.ping()
             except Exception as e:
                 logger.warning("Redis unavailable, using in-memory storage", error=str(e))
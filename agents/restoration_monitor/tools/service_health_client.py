@@ -37,13 +37,17 @@ CNC APIs.  Configure via:
 API spec versions: Crosswork Service Health 7.1.0
 """
 
+import asyncio
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
 import structlog
 
+from agent_template.metrics import httpx_event_hooks
+
 logger = structlog.get_logger(__name__)
 
 # -------------------------------------------------------------------
@@ -107,6 +111,10 @@ class ServiceHealthClient:
             username:    CNC login username.  Env: CNC_USERNAME
             password:    CNC login password.  Env: CNC_PASSWORD
             timeout:     Per-request timeout in seconds.
+
+        Impacted-services lookups (shared by all incidents in the process):
+            SH_IMPACTED_CACHE_TTL_SECONDS: Per-transport-ID result cache TTL (default 5)
+            SH_IMPACTED_CONCURRENCY: Concurrent /impactedServices requests (default 8)
         """
         self._sh_base = (sh_base_url or os.getenv("CNC_SH_URL", _DEFAULT_SH_BASE_URL)).rstrip("/")
 
@@ -122,8 +130,16 @@ class ServiceHealthClient:
 
         self._jwt_token: Optional[str] = None
         self._jwt_expires_at: Optional[datetime] = None
+        self._jwt_lock = asyncio.Lock()
         self._client: Optional[httpx.AsyncClient] = None
 
+        self.impacted_cache_ttl = float(os.getenv("SH_IMPACTED_CACHE_TTL_SECONDS", "5"))
+        self._impacted_semaphore = asyncio.Semaphore(int(os.getenv("SH_IMPACTED_CONCURRENCY", "8")))
+        # subservice_id -> (services, fetched_at)
+        self._impacted_cache: Dict[str, tuple[List[Dict[str, Any]], float]] = {}
+        # subservice_id -> in-flight request shared by concurrent callers
+        self._impacted_inflight: Dict[str, asyncio.Task] = {}
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -133,6 +149,7 @@ class ServiceHealthClient:
         if self._client is None or self._client.is_closed:
             ca_cert = os.getenv("CA_CERT_PATH")
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=ca_cert if ca_cert else True,
             )
@@ -147,11 +164,24 @@ class ServiceHealthClient:
           2. POST CNC_JWT_URL with form-encoded tgt → JWT string
 
         The token is cached and reused for up to 8 hours (CNC default expiry).
+        Concurrent callers share one refresh.
         """
-        if self._jwt_token and self._jwt_expires_at:
-            if datetime.now(timezone.utc) < self._jwt_expires_at - timedelta(minutes=5):
+        if self._jwt_valid():
+            return self._jwt_token
+
+        async with self._jwt_lock:
+            if self._jwt_valid():
                 return self._jwt_token
+            return await self._refresh_jwt_token()
 
+    def _jwt_valid(self) -> bool:
+        return bool(
+            self._jwt_token
+            and self._jwt_expires_at
+            and datetime.now(timezone.utc) < self._jwt_expires_at - timedelta(minutes=5)
+        )
+
+    async def _refresh_jwt_token(self) -> str:
         client = await self._get_client()
 
         try:
@@ -512,8 +542,12 @@ class ServiceHealthClient:
                           assurance graph that represents the transport link or
                           its monitoring probe session.
 
-        The method calls the endpoint once per transport_id and aggregates the
-        results, deduplicating by ``serviceId``.
+        The endpoint is called once per transport_id, concurrently (at most
+        SH_IMPACTED_CONCURRENCY at a time), and the results are aggregated,
+        deduplicating by ``serviceId``. Per-transport-ID results are cached
+        for SH_IMPACTED_CACHE_TTL_SECONDS and identical in-flight requests
+        are coalesced, so incidents polling the same transport links share
+        one CNC request per TTL.
 
         Args:
             transport_ids: List of subservice IDs (UUIDs prefixed with "ss-").
@@ -537,52 +571,32 @@ class ServiceHealthClient:
             for svc in services:
                 print(svc["serviceId"], svc["serviceType"])
         """
-        endpoint = f"{self._assurance_url}/impactedServices"
+        unique_ids = list(dict.fromkeys(transport_ids))
+        results = await asyncio.gather(
+            *(self._impacted_services_for(subservice_id) for subservice_id in unique_ids),
+            return_exceptions=True,
+        )
+
         seen_ids: set = set()
         all_services: List[Dict[str, Any]] = []
 
-        for subservice_id in transport_ids:
-            body: Dict[str, Any] = {"subservice_id": subservice_id}
-            logger.info(
-                "Querying impacted services",
-                subservice_id=subservice_id,
-                endpoint=endpoint,
-            )
-
-            try:
-                response = await self._post(endpoint, body)
-
-                # Response schema: ResponseImpactedServices
-                # { "status": ..., "services": [ {serviceId, serviceType, serviceName}, ... ], "error": "" }
-                services = response.get("services", [])
-                error_msg = response.get("error", "")
-
-                if error_msg:
-                    logger.warning(
-                        "Impacted services response contains error",
-                        subservice_id=subservice_id,
-                        api_error=error_msg,
-                    )
-
-                for svc in services:
-                    svc_id = svc.get("serviceId", "")
-                    if svc_id and svc_id not in seen_ids:
-                        seen_ids.add(svc_id)
-                        all_services.append(svc)
-
-                logger.info(
-                    "Impacted services retrieved",
-                    subservice_id=subservice_id,
-                    count=len(services),
-                )
-
-            except httpx.HTTPError as exc:
+        for subservice_id, services in zip(unique_ids, results):
+            if isinstance(services, httpx.HTTPError):
                 logger.error(
                     "Impacted services request failed",
                     subservice_id=subservice_id,
-                    error=str(exc),
+                    error=str(services),
                 )
                 # Continue processing remaining transport IDs.
+                continue
+            if isinstance(services, BaseException):
+                raise services
+
+            for svc in services:
+                svc_id = svc.get("serviceId", "")
+                if svc_id and svc_id not in seen_ids:
+                    seen_ids.add(svc_id)
+                    all_services.append(svc)
 
         logger.info(
             "Impacted services aggregation complete",
@@ -591,6 +605,58 @@ class ServiceHealthClient:
         )
         return all_services
 
+    async def _impacted_services_for(self, subservice_id: str) -> List[Dict[str, Any]]:
+        """Impacted services of one transport ID: cached, else joins or starts the request"""
+        cached = self._impacted_cache.get(subservice_id)
+        if cached is not None and time.monotonic() - cached[1] < self.impacted_cache_ttl:
+            return cached[0]
+
+        task = self._impacted_inflight.get(subservice_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_impacted_services(subservice_id))
+            self._impacted_inflight[subservice_id] = task
+            task.add_done_callback(lambda _: self._impacted_inflight.pop(subservice_id, None))
+        # A cancelled poll must not cancel the request other incidents wait on
+        return await asyncio.shield(task)
+
+    async def _fetch_impacted_services(self, subservice_id: str) -> List[Dict[str, Any]]:
+        endpoint = f"{self._assurance_url}/impactedServices"
+        body: Dict[str, Any] = {"subservice_id": subservice_id}
+        logger.info(
+            "Querying impacted services",
+            subservice_id=subservice_id,
+            endpoint=endpoint,
+        )
+
+        async with self._impacted_semaphore:
+            response = await self._post(endpoint, body)
+
+        # Response schema: ResponseImpactedServices
+        # { "status": ..., "services": [ {serviceId, serviceType, serviceName}, ... ], "error": "" }
+        services = response.get("services", [])
+        error_msg = response.get("error", "")
+
+        if error_msg:
+            logger.warning(
+                "Impacted services response contains error",
+                subservice_id=subservice_id,
+                api_error=error_msg,
+            )
+        else:
+            now = time.monotonic()
+            if len(self._impacted_cache) >= 1024:
+                self._impacted_cache = {
+                    k: v for k, v in self._impacted_cache.items() if now - v[1] < self.impacted_cache_ttl
+                }
+            self._impacted_cache[subservice_id] = (services, now)
+
+        logger.info(
+            "Impacted services retrieved",
+            subservice_id=subservice_id,
+            count=len(services),
+        )
+        return services
+
     async def get_matching_subservices(self, service_id: str) -> Dict[str, Any]:
         """
         Retrieve subservices matching a given service, optionally filtered by type or tags.
@@ -0,0 +1,213 @@
+"""Shared SLA Poller - One PCA poll per monitored path, shared by all incidents
+
+Restoration tasks register the (source, dest, sla_tier) path they monitor.
+Each unique path is polled once per SLA_POLL_INTERVAL_SECONDS, however many
+incidents watch it, into a rolling window of the last SLA_WINDOW_SAMPLES
+results. poll_sla reads the latest sample and verify_stability checks the
+most recent samples, so PCA load scales with unique paths, not incidents.
+Samples more than two intervals old (polls failing, or a path that was
+dropped and re-watched) are never used: readers poll again or raise.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+import structlog
+
+from ..schemas.restoration import PollSLAOutput
+from .pca_client import get_pca_client
+
+logger = structlog.get_logger(__name__)
+
+PathKey = Tuple[str, str, str]  # (source, dest, sla_tier)
+
+
+@dataclass
+class MonitoredPath:
+    """Rolling sample window of one path and the incidents watching it"""
+    key: PathKey
+    samples: deque
+    sample_times: deque  # Wall-clock start of the poll behind each sample
+    incidents: set = field(default_factory=set)
+    last_read: float = field(default_factory=time.monotonic)
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+    polling: Optional[asyncio.Task] = None
+    last_error: Optional[str] = None
+
+
+class SharedSLAPoller:
+    """Deduplicated, interval-driven PCA polling of monitored paths"""
+
+    def __init__(self):
+        self.interval = float(os.getenv("SLA_POLL_INTERVAL_SECONDS", "10"))
+        self.window = int(os.getenv("SLA_WINDOW_SAMPLES", "12"))
+        self.idle_seconds = float(os.getenv("SLA_PATH_IDLE_SECONDS", "900"))
+        self.max_age = self.interval * 2
+        self._semaphore = asyncio.Semaphore(int(os.getenv("SLA_POLL_CONCURRENCY", "16")))
+        self._paths: dict[PathKey, MonitoredPath] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(self, incident_id: str, source: str, dest: str, sla_tier: str) -> MonitoredPath:
+        """Register an incident on a path (idempotent) and start polling it"""
+        key = (source, dest, sla_tier)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = MonitoredPath(
+                key=key, samples=deque(maxlen=self.window), sample_times=deque(maxlen=self.window)
+            )
+            logger.info("Monitoring new SLA path", source=source, dest=dest, sla_tier=sla_tier,
+                        unique_paths=len(self._paths))
+        path.incidents.add(incident_id)
+        path.last_read = time.monotonic()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return path
+
+    def release(self, incident_id: str) -> None:
+        """Unregister an incident; paths nobody watches stop being polled"""
+        for key, path in list(self._paths.items()):
+            path.incidents.discard(incident_id)
+            if not path.incidents:
+                del self._paths[key]
+
+    async def latest(self, incident_id: str, source: str, dest: str, sla_tier: str) -> PollSLAOutput:
+        """
+        Most recent sample of the path, polling now if it has none within
+        max_age. Raises if polling fails instead of returning a stale sample.
+        """
+        path = self.watch(incident_id, source, dest, sla_tier)
+        if not self._fresh_count(path):
+            await self._poll(path)
+        if not self._fresh_count(path):
+            raise RuntimeError(
+                f"No SLA sample for {source}->{dest} in the last {self.max_age:g}s "
+                f"(last poll error: {path.last_error})"
+            )
+        return path.samples[-1]
+
+    async def sample_after(self, incident_id: str, source: str, dest: str, sla_tier: str,
+                           after: float) -> PollSLAOutput:
+        """
+        Latest sample of a poll started after wall-clock time `after`,
+        polling now if the window has none. Raises if polling fails instead
+        of returning an older sample.
+        """
+        path = self.watch(incident_id, source, dest, sla_tier)
+        # Twice at most: a coalesced in-flight poll may have started too early
+        for _ in range(2):
+            if path.sample_times and path.sample_times[-1] > after:
+                return path.samples[-1]
+            await self._poll(path)
+        if path.sample_times and path.sample_times[-1] > after:
+            return path.samples[-1]
+        raise RuntimeError(f"No SLA sample for {source}->{dest} newer than {after}")
+
+    async def is_stable(self, incident_id: str, source: str, dest: str, sla_tier: str, check_count: int) -> bool:
+        """
+        True if the last check_count samples all meet SLA. Only an unbroken
+        run of fresh samples counts (see _fresh_count); waits for the window
+        to hold check_count of them (one per interval) if needed, but raises
+        TimeoutError if polls keep failing past (check_count + 2) intervals.
+        """
+        path = self.watch(incident_id, source, dest, sla_tier)
+        if not self._fresh_count(path):
+            await self._poll(path)
+        deadline = time.monotonic() + self.interval * (check_count + 2)
+        while self._fresh_count(path) < min(check_count, self.window):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Only {self._fresh_count(path)} of {check_count} fresh SLA samples for {source}->{dest} "
+                    f"(last poll error: {path.last_error})"
+                )
+            path.updated.clear()
+            try:
+                await asyncio.wait_for(path.updated.wait(), timeout=min(remaining, self.interval * 2))
+            except asyncio.TimeoutError:
+                pass
+            # Re-register in case the path was dropped meanwhile
+            path = self.watch(incident_id, source, dest, sla_tier)
+
+        recent = list(path.samples)[-check_count:]
+        for i, sample in enumerate(recent):
+            if not sample.meets_sla:
+                logger.warning("Stability check failed", check_number=i + 1, samples=len(recent))
+                return False
+        return True
+
+    def _fresh_count(self, path: MonitoredPath) -> int:
+        """
+        Number of most recent samples with no gap over max_age between
+        them, counting back from now. A failed poll leaves a gap, so samples
+        from before an outage are not mixed into a stability check.
+        """
+        count = 0
+        newer = time.time()
+        for sampled_at in reversed(path.sample_times):
+            if newer - sampled_at > self.max_age:
+                break
+            count += 1
+            newer = sampled_at
+        return count
+
+    async def _run(self) -> None:
+        while self._paths:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            for key, path in list(self._paths.items()):
+                if now - path.last_read > self.idle_seconds:
+                    # Owner crashed or never released; stop polling on its behalf
+                    logger.warning("Dropping idle SLA path", source=key[0], dest=key[1], incidents=len(path.incidents))
+                    del self._paths[key]
+            results = await asyncio.gather(
+                *(self._poll(path) for path in list(self._paths.values())), return_exceptions=True
+            )
+            for error in results:
+                if isinstance(error, Exception):
+                    logger.warning("SLA path poll failed", error=str(error))
+
+    async def _poll(self, path: MonitoredPath) -> None:
+        # Coalesce with a poll already running for this path (first reads vs interval tick)
+        if path.polling is None or path.polling.done():
+            path.polling = asyncio.create_task(self._fetch(path))
+        await asyncio.shield(path.polling)
+
+    async def _fetch(self, path: MonitoredPath) -> None:
+        source, dest, sla_tier = path.key
+        started = time.time()
+        try:
+            async with self._semaphore:
+                result = await get_pca_client().get_path_sla(path_endpoints=(source, dest), sla_tier=sla_tier)
+        except Exception as e:
+            path.last_error = str(e)
+            raise
+        path.last_error = None
+        path.sample_times.append(started)
+        path.samples.append(result)
+        path.updated.set()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._paths.clear()
+
+    def summary(self) -> dict:
+        return {
+            "unique_paths": len(self._paths),
+            "incidents": len({i for p in self._paths.values() for i in p.incidents}),
+        }
+
+
+_sla_poller: Optional[SharedSLAPoller] = None
+
+
+def get_sla_poller() -> SharedSLAPoller:
+    """Get or create shared SLA poller singleton"""
+    global _sla_poller
+    if _sla_poller is None:
+        _sla_poller = SharedSLAPoller()
+    return _sla_poller
@@ -4,6 +4,9 @@ from typing import Optional
 import httpx
 import structlog
 
+from agent_template.metrics import httpx_event_hooks, instrument_redis
+from agent_template.tools.tunnel_registry import get_tunnel_registry
+
 from ..schemas.restoration import DeleteTunnelInput, DeleteTunnelOutput
 
 logger = structlog.get_logger(__name__)
@@ -29,6 +32,7 @@ class TunnelDeleter:
         """Get or create HTTP client"""
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 base_url=self.cnc_base_url,
                 timeout=30,
             )
@@ -39,7 +43,9 @@ class TunnelDeleter:
         if self._redis is None:
             try:
                 import redis.asyncio as aioredis
-                self._redis = aioredis.from_url(self.redis_url)
+                self._redis = instrument_redis(
+                    aioredis.from_url(self.redis_url), target="tunnel_deleter"
+                )
                 await self._redis.ping()
             except Exception:
                 self._redis = None
@@ -125,12 +131,26 @@ class TunnelDeleter:
             logger.info("BSID release simulated (no Redis)", bsid=bsid)
             return True
 
+    async def _release_reference(self, tunnel_id: str, incident_id: str) -> bool:
+        """Drop the incident's registry reference; True if other incidents still use the tunnel"""
+        registry = get_tunnel_registry()
+        if registry is None:
+            return False
+        try:
+            remaining_refs = await registry.release(tunnel_id, incident_id)
+        except Exception as e:
+            logger.warning("Tunnel registry release failed", tunnel_id=tunnel_id, error=str(e))
+            return False
+        return bool(remaining_refs)
+
     async def cleanup_incident_tunnels(
         self,
         incident_id: str,
     ) -> dict:
         """
         Clean up all tunnels associated with an incident.
+        Tunnels still shared with other incidents (tunnel registry) are
+        only dereferenced, not deleted.
         Returns summary of cleanup actions.
         """
         logger.info("Cleaning up incident tunnels", incident_id=incident_id)
@@ -138,6 +158,7 @@ class TunnelDeleter:
         redis = await self._get_redis()
         cleanup_summary = {
             "tunnels_deleted": 0,
+            "tunnels_retained": 0,
             "bsids_released": [],
             "errors": [],
         }
@@ -150,6 +171,9 @@ class TunnelDeleter:
             for tunnel_id_bytes in tunnel_ids:
                 tunnel_id = tunnel_id_bytes.decode() if isinstance(tunnel_id_bytes, bytes) else tunnel_id_bytes
                 try:
+                    if await self._release_reference(tunnel_id, incident_id):
+                        cleanup_summary["tunnels_retained"] += 1
+                        continue
                     result = await self.delete_tunnel(tunnel_id)
                     if result.success:
                         cleanup_summary["tunnels_deleted"] += 1
@@ -45,7 +45,7 @@ async def analyze_impact_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "analyze_impact",
-            "nodes_executed": state.get("nodes_executed", []) + ["analyze_impact"],
+            "nodes_executed": ["analyze_impact"],
             "impact_assessment": {},
             "total_affected": 0,
             "services_by_type": {},
@@ -72,7 +72,7 @@ async def analyze_impact_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "analyze_impact",
-        "nodes_executed": state.get("nodes_executed", []) + ["analyze_impact"],
+        "nodes_executed": ["analyze_impact"],
         "impact_assessment": service_impacts,
         "total_affected": aggregation.get("total_affected", 0),
         "services_by_type": aggregation.get("services_by_type", {}),
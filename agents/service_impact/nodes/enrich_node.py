@@ -45,7 +45,7 @@ async def enrich_sla_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "enrich_sla",
-            "nodes_executed": state.get("nodes_executed", []) + ["enrich_sla"],
+            "nodes_executed": ["enrich_sla"],
             "affected_services": [],
             "services_by_tier": {},
             "highest_priority_tier": None,
@@ -76,7 +76,7 @@ async def enrich_sla_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "enrich_sla",
-        "nodes_executed": state.get("nodes_executed", []) + ["enrich_sla"],
+        "nodes_executed": ["enrich_sla"],
         "affected_services": enriched_services,
         "services_by_tier": services_by_tier,
         "highest_priority_tier": highest_priority_tier,
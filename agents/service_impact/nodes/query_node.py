@@ -43,7 +43,7 @@ async def query_services_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "query_services",
-            "nodes_executed": state.get("nodes_executed", []) + ["query_services"],
+            "nodes_executed": ["query_services"],
             "raw_services": [],
             "query_success": True,
             "query_error": None,
@@ -75,7 +75,7 @@ async def query_services_node(state: dict[str, Any]) -> dict[str, Any]:
 
         return {
             "current_node": "query_services",
-            "nodes_executed": state.get("nodes_executed", []) + ["query_services"],
+            "nodes_executed": ["query_services"],
             "raw_services": all_services,
             "query_success": True,
             "query_error": None,
@@ -89,7 +89,7 @@ async def query_services_node(state: dict[str, Any]) -> dict[str, Any]:
         )
         return {
             "current_node": "query_services",
-            "nodes_executed": state.get("nodes_executed", []) + ["query_services"],
+            "nodes_executed": ["query_services"],
             "raw_services": [],
             "query_success": False,
             "query_error": str(e),
@@ -62,7 +62,7 @@ async def return_affected_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "return_affected",
-        "nodes_executed": state.get("nodes_executed", []) + ["return_affected"],
+        "nodes_executed": ["return_affected"],
         "result": result,
         "status": "success",
         "completed_at": datetime.now(timezone.utc).isoformat(),
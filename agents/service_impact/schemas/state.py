@@ -5,7 +5,9 @@ TypedDict for LangGraph workflow state.
 From DESIGN.md Service Impact Agent.
 """
 
-from typing import TypedDict, List, Optional, Literal, Any
+from typing import Annotated, TypedDict, List, Optional, Literal, Any
+
+from agent_template.schemas.state import append_history
 
 
 class ServiceImpactState(TypedDict, total=False):
@@ -44,7 +46,7 @@ class ServiceImpactState(TypedDict, total=False):
 
     # Workflow control
     current_node: str
-    nodes_executed: List[str]
+    nodes_executed: Annotated[List[str], append_history]  # Nodes return only their own name
     iteration_count: int
     max_iterations: int
     status: Literal["running", "success", "failed"]
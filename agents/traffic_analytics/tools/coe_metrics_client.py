@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional
 import httpx
 import structlog
 
+from agent_template.metrics import httpx_event_hooks
+
 logger = structlog.get_logger(__name__)
 
 # Default base URLs derived from spec server definitions
@@ -84,6 +86,7 @@ class COEMetricsClient:
                 headers["Authorization"] = f"Bearer {jwt_token}"
 
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=verify,
                 headers=headers,
@@ -9,6 +9,8 @@ from agent_template.api.server import A2ATaskServer
 from agent_template.tools.mcp_client import MCPToolClient
 from agent_template.tools.a2a_client import A2AClient, configure_a2a_client
 from .workflow import TunnelProvisioningWorkflow
+from .tools.bsid_allocator import get_bsid_allocator
+from .tools.nso_job_poller import get_nso_job_poller
 
 load_dotenv()
 structlog.configure(processors=[structlog.stdlib.filter_by_level, structlog.stdlib.add_logger_name,
@@ -46,6 +48,13 @@ class TunnelProvisioningRunner:
     def run(self) -> None:
         asyncio.run(self.initialize())
         server = self.create_server()
+
+        @server.app.on_event("shutdown")
+        async def _return_bsids() -> None:
+            # Hand unallocated BSIDs back so other replicas can lease them
+            await get_bsid_allocator().close()
+            await get_nso_job_poller().close()
+
         logger.info("Starting Tunnel Provisioning A2A server", port=self.config.a2a.port)
         uvicorn.run(server.app, host=self.config.a2a.host, port=self.config.a2a.port, log_level=self.config.observability.log_level.lower())
 
@@ -1,14 +1,15 @@
 """Tunnel Provisioning Agent Nodes - From DESIGN.md workflow"""
 from .detect_node import detect_te_type_node
+from .screen_node import screen_paths_node
 from .build_node import build_payload_node
 from .create_node import create_tunnel_node
 from .verify_node import verify_tunnel_node
 from .steer_node import steer_traffic_node
 from .return_node import return_success_node
-from .conditions import check_creation_success, check_tunnel_verified, check_can_retry
+from .conditions import check_screening_passed, check_creation_success, check_tunnel_verified, check_can_retry
 
 __all__ = [
-    "detect_te_type_node", "build_payload_node", "create_tunnel_node",
+    "detect_te_type_node", "screen_paths_node", "build_payload_node", "create_tunnel_node",
     "verify_tunnel_node", "steer_traffic_node", "return_success_node",
-    "check_creation_success", "check_tunnel_verified", "check_can_retry",
+    "check_screening_passed", "check_creation_success", "check_tunnel_verified", "check_can_retry",
 ]
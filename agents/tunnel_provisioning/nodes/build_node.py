@@ -17,13 +17,15 @@ async def build_payload_node(state: dict[str, Any]) -> dict[str, Any]:
 
     logger.info("Building tunnel payload", incident_id=incident_id, te_type=te_type)
 
-    # Allocate BSID
+    # Allocate BSID (batch provisioning leases them up front per head-end)
     bsid_allocator = get_bsid_allocator()
     try:
-        if te_type in ["sr-mpls", "srv6"]:
-            binding_sid = await bsid_allocator.allocate_mpls_bsid(head_end)
-        else:
+        if te_type not in ["sr-mpls", "srv6"]:
             binding_sid = None
+        elif state.get("binding_sid"):
+            binding_sid = state["binding_sid"]
+        else:
+            binding_sid = await bsid_allocator.allocate_mpls_bsid(head_end)
     except Exception as e:
         logger.warning("BSID allocation failed, using default", error=str(e))
         binding_sid = 24001
@@ -64,7 +66,7 @@ async def build_payload_node(state: dict[str, Any]) -> dict[str, Any]:
     logger.info("Payload built", incident_id=incident_id, color=color, binding_sid=binding_sid)
     return {
         "current_node": "build_payload",
-        "nodes_executed": state.get("nodes_executed", []) + ["build_payload"],
+        "nodes_executed": ["build_payload"],
         "tunnel_payload": payload,
         "binding_sid": binding_sid,
         "color": color,
@@ -1,6 +1,10 @@
 """Conditional Edge Functions - From DESIGN.md workflow transitions"""
 from typing import Any, Literal
 
+def check_screening_passed(state: dict[str, Any]) -> Literal["build", "return"]:
+    """Check if a candidate path survived dry-run screening"""
+    return "return" if state.get("screening_passed") is False else "build"
+
 def check_creation_success(state: dict[str, Any]) -> Literal["verify", "retry"]:
     """Check if tunnel creation succeeded"""
     return "verify" if state.get("creation_success", False) else "retry"
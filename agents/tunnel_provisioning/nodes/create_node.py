@@ -37,7 +37,11 @@ def _segment_list_from_config(config: TunnelConfig) -> list[dict]:
 def _coe_result_to_tunnel_result(raw: dict, te_type: str) -> TunnelResult:
     """Convert COE raw dict response → TunnelResult for unified handling downstream."""
     results = raw.get("output", {}).get("results", [])
-    first = results[0] if results else {}
+    return _coe_entry_to_tunnel_result(results[0] if results else {}, te_type)
+
+
+def _coe_entry_to_tunnel_result(first: dict, te_type: str) -> TunnelResult:
+    """Convert one COE output.results[] entry → TunnelResult."""
     state = first.get("state", "")
     success = state in ("success", "CREATED", "MODIFIED", "")  # COE may omit state on success
     tunnel_id = first.get("path-name") or first.get("color") or ""
@@ -55,6 +59,16 @@ def _coe_result_to_tunnel_result(raw: dict, te_type: str) -> TunnelResult:
     )
 
 
+def _rsvp_path_options(config: TunnelConfig) -> dict[str, Any]:
+    """COE rsvp-te-tunnel-path options from TunnelConfig."""
+    path_options: dict[str, Any] = {
+        "optimization-objective": config.optimization_objective,
+    }
+    if config.explicit_hops:
+        path_options["hops"] = config.explicit_hops
+    return path_options
+
+
 async def _create_via_pce(config: TunnelConfig) -> TunnelResult:
     """PCE-initiated path: COE REST API → PCE programs router via PCEP."""
     from ..tools.coe_tunnel_ops_client import get_coe_tunnel_ops_client
@@ -70,17 +84,12 @@ async def _create_via_pce(config: TunnelConfig) -> TunnelResult:
         )
     else:
         # rsvp-te
-        path_options: dict[str, Any] = {
-            "optimization-objective": config.optimization_objective,
-        }
-        if config.explicit_hops:
-            path_options["hops"] = config.explicit_hops
         raw = await coe.create_rsvp_tunnel(
             tunnel_name=config.path_name,
             source=config.head_end,
             destination=config.end_point,
             bandwidth=_bandwidth_mbps(config),
-            path_options=path_options,
+            path_options=_rsvp_path_options(config),
         )
 
     return _coe_result_to_tunnel_result(raw, config.te_type)
@@ -148,7 +157,7 @@ async def create_tunnel_node(state: dict[str, Any]) -> dict[str, Any]:
         logger.info("Tunnel created", incident_id=incident_id, tunnel_id=result.tunnel_id)
         return {
             "current_node": "create_tunnel",
-            "nodes_executed": state.get("nodes_executed", []) + ["create_tunnel"],
+            "nodes_executed": ["create_tunnel"],
             "tunnel_id": result.tunnel_id,
             "creation_success": True,
             "binding_sid": result.binding_sid,
@@ -157,7 +166,7 @@ async def create_tunnel_node(state: dict[str, Any]) -> dict[str, Any]:
         logger.error("Tunnel creation failed", incident_id=incident_id, error=result.message)
         return {
             "current_node": "create_tunnel",
-            "nodes_executed": state.get("nodes_executed", []) + ["create_tunnel"],
+            "nodes_executed": ["create_tunnel"],
             "creation_success": False,
             "creation_error": result.message,
             "retry_count": retry_count + 1,
@@ -20,6 +20,6 @@ async def detect_te_type_node(state: dict[str, Any]) -> dict[str, Any]:
     logger.info("TE type detected", incident_id=incident_id, te_type=te_type)
     return {
         "current_node": "detect_te_type",
-        "nodes_executed": state.get("nodes_executed", []) + ["detect_te_type"],
+        "nodes_executed": ["detect_te_type"],
         "detected_te_type": te_type,
     }
@@ -23,6 +23,7 @@ async def return_success_node(state: dict[str, Any]) -> dict[str, Any]:
             "te_type": te_type,
             "operational_status": operational_status,
             "traffic_steered": state.get("traffic_steered", False),
+            "computed_path": state.get("computed_path"),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         status = "success"
@@ -40,7 +41,7 @@ async def return_success_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "return_success",
-        "nodes_executed": state.get("nodes_executed", []) + ["return_success"],
+        "nodes_executed": ["return_success"],
         "result": result,
         "status": status,
         "completed_at": datetime.now(timezone.utc).isoformat(),
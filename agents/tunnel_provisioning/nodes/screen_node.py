@@ -0,0 +1,38 @@
+"""Screen Candidate Paths Node - dry-run top-k paths before committing one"""
+from typing import Any
+import structlog
+from ..tools.dryrun_screener import get_dryrun_screener
+
+logger = structlog.get_logger(__name__)
+
+async def screen_paths_node(state: dict[str, Any]) -> dict[str, Any]:
+    """Dry-run candidate_paths concurrently and keep the first admissible one as computed_path.
+
+    Without candidate_paths the computed_path is committed unscreened, as before.
+    """
+    incident_id = state.get("incident_id")
+    candidates = state.get("candidate_paths") or []
+    update: dict[str, Any] = {
+        "current_node": "screen_paths",
+        "nodes_executed": ["screen_paths"],
+    }
+    if not candidates:
+        return update
+
+    screener = get_dryrun_screener()
+    verdicts = await screener.screen(
+        te_type=state.get("detected_te_type", "sr-mpls"),
+        head_end=state.get("head_end"),
+        end_point=state.get("end_point"),
+        candidates=candidates,
+        bandwidth_mbps=int(state.get("bandwidth_mbps") or 0),
+    )
+    selected = screener.select(candidates, verdicts)
+    if selected is None:
+        error = f"All {len(candidates)} candidate paths rejected by dry-run"
+        logger.warning(error, incident_id=incident_id)
+        return {**update, "screening_passed": False, "creation_success": False, "creation_error": error}
+
+    logger.info("Candidate path selected", incident_id=incident_id, path_id=selected.get("path_id"),
+                rank=candidates.index(selected) + 1, verified_by_dryrun=verdicts[candidates.index(selected)] is True)
+    return {**update, "screening_passed": True, "computed_path": selected}
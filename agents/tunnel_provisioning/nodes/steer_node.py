@@ -26,28 +26,35 @@ async def _steer_rsvp_te_vrfs(
     Returns:
         (success, error_message) — error_message is empty string on success.
     """
-    url = f"{CNC_NSO_URL}/api/running/devices/device/{head_end}/config/vrf-steering"
-    payload = {
-        "input": {
-            "vrfs": [
-                {
-                    "name": vrf,
-                    "tunnel-id": tunnel_id,
-                    "next-hop": tunnel_endpoint_ip,
-                }
-                for vrf in affected_vrfs
-            ]
-        }
-    }
-
     logger.info(
         "Posting RSVP-TE VRF steering to CNC/NSO",
-        url=url,
         head_end=head_end,
         affected_vrfs=affected_vrfs,
         tunnel_id=tunnel_id,
         tunnel_endpoint_ip=tunnel_endpoint_ip,
     )
+    return await _steer_rsvp_te_vrf_entries(
+        head_end,
+        [
+            {
+                "name": vrf,
+                "tunnel-id": tunnel_id,
+                "next-hop": tunnel_endpoint_ip,
+            }
+            for vrf in affected_vrfs
+        ],
+    )
+
+
+async def _steer_rsvp_te_vrf_entries(head_end: str, vrf_entries: list[dict]) -> Tuple[bool, str]:
+    """POST one vrf-steering update for a head-end.
+
+    vrf_entries may point VRFs at several tunnels, so batch provisioning
+    steers everything on a head-end in a single call.
+    """
+    url = f"{CNC_NSO_URL}/api/running/devices/device/{head_end}/config/vrf-steering"
+    payload = {"input": {"vrfs": vrf_entries}}
+    tunnel_ids = sorted({entry["tunnel-id"] for entry in vrf_entries})
 
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
@@ -56,7 +63,7 @@ async def _steer_rsvp_te_vrfs(
         logger.info(
             "RSVP-TE VRF steering succeeded",
             head_end=head_end,
-            tunnel_id=tunnel_id,
+            tunnel_ids=tunnel_ids,
             status_code=response.status_code,
         )
         return (True, "")
@@ -65,7 +72,7 @@ async def _steer_rsvp_te_vrfs(
         logger.error(
             "RSVP-TE VRF steering failed",
             head_end=head_end,
-            tunnel_id=tunnel_id,
+            tunnel_ids=tunnel_ids,
             error=error_msg,
         )
         return (False, error_msg)
@@ -100,7 +107,7 @@ async def steer_traffic_node(state: dict[str, Any]) -> dict[str, Any]:
 
     base_update: dict[str, Any] = {
         "current_node": "steer_traffic",
-        "nodes_executed": state.get("nodes_executed", []) + ["steer_traffic"],
+        "nodes_executed": ["steer_traffic"],
     }
 
     # ------------------------------------------------------------------
@@ -127,7 +127,7 @@ async def verify_tunnel_node(state: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "current_node": "verify_tunnel",
-        "nodes_executed": state.get("nodes_executed", []) + ["verify_tunnel"],
+        "nodes_executed": ["verify_tunnel"],
         "tunnel_verified": verify_result["tunnel_verified"],
         "operational_status": verify_result["operational_status"],
     }
@@ -1,5 +1,7 @@
 """Tunnel Provisioning Agent State Schema - From DESIGN.md"""
-from typing import TypedDict, List, Optional, Literal, Any
+from typing import Annotated, TypedDict, List, Optional, Literal, Any
+
+from agent_template.schemas.state import append_history
 
 class TunnelProvisioningState(TypedDict, total=False):
     task_id: str
@@ -10,12 +12,16 @@ class TunnelProvisioningState(TypedDict, total=False):
     head_end: str
     end_point: str
     computed_path: dict
+    candidate_paths: List[dict]  # Top-k from Path Computation, best first (dry-run screened)
+    bandwidth_mbps: Optional[float]
     path_type: Literal["dynamic", "explicit"]
     requested_te_type: Optional[str]
     input_payload: dict
     # Detection
     detected_te_type: str
     device_capabilities: dict
+    # Screening
+    screening_passed: Optional[bool]
     # Payload
     tunnel_payload: dict
     binding_sid: Optional[int]
@@ -35,7 +41,7 @@ class TunnelProvisioningState(TypedDict, total=False):
     tunnel_endpoint_ip: Optional[str]
     # Workflow
     current_node: str
-    nodes_executed: List[str]
+    nodes_executed: Annotated[List[str], append_history]  # Nodes return only their own name
     status: Literal["running", "success", "failed", "escalated"]
     error: Optional[str]
     started_at: str
@@ -4,6 +4,9 @@ from .cnc_tunnel import CNCTunnelClient, get_cnc_tunnel_client
 from .bsid_allocator import BSIDAllocator, get_bsid_allocator
 from .cnc_srte_config_client import CNCSRTEConfigClient, get_srte_config_client
 from .coe_tunnel_ops_client import COETunnelOpsClient, get_coe_tunnel_ops_client
+from .nso_job_poller import NSOJobPoller, get_nso_job_poller
+from .batch_provisioner import BatchProvisioner, get_batch_provisioner
+from .dryrun_screener import DryRunScreener, get_dryrun_screener
 
 __all__ = [
     "TETypeDetector", "get_te_detector",
@@ -11,4 +14,7 @@ __all__ = [
     "BSIDAllocator", "get_bsid_allocator",
     "CNCSRTEConfigClient", "get_srte_config_client",
     "COETunnelOpsClient", "get_coe_tunnel_ops_client",
+    "NSOJobPoller", "get_nso_job_poller",
+    "BatchProvisioner", "get_batch_provisioner",
+    "DryRunScreener", "get_dryrun_screener",
 ]
@@ -0,0 +1,299 @@
+"""Batch Tunnel Provisioner - provision_tunnels_batch task
+
+Provisions many protection tunnels in one task instead of one graph run
+per tunnel:
+
+  1. detect TE type, dry-run screen candidate_paths and build each payload
+     with the regular nodes, leasing SR BSIDs with one allocator call per
+     head-end
+  2. create tunnels grouped by (mode, head-end, SR/RSVP): one COE
+     sr-policy-create / rsvp-te-tunnel-create or NSO sr-policy-create per
+     group. The NSO RSVP-TE dispatch takes a single tunnel, so those run
+     concurrently and their jobs are tracked by the shared NSO job poller.
+  3. verify everything with one COE SR policy and one RSVP-TE datalist call
+  4. steer RSVP-TE VRFs with one vrf-steering call per head-end
+"""
+import asyncio
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Optional
+import structlog
+
+from ..schemas.tunnels import TunnelConfig, TunnelResult
+
+logger = structlog.get_logger(__name__)
+
+SR_TE_TYPES = ("sr-mpls", "srv6")
+
+
+def _is_sr(item: dict[str, Any]) -> bool:
+    return item.get("detected_te_type") in SR_TE_TYPES
+
+
+def _datalist_key(sr: bool, head_end: Any, end_point: Any, name: Any) -> tuple:
+    """SR policies match on color, RSVP-TE tunnels on path-name"""
+    return (sr, str(head_end), str(end_point), str(name))
+
+
+class BatchProvisioner:
+    """Create, verify and steer a batch of tunnels across many head-ends"""
+
+    async def provision(self, tunnels: list[dict[str, Any]], incident_id: Optional[str] = None) -> dict[str, Any]:
+        """
+        Provision a batch of tunnels.
+
+        Args:
+            tunnels: Per-tunnel provision_tunnel payloads (head_end, end_point,
+                     te_type, computed_path, candidate_paths, path_type,
+                     provisioning_mode, affected_vrfs, tunnel_endpoint_ip,
+                     optional incident_id)
+            incident_id: Default incident for tunnels that do not name one
+
+        Returns:
+            Batch summary with one return_success-shaped result per tunnel,
+            in request order
+        """
+        logger.info("Provisioning tunnel batch", incident_id=incident_id, tunnels=len(tunnels))
+
+        items = await self._prepare(tunnels, incident_id)
+        await self._create(items)
+        await self._verify(items)
+        await self._steer(items)
+
+        results = [self._result(item) for item in items]
+        succeeded = sum(1 for result in results if result["success"])
+        logger.info("Tunnel batch complete", incident_id=incident_id, total=len(results), succeeded=succeeded)
+        return {
+            "incident_id": incident_id,
+            "success": succeeded == len(results),
+            "total": len(results),
+            "succeeded": succeeded,
+            "tunnels": results,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def _prepare(self, tunnels: list[dict[str, Any]], incident_id: Optional[str]) -> list[dict[str, Any]]:
+        """Detect TE type and build a TunnelConfig per tunnel"""
+        from ..nodes.detect_node import detect_te_type_node
+        from ..nodes.screen_node import screen_paths_node
+        from ..nodes.build_node import build_payload_node
+        from .bsid_allocator import get_bsid_allocator
+
+        items = []
+        for spec in tunnels:
+            item = {
+                "incident_id": spec.get("incident_id") or incident_id,
+                "service_id": spec.get("service_id"),
+                "head_end": spec.get("head_end"),
+                "end_point": spec.get("end_point"),
+                "computed_path": spec.get("computed_path", {}),
+                "candidate_paths": spec.get("candidate_paths", []),
+                "bandwidth_mbps": spec.get("bandwidth_mbps"),
+                "path_type": spec.get("path_type", "explicit"),
+                "requested_te_type": spec.get("te_type"),
+                "device_capabilities": spec.get("device_capabilities"),
+                "provisioning_mode": spec.get("provisioning_mode"),
+                "affected_vrfs": spec.get("affected_vrfs"),
+                "tunnel_endpoint_ip": spec.get("tunnel_endpoint_ip"),
+            }
+            item.update(await detect_te_type_node(item))
+            items.append(item)
+
+        # Candidate dry-runs are independent across tunnels
+        for item, update in zip(items, await asyncio.gather(*[screen_paths_node(item) for item in items])):
+            item.update(update)
+        items_to_build = [item for item in items if item.get("screening_passed") is not False]
+
+        # One BSID lease per head-end instead of one allocator call per tunnel
+        sr_counts: dict[str, int] = defaultdict(int)
+        for item in items_to_build:
+            if _is_sr(item) and item["head_end"]:
+                sr_counts[item["head_end"]] += 1
+        allocator = get_bsid_allocator()
+        leased = await asyncio.gather(
+            *[allocator.allocate_many(head_end, n) for head_end, n in sr_counts.items()],
+            return_exceptions=True,
+        )
+        bsids: dict[str, list[int]] = {}
+        for head_end, block in zip(sr_counts, leased):
+            if isinstance(block, Exception):
+                logger.warning("BSID block allocation failed, allocating per tunnel", head_end=head_end, error=str(block))
+            else:
+                bsids[head_end] = block
+
+        nso_mode = os.getenv("NSO_PROVISIONING_MODE", "async").lower()
+        for item in items_to_build:
+            if _is_sr(item) and bsids.get(item["head_end"]):
+                item["binding_sid"] = bsids[item["head_end"]].pop()
+            item.update(await build_payload_node(item))
+            try:
+                config = TunnelConfig(**item["tunnel_payload"], provisioning_mode=item["provisioning_mode"])
+            except Exception as e:
+                logger.error("Invalid tunnel in batch", incident_id=item["incident_id"], error=str(e))
+                item["creation_error"] = f"Invalid tunnel payload: {e}"
+                continue
+            item["config"] = config
+            item["provisioning_mode"] = (config.provisioning_mode or os.getenv("TUNNEL_PROVISIONING_MODE", "nso")).lower()
+            item["nso_mode"] = nso_mode
+        return items
+
+    async def _create(self, items: list[dict[str, Any]]) -> None:
+        groups: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        for item in items:
+            if "config" in item:
+                groups[(item["provisioning_mode"], item["head_end"], _is_sr(item))].append(item)
+
+        logger.info("Creating tunnel batch", tunnels=sum(len(g) for g in groups.values()), groups=len(groups))
+        await asyncio.gather(*[self._create_group(mode, sr, group) for (mode, _, sr), group in groups.items()])
+
+    async def _create_group(self, mode: str, sr: bool, group: list[dict[str, Any]]) -> None:
+        """Create one head-end's SR or RSVP-TE tunnels in as few calls as the API allows"""
+        from ..nodes.create_node import (
+            _bandwidth_mbps, _coe_entry_to_tunnel_result, _create_via_nso, _rsvp_path_options,
+            _segment_list_from_config,
+        )
+
+        configs: list[TunnelConfig] = [item["config"] for item in group]
+        try:
+            if mode == "pce":
+                from .coe_tunnel_ops_client import get_coe_tunnel_ops_client
+                coe = get_coe_tunnel_ops_client()
+                if sr:
+                    output = await coe.create_sr_policies_coe([
+                        coe.sr_policy_entry(c.head_end, c.color or 0, c.end_point, _segment_list_from_config(c))
+                        for c in configs
+                    ])
+                else:
+                    output = await coe.create_rsvp_tunnels([
+                        coe.rsvp_tunnel_entry(c.path_name, c.head_end, c.end_point, _bandwidth_mbps(c),
+                                              _rsvp_path_options(c))
+                        for c in configs
+                    ])
+                entries = output.get("results", [])
+                entries = entries + [{"state": "failure", "message": "No COE result"}] * (len(configs) - len(entries))
+                results = [_coe_entry_to_tunnel_result(entry, c.te_type) for entry, c in zip(entries, configs)]
+            else:
+                from .cnc_tunnel import get_cnc_tunnel_client
+                client = get_cnc_tunnel_client()
+                if sr:
+                    results = await client.create_sr_policies(configs)
+                else:
+                    # NSO RSVP-TE dispatch is single-tunnel; jobs share one poller
+                    results = await asyncio.gather(*[_create_via_nso(c, group[0]["nso_mode"], client) for c in configs])
+        except Exception as e:
+            logger.error("Tunnel group creation failed", head_end=group[0]["head_end"], mode=mode, error=str(e))
+            results = [TunnelResult(success=False, te_type=c.te_type, message=f"CNC API error: {e}") for c in configs]
+
+        for item, result in zip(group, results):
+            if result.success:
+                item["creation_success"] = True
+                item["tunnel_id"] = result.tunnel_id or item["config"].path_name
+                item["binding_sid"] = result.binding_sid or item.get("binding_sid")
+            else:
+                item["creation_error"] = result.message
+
+    async def _verify(self, items: list[dict[str, Any]]) -> None:
+        """Verify every created tunnel against one datalist call per kind"""
+        from .coe_tunnel_ops_client import get_coe_tunnel_ops_client
+
+        created = [item for item in items if item.get("creation_success")]
+        if not created:
+            return
+
+        coe = get_coe_tunnel_ops_client()
+        calls = {}
+        if any(_is_sr(item) for item in created):
+            calls[True] = coe.list_sr_policies()
+        if any(not _is_sr(item) for item in created):
+            calls[False] = coe.list_rsvp_tunnels()
+        outputs = await asyncio.gather(*calls.values(), return_exceptions=True)
+
+        found: dict[tuple, dict] = {}
+        for sr, output in zip(calls, outputs):
+            if isinstance(output, Exception):
+                logger.error("Tunnel datalist call failed, batch left unverified", sr=sr, error=str(output))
+                continue
+            for entry in output.get("sr-policy-datalist" if sr else "rsvp-datalist", []):
+                name = entry.get("color") if sr else entry.get("path-name")
+                found[_datalist_key(sr, entry.get("head-end"), entry.get("end-point"), name)] = entry
+
+        for item in created:
+            config = item["config"]
+            name = config.color if _is_sr(item) else config.path_name
+            entry = found.get(_datalist_key(_is_sr(item), config.head_end, config.end_point, name), {})
+            op_status = entry.get("operational-status") or entry.get("admin-status") or "unknown"
+            item["operational_status"] = op_status
+            item["tunnel_verified"] = op_status == "up"
+            if not item["tunnel_verified"]:
+                item["creation_error"] = f"Tunnel not up after creation (operational_status={op_status})"
+
+        logger.info(
+            "Tunnel batch verified",
+            created=len(created),
+            verified=sum(1 for item in created if item["tunnel_verified"]),
+        )
+
+    async def _steer(self, items: list[dict[str, Any]]) -> None:
+        """SR steering is automatic (ODN/color); RSVP-TE VRFs are steered per head-end"""
+        from ..nodes.steer_node import _steer_rsvp_te_vrf_entries
+
+        vrf_entries: dict[str, list[dict]] = defaultdict(list)
+        steered_items: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for item in items:
+            if not item.get("tunnel_verified"):
+                continue
+            if _is_sr(item):
+                item["traffic_steered"] = True
+                continue
+            if not (item["affected_vrfs"] and item["tunnel_endpoint_ip"]):
+                item["traffic_steered"] = False
+                item["steer_error"] = "Missing VRF steering parameters for RSVP-TE"
+                continue
+            vrf_entries[item["head_end"]].extend(
+                {"name": vrf, "tunnel-id": item["tunnel_id"], "next-hop": item["tunnel_endpoint_ip"]}
+                for vrf in item["affected_vrfs"]
+            )
+            steered_items[item["head_end"]].append(item)
+
+        head_ends = list(vrf_entries)
+        outcomes = await asyncio.gather(*[_steer_rsvp_te_vrf_entries(he, vrf_entries[he]) for he in head_ends])
+        for head_end, (success, error) in zip(head_ends, outcomes):
+            for item in steered_items[head_end]:
+                item["traffic_steered"] = success
+                if not success:
+                    item["steer_error"] = error
+
+    @staticmethod
+    def _result(item: dict[str, Any]) -> dict[str, Any]:
+        """Per-tunnel result in the return_success_node shape"""
+        if item.get("creation_success") and item.get("tunnel_verified"):
+            result = {
+                "incident_id": item["incident_id"],
+                "service_id": item["service_id"],
+                "success": True,
+                "tunnel_id": item["tunnel_id"],
+                "binding_sid": item.get("binding_sid"),
+                "te_type": item.get("detected_te_type"),
+                "operational_status": item.get("operational_status", "up"),
+                "traffic_steered": item.get("traffic_steered", False),
+                "computed_path": item.get("computed_path"),
+            }
+            if item.get("steer_error"):
+                result["steer_error"] = item["steer_error"]
+            return result
+        return {
+            "incident_id": item["incident_id"],
+            "service_id": item["service_id"],
+            "success": False,
+            "error": item.get("creation_error", "Unknown error"),
+        }
+
+
+_batch_provisioner: Optional[BatchProvisioner] = None
+
+def get_batch_provisioner() -> BatchProvisioner:
+    global _batch_provisioner
+    if _batch_provisioner is None:
+        _batch_provisioner = BatchProvisioner()
+    return _batch_provisioner
@@ -1,48 +1,93 @@
-"""BSID Allocator - From DESIGN.md BSIDAllocator"""
+"""BSID Allocator - From DESIGN.md BSIDAllocator
+
+MPLS BSIDs are leased from Redis a block at a time per head-end (returned
+BSIDs first, then an INCRBY on the head-end's high-water mark, in one Lua
+call) and handed out from memory, so steady-state allocation makes no
+Redis round trip and concurrent replicas never share a BSID. Unused BSIDs
+go back to the head-end's free set on close(); a replica that dies keeps
+its block out of circulation.
+"""
+import asyncio
 import os
+from collections import deque
 from typing import Optional
 from datetime import datetime
 import structlog
 import redis.asyncio as redis
 
+from agent_template.metrics import instrument_redis
+
 logger = structlog.get_logger(__name__)
 
+# KEYS: high-water mark, free set; ARGV: count, range start, range end
+# Returns the reserved BSIDs (fewer than count when the range is exhausted)
+RESERVE_SCRIPT = """
+local count = tonumber(ARGV[1])
+local bsids = redis.call('SPOP', KEYS[2], count)
+local wanted = count - #bsids
+if wanted > 0 then
+    local range_end = tonumber(ARGV[3])
+    redis.call('SET', KEYS[1], tonumber(ARGV[2]) - 1, 'NX')
+    local last = redis.call('INCRBY', KEYS[1], wanted)
+    if last > range_end then
+        redis.call('SET', KEYS[1], range_end)
+    end
+    for bsid = last - wanted + 1, math.min(last, range_end) do
+        bsids[#bsids + 1] = bsid
+    end
+end
+return bsids
+"""
+
 class BSIDAllocator:
     """Allocate Binding SIDs for SR policies - From DESIGN.md"""
     SR_MPLS_BSID_RANGE = (24000, 24999)
     SRV6_BSID_PREFIX = "fc00:0:ffff::"
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, block_size: Optional[int] = None):
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://redis:6379")
+        self.block_size = block_size or int(os.getenv("BSID_BLOCK_SIZE", "32"))
         self._client: Optional[redis.Redis] = None
+        self._reserve = None
+        self._blocks: dict[str, deque[int]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
 
     async def _get_client(self) -> redis.Redis:
         if self._client is None:
-            self._client = redis.from_url(self.redis_url, decode_responses=True)
+            self._client = instrument_redis(
+                redis.from_url(self.redis_url, decode_responses=True), target="bsid_allocator"
+            )
+            self._reserve = self._client.register_script(RESERVE_SCRIPT)
         return self._client
 
-    async def allocate_mpls_bsid(self, head_end: str) -> int:
-        """Allocate next available MPLS BSID for head-end"""
-        client = await self._get_client()
-        key = f"bsid:mpls:{head_end}"
-
-        # Check free list first
-        free_key = f"bsid:free:{head_end}"
-        free_bsid = await client.spop(free_key)
-        if free_bsid:
-            return int(free_bsid)
+    async def _lease(self, head_end: str, count: int) -> None:
+        """Reserve at least count more BSIDs for head_end into its local block"""
+        await self._get_client()
+        bsids = await self._reserve(
+            keys=[f"bsid:mpls:{head_end}", f"bsid:free:{head_end}"],
+            args=[max(count, self.block_size), *self.SR_MPLS_BSID_RANGE],
+        )
+        block = self._blocks.setdefault(head_end, deque())
+        block.extend(sorted(int(bsid) for bsid in bsids))
+        logger.info("Leased MPLS BSID block", head_end=head_end, leased=len(bsids), available=len(block))
 
-        # Allocate new
-        current = await client.get(key)
-        current = int(current) if current else self.SR_MPLS_BSID_RANGE[0] - 1
-        next_bsid = current + 1
+    async def allocate_many(self, head_end: str, n: int) -> list[int]:
+        """Allocate n MPLS BSIDs for head-end (one Redis call at most)"""
+        block = self._blocks.setdefault(head_end, deque())
+        if len(block) < n:
+            async with self._locks.setdefault(head_end, asyncio.Lock()):
+                if len(block) < n:
+                    await self._lease(head_end, n - len(block))
+            if len(block) < n:
+                raise Exception(f"No more BSIDs available for {head_end}")
+        return [block.popleft() for _ in range(n)]
 
-        if next_bsid > self.SR_MPLS_BSID_RANGE[1]:
-            raise Exception(f"No more BSIDs available for {head_end}")
-
-        await client.set(key, next_bsid)
-        logger.info("Allocated MPLS BSID", head_end=head_end, bsid=next_bsid)
-        return next_bsid
+    async def allocate_mpls_bsid(self, head_end: str) -> int:
+        """Allocate next available MPLS BSID for head-end"""
+        block = self._blocks.get(head_end)
+        bsid = block.popleft() if block else (await self.allocate_many(head_end, 1))[0]
+        logger.info("Allocated MPLS BSID", head_end=head_end, bsid=bsid)
+        return bsid
 
     async def allocate_srv6_bsid(self, head_end: str) -> str:
         """Allocate SRv6 BSID"""
@@ -59,8 +104,22 @@ class BSIDAllocator:
         await client.sadd(f"bsid:free:{head_end}", bsid)
         logger.info("Released BSID", head_end=head_end, bsid=bsid)
 
+    async def return_unused(self) -> None:
+        """Give every locally leased, unallocated BSID back to its free set"""
+        blocks = {head_end: list(block) for head_end, block in self._blocks.items() if block}
+        self._blocks.clear()
+        if not blocks:
+            return
+        client = await self._get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for head_end, bsids in blocks.items():
+                pipe.sadd(f"bsid:free:{head_end}", *bsids)
+            await pipe.execute()
+        logger.info("Returned unused BSIDs", head_ends=len(blocks), bsids=sum(len(b) for b in blocks.values()))
+
     async def close(self) -> None:
         if self._client:
+            await self.return_unused()
             await self._client.close()
             self._client = None
 
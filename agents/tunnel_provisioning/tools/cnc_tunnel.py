@@ -1,12 +1,14 @@
 """CNC Tunnel Client - From DESIGN.md CNC API Integration"""
-import asyncio
 import os
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta, timezone
 import structlog
 import httpx
 
+from agent_template.metrics import httpx_event_hooks
+
 from ..schemas.tunnels import TunnelConfig, TunnelResult
+from .nso_job_poller import get_nso_job_poller
 
 logger = structlog.get_logger(__name__)
 
@@ -27,6 +29,7 @@ class CNCTunnelClient:
         if self._client is None:
             ca_cert = os.getenv("CA_CERT_PATH")
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=ca_cert if ca_cert else True,
             )
@@ -63,29 +66,32 @@ class CNCTunnelClient:
 
     async def create_sr_policy(self, config: TunnelConfig) -> TunnelResult:
         """Create SR-MPLS or SRv6 policy via CNC - From DESIGN.md SR Policy Create"""
+        return (await self.create_sr_policies([config]))[0]
+
+    async def create_sr_policies(self, configs: list[TunnelConfig]) -> list[TunnelResult]:
+        """Create several SR policies in one sr-policy-create transaction (one result per config)"""
         client = await self._get_client()
         token = await self._get_jwt_token()
 
-        payload = {
-            "input": {
-                "sr-policies": [{
-                    "head-end": config.head_end,
-                    "end-point": config.end_point,
-                    "color": config.color or 100,
-                    "path-name": config.path_name,
-                    "description": f"Protection tunnel for {config.path_name}",
-                    "sr-policy-path": {
-                        "path-optimization-objective": config.optimization_objective,
-                        "protected": config.protected,
-                    }
-                }]
+        entries = []
+        for config in configs:
+            entry = {
+                "head-end": config.head_end,
+                "end-point": config.end_point,
+                "color": config.color or 100,
+                "path-name": config.path_name,
+                "description": f"Protection tunnel for {config.path_name}",
+                "sr-policy-path": {
+                    "path-optimization-objective": config.optimization_objective,
+                    "protected": config.protected,
+                }
             }
-        }
-
-        if config.binding_sid:
-            payload["input"]["sr-policies"][0]["binding-sid"] = config.binding_sid
-        if config.explicit_hops:
-            payload["input"]["sr-policies"][0]["sr-policy-path"]["hops"] = config.explicit_hops
+            if config.binding_sid:
+                entry["binding-sid"] = config.binding_sid
+            if config.explicit_hops:
+                entry["sr-policy-path"]["hops"] = config.explicit_hops
+            entries.append(entry)
+        payload = {"input": {"sr-policies": entries}}
 
         endpoint = "/operations/cisco-crosswork-optimization-engine-sr-policy-operations:sr-policy-create"
 
@@ -97,27 +103,36 @@ class CNCTunnelClient:
             )
             if response.status_code == 200:
                 data = response.json()
-                result = data.get("output", {}).get("results", [{}])[0]
-                return TunnelResult(
-                    success=result.get("state") == "success",
-                    tunnel_id=f"sr-policy-{config.head_end}-{config.end_point}-{config.color or 100}",
-                    binding_sid=config.binding_sid,
+                results = data.get("output", {}).get("results", [])
+                return [
+                    TunnelResult(
+                        success=result.get("state") == "success",
+                        tunnel_id=f"sr-policy-{config.head_end}-{config.end_point}-{config.color or 100}",
+                        binding_sid=config.binding_sid,
+                        te_type=config.te_type,
+                        operational_status="up" if result.get("state") == "success" else "down",
+                        state=result.get("state", "failure"),
+                        message=result.get("message", "")
+                    )
+                    for config, result in zip(configs, results + [{}] * (len(configs) - len(results)))
+                ]
+            return [
+                TunnelResult(success=False, te_type=config.te_type, message=f"API error: {response.status_code}")
+                for config in configs
+            ]
+        except Exception as e:
+            logger.error("Tunnel creation failed", error=str(e), policies=len(configs))
+            return [
+                TunnelResult(
+                    success=False,
+                    tunnel_id="",
                     te_type=config.te_type,
-                    operational_status="up" if result.get("state") == "success" else "down",
-                    state=result.get("state", "failure"),
-                    message=result.get("message", "")
+                    operational_status="down",
+                    state="failure",
+                    message=f"CNC API error: {e}",
                 )
-            return TunnelResult(success=False, te_type=config.te_type, message=f"API error: {response.status_code}")
-        except Exception as e:
-            logger.error("Tunnel creation failed", error=str(e))
-            return TunnelResult(
-                success=False,
-                tunnel_id="",
-                te_type=config.te_type,
-                operational_status="down",
-                state="failure",
-                message=f"CNC API error: {e}",
-            )
+                for config in configs
+            ]
 
     async def create_rsvp_tunnel(self, config: TunnelConfig) -> TunnelResult:
         """Create RSVP-TE tunnel via CNC - dispatches to PCE or NSO mode based on env var."""
@@ -262,82 +277,12 @@ class CNCTunnelClient:
             return False
 
     async def _poll_nso_job(self, job_id: str) -> TunnelResult:
-        """Poll NSO job status until completion, timeout, or failure.
+        """Wait for an NSO job via the shared poller (see nso_job_poller.py).
 
-        Polls /api/running/jobs/{job_id} every 3 seconds for up to 30 seconds.
         Returns a TunnelResult reflecting the final job outcome.
         """
-        poll_url_base = os.getenv(
-            "CNC_NSO_JOBS_URL",
-            "https://cnc.example.com:8888/api/running/jobs",
-        )
-        poll_url = f"{poll_url_base}/{job_id}"
-        poll_interval = 3
-        max_wait = 30
-        attempts = 0
-
-        logger.info("Polling NSO job", job_id=job_id, poll_url=poll_url, max_wait_seconds=max_wait)
-
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=os.getenv("CA_CERT_PATH") or True,
-        ) as poll_client:
-            token = await self._get_jwt_token()
-            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/yang-data+json"}
-
-            elapsed = 0
-            while elapsed < max_wait:
-                attempts += 1
-                try:
-                    resp = await poll_client.get(poll_url, headers=headers)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        status = data.get("status", "running")
-                        logger.info(
-                            "NSO job poll attempt",
-                            job_id=job_id,
-                            attempt=attempts,
-                            status=status,
-                        )
-                        if status == "completed":
-                            return TunnelResult(
-                                success=True,
-                                te_type="rsvp-te",
-                                state="success",
-                                operational_status="up",
-                                message=f"NSO job {job_id} completed successfully",
-                            )
-                        if status == "failed":
-                            error_msg = data.get("error", "NSO job failed")
-                            logger.error("NSO job failed", job_id=job_id, error=error_msg)
-                            return TunnelResult(
-                                success=False,
-                                te_type="rsvp-te",
-                                state="failure",
-                                operational_status="down",
-                                message=f"NSO job {job_id} failed: {error_msg}",
-                            )
-                        # status == "running" — continue polling
-                    else:
-                        logger.warning(
-                            "NSO job poll returned unexpected status",
-                            job_id=job_id,
-                            http_status=resp.status_code,
-                        )
-                except Exception as e:
-                    logger.warning("NSO job poll request error", job_id=job_id, attempt=attempts, error=str(e))
-
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
-
-        logger.error("NSO job polling timed out", job_id=job_id, attempts=attempts)
-        return TunnelResult(
-            success=False,
-            te_type="rsvp-te",
-            state="failure",
-            operational_status="down",
-            message="NSO job timeout",
-        )
+        logger.info("Waiting on NSO job", job_id=job_id)
+        return await get_nso_job_poller().wait(job_id)
 
     async def verify_tunnel(self, tunnel_id: str, tunnel_type: str) -> Dict[str, Any]:
         """Verify tunnel status via CNC operational state API"""
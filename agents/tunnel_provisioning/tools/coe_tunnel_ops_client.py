@@ -33,6 +33,8 @@ from datetime import datetime, timedelta, timezone
 import structlog
 import httpx
 
+from agent_template.metrics import httpx_event_hooks
+
 logger = structlog.get_logger(__name__)
 
 # YANG content-type used by all COE RESTCONF endpoints
@@ -98,6 +100,7 @@ class COETunnelOpsClient:
         if self._client is None:
             ca_cert = os.getenv("CA_CERT_PATH")
             self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
                 timeout=self.timeout,
                 verify=ca_cert if ca_cert else True,
             )
@@ -262,14 +265,7 @@ class COETunnelOpsClient:
         Returns:
             Parsed output dict; output.results[] contains per-tunnel state/message.
         """
-        tunnel_entry: Dict[str, Any] = {
-            "head-end": source,
-            "end-point": destination,
-            "path-name": tunnel_name,
-            "signaled-bandwidth": bandwidth,
-        }
-        if path_options:
-            tunnel_entry["rsvp-te-tunnel-path"] = path_options
+        tunnel_entry = self.rsvp_tunnel_entry(tunnel_name, source, destination, bandwidth, path_options)
 
         endpoint = f"{_RSVP_PREFIX}rsvp-te-tunnel-create"
         logger.info(
@@ -295,6 +291,46 @@ class COETunnelOpsClient:
             )
             raise
 
+    @staticmethod
+    def rsvp_tunnel_entry(
+        tunnel_name: str,
+        source: str,
+        destination: str,
+        bandwidth: int,
+        path_options: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """rsvp-te-tunnels[] entry (see create_rsvp_tunnel for the fields)."""
+        tunnel_entry: Dict[str, Any] = {
+            "head-end": source,
+            "end-point": destination,
+            "path-name": tunnel_name,
+            "signaled-bandwidth": bandwidth,
+        }
+        if path_options:
+            tunnel_entry["rsvp-te-tunnel-path"] = path_options
+        return tunnel_entry
+
+    async def create_rsvp_tunnels(self, tunnel_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several RSVP-TE tunnels in one rsvp-te-tunnel-create call.
+
+        Args:
+            tunnel_entries: Entries built with rsvp_tunnel_entry().
+
+        Returns:
+            Parsed output dict; output.results[] holds one entry per tunnel,
+            in request order.
+        """
+        endpoint = f"{_RSVP_PREFIX}rsvp-te-tunnel-create"
+        logger.info("Creating RSVP-TE tunnels via COE", count=len(tunnel_entries))
+
+        try:
+            data = await self._post(endpoint, {"input": {"rsvp-te-tunnels": tunnel_entries}})
+            return data.get("output", data)
+        except Exception as e:
+            logger.error("create_rsvp_tunnels failed", count=len(tunnel_entries), error=str(e))
+            raise
+
     async def delete_rsvp_tunnel(
         self, tunnel_name: str, source: str
     ) -> Dict[str, Any]:
@@ -576,13 +612,7 @@ class COETunnelOpsClient:
         Returns:
             Parsed output dict; output.results[] contains per-policy state/message/color.
         """
-        policy_entry: Dict[str, Any] = {
-            "head-end": head_end,
-            "end-point": end_point,
-            "color": color,
-        }
-        if segment_list:
-            policy_entry["sr-policy-path"] = {"hops": segment_list}
+        policy_entry = self.sr_policy_entry(head_end, color, end_point, segment_list)
 
         endpoint = f"{_SR_PREFIX}sr-policy-create"
         logger.info(
@@ -609,6 +639,44 @@ class COETunnelOpsClient:
             )
             raise
 
+    @staticmethod
+    def sr_policy_entry(
+        head_end: str,
+        color: int,
+        end_point: str,
+        segment_list: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """sr-policies[] entry (see create_sr_policy_coe for the fields)."""
+        policy_entry: Dict[str, Any] = {
+            "head-end": head_end,
+            "end-point": end_point,
+            "color": color,
+        }
+        if segment_list:
+            policy_entry["sr-policy-path"] = {"hops": segment_list}
+        return policy_entry
+
+    async def create_sr_policies_coe(self, policy_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several SR policies in one sr-policy-create call.
+
+        Args:
+            policy_entries: Entries built with sr_policy_entry().
+
+        Returns:
+            Parsed output dict; output.results[] holds one entry per policy,
+            in request order.
+        """
+        endpoint = f"{_SR_PREFIX}sr-policy-create"
+        logger.info("Creating SR policies via COE", count=len(policy_entries))
+
+        try:
+            data = await self._post(endpoint, {"input": {"sr-policies": policy_entries}})
+            return data.get("output", data)
+        except Exception as e:
+            logger.error("create_sr_policies_coe failed", count=len(policy_entries), error=str(e))
+            raise
+
     async def delete_sr_policy_coe(
         self, head_end: str, color: int, end_point: str
     ) -> Dict[str, Any]:
@@ -0,0 +1,139 @@
+"""Dry-Run Screener - Screen candidate protection paths before committing
+
+Dry-runs every candidate path concurrently through COE (sr-policy-dryrun /
+rsvp-te-tunnel-dryrun) so bandwidth, SRLG and admission rejections are
+found before the real create, not after it through the retry loop.
+
+Verdicts are cached per (TE type, head-end, end-point, hops, bandwidth,
+objective, topology version) for DRYRUN_CACHE_TTL_SECONDS; the TTL bounds
+staleness when the KG does not report a topology version.
+"""
+import asyncio
+import os
+import time
+from typing import Any, Optional
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class DryRunScreener:
+    """Concurrent, cached COE dry-runs of candidate paths"""
+
+    def __init__(self, cache_ttl_seconds: Optional[float] = None):
+        self.cache_ttl_seconds = (
+            cache_ttl_seconds
+            if cache_ttl_seconds is not None
+            else float(os.getenv("DRYRUN_CACHE_TTL_SECONDS", "30"))
+        )
+        # key -> (verdict, message, cached_at)
+        self._cache: dict[tuple, tuple[bool, str, float]] = {}
+
+    @staticmethod
+    def _cache_key(te_type: str, head_end: str, end_point: str, path: dict[str, Any],
+                   bandwidth_mbps: int, objective: str) -> tuple:
+        return (te_type, head_end, end_point, tuple(path.get("segments", [])),
+                bandwidth_mbps, objective, path.get("topology_version"))
+
+    def _cached(self, key: tuple) -> Optional[tuple[bool, str]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[2] > self.cache_ttl_seconds:
+            del self._cache[key]
+            return None
+        return entry[0], entry[1]
+
+    async def screen(
+        self,
+        te_type: str,
+        head_end: str,
+        end_point: str,
+        candidates: list[dict[str, Any]],
+        bandwidth_mbps: int = 0,
+        objective: str = "delay",
+    ) -> list[Optional[bool]]:
+        """
+        Dry-run all candidates concurrently.
+
+        Returns:
+            One verdict per candidate, in order: True (admissible), False
+            (rejected) or None (dry-run unavailable; not cached)
+        """
+        keys = [self._cache_key(te_type, head_end, end_point, c, bandwidth_mbps, objective) for c in candidates]
+        cached = [self._cached(key) for key in keys]
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+
+        outcomes = await asyncio.gather(
+            *[self._dryrun(te_type, head_end, end_point, candidates[i], bandwidth_mbps, objective) for i in misses]
+        )
+        verdicts: list[Optional[bool]] = [hit[0] if hit else None for hit in cached]
+        now = time.monotonic()
+        for i, (verdict, message) in zip(misses, outcomes):
+            verdicts[i] = verdict
+            if verdict is not None:
+                self._cache[keys[i]] = (verdict, message, now)
+            if verdict is False:
+                logger.info("Candidate path rejected by dry-run", path_id=candidates[i].get("path_id"), message=message)
+
+        logger.info(
+            "Candidate paths screened",
+            head_end=head_end,
+            end_point=end_point,
+            candidates=len(candidates),
+            cache_hits=len(candidates) - len(misses),
+            passed=sum(1 for v in verdicts if v),
+        )
+        return verdicts
+
+    async def _dryrun(self, te_type: str, head_end: str, end_point: str, path: dict[str, Any],
+                      bandwidth_mbps: int, objective: str) -> tuple[Optional[bool], str]:
+        from .coe_tunnel_ops_client import get_coe_tunnel_ops_client
+
+        segments = path.get("segments", [])
+        coe = get_coe_tunnel_ops_client()
+        try:
+            if te_type in ("sr-mpls", "srv6"):
+                output = await coe.dryrun_sr_policy_coe(
+                    head_end=head_end,
+                    color=0,
+                    end_point=end_point,
+                    segment_list=[{"hop": {"node-ipv4-address": seg}, "step": i + 1} for i, seg in enumerate(segments)],
+                )
+            else:
+                output = await coe.dryrun_rsvp_tunnel(
+                    tunnel_name=f"dryrun-{path.get('path_id', 'candidate')}",
+                    source=head_end,
+                    destination=end_point,
+                    bandwidth=bandwidth_mbps,
+                    path_options={
+                        "rsvp-te-tunnel-path": {
+                            "optimization-objective": objective,
+                            "hops": [{"address": seg, "hop-type": "strict", "index": i + 1}
+                                     for i, seg in enumerate(segments)],
+                        }
+                    },
+                )
+        except Exception as e:
+            logger.warning("Dry-run unavailable", path_id=path.get("path_id"), error=str(e))
+            return None, str(e)
+
+        # COE may omit state on success, as on create
+        return output.get("state", "success") == "success", output.get("message", "")
+
+    def select(self, candidates: list[dict[str, Any]], verdicts: list[Optional[bool]]) -> Optional[dict[str, Any]]:
+        """First admissible candidate, else the first one that could not be dry-run"""
+        for wanted in (True, None):
+            for candidate, verdict in zip(candidates, verdicts):
+                if verdict is wanted:
+                    return candidate
+        return None
+
+
+_dryrun_screener: Optional[DryRunScreener] = None
+
+def get_dryrun_screener() -> DryRunScreener:
+    global _dryrun_screener
+    if _dryrun_screener is None:
+        _dryrun_screener = DryRunScreener()
+    return _dryrun_screener
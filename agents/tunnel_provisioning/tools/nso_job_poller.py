@@ -0,0 +1,136 @@
+"""NSO Job Poller - One shared poller for every pending NSO job
+
+Replaces a 3 s sleep loop per job: all pending jobs are polled together
+by a single background task whose interval starts short and backs off
+while nothing changes, resetting whenever a job is added or finishes.
+"""
+import asyncio
+import os
+import time
+from typing import Optional
+import httpx
+import structlog
+
+from agent_template.metrics import httpx_event_hooks
+
+from ..schemas.tunnels import TunnelResult
+
+logger = structlog.get_logger(__name__)
+
+
+class NSOJobPoller:
+    """Track NSO jobs to completion with adaptive backoff"""
+
+    def __init__(
+        self,
+        jobs_url: Optional[str] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.jobs_url = jobs_url or os.getenv("CNC_NSO_JOBS_URL", "https://cnc.example.com:8888/api/running/jobs")
+        self.min_interval = min_interval or float(os.getenv("NSO_JOB_POLL_MIN_SECONDS", "0.5"))
+        self.max_interval = max_interval or float(os.getenv("NSO_JOB_POLL_MAX_SECONDS", "5"))
+        self.timeout = timeout or float(os.getenv("NSO_JOB_TIMEOUT_SECONDS", "30"))
+        self._pending: dict[str, tuple[asyncio.Future, float]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                event_hooks=httpx_event_hooks("cnc"),
+                timeout=30,
+                verify=os.getenv("CA_CERT_PATH") or True,
+            )
+        return self._client
+
+    async def wait(self, job_id: str) -> TunnelResult:
+        """Wait for an NSO job to complete, fail or time out"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = (future, time.monotonic() + self.timeout)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        interval = self.min_interval
+        while self._pending:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+                interval = self.min_interval  # New job: poll soon
+            except asyncio.TimeoutError:
+                pass
+
+            finished = await self._poll_all()
+            interval = self.min_interval if finished else min(interval * 2, self.max_interval)
+
+    async def _poll_all(self) -> int:
+        """Poll every pending job once; returns how many finished"""
+        from .cnc_tunnel import get_cnc_tunnel_client
+
+        client = await self._get_client()
+        job_ids = list(self._pending)
+        try:
+            token = await get_cnc_tunnel_client()._get_jwt_token()
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/yang-data+json"}
+            statuses = await asyncio.gather(*[self._status(client, headers, job_id) for job_id in job_ids])
+        except Exception as e:
+            # Keep the deadlines running; jobs time out rather than hang
+            logger.warning("NSO job poll authentication failed", error=str(e))
+            statuses = [("running", "")] * len(job_ids)
+
+        finished = 0
+        now = time.monotonic()
+        for job_id, (status, error) in zip(job_ids, statuses):
+            future, deadline = self._pending[job_id]
+            if status == "completed":
+                result = TunnelResult(success=True, te_type="rsvp-te", state="success", operational_status="up",
+                                      message=f"NSO job {job_id} completed successfully")
+            elif status == "failed":
+                logger.error("NSO job failed", job_id=job_id, error=error)
+                result = TunnelResult(success=False, te_type="rsvp-te", state="failure", operational_status="down",
+                                      message=f"NSO job {job_id} failed: {error}")
+            elif now >= deadline:
+                logger.error("NSO job polling timed out", job_id=job_id)
+                result = TunnelResult(success=False, te_type="rsvp-te", state="failure", operational_status="down",
+                                      message="NSO job timeout")
+            else:
+                continue
+            del self._pending[job_id]
+            if not future.done():
+                future.set_result(result)
+            finished += 1
+
+        logger.debug("NSO jobs polled", polled=len(job_ids), finished=finished, pending=len(self._pending))
+        return finished
+
+    async def _status(self, client: httpx.AsyncClient, headers: dict, job_id: str) -> tuple[str, str]:
+        try:
+            resp = await client.get(f"{self.jobs_url}/{job_id}", headers=headers)
+            if resp.status_code == 200:
+                data = resp.json()
+                return data.get("status", "running"), data.get("error", "NSO job failed")
+            logger.warning("NSO job poll returned unexpected status", job_id=job_id, http_status=resp.status_code)
+        except Exception as e:
+            logger.warning("NSO job poll request error", job_id=job_id, error=str(e))
+        return "running", ""
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+_nso_job_poller: Optional[NSOJobPoller] = None
+
+def get_nso_job_poller() -> NSOJobPoller:
+    global _nso_job_poller
+    if _nso_job_poller is None:
+        _nso_job_poller = NSOJobPoller()
+    return _nso_job_poller
@@ -1,15 +1,19 @@
 """Tunnel Provisioning Workflow - From DESIGN.md"""
+import time
 from typing import Any, Optional
 import structlog
 from langgraph.graph import StateGraph, START, END
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from agent_template import metrics
 from agent_template.workflow import BaseWorkflow
 from agent_template.tools.mcp_client import MCPToolClient
 from agent_template.tools.a2a_client import A2AClient
 from .schemas.state import TunnelProvisioningState
-from .nodes import (detect_te_type_node, build_payload_node, create_tunnel_node, verify_tunnel_node,
-                    steer_traffic_node, return_success_node, check_creation_success, check_tunnel_verified, check_can_retry)
+from .tools.batch_provisioner import get_batch_provisioner
+from .nodes import (detect_te_type_node, screen_paths_node, build_payload_node, create_tunnel_node, verify_tunnel_node,
+                    steer_traffic_node, return_success_node, check_screening_passed, check_creation_success,
+                    check_tunnel_verified, check_can_retry)
 
 logger = structlog.get_logger(__name__)
 
@@ -20,7 +24,7 @@ async def _increment_retry_node(state: dict[str, Any]) -> dict[str, Any]:
 
 
 class TunnelProvisioningWorkflow(BaseWorkflow):
-    """Tunnel Provisioning Workflow - From DESIGN.md: DETECT_TE -> BUILD -> CREATE -> VERIFY -> STEER -> RETURN"""
+    """Tunnel Provisioning Workflow - From DESIGN.md: DETECT_TE -> SCREEN -> BUILD -> CREATE -> VERIFY -> STEER -> RETURN"""
 
     def __init__(self, agent_name: str = "tunnel_provisioning", agent_version: str = "1.0.0",
                  mcp_client: Optional[MCPToolClient] = None, a2a_client: Optional[A2AClient] = None,
@@ -37,10 +41,55 @@ class TunnelProvisioningWorkflow(BaseWorkflow):
         return {**base, "service_id": payload.get("service_id"), "head_end": payload.get("head_end"),
                 "end_point": payload.get("end_point"), "computed_path": payload.get("computed_path", {}),
                 "path_type": payload.get("path_type", "explicit"), "requested_te_type": payload.get("te_type"),
+                "candidate_paths": payload.get("candidate_paths", []), "bandwidth_mbps": payload.get("bandwidth_mbps"),
+                "affected_vrfs": payload.get("affected_vrfs"), "tunnel_endpoint_ip": payload.get("tunnel_endpoint_ip"),
                 "retry_count": 0, "creation_success": False, "tunnel_verified": False, "traffic_steered": False}
 
+    async def execute(self, task_id: str, task_type: str, incident_id: Optional[str] = None,
+                      payload: dict[str, Any] = None, correlation_id: Optional[str] = None) -> dict[str, Any]:
+        """
+        provision_tunnels_batch bypasses the per-tunnel graph (see tools/batch_provisioner.py);
+        steer_traffic runs only the steer step, for an existing (shared) tunnel
+        """
+        if task_type == "steer_traffic":
+            return await self._steer_existing(task_id, incident_id, payload or {})
+        if task_type != "provision_tunnels_batch":
+            return await super().execute(task_id, task_type, incident_id, payload, correlation_id)
+
+        logger.info("Executing batch provisioning", agent=self.agent_name, task_id=task_id)
+        timings, timings_token = metrics.start_task_timings()
+        started = time.perf_counter()
+        outcome = "exception"
+        try:
+            result = await get_batch_provisioner().provision((payload or {}).get("tunnels", []), incident_id)
+            outcome = "ok" if result["success"] else "error"
+            return result
+        finally:
+            metrics.observe_task(self.agent_name, task_type, outcome, time.perf_counter() - started)
+            metrics.end_task_timings(timings_token)
+
+    async def _steer_existing(self, task_id: str, incident_id: Optional[str], payload: dict[str, Any]) -> dict[str, Any]:
+        """Steer an incident's VRFs onto a tunnel that is already up"""
+        logger.info("Steering onto existing tunnel", agent=self.agent_name, task_id=task_id,
+                    tunnel_id=payload.get("tunnel_id"))
+        started = time.perf_counter()
+        outcome = "exception"
+        try:
+            steered = await steer_traffic_node({
+                "incident_id": incident_id, "tunnel_id": payload.get("tunnel_id"),
+                "detected_te_type": payload.get("te_type"), "head_end": payload.get("head_end"),
+                "end_point": payload.get("end_point"), "color": payload.get("color", 0),
+                "affected_vrfs": payload.get("affected_vrfs"), "tunnel_endpoint_ip": payload.get("tunnel_endpoint_ip"),
+            })
+            outcome = "ok" if steered["traffic_steered"] else "error"
+            return {"success": steered["traffic_steered"], "tunnel_id": payload.get("tunnel_id"),
+                    "traffic_steered": steered["traffic_steered"], "error": steered.get("steer_error")}
+        finally:
+            metrics.observe_task(self.agent_name, "steer_traffic", outcome, time.perf_counter() - started)
+
     def build_graph(self, graph: StateGraph) -> None:
         graph.add_node("detect_te_type", detect_te_type_node)
+        graph.add_node("screen_paths", screen_paths_node)
         graph.add_node("build_payload", build_payload_node)
         graph.add_node("create_tunnel", create_tunnel_node)
         graph.add_node("verify_tunnel", verify_tunnel_node)
@@ -48,7 +97,8 @@ class TunnelProvisioningWorkflow(BaseWorkflow):
         graph.add_node("return_success", return_success_node)
 
         graph.add_edge(START, "detect_te_type")
-        graph.add_edge("detect_te_type", "build_payload")
+        graph.add_edge("detect_te_type", "screen_paths")
+        graph.add_conditional_edges("screen_paths", check_screening_passed, {"build": "build_payload", "return": "return_success"})
         graph.add_edge("build_payload", "create_tunnel")
         graph.add_conditional_edges("create_tunnel", check_creation_success, {"verify": "verify_tunnel", "retry": "retry_gate"})
         graph.add_node("retry_gate", _increment_retry_node)
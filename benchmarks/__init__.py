@@ -0,0 +1 @@
+"""Performance benchmarks for the Customer Experience Management agents"""
@@ -0,0 +1,159 @@
+"""
+Alert Replay
+
+Replays an Event Correlator recording (ALERT_RECORD_PATH, see
+agents/event_correlator/tools/alert_recorder.py) at 1x, Nx or maximum
+speed, either into a running agent's /a2a/tasks or straight into an
+in-process EventCorrelatorWorkflow, and reports throughput, incidents
+emitted and dedup/suppression ratios.
+
+Inputs the live subscriber/consumer would have dropped (non-degradation
+CNC events, DPM counters under threshold) are counted but not sent.
+
+Usage:
+    python -m benchmarks.alert_replay storm.rec.gz --speed 10 --target http://localhost:8001
+    REDIS_URL=redis://localhost:6379 python -m benchmarks.alert_replay storm.rec.gz --speed 0 --direct
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from agents.event_correlator.tools.alert_recorder import SOURCES, read_recording, to_correlate_payload
+from benchmarks.alert_storm import percentiles
+
+TERMINAL_NODES = {"emit": "emitted", "suppress": "suppressed", "discard": "discarded"}
+
+
+def a2a_sender(client: httpx.AsyncClient, target: str) -> Callable[[dict], Awaitable[str]]:
+    async def send(payload: dict[str, Any]) -> str:
+        response = await client.post(
+            f"{target}/a2a/tasks",
+            json={"task_type": "correlate_alert", "payload": payload, "priority": 1},
+        )
+        response.raise_for_status()
+        # The terminal node shows up in the task's node timings
+        nodes = ((response.json().get("timings") or {}).get("nodes_ms") or {}).keys()
+        return next((TERMINAL_NODES[n] for n in nodes if n in TERMINAL_NODES), "unknown")
+
+    return send
+
+
+def workflow_sender() -> Callable[[dict], Awaitable[str]]:
+    from agents.event_correlator.workflow import EventCorrelatorWorkflow
+
+    workflow = EventCorrelatorWorkflow()
+    app = workflow.compile()
+    counter = 0
+
+    async def send(payload: dict[str, Any]) -> str:
+        nonlocal counter
+        counter += 1
+        state = workflow.get_initial_state(
+            task_id=f"replay-{counter}",
+            task_type="correlate_alert",
+            payload=payload,
+        )
+        final_state = await app.ainvoke(state)
+        return final_state.get("workflow_result") or "unknown"
+
+    return send
+
+
+async def replay(
+    path: str,
+    send: Callable[[dict], Awaitable[str]],
+    speed: float,
+    concurrency: int,
+    sources: Optional[set[str]] = None,
+) -> dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes: dict[str, int] = {}
+    latencies: list[float] = []
+    recorded = filtered = errors = 0
+    pending: set[asyncio.Task] = set()
+
+    async def run(payload: dict[str, Any]) -> None:
+        nonlocal errors
+        try:
+            start = time.perf_counter()
+            outcome = await send(payload)
+            latencies.append(time.perf_counter() - start)
+        except Exception:
+            errors += 1
+            outcome = "error"
+        finally:
+            semaphore.release()
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    start = time.perf_counter()
+    first_ts: Optional[float] = None
+    for record in read_recording(path, sources):
+        recorded += 1
+        payload = to_correlate_payload(record)
+        if payload is None:
+            filtered += 1
+            continue
+
+        if speed > 0:
+            # Keep the recorded inter-arrival gaps, scaled by speed
+            first_ts = record["ts"] if first_ts is None else first_ts
+            delay = (record["ts"] - first_ts) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        await semaphore.acquire()
+        task = asyncio.create_task(run(payload))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    if pending:
+        await asyncio.gather(*pending)
+    elapsed = time.perf_counter() - start
+
+    sent = recorded - filtered
+    return {
+        "recording": path,
+        "speed": speed or "max",
+        "recorded": recorded,
+        "filtered": filtered,
+        "sent": sent,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 2),
+        "alerts_per_sec": round(sent / elapsed, 1) if elapsed else 0.0,
+        "incidents_emitted": outcomes.get("emitted", 0),
+        "dedup_ratio": round(outcomes.get("discarded", 0) / sent, 4) if sent else 0.0,
+        "suppression_ratio": round(outcomes.get("suppressed", 0) / sent, 4) if sent else 0.0,
+        "outcomes": outcomes,
+        "latency_seconds": percentiles(latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier, 0 = as fast as possible")
+    parser.add_argument("--target", default="http://localhost:8001", help="Event Correlator base URL")
+    parser.add_argument("--direct", action="store_true", help="Run an in-process workflow instead of A2A")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--source", action="append", choices=SOURCES, help="Only replay these sources")
+    args = parser.parse_args()
+
+    sources = set(args.source) if args.source else None
+    if args.direct:
+        results = await replay(args.recording, workflow_sender(), args.speed, args.concurrency, sources)
+    else:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+            send = a2a_sender(client, args.target)
+            results = await replay(args.recording, send, args.speed, args.concurrency, sources)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
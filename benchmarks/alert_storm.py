@@ -0,0 +1,261 @@
+"""
+Alert Storm Load Driver
+
+Drives the full protection path against the simulator (python -m simulator)
+and reports end-to-end latency under load:
+
+1. sample core links from the simulator and degrade them
+2. fire a storm of PCA alerts at the Event Correlator (correlate_alert)
+3. hand the correlated incident to the Orchestrator (handle_alert, async)
+4. poll the orchestrator's incident state in Redis until the incident is
+   protected (monitoring/restoring/closed), escalated or times out
+
+Time-to-protect is measured from the first alert of a storm. Each agent's
+/metrics endpoint is scraped before and after the run for tasks/sec, CPU
+and RSS.
+
+The Event Correlator keeps the incident payload in its workflow state
+rather than forwarding it, so the driver builds the orchestrator's
+handle_alert task itself (from the EC result when it carries one).
+
+Usage:
+    python -m benchmarks.alert_storm --simulator http://localhost:9443 \\
+        --event-correlator http://localhost:8001 --orchestrator http://localhost:8000 \\
+        --agent service_impact=http://localhost:8002 --storms 20 --alerts-per-storm 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import uuid4
+
+import httpx
+
+from agents.orchestrator.tools.state_manager import StateManagerTool
+
+PROTECTED_STATUSES = {"monitoring", "restoring", "closed"}
+FAILED_STATUSES = {"escalated"}
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    return {
+        "count": len(ordered),
+        "p50": pct(0.50),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "max": round(ordered[-1], 3),
+        "mean": round(statistics.fmean(ordered), 3),
+    }
+
+
+def parse_metrics(text: str) -> dict[str, float]:
+    """Sum Prometheus samples by metric name (labels dropped)"""
+    totals: dict[str, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name_part, _, value = line.rpartition(" ")
+        name = name_part.split("{", 1)[0]
+        try:
+            totals[name] = totals.get(name, 0.0) + float(value)
+        except ValueError:
+            continue
+    return totals
+
+
+async def scrape(client: httpx.AsyncClient, agents: dict[str, str]) -> dict[str, dict[str, float]]:
+    async def one(name: str, url: str) -> tuple[str, dict[str, float]]:
+        try:
+            response = await client.get(f"{url}/metrics")
+            response.raise_for_status()
+            return name, parse_metrics(response.text)
+        except httpx.HTTPError:
+            return name, {}
+
+    return dict(await asyncio.gather(*[one(n, u) for n, u in agents.items()]))
+
+
+def agent_usage(
+    before: dict[str, dict[str, float]],
+    after: dict[str, dict[str, float]],
+    elapsed: float,
+) -> dict[str, dict[str, Any]]:
+    usage = {}
+    for name, end in after.items():
+        start = before.get(name, {})
+
+        def delta(metric: str) -> float:
+            return end.get(metric, 0.0) - start.get(metric, 0.0)
+
+        usage[name] = {
+            "tasks": int(delta("workflow_task_duration_seconds_count")),
+            "tasks_per_sec": round(delta("workflow_task_duration_seconds_count") / elapsed, 2),
+            "cpu_pct": round(100 * delta("process_cpu_seconds_total") / elapsed, 1),
+            "rss_mb": round(end.get("process_resident_memory_bytes", 0.0) / 2**20, 1),
+        }
+    return usage
+
+
+def pca_alert(link: dict[str, Any], i: int) -> dict[str, Any]:
+    return {
+        "alert_id": f"pca-{uuid4().hex[:12]}",
+        "metric_type": ("latency", "jitter", "packet_loss")[i % 3],
+        "current_value": 120.0 + i,
+        "threshold_value": 50.0,
+        "source_ip": link["source_ip"],
+        "dest_ip": link["dest_ip"],
+        "link_id": link["link_id"],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class StormRunner:
+    def __init__(self, args: argparse.Namespace, client: httpx.AsyncClient):
+        self.args = args
+        self.client = client
+        self.state = StateManagerTool(redis_url=args.redis_url)
+        self.semaphore = asyncio.Semaphore(args.concurrency)
+        self.ec_latencies: list[float] = []
+        self.ec_errors = 0
+        self.time_to_protect: list[float] = []
+        self.outcomes: dict[str, int] = {}
+
+    async def correlate(self, alert: dict[str, Any]) -> Optional[dict[str, Any]]:
+        task = {
+            "task_type": "correlate_alert",
+            "payload": {"source": "pca", "alert": alert},
+            "priority": 1,
+        }
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                response = await self.client.post(f"{self.args.event_correlator}/a2a/tasks", json=task)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                self.ec_errors += 1
+                return None
+            finally:
+                self.ec_latencies.append(time.perf_counter() - start)
+        return response.json().get("result") or {}
+
+    async def wait_for_protection(self, incident_id: str, started: float) -> str:
+        deadline = started + self.args.timeout
+        status = "unknown"
+        while time.perf_counter() < deadline:
+            incident = await self.state.get_incident(incident_id)
+            status = (incident or {}).get("status", "unknown")
+            if status in PROTECTED_STATUSES:
+                self.time_to_protect.append(time.perf_counter() - started)
+                return "protected"
+            if status in FAILED_STATUSES:
+                return status
+            await asyncio.sleep(self.args.poll_interval)
+        return "timeout"
+
+    async def storm(self, n: int) -> None:
+        sample = await self.client.get(
+            f"{self.args.simulator}/sim/topology/sample",
+            params={"links": self.args.links_per_storm, "salt": n},
+        )
+        links = sample.json()["links"]
+        for link in links:
+            await self.client.post(
+                f"{self.args.simulator}/sim/links/{link['link_id']}/degrade",
+                json={"duration_seconds": self.args.timeout},
+            )
+
+        started = time.perf_counter()
+        alerts = [pca_alert(links[i % len(links)], i) for i in range(self.args.alerts_per_storm)]
+        results = await asyncio.gather(*[self.correlate(alert) for alert in alerts])
+
+        incident = next((r.get("incident_payload") for r in results if r and r.get("incident_payload")), None) or {}
+        incident_id = incident.get("incident_id") or f"INC-STORM-{uuid4().hex[:8]}-{n:04d}"
+        task = {
+            "task_type": "handle_alert",
+            "incident_id": incident_id,
+            "payload": {
+                "alert_type": incident.get("alert_type", "sla_degradation"),
+                "degraded_links": incident.get("degraded_links") or [link["link_id"] for link in links],
+                "severity": incident.get("severity", "critical"),
+            },
+            "priority": 1,
+        }
+        try:
+            response = await self.client.post(f"{self.args.orchestrator}/a2a/tasks/async", json=task)
+            response.raise_for_status()
+            outcome = await self.wait_for_protection(incident_id, started)
+        except httpx.HTTPError:
+            outcome = "orchestrator_error"
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--simulator", default="http://localhost:9443")
+    parser.add_argument("--event-correlator", default="http://localhost:8001")
+    parser.add_argument("--orchestrator", default="http://localhost:8000")
+    parser.add_argument("--redis-url", default="redis://localhost:6379")
+    parser.add_argument("--storms", type=int, default=10)
+    parser.add_argument("--parallel-storms", type=int, default=1)
+    parser.add_argument("--alerts-per-storm", type=int, default=50)
+    parser.add_argument("--links-per-storm", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=50, help="Max in-flight EC requests")
+    parser.add_argument(
+        "--agent",
+        action="append",
+        default=[],
+        metavar="NAME=URL",
+        help="Extra agent to scrape /metrics from (repeatable)",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-incident protection timeout")
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    args = parser.parse_args()
+
+    agents = {"event_correlator": args.event_correlator, "orchestrator": args.orchestrator}
+    agents.update(dict(item.split("=", 1) for item in args.agent))
+
+    limits = httpx.Limits(max_connections=args.concurrency + 20)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        runner = StormRunner(args, client)
+        before = await scrape(client, agents)
+        start = time.perf_counter()
+
+        storms = asyncio.Semaphore(args.parallel_storms)
+
+        async def run(n: int) -> None:
+            async with storms:
+                await runner.storm(n)
+
+        await asyncio.gather(*[run(n) for n in range(args.storms)])
+        elapsed = time.perf_counter() - start
+        after = await scrape(client, agents)
+        simulator_stats = (await client.get(f"{args.simulator}/sim/stats")).json()
+
+    results = {
+        "storms": args.storms,
+        "alerts": args.storms * args.alerts_per_storm,
+        "elapsed_seconds": round(elapsed, 2),
+        "alerts_per_sec": round(args.storms * args.alerts_per_storm / elapsed, 1),
+        "event_correlator_latency_seconds": percentiles(runner.ec_latencies),
+        "event_correlator_errors": runner.ec_errors,
+        "time_to_protect_seconds": percentiles(runner.time_to_protect),
+        "outcomes": runner.outcomes,
+        "agents": agent_usage(before, after, elapsed),
+        "simulator": simulator_stats,
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
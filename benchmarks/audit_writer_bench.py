@@ -0,0 +1,151 @@
+"""
+Audit Writer Benchmark
+
+Measures audit events/sec against a local PostgreSQL for:
+- single:  one INSERT per event (PostgreSQLClient.insert_audit_event)
+- batched: write-behind AuditWriter (COPY batches)
+
+Creates an audit_events table (without the incidents FK) if it does not
+exist, so it can run against a scratch database.
+
+Usage:
+    POSTGRES_HOST=localhost POSTGRES_DB=audit_bench \\
+        python -m benchmarks.audit_writer_bench --events 20000 --producers 50
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from agents.audit.tools.audit_writer import AuditWriter
+from agents.audit.tools.postgresql_client import PostgreSQLClient
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS audit_events (
+    event_id UUID PRIMARY KEY,
+    timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    incident_id VARCHAR(50),
+    agent_name VARCHAR(50) NOT NULL,
+    node_name VARCHAR(50),
+    event_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    previous_state VARCHAR(50),
+    new_state VARCHAR(50),
+    decision_type VARCHAR(20),
+    decision_reasoning TEXT,
+    actor VARCHAR(100) DEFAULT 'system'
+)
+"""
+
+
+def make_event(i: int) -> dict:
+    """Synthetic orchestrator phase-change event"""
+    return {
+        "event_id": str(uuid4()),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "incident_id": f"INC-BENCH-{i % 500:04d}",
+        "agent_name": "orchestrator",
+        "node_name": "steer_traffic",
+        "event_type": "state_change",
+        "payload": {"phase": "steering", "link_id": f"link-{i % 64}", "services": i % 20},
+        "previous_state": "provisioning",
+        "new_state": "steering",
+        "decision_type": "rule_based",
+        "decision_reasoning": "Protection tunnel operational",
+        "actor": "system",
+    }
+
+
+async def _run_producers(total: int, producers: int, write) -> float:
+    """Run producers concurrently, return elapsed seconds"""
+    per_producer = total // producers
+
+    async def producer(offset: int) -> None:
+        for i in range(per_producer):
+            await write(make_event(offset + i))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[producer(p * per_producer) for p in range(producers)])
+    return time.perf_counter() - start
+
+
+async def bench_single(pg: PostgreSQLClient, total: int, producers: int) -> float:
+    async def write(event: dict) -> None:
+        await pg.insert_audit_event(
+            event_id=event["event_id"],
+            timestamp=datetime.fromisoformat(event["timestamp"]),
+            incident_id=event["incident_id"],
+            agent_name=event["agent_name"],
+            node_name=event["node_name"],
+            event_type=event["event_type"],
+            payload=event["payload"],
+            previous_state=event["previous_state"],
+            new_state=event["new_state"],
+            decision_type=event["decision_type"],
+            decision_reasoning=event["decision_reasoning"],
+            actor=event["actor"],
+        )
+
+    return await _run_producers(total, producers, write)
+
+
+async def bench_batched(
+    pg: PostgreSQLClient,
+    total: int,
+    producers: int,
+    durability: str,
+    batch_size: int,
+    spill_dir: str,
+) -> float:
+    writer = AuditWriter(
+        pg_client=pg,
+        batch_size=batch_size,
+        durability=durability,
+        spill_dir=spill_dir,
+    )
+    await writer.start()
+    elapsed = await _run_producers(total, producers, writer.write)
+    # Include the final drain so "enqueue" numbers are comparable
+    start = time.perf_counter()
+    await writer.stop()
+    return elapsed + (time.perf_counter() - start)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--producers", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--spill-dir", default="/tmp/audit-bench-spill")
+    parser.add_argument("--skip-single", action="store_true", help="Skip the slow per-event baseline")
+    args = parser.parse_args()
+
+    pg = PostgreSQLClient(pool_size=args.producers)
+    await pg.connect()
+    if not pg.connected:
+        raise SystemExit("asyncpg is required for this benchmark: pip install asyncpg")
+
+    async with pg._pool.acquire() as conn:
+        await conn.execute(CREATE_TABLE_SQL)
+
+    results = {"events": args.events, "producers": args.producers, "batch_size": args.batch_size}
+
+    if not args.skip_single:
+        elapsed = await bench_single(pg, args.events, args.producers)
+        results["single_events_per_sec"] = round(args.events / elapsed, 1)
+
+    for durability in ("flush", "enqueue"):
+        elapsed = await bench_batched(
+            pg, args.events, args.producers, durability, args.batch_size, args.spill_dir
+        )
+        results[f"batched_{durability}_events_per_sec"] = round(args.events / elapsed, 1)
+
+    await pg.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,17 @@
+"""
+Micro-benchmarks for the hot-path tools (pytest-benchmark).
+
+Fixed, seeded synthetic datasets keep runs comparable across commits.
+Redis-backed tools run against fakeredis, or a real Redis when
+BENCH_REDIS_URL is set.
+
+Usage:
+    pip install pytest-benchmark fakeredis
+    # Record a baseline (saved under .benchmarks/)
+    python -m pytest benchmarks/micro --benchmark-autosave
+    # Compare against the latest baseline; pytest.ini fails the run on a
+    # >15% mean regression
+    python -m pytest benchmarks/micro
+    # JSON for CI artifacts
+    python -m pytest benchmarks/micro --benchmark-json=bench.json
+"""
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the micro-benchmarks
+"""
+
+import asyncio
+import logging
+import os
+from uuid import uuid4
+
+import pytest
+import structlog
+
+
+def pytest_configure(config):
+    # Measure the tools, not log rendering
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    """Run coroutines on one loop for the whole session"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def redis_client(event_loop_runner):
+    """fakeredis by default, a real Redis when BENCH_REDIS_URL is set"""
+    url = os.getenv("BENCH_REDIS_URL")
+    if url:
+        import redis.asyncio as redis
+
+        client = redis.from_url(url, decode_responses=True)
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    event_loop_runner(client.aclose())
+
+
+@pytest.fixture
+def key_prefix():
+    """Fresh key space per benchmark, so runs do not see each other's state"""
+    return f"bench:{uuid4().hex[:8]}:"
+
+
+@pytest.fixture
+def run_async(benchmark, event_loop_runner):
+    """benchmark() for coroutine functions"""
+
+    def run(func, *args, **kwargs):
+        return benchmark(lambda: event_loop_runner(func(*args, **kwargs)))
+
+    return run
@@ -0,0 +1,188 @@
+"""
+Synthetic Benchmark Datasets
+
+Deterministic (seeded) inputs sized like a busy production window, so the
+same benchmark measures the same work on every run.
+"""
+
+import random
+from datetime import datetime, timezone
+from typing import Any
+
+SEED = 42
+NUM_LINKS = 200
+NUM_PES = 50
+NUM_SERVICES = 500
+
+SLA_TIERS = ("platinum", "gold", "silver", "bronze")
+SERVICE_TYPES = ("l3vpn", "l2vpn", "evpn")
+
+
+def link_ids(count: int = NUM_LINKS) -> list[str]:
+    return [f"link-{i:04d}" for i in range(count)]
+
+
+def pe_names(count: int = NUM_PES) -> list[str]:
+    return [f"PE{i}" for i in range(count)]
+
+
+def normalized_alerts(count: int = 1000) -> list[dict[str, Any]]:
+    """Alerts as produced by the Event Correlator ingest node"""
+    rng = random.Random(SEED)
+    links = link_ids()
+    now = datetime.now(timezone.utc).isoformat()
+    alerts = []
+    for i in range(count):
+        metric = rng.choice(("latency", "jitter", "loss"))
+        alerts.append({
+            "alert_id": f"ALERT-{i:06d}",
+            "source": "pca",
+            "timestamp": now,
+            "link_id": rng.choice(links),
+            "interface_a": "PE1:Gi0/0/0/1",
+            "interface_z": "P1:Gi0/0/0/2",
+            "latency_ms": rng.uniform(50, 200) if metric == "latency" else None,
+            "jitter_ms": rng.uniform(5, 40) if metric == "jitter" else None,
+            "packet_loss_pct": rng.uniform(0.1, 5) if metric == "loss" else None,
+            "violated_thresholds": [metric],
+            "severity": rng.choice(("critical", "major", "minor")),
+        })
+    return alerts
+
+
+def telemetry(sr_pm: int = 2000, netflow: int = 5000):
+    """TelemetryData mixing SRv6 locator, SR-MPLS BSID and NetFlow records"""
+    from agents.traffic_analytics.schemas.telemetry import FlowRecord, SRPMMetric, TelemetryData
+
+    rng = random.Random(SEED)
+    pes = pe_names()
+    metrics = []
+    for i in range(sr_pm):
+        src, dst = rng.sample(pes, 2)
+        if i % 2:
+            metrics.append(SRPMMetric(
+                metric_id=f"m{i}", headend=src, endpoint=dst,
+                srv6_locator=f"fc00:0:{src}::/48",
+                source_locator=f"fc00:0:{src}::", dest_locator=f"fc00:0:{dst}::",
+                traffic_gbps=rng.uniform(0.01, 0.5),
+            ))
+        else:
+            metrics.append(SRPMMetric(
+                metric_id=f"m{i}", headend=src, endpoint=dst,
+                sr_policy_bsid=24000 + i, traffic_gbps=rng.uniform(0.01, 0.5),
+            ))
+    flows = []
+    for i in range(netflow):
+        src, dst = rng.sample(pes, 2)
+        if i % 2:
+            flows.append(FlowRecord(
+                flow_id=f"f{i}", src_ip=f"10.0.{i % 250}.1", dst_ip=f"10.1.{i % 250}.1",
+                src_pe=src, dst_pe=dst, bytes=rng.randint(10**6, 10**9),
+            ))
+        else:
+            flows.append(FlowRecord(
+                flow_id=f"f{i}", src_ip=f"192.0.{pes.index(src)}.1", dst_ip=f"192.0.{pes.index(dst)}.1",
+                bytes=rng.randint(10**6, 10**9),
+            ))
+    return TelemetryData(
+        sr_pm=metrics, netflow=flows, sr_pm_count=len(metrics), netflow_count=len(flows),
+    )
+
+
+def register_pe_mappings(builder) -> None:
+    """Locator and IP mappings matching telemetry()"""
+    for i, pe in enumerate(pe_names()):
+        builder.register_locator_mapping(f"fc00:0:{pe}::", pe)
+        builder.register_ip_mapping(f"192.0.{i}.1", pe)
+
+
+def kg_topology(num_links: int = NUM_LINKS) -> dict[str, Any]:
+    """
+    KG topology (links + PE-pair paths) in the CongestionPredictor format.
+
+    Every 10th link is a 10G access link; with telemetry() about 16 of
+    them cross the utilization threshold (7 critical), so predict() runs
+    its risk path and not only the no-risk scan.
+    """
+    rng = random.Random(SEED)
+    pes = pe_names()
+    links = []
+    for i, link_id in enumerate(link_ids(num_links)):
+        a, z = rng.sample(pes, 2)
+        capacity = 10.0 if i % 10 == 0 else 100.0
+        links.append({
+            "link_id": link_id,
+            "endpoints": [a, z],
+            "capacity_gbps": capacity,
+            "current_traffic_gbps": capacity * rng.uniform(0.2, 0.95),
+        })
+    ids = [link["link_id"] for link in links]
+    paths = {
+        (src, dst): rng.sample(ids, rng.randint(2, 5))
+        for src in pes
+        for dst in pes
+        if src != dst
+    }
+    return {"links": links, "paths": paths}
+
+
+def services(count: int = NUM_SERVICES) -> list[dict[str, Any]]:
+    """CNC service records as seen by the Service Impact agent"""
+    rng = random.Random(SEED)
+    links = link_ids()
+    pes = pe_names()
+    result = []
+    for i in range(count):
+        a, z = rng.sample(pes, 2)
+        result.append({
+            "service_id": f"svc-{i:05d}",
+            "service_name": f"svc-{i:05d}",
+            "service_type": rng.choice(SERVICE_TYPES),
+            "customer_id": f"cust-{i % 40:03d}",
+            "customer_name": f"Customer {i % 40}",
+            "sla_tier": rng.choice(SLA_TIERS),
+            "endpoint_a": a,
+            "endpoint_z": z,
+            "current_path": rng.sample(links, rng.randint(2, 6)),
+            "current_te_type": rng.choice(("rsvp-te", "sr-mpls", "srv6")),
+            "redundancy_available": rng.random() < 0.3,
+        })
+    return result
+
+
+def degraded_links() -> list[str]:
+    return link_ids()[:4]
+
+
+def candidate_paths(count: int = 50):
+    """ComputedPath candidates as returned by the KG"""
+    from agents.path_computation.schemas.paths import ComputedPath
+
+    rng = random.Random(SEED)
+    paths = []
+    for i in range(count):
+        hops = rng.randint(2, 8)
+        paths.append(ComputedPath(
+            path_id=f"path-{i:03d}",
+            source="PE1",
+            destination="PE2",
+            segments=[f"P{rng.randint(0, 99)}" for _ in range(hops)],
+            segment_sids=[16000 + rng.randint(0, 99) for _ in range(hops)],
+            total_hops=hops,
+            total_delay_ms=rng.uniform(5, 60),
+            total_igp_metric=rng.randint(10, 200),
+            total_te_metric=rng.randint(10, 200),
+            min_available_bandwidth_gbps=rng.uniform(1, 40),
+        ))
+    return paths
+
+
+def notification_data(count: int = NUM_SERVICES) -> dict[str, Any]:
+    return {
+        "degraded_links": degraded_links(),
+        "affected_services": [
+            {"service_id": s["service_id"], "customer": s["customer_name"], "sla_tier": s["sla_tier"]}
+            for s in services(count)
+        ],
+        "service_count": count,
+    }
@@ -0,0 +1,30 @@
+"""
+Traffic Analytics: demand matrix and congestion prediction
+"""
+
+from agents.traffic_analytics.tools.congestion_predictor import CongestionPredictor
+from agents.traffic_analytics.tools.demand_matrix_builder import DemandMatrixBuilder
+
+from . import datasets
+
+
+def _builder() -> DemandMatrixBuilder:
+    builder = DemandMatrixBuilder()
+    datasets.register_pe_mappings(builder)
+    return builder
+
+
+def test_build_matrix(benchmark):
+    builder = _builder()
+    telemetry = datasets.telemetry()
+    matrix = benchmark(builder.build_matrix, telemetry)
+    assert matrix.get_pe_count() == datasets.NUM_PES
+
+
+def test_predict(run_async):
+    predictor = CongestionPredictor()
+    predictor._topology = datasets.kg_topology()
+    matrix = _builder().build_matrix(datasets.telemetry())
+    risks = run_async(predictor.predict, matrix)
+    assert any(risk.risk_level == "high" for risk in risks)
+    assert any(risk.risk_level == "medium" for risk in risks)
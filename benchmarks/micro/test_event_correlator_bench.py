@@ -0,0 +1,61 @@
+"""
+Event Correlator hot path: dedup, correlation and flap detection
+"""
+
+import itertools
+
+from agents.event_correlator.tools.correlator import AlertCorrelator
+from agents.event_correlator.tools.dedup_checker import DedupChecker
+from agents.event_correlator.tools.flap_detector import FlapDetector
+
+from . import datasets
+
+ALERTS = datasets.normalized_alerts()
+
+
+def _with_client(tool, redis_client):
+    tool._client = redis_client
+    return tool
+
+
+def test_dedup_check_and_record(run_async, redis_client, key_prefix):
+    checker = _with_client(DedupChecker(key_prefix=key_prefix), redis_client)
+    rounds = itertools.count()
+
+    async def batch():
+        # New key space per round, so every round sees first-time alerts
+        checker.key_prefix = f"{key_prefix}{next(rounds)}:"
+        for alert in ALERTS[:200]:
+            is_duplicate, _ = await checker.check_duplicate(alert)
+            if not is_duplicate:
+                await checker.record_alert(alert)
+
+    run_async(batch)
+
+
+def test_dedup_hash(benchmark):
+    checker = DedupChecker()
+    benchmark(lambda: [checker._compute_hash(alert) for alert in ALERTS])
+
+
+def test_correlate(run_async, redis_client, key_prefix):
+    correlator = _with_client(AlertCorrelator(key_prefix=key_prefix), redis_client)
+    alerts = itertools.cycle(ALERTS)
+
+    async def batch():
+        for _ in range(100):
+            await correlator.correlate(next(alerts))
+
+    run_async(batch)
+
+
+def test_flap_detection(run_async, redis_client, key_prefix):
+    detector = _with_client(FlapDetector(key_prefix=key_prefix), redis_client)
+    links = datasets.link_ids()
+
+    async def batch():
+        for link_id in links[:100]:
+            await detector.record_event(link_id)
+            await detector.check_flapping(link_id)
+
+    run_async(batch)
@@ -0,0 +1,23 @@
+"""
+Path selection and notification formatting
+"""
+
+from agents.notification.tools.message_formatter import MessageFormatter
+from agents.path_computation.tools.path_validator import PathValidator
+
+from . import datasets
+
+
+def test_select_best_path(benchmark):
+    validator = PathValidator()
+    paths = datasets.candidate_paths()
+    sla = {"max_delay_ms": 20.0, "min_bandwidth_gbps": 10.0}
+    best = benchmark(validator.select_best_path, paths, sla, "delay")
+    assert best is not None
+
+
+def test_format_message(benchmark):
+    formatter = MessageFormatter()
+    data = datasets.notification_data()
+    message = benchmark(formatter.format_message, "incident_detected", "INC-BENCH-0001", "critical", data)
+    assert "INC-BENCH-0001" in message.subject
@@ -0,0 +1,31 @@
+"""
+Service Impact: impact analysis and SLA enrichment over 500 services
+"""
+
+from agents.service_impact.tools.impact_analyzer import ImpactAnalyzer
+from agents.service_impact.tools.sla_enricher import SLAEnricher
+
+from . import datasets
+
+SERVICES = datasets.services()
+DEGRADED = datasets.degraded_links()
+
+
+def test_aggregate_impact(benchmark):
+    analyzer = ImpactAnalyzer()
+    result = benchmark(analyzer.aggregate_impact, SERVICES, DEGRADED)
+    assert result["total_affected"] == len(SERVICES)
+
+
+def test_analyze_and_enrich(benchmark):
+    analyzer = ImpactAnalyzer()
+    enricher = SLAEnricher()
+
+    def run():
+        impacts = {
+            s["service_id"]: analyzer.analyze_service_impact(s, DEGRADED) for s in SERVICES
+        }
+        return enricher.enrich_services(SERVICES, impacts)
+
+    enriched = benchmark(run)
+    assert len(enriched) == len(SERVICES)
@@ -0,0 +1,117 @@
+"""
+BaseWorkflow.execute overhead (graph invoke, state, metrics, timings)
+
+EmptyWorkflow runs one no-op node, so its timings are the floor cost every
+task pays before any agent logic: workflow execution alone, and the whole
+A2A hop (request parsing, TaskInput, execute, TaskOutput, response JSON).
+"""
+
+import httpx
+from langgraph.graph import END, START, StateGraph
+
+from agent_template.api.server import A2ATaskServer
+from agent_template.schemas.state import WorkflowState
+from agent_template.workflow import BaseWorkflow
+
+
+class ThreeNodeWorkflow(BaseWorkflow):
+    """Minimal linear graph, so the benchmark measures framework cost"""
+
+    def get_state_class(self):
+        return WorkflowState
+
+    def build_graph(self, graph: StateGraph):
+        async def ingest(state: dict) -> dict:
+            return {"current_node": "ingest"}
+
+        async def process(state: dict) -> dict:
+            return {"current_node": "process"}
+
+        async def emit(state: dict) -> dict:
+            return {"result": {"emitted": True}, "current_node": "emit"}
+
+        graph.add_node("ingest", ingest)
+        graph.add_node("process", process)
+        graph.add_node("emit", emit)
+        graph.add_edge(START, "ingest")
+        graph.add_edge("ingest", "process")
+        graph.add_edge("process", "emit")
+        graph.add_edge("emit", END)
+
+
+def test_execute(run_async):
+    workflow = ThreeNodeWorkflow(agent_name="bench", agent_version="1.0.0")
+    workflow.compile()
+    result = run_async(
+        workflow.execute,
+        task_id="bench-1",
+        task_type="bench",
+        payload={"alert": {"link_id": "link-0001"}},
+    )
+    assert result == {"emitted": True}
+
+
+class EmptyWorkflow(BaseWorkflow):
+    """Single no-op node: per-task overhead of the framework only"""
+
+    def get_state_class(self):
+        return WorkflowState
+
+    def build_graph(self, graph: StateGraph):
+        async def noop(state: dict) -> dict:
+            return {}
+
+        graph.add_node("noop", noop)
+        graph.add_edge(START, "noop")
+        graph.add_edge("noop", END)
+
+
+def test_initial_state(benchmark):
+    workflow = EmptyWorkflow(agent_name="bench", agent_version="1.0.0")
+    state = benchmark(
+        workflow.get_initial_state,
+        task_id="bench-1",
+        task_type="bench",
+        payload={"alert": {"link_id": "link-0001"}},
+    )
+    assert state["nodes_executed"] == []
+
+
+def test_compile_shared(benchmark):
+    EmptyWorkflow(agent_name="bench", agent_version="1.0.0").compile()
+    app = benchmark(lambda: EmptyWorkflow(agent_name="bench", agent_version="1.0.0").compile())
+    assert app is EmptyWorkflow(agent_name="bench", agent_version="1.0.0").compile()
+
+
+def test_execute_empty(run_async):
+    workflow = EmptyWorkflow(agent_name="bench", agent_version="1.0.0")
+    workflow.compile()
+    result = run_async(
+        workflow.execute,
+        task_id="bench-1",
+        task_type="bench",
+        payload={"alert": {"link_id": "link-0001"}},
+    )
+    assert result == {}
+
+
+def test_a2a_task_empty(run_async, monkeypatch):
+    monkeypatch.delenv("A2A_SHARED_SECRET", raising=False)
+    workflow = EmptyWorkflow(agent_name="bench", agent_version="1.0.0")
+    server = A2ATaskServer(
+        agent_name="bench",
+        agent_version="1.0.0",
+        agent_description="Empty workflow",
+        workflow_executor=workflow.execute,
+        supported_task_types=["bench"],
+    )
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://bench")
+    task = {"task_type": "bench", "payload": {"alert": {"link_id": "link-0001"}}}
+
+    async def post_task():
+        response = await client.post("/a2a/tasks", json=task)
+        response.raise_for_status()
+        return response.json()
+
+    output = run_async(post_task)
+    assert output["status"]["state"] == "completed"
@@ -0,0 +1,195 @@
+"""
+Agent Startup Benchmark
+
+Reports cold-start cost of each agent's main.py:
+
+1. import audit: `python -X importtime` of the agent's main module, giving
+   total import time, the slowest top-level imports and any heavy optional
+   dependencies (provider SDKs, Kafka/Postgres/Elasticsearch/gRPC clients)
+   loaded at startup instead of on first use
+2. time-to-ready: starts the agent and polls GET /ready until it answers
+   200, i.e. until the runner's initialize() (config, MCP/A2A clients,
+   graph compilation) has finished
+
+Agents listen on their configured ports, so they are started one at a
+time; point REDIS_URL, MCP_SERVER_URL etc. at the simulator or stubs first.
+
+Usage:
+    python -m benchmarks.startup --runs 3
+    python -m benchmarks.startup --agent event_correlator --agent audit --imports-only
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# name -> (A2A port, working directory, module run with python -m)
+AGENTS: dict[str, tuple[int, Path, str]] = {
+    "orchestrator": (8000, REPO_ROOT / "agents" / "orchestrator", "main"),
+    "event_correlator": (8001, REPO_ROOT, "agents.event_correlator.main"),
+    "service_impact": (8002, REPO_ROOT, "agents.service_impact.main"),
+    "path_computation": (8003, REPO_ROOT, "agents.path_computation.main"),
+    "tunnel_provisioning": (8004, REPO_ROOT, "agents.tunnel_provisioning.main"),
+    "restoration_monitor": (8005, REPO_ROOT, "agents.restoration_monitor.main"),
+    "traffic_analytics": (8006, REPO_ROOT, "agents.traffic_analytics.main"),
+    "notification": (8007, REPO_ROOT, "agents.notification.main"),
+    "audit": (8008, REPO_ROOT, "agents.audit.main"),
+}
+
+# Should only be imported on first use, never at startup
+DEFERRED_MODULES = (
+    "langchain_aws",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_community",
+    "langchain_mcp_adapters",
+    "langgraph.prebuilt",
+    "aiokafka",
+    "asyncpg",
+    "elasticsearch",
+    "grpc",
+    "google.protobuf",
+    "boto3",
+    "botocore",
+)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.getenv("PYTHONPATH")]))}
+
+
+def audit_imports(name: str, top: int) -> dict[str, Any]:
+    """Import the agent's main module under -X importtime and summarize"""
+    _, cwd, module = AGENTS[name]
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+
+    top_level: list[tuple[str, int]] = []
+    loaded: set[str] = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, package = match.groups()
+        loaded.add(package)
+        if len(indent) <= 1:
+            top_level.append((package, int(cumulative)))
+
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        return {"error": errors[-1] if errors else f"exit {proc.returncode}", "wall_seconds": round(wall, 3)}
+
+    return {
+        "wall_seconds": round(wall, 3),
+        "import_seconds": round(sum(us for _, us in top_level) / 1e6, 3),
+        "modules": len(loaded),
+        "slowest": [
+            {"module": package, "ms": round(us / 1000, 1)}
+            for package, us in sorted(top_level, key=lambda item: item[1], reverse=True)[:top]
+        ],
+        "eager_heavy_imports": sorted(
+            heavy for heavy in DEFERRED_MODULES
+            if any(package == heavy or package.startswith(heavy + ".") for package in loaded)
+        ),
+    }
+
+
+def time_to_ready(name: str, timeout: float, poll_interval: float) -> dict[str, Any]:
+    """Start the agent and measure the time until /ready answers 200"""
+    port, cwd, module = AGENTS[name]
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", module],
+        cwd=cwd,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    first_response: Optional[float] = None
+    ready: Optional[float] = None
+    try:
+        with httpx.Client(timeout=poll_interval * 4) as client:
+            while time.perf_counter() - start < timeout and proc.poll() is None:
+                try:
+                    response = client.get(f"http://127.0.0.1:{port}/ready")
+                    first_response = first_response or time.perf_counter() - start
+                    if response.status_code == 200:
+                        ready = time.perf_counter() - start
+                        break
+                except httpx.HTTPError:
+                    pass
+                time.sleep(poll_interval)
+    finally:
+        proc.terminate()
+        try:
+            _, stderr = proc.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            _, stderr = proc.communicate()
+
+    result: dict[str, Any] = {
+        "ready_seconds": round(ready, 3) if ready is not None else None,
+        "listening_seconds": round(first_response, 3) if first_response is not None else None,
+    }
+    if ready is None:
+        lines = (stderr or "").strip().splitlines()
+        result["error"] = lines[-1] if lines else "not ready before timeout"
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agent", action="append", choices=sorted(AGENTS), help="Agent to measure (repeatable, default all)")
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts per agent")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-start readiness timeout")
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--imports-only", action="store_true", help="Skip starting the agents")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    for name in args.agent or list(AGENTS):
+        report: dict[str, Any] = {"imports": audit_imports(name, args.top)}
+        if not args.imports_only:
+            starts = [time_to_ready(name, args.timeout, args.poll_interval) for _ in range(args.runs)]
+            ready = [s["ready_seconds"] for s in starts if s["ready_seconds"] is not None]
+            report["time_to_ready_seconds"] = {
+                "runs": len(starts),
+                "ready": len(ready),
+                "min": min(ready) if ready else None,
+                "median": round(statistics.median(ready), 3) if ready else None,
+                "max": max(ready) if ready else None,
+            }
+            errors = sorted({s["error"] for s in starts if "error" in s})
+            if errors:
+                report["errors"] = errors
+        results[name] = report
+        print(f"{name}: {json.dumps(report.get('time_to_ready_seconds') or report['imports'].get('import_seconds'))}",
+              file=sys.stderr)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+CNC / COE / PCA / Knowledge Graph simulator for load and latency testing.
+
+Serves every operation in api_specs/ from a synthetic topology (10k devices,
+100k services by default) with stateful handlers for the protection path
+and per-endpoint latency/error injection.
+"""
+
+from .app import Simulator, create_app, simulator_from_env
+from .faults import FaultInjector, FaultRule
+from .specs import SpecCatalog, SpecOperation
+from .state import SimulatorState, Tunnel
+from .topology import SyntheticTopology
+
+__all__ = [
+    "Simulator",
+    "create_app",
+    "simulator_from_env",
+    "FaultInjector",
+    "FaultRule",
+    "SpecCatalog",
+    "SpecOperation",
+    "SimulatorState",
+    "Tunnel",
+    "SyntheticTopology",
+]
@@ -0,0 +1,27 @@
+"""
+Simulator Entry Point
+
+Usage:
+    SIM_PORT=9443 SIM_FAULTS_FILE=simulator/faults.example.yaml python -m simulator
+"""
+
+import os
+
+import uvicorn
+
+from .app import create_app
+
+
+def main():
+    """Run the simulator"""
+    uvicorn.run(
+        create_app(),
+        host=os.getenv("SIM_HOST", "0.0.0.0"),
+        port=int(os.getenv("SIM_PORT", "9443")),
+        log_level=os.getenv("LOG_LEVEL", "warning").lower(),
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+CNC / COE / PCA / KG Simulator Server
+
+One FastAPI app serving every operation in api_specs/ plus the stateful
+handlers in handlers.py, so all agents can point their CNC_*, PCA_* and
+KG_* URLs at a single host:port. Requests are dispatched through a
+catch-all route (exact-path dict lookup first, then templated routes) so
+the route table stays cheap with a few hundred operations.
+
+Admin endpoints (under /sim) let a load driver degrade links, sample the
+topology, read per-route stats and swap fault rules at runtime.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import structlog
+from fastapi import FastAPI, Request, Response
+
+from .faults import FaultInjector, FaultRule
+from .handlers import SimulatorHandlers
+from .specs import SpecCatalog, SpecOperation, compile_path
+from .state import SimulatorState
+from .topology import SyntheticTopology
+
+logger = structlog.get_logger(__name__)
+
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
+@dataclass
+class RouteStats:
+    count: int = 0
+    errors: int = 0
+    injected_errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "injected_errors": self.injected_errors,
+            "avg_ms": round(1000 * self.total_seconds / self.count, 2) if self.count else 0.0,
+            "max_ms": round(1000 * self.max_seconds, 2),
+        }
+
+
+@dataclass
+class Route:
+    method: str
+    template: str
+    handler: Callable
+    pattern: Optional[re.Pattern] = field(default=None, repr=False)
+
+
+class Router:
+    """Exact-path lookup with a templated-route fallback"""
+
+    def __init__(self):
+        self._exact: dict[tuple[str, str], Route] = {}
+        self._templated: dict[str, list[Route]] = {}
+
+    def add(self, method: str, template: str, handler: Callable) -> None:
+        key = (method, template)
+        if key in self._exact or any(r.template == template for r in self._templated.get(method, [])):
+            return  # First registration wins (handlers before spec examples)
+        if template.startswith("*"):
+            # Suffix route: any prefix (e.g. NSO base path baked into client URLs)
+            pattern = compile_path("{_prefix}" + template[1:])
+            pattern = re.compile(pattern.pattern.replace(r"(?P<_prefix>[^/]+)", r"(?P<_prefix>.*)", 1))
+        else:
+            pattern = compile_path(template)
+        route = Route(method, template, handler, pattern)
+        if pattern is None:
+            self._exact[key] = route
+        else:
+            self._templated.setdefault(method, []).append(route)
+
+    def resolve(self, method: str, path: str) -> Optional[tuple[Route, dict[str, str]]]:
+        route = self._exact.get((method, path))
+        if route is not None:
+            return route, {}
+        for route in self._templated.get(method, ()):
+            match = route.pattern.match(path)
+            if match:
+                params = {k: v for k, v in match.groupdict().items() if not k.startswith("_")}
+                return route, params
+        return None
+
+    def __len__(self) -> int:
+        return len(self._exact) + sum(len(routes) for routes in self._templated.values())
+
+
+def _spec_handler(op: SpecOperation) -> Callable:
+    async def handler(query: dict, body: Any, **params: str) -> Any:
+        return op.status_code, op.example
+
+    return handler
+
+
+def _response(result: Any) -> Response:
+    status = 200
+    if isinstance(result, tuple):
+        status, result = result
+    if result is None:
+        return Response(status_code=204 if status == 200 else status)
+    if isinstance(result, str):
+        return Response(content=result, status_code=status, media_type="text/plain")
+    return Response(content=_dumps(result), status_code=status, media_type="application/json")
+
+
+class Simulator:
+    """Topology, state, routes and fault injection for one simulator process"""
+
+    def __init__(
+        self,
+        topology: Optional[SyntheticTopology] = None,
+        faults: Optional[FaultInjector] = None,
+        spec_dir: Optional[str] = None,
+        nso_job_seconds: float = 2.0,
+    ):
+        self.topology = topology or SyntheticTopology()
+        self.state = SimulatorState(self.topology, nso_job_seconds=nso_job_seconds)
+        self.faults = faults or FaultInjector()
+        self.handlers = SimulatorHandlers(self.topology, self.state)
+        self.router = Router()
+        self.stats: dict[str, RouteStats] = {}
+        self.unmatched = 0
+
+        for method, path, handler in self.handlers.routes():
+            self.router.add(method, path, handler)
+        self.catalog = SpecCatalog(spec_dir).load()
+        for op in self.catalog.operations:
+            self.router.add(op.method, op.path, _spec_handler(op))
+        logger.info(
+            "Simulator ready",
+            routes=len(self.router),
+            **self.topology.summary(),
+        )
+
+    async def dispatch(self, request: Request) -> Response:
+        method, path = request.method, request.url.path
+        resolved = self.router.resolve(method, path)
+        if resolved is None:
+            self.unmatched += 1
+            return _response((404, {"error": "no simulated route", "method": method, "path": path}))
+        route, params = resolved
+
+        start = time.perf_counter()
+        stats = self.stats.setdefault(f"{method} {route.template}", RouteStats())
+        delay, error_status = self.faults.decide(method, route.template)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if error_status is not None:
+            stats.injected_errors += 1
+            response = _response((error_status, {"error": "injected fault"}))
+        else:
+            body = None
+            raw = await request.body()
+            if raw:
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    body = raw.decode(errors="replace")
+            try:
+                response = _response(await route.handler(dict(request.query_params), body, **params))
+            except Exception as e:
+                logger.error("Handler failed", route=route.template, error=str(e))
+                response = _response((500, {"error": str(e)}))
+
+        elapsed = time.perf_counter() - start
+        stats.count += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if response.status_code >= 400:
+            stats.errors += 1
+        return response
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "topology": self.topology.summary(),
+            "state": self.state.summary(),
+            "unmatched_requests": self.unmatched,
+            "routes": {key: stats.as_dict() for key, stats in sorted(self.stats.items())},
+        }
+
+
+def create_app(simulator: Optional[Simulator] = None) -> FastAPI:
+    """FastAPI app for a simulator (built from SIM_* env vars if not given)"""
+    sim = simulator or simulator_from_env()
+    app = FastAPI(title="CNC Simulator", version="1.0.0")
+    app.state.simulator = sim
+
+    # ============== Admin Endpoints ==============
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "routes": len(sim.router)}
+
+    @app.post("/sim/links/{link_id}/degrade")
+    async def degrade_link(link_id: str, request: Request):
+        body = await request.json() if await request.body() else {}
+        try:
+            sim.state.degrade(
+                link_id,
+                duration_seconds=float(body.get("duration_seconds", 60)),
+                latency_ms=float(body.get("latency_ms", 120)),
+                jitter_ms=float(body.get("jitter_ms", 25)),
+                loss_pct=float(body.get("loss_pct", 2)),
+            )
+        except (KeyError, ValueError):
+            return _response((404, {"error": "unknown link"}))
+        return {"link_id": link_id, "degraded": True}
+
+    @app.delete("/sim/links/{link_id}/degrade")
+    async def clear_link(link_id: str):
+        try:
+            sim.state.clear(link_id)
+        except (KeyError, ValueError):
+            return _response((404, {"error": "unknown link"}))
+        return {"link_id": link_id, "degraded": False}
+
+    @app.get("/sim/topology/sample")
+    async def sample_links(links: int = 1, salt: int = 0):
+        topo = sim.topology
+        sampled = []
+        for link_id in topo.sample_core_links(links, salt):
+            index = topo.parse_link(link_id)
+            a, z = topo.core_link_ends(index)
+            # A PE homed on each end, for PCA source/dest addressing
+            source_pe, dest_pe = a, z + topo.num_p * ((salt + index) % topo.pe_per_p)
+            sampled.append({
+                "link_id": link_id,
+                "a_node": topo.p_name(a),
+                "z_node": topo.p_name(z),
+                "source_pe": topo.pe_name(source_pe),
+                "dest_pe": topo.pe_name(dest_pe),
+                "source_ip": topo.loopback("pe", source_pe),
+                "dest_ip": topo.loopback("pe", dest_pe),
+                "services": topo.count_services_on_link(link_id),
+            })
+        return {"links": sampled}
+
+    @app.get("/sim/stats")
+    async def stats():
+        return sim.summary()
+
+    @app.get("/sim/faults")
+    async def get_faults():
+        return {"rules": [rule.as_dict() for rule in sim.faults.rules]}
+
+    @app.put("/sim/faults")
+    async def put_faults(request: Request):
+        body = await request.json()
+        rules = body.get("rules", body) if isinstance(body, dict) else body
+        sim.faults.set_rules([FaultRule.from_dict(item) for item in rules])
+        return {"rules": len(sim.faults.rules)}
+
+    # ============== Simulated APIs ==============
+
+    @app.api_route("/{full_path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def dispatch(request: Request):
+        return await sim.dispatch(request)
+
+    return app
+
+
+def simulator_from_env() -> Simulator:
+    """Build a Simulator from SIM_* environment variables"""
+    seed = int(os.getenv("SIM_SEED", "7"))
+    topology = SyntheticTopology(
+        devices=int(os.getenv("SIM_DEVICES", "10000")),
+        pe_per_p=int(os.getenv("SIM_PE_PER_P", "20")),
+        services=int(os.getenv("SIM_SERVICES", "100000")),
+        seed=seed,
+        te_type=os.getenv("SIM_TE_TYPE") or None,
+    )
+    return Simulator(
+        topology=topology,
+        faults=FaultInjector.from_file(os.getenv("SIM_FAULTS_FILE"), seed=seed),
+        spec_dir=os.getenv("SIM_SPEC_DIR") or None,
+        nso_job_seconds=float(os.getenv("SIM_NSO_JOB_SECONDS", "2.0")),
+    )
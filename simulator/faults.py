@@ -0,0 +1,121 @@
+"""
+Latency and Error Injection
+
+Rules are matched in order against "METHOD /path" using fnmatch patterns;
+the first match wins. Latency is drawn from a log-normal distribution fitted
+to the rule's p50/p99 so tails look like a loaded controller rather than a
+constant sleep.
+
+Rule file (YAML or JSON list):
+
+    - match: "POST /crosswork/nbi/optimization/v3/restconf/operations/*sr-policy-create"
+      latency_ms: {p50: 800, p99: 4000}
+      error_rate: 0.02
+      error_status: 503
+    - match: "* /crosswork/nbi/servicehealth/*"
+      latency_ms: {p50: 40, p99: 250}
+"""
+
+import fnmatch
+import json
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# z-score of the 99th percentile of a standard normal
+_Z99 = 2.3263
+
+
+@dataclass
+class FaultRule:
+    match: str
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FaultRule":
+        latency = data.get("latency_ms", 0)
+        if isinstance(latency, dict):
+            p50 = float(latency.get("p50", 0))
+            p99 = float(latency.get("p99", p50))
+        else:
+            p50 = p99 = float(latency)
+        return cls(
+            match=data["match"],
+            p50_ms=p50,
+            p99_ms=max(p99, p50),
+            error_rate=float(data.get("error_rate", 0.0)),
+            error_status=int(data.get("error_status", 503)),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "match": self.match,
+            "latency_ms": {"p50": self.p50_ms, "p99": self.p99_ms},
+            "error_rate": self.error_rate,
+            "error_status": self.error_status,
+        }
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """Delay in seconds"""
+        if self.p50_ms <= 0:
+            return 0.0
+        if self.p99_ms <= self.p50_ms:
+            return self.p50_ms / 1000
+        sigma = math.log(self.p99_ms / self.p50_ms) / _Z99
+        return rng.lognormvariate(math.log(self.p50_ms), sigma) / 1000
+
+
+class FaultInjector:
+    """Per-endpoint latency and error injection"""
+
+    def __init__(self, rules: Optional[list[FaultRule]] = None, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        self.set_rules(rules or [])
+
+    def set_rules(self, rules: list[FaultRule]) -> None:
+        self.rules = list(rules)
+        # Keyed by route template, so the cache stays small
+        self._cache: dict[str, Optional[FaultRule]] = {}
+
+    @classmethod
+    def from_file(cls, path: Optional[str], seed: Optional[int] = None) -> "FaultInjector":
+        if not path:
+            return cls(seed=seed)
+        file = Path(path)
+        if file.suffix == ".json":
+            data = json.loads(file.read_text(encoding="utf-8"))
+        else:
+            import yaml
+
+            data = yaml.safe_load(file.read_text(encoding="utf-8"))
+        rules = [FaultRule.from_dict(item) for item in data or []]
+        logger.info("Loaded fault rules", path=path, rules=len(rules))
+        return cls(rules, seed=seed)
+
+    def rule_for(self, method: str, route: str) -> Optional[FaultRule]:
+        key = f"{method} {route}"
+        if key not in self._cache:
+            self._cache[key] = next(
+                (rule for rule in self.rules if fnmatch.fnmatchcase(key, rule.match)),
+                None,
+            )
+        return self._cache[key]
+
+    def decide(self, method: str, route: str) -> tuple[float, Optional[int]]:
+        """(delay seconds, error status or None) for one request"""
+        rule = self.rule_for(method, route)
+        if rule is None:
+            return 0.0, None
+        delay = rule.sample_delay(self._rng)
+        if rule.error_rate and self._rng.random() < rule.error_rate:
+            return delay, rule.error_status
+        return delay, None
@@ -0,0 +1,495 @@
+"""
+Stateful Endpoint Handlers
+
+Dedicated handlers for the CNC/COE/PCA/KG endpoints on the protection path,
+at the URLs the agent clients actually call. They answer from the synthetic
+topology and SimulatorState, so a full incident (detect -> assess ->
+compute -> provision -> steer -> monitor -> restore) runs end to end.
+
+Handlers are plain methods decorated with @route; return values:
+    dict/list -> JSON, str -> text/plain, (status, body) -> explicit status,
+    None -> 204 No Content.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+from uuid import uuid4
+
+from .state import SimulatorState, Tunnel
+from .topology import SyntheticTopology
+
+# Base paths (client defaults in agents/*/tools)
+SSO = "/crosswork/sso"
+SERVICE_HEALTH = "/crosswork/nbi/servicehealth/v1"
+INVENTORY = "/crosswork/nbi/cat-inventory/v1"
+TOPOLOGY = "/crosswork/nbi/topology/v1"
+SRPM = "/crosswork/nbi/srpm/v1"
+DPM = "/crosswork/dpm/v1"
+COE = "/crosswork/nbi/optimization/v3/restconf"
+RESTCONF = "/crosswork/nbi/restconf/data"
+ASSURANCE = "/crosswork/aa/agmgr/v1"
+SR_OPS = "cisco-crosswork-optimization-engine-sr-policy-operations"
+RSVP_OPS = "cisco-crosswork-optimization-engine-rsvp-te-tunnel-operations"
+RSVP_OPS_LEGACY = "cisco-crosswork-optimization-engine-rsvp-te-operations"
+NSO_DISPATCH = "/api/operations/dispatch/te-operations:create-rsvp-te-tunnel"
+
+DEFAULT_LIST_LIMIT = 5000
+
+
+def route(method: str, *paths: str) -> Callable:
+    """Register a handler method for one or more paths"""
+
+    def decorator(func: Callable) -> Callable:
+        func._sim_routes = [(method, path) for path in paths]
+        return func
+
+    return decorator
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _input(body: Any) -> dict:
+    if isinstance(body, dict):
+        return body.get("input", body) or {}
+    return {}
+
+
+class SimulatorHandlers:
+    """Endpoint implementations backed by the synthetic network"""
+
+    def __init__(self, topology: SyntheticTopology, state: SimulatorState, max_services: int = 500):
+        self.topology = topology
+        self.state = state
+        self.max_services = max_services
+
+    def routes(self) -> list[tuple[str, str, Callable]]:
+        found = []
+        for name in dir(self):
+            handler = getattr(self, name)
+            for method, path in getattr(handler, "_sim_routes", ()):
+                found.append((method, path, handler))
+        return found
+
+    # ============== SSO ==============
+
+    @route("POST", f"{SSO}/v1/tickets")
+    async def sso_tgt(self, query: dict, body: Any) -> str:
+        return f"TGT-{uuid4().hex}-cnc-sim"
+
+    @route("POST", f"{SSO}/v2/tickets/jwt")
+    async def sso_jwt(self, query: dict, body: Any) -> str:
+        return f"eyJhbGciOiJIUzI1NiJ9.{uuid4().hex}.sim"
+
+    # ============== Service Health / Inventory ==============
+
+    @route("GET", f"{SERVICE_HEALTH}/services")
+    async def services_by_link(self, query: dict, body: Any) -> Any:
+        link_filter = query.get("filter", "")
+        if not link_filter.startswith("link_id="):
+            return {"services": []}
+        try:
+            services = self.topology.services_on_link(link_filter[8:], self.max_services)
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown link"}
+        return {"services": services}
+
+    @route("GET", f"{SERVICE_HEALTH}/services/{{service_id}}")
+    async def service_details(self, query: dict, body: Any, service_id: str) -> Any:
+        try:
+            return self.topology.service(self.topology.parse_service(service_id))
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown service"}
+
+    @route(
+        "POST",
+        f"{INVENTORY}/operations/cat-inventory-rpc-get-associated-services-for-transport",
+        f"{INVENTORY}/restconf/operations/cat-inventory-rpc:get-associated-services-for-transport",
+    )
+    async def services_for_transport(self, query: dict, body: Any) -> Any:
+        transport_id = _input(body).get("transport-id", "")
+        tunnel = self.state.tunnels.get(transport_id)
+        link_id = transport_id if tunnel is None else None
+        try:
+            services = self.topology.services_on_link(link_id, self.max_services) if link_id else []
+        except (KeyError, ValueError):
+            services = []
+        return {"output": {"services": services}}
+
+    @route(
+        "POST",
+        f"{INVENTORY}/operations/cat-inventory-rpc-get-services-count",
+        f"{INVENTORY}/restconf/operations/cat-inventory-rpc:get-services-count",
+    )
+    async def services_count(self, query: dict, body: Any) -> Any:
+        return {"output": {"count": self.topology.num_services}}
+
+    @route(
+        "POST",
+        f"{INVENTORY}/operations/cat-inventory-rpc-get-service-plan-data",
+        f"{INVENTORY}/restconf/operations/cat-inventory-rpc:get-service-plan-data",
+    )
+    async def service_plan(self, query: dict, body: Any) -> Any:
+        service_id = _input(body).get("service-id", "")
+        try:
+            service = self.topology.service(self.topology.parse_service(service_id))
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown service"}
+        return {"output": service}
+
+    @route("POST", f"{ASSURANCE}/impactedServices")
+    async def impacted_services(self, query: dict, body: Any) -> Any:
+        # Subservice IDs are "ss-<link_id>" in the simulator
+        subservice = (body or {}).get("subservice_id", "")
+        link_id = subservice[3:] if subservice.startswith("ss-") else subservice
+        try:
+            services = self.topology.services_on_link(link_id, self.max_services)
+        except (KeyError, ValueError):
+            services = []
+        return {
+            "status": "ok",
+            "services": [
+                {
+                    "serviceId": s["service_id"],
+                    "serviceType": s["service_type"].upper(),
+                    "serviceName": s["service_name"],
+                }
+                for s in services
+            ],
+            "error": "",
+        }
+
+    # ============== Topology ==============
+
+    @route("GET", f"{TOPOLOGY}/topology/igp-path")
+    async def igp_path(self, query: dict, body: Any) -> Any:
+        try:
+            path = self.topology.shortest_path(query.get("source", ""), query.get("destination", ""))
+        except (KeyError, ValueError):
+            path = None
+        if path is None:
+            return 404, {"error": "no path"}
+        hops = []
+        links = [None] + path["links"] + [None]
+        for i, node in enumerate(path["segments"]):
+            hops.append({
+                "node": node,
+                "interface_in": f"Gi0/0/0/{i}" if i else None,
+                "interface_out": f"Gi0/0/0/{i + 1}",
+                "link_id": links[i] if i < len(links) else None,
+            })
+        return {"hops": hops}
+
+    @route("GET", f"{TOPOLOGY}/topology/links/{{link_id}}/metrics")
+    async def topology_link_metrics(self, query: dict, body: Any, link_id: str) -> Any:
+        try:
+            index = self.topology.parse_link(link_id)
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown link"}
+        return {**self.topology.link_metrics(index), **self.state.link_state(index)}
+
+    @route("GET", f"{TOPOLOGY}/topology/nodes/{{node_id}}/links")
+    async def node_links(self, query: dict, body: Any, node_id: str) -> Any:
+        try:
+            links = self.topology.node_links(node_id)
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown node"}
+        return {"links": [self.topology.link_metrics(link.index) for link in links]}
+
+    @route("GET", f"{TOPOLOGY}/topology/links")
+    async def links_between(self, query: dict, body: Any) -> Any:
+        topo = self.topology
+        try:
+            src_kind, src = topo.parse_node(query.get("source_loopback", ""))
+            dst_kind, dst = topo.parse_node(query.get("dest_loopback", ""))
+        except (KeyError, ValueError):
+            return {"links": []}
+        src_homes = topo.pe_homes(src) if src_kind == "pe" else (src,)
+        dst_homes = set(topo.pe_homes(dst) if dst_kind == "pe" else (dst,))
+        links = [
+            topo.link_metrics(link_index)
+            for home in src_homes
+            for link_index, neighbour in topo.p_links(home)
+            if neighbour in dst_homes
+        ]
+        return {"links": links}
+
+    @route("GET", f"{TOPOLOGY}/topology/nodes")
+    async def node_by_loopback(self, query: dict, body: Any) -> Any:
+        try:
+            return self.topology.node(query.get("loopback", ""))
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown loopback"}
+
+    # ============== Performance (SR-PM / DPM / PCA) ==============
+
+    @route("GET", f"{SRPM}/links/{{link_id}}/metrics")
+    async def srpm_link_metrics(self, query: dict, body: Any, link_id: str) -> Any:
+        try:
+            link = self.state.link_state(self.topology.parse_link(link_id))
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown link"}
+        return {
+            "link_id": link_id,
+            "delay_usec": int(link["delay_ms"] * 1000),
+            "delay_variation_usec": int(link["jitter_ms"] * 1000),
+            "packet_loss_pct": link["packet_loss_pct"],
+            "measurement_time": _now(),
+        }
+
+    @route("GET", f"{DPM}/links/{{link_id}}/counters")
+    async def dpm_link_counters(self, query: dict, body: Any, link_id: str) -> Any:
+        try:
+            link = self.state.link_state(self.topology.parse_link(link_id))
+        except (KeyError, ValueError):
+            return 404, {"error": "unknown link"}
+        return {
+            "link_id": link_id,
+            "packet_loss_pct": link["packet_loss_pct"],
+            "error_rate": link["packet_loss_pct"] / 10,
+            "timestamp": _now(),
+        }
+
+    @route("GET", "/api/v1/metrics")
+    async def pca_metrics(self, query: dict, body: Any) -> Any:
+        sla = self.state.path_sla(query.get("source", ""), query.get("dest", ""))
+        return {**sla, "measurement_time": datetime.now().isoformat()}
+
+    # ============== Knowledge Graph ==============
+
+    @route("POST", "/api/v1/dijkstra")
+    async def dijkstra(self, query: dict, body: Any) -> Any:
+        body = body or {}
+        avoid = list(body.get("avoid_links") or [])
+        # Links degraded right now are not usable for protection
+        avoid += [self.topology.link_id(i) for i in list(self.state.degraded)]
+        try:
+            path = self.topology.shortest_path(
+                body.get("source", ""),
+                body.get("destination", ""),
+                avoid_links=avoid,
+                avoid_nodes=body.get("avoid_nodes") or [],
+                metric=body.get("metric", "igp"),
+                max_hops=body.get("max_hops"),
+            )
+        except (KeyError, ValueError):
+            path = None
+        if path is None:
+            return 404, {"error": "no path satisfies constraints"}
+        return {
+            "path_id": f"path-{uuid4().hex[:8]}",
+            **path,
+            "recommended_te_type": self.topology.te_type or "sr-mpls",
+        }
+
+    @route("GET", "/api/v1/topology/links")
+    async def kg_links(self, query: dict, body: Any) -> Any:
+        limit = min(int(query.get("limit", DEFAULT_LIST_LIMIT)), self.topology.num_core_links)
+        links = []
+        for index in range(limit):
+            metrics = self.topology.link_metrics(index)
+            links.append({
+                "link_id": metrics["link_id"],
+                "endpoints": [metrics["a_node"], metrics["z_node"]],
+                "capacity_gbps": metrics["bandwidth_gbps"],
+                "current_traffic_gbps": round(
+                    metrics["bandwidth_gbps"] - metrics["available_bandwidth_gbps"], 2
+                ),
+            })
+        return {"links": links, "paths": {}}
+
+    # ============== COE tunnel operations ==============
+
+    def _coe_results(self, tunnels: list[Tunnel]) -> dict:
+        return {
+            "output": {
+                "results": [
+                    {
+                        "state": "success",
+                        "message": "Simulated",
+                        "path-name": t.tunnel_id,
+                        "color": t.color,
+                        "binding-sid": t.binding_sid,
+                    }
+                    for t in tunnels
+                ]
+            }
+        }
+
+    @route("POST", f"{COE}/operations/{SR_OPS}:sr-policy-create")
+    async def coe_sr_policy_create(self, query: dict, body: Any) -> Any:
+        created = []
+        for policy in _input(body).get("sr-policies", []):
+            color = policy.get("color", 100)
+            tunnel_id = policy.get("path-name") or f"sr-policy-{policy.get('head-end')}-{policy.get('end-point')}-{color}"
+            created.append(self.state.add_tunnel(Tunnel(
+                tunnel_id=tunnel_id,
+                te_type="sr-mpls",
+                head_end=policy.get("head-end", ""),
+                end_point=policy.get("end-point", ""),
+                color=color,
+                binding_sid=policy.get("binding-sid"),
+            )))
+        return self._coe_results(created)
+
+    @route(
+        "POST",
+        f"{COE}/operations/{RSVP_OPS}:rsvp-te-tunnel-create",
+        f"{COE}/operations/{RSVP_OPS_LEGACY}:rsvp-te-tunnel-create",
+    )
+    async def coe_rsvp_create(self, query: dict, body: Any) -> Any:
+        created = []
+        for entry in _input(body).get("rsvp-te-tunnels", []):
+            name = entry.get("path-name") or entry.get("tunnel-name") or f"rsvp-{uuid4().hex[:8]}"
+            created.append(self.state.add_tunnel(Tunnel(
+                tunnel_id=name,
+                te_type="rsvp-te",
+                head_end=entry.get("head-end", ""),
+                end_point=entry.get("end-point", ""),
+                bandwidth=entry.get("signaled-bandwidth") or entry.get("bandwidth") or 0,
+                binding_sid=entry.get("binding-label"),
+            )))
+        return self._coe_results(created)
+
+    @route(
+        "POST",
+        f"{COE}/operations/{SR_OPS}:sr-policy-delete",
+        f"{COE}/operations/{RSVP_OPS}:rsvp-te-tunnel-delete",
+        f"{COE}/operations/{RSVP_OPS_LEGACY}:rsvp-te-tunnel-delete",
+    )
+    async def coe_delete(self, query: dict, body: Any) -> Any:
+        data = _input(body)
+        entries = data.get("sr-policies") or data.get("rsvp-te-tunnels") or []
+        for entry in entries:
+            key = entry.get("path-name") or entry.get("policy-name") or entry.get("tunnel-name")
+            if key:
+                self.state.remove_tunnel(key)
+            elif "color" in entry:
+                tunnel = self.state.find_tunnel(head_end=entry.get("head-end"), color=entry["color"])
+                if tunnel:
+                    self.state.remove_tunnel(tunnel.tunnel_id)
+        return {"output": {"results": [{"state": "success"} for _ in entries]}}
+
+    @route(
+        "POST",
+        f"{COE}/operations/{SR_OPS}:sr-policy-dryrun",
+        f"{COE}/operations/{RSVP_OPS}:rsvp-te-tunnel-dryrun",
+    )
+    async def coe_dryrun(self, query: dict, body: Any) -> Any:
+        data = _input(body)
+        entries = data.get("sr-policies") or data.get("rsvp-te-tunnels") or []
+        return {"output": {"results": [{"state": "success", "message": "Dry run OK"} for _ in entries]}}
+
+    @route("POST", f"{COE}/operations/{SR_OPS}:sr-datalist-oper")
+    async def coe_sr_datalist(self, query: dict, body: Any) -> Any:
+        entries = [t.as_coe_entry() for t in self.state.tunnels.values() if t.te_type != "rsvp-te"]
+        return {"output": {"sr-policy-datalist": entries, "end-of-list": True}}
+
+    @route("POST", f"{COE}/operations/{RSVP_OPS}:rsvp-te-datalist-oper")
+    async def coe_rsvp_datalist(self, query: dict, body: Any) -> Any:
+        entries = [t.as_coe_entry() for t in self.state.tunnels.values() if t.te_type == "rsvp-te"]
+        return {"output": {"rsvp-datalist": entries, "end-of-list": True}}
+
+    @route("GET", f"{COE}/data/{SR_OPS}:sr-policies/sr-policy={{tunnel_id}}")
+    async def coe_sr_policy_state(self, query: dict, body: Any, tunnel_id: str) -> Any:
+        if tunnel_id not in self.state.tunnels:
+            return 404, {"error": "unknown policy"}
+        return {"operational-state": "up", "admin-state": "up"}
+
+    # ============== NSO ==============
+
+    @route("POST", NSO_DISPATCH)
+    async def nso_create_rsvp(self, query: dict, body: Any) -> Any:
+        data = _input(body)
+        head_end, end_point = data.get("head-end", ""), data.get("end-point", "")
+        self.state.add_tunnel(Tunnel(
+            tunnel_id=f"rsvp-te-{head_end}-{end_point}",
+            te_type="rsvp-te",
+            head_end=head_end,
+            end_point=end_point,
+            bandwidth=data.get("bandwidth", 0),
+        ))
+        job_id = self.state.start_job()
+        return 202, {"output": {"message": f"job-id: {job_id}"}}
+
+    @route("DELETE", f"{NSO_DISPATCH}/{{tunnel_id}}")
+    async def nso_delete_rsvp(self, query: dict, body: Any, tunnel_id: str) -> Any:
+        return None if self.state.remove_tunnel(tunnel_id) else (404, {"error": "unknown tunnel"})
+
+    @route("GET", "/api/running/jobs/{job_id}")
+    async def nso_job(self, query: dict, body: Any, job_id: str) -> Any:
+        status = self.state.job_status(job_id)
+        if status is None:
+            return 404, {"error": "unknown job"}
+        return {"job-id": job_id, "status": status}
+
+    @route("POST", "*/api/running/devices/device/{head_end}/config/vrf-steering")
+    async def nso_vrf_steering(self, query: dict, body: Any, head_end: str) -> Any:
+        vrfs = _input(body).get("vrfs", [])
+        return {"output": {"result": "ok", "device": head_end, "vrfs": len(vrfs)}}
+
+    # ============== SR-TE config (RESTCONF) ==============
+
+    @route("POST", f"{RESTCONF}/cisco-sr-te-cfp:sr-te/policies")
+    async def srte_create(self, query: dict, body: Any) -> Any:
+        policy = (body or {}).get("cisco-sr-te-cfp:policy", {})
+        head_end, end_point = policy.get("head-end", ""), policy.get("tail-end", policy.get("end-point", ""))
+        color = policy.get("color", 100)
+        binding = (policy.get("binding-sid") or {}).get("mpls-label")
+        self.state.add_tunnel(Tunnel(
+            tunnel_id=f"{head_end},{color},{end_point}",
+            te_type="sr-mpls",
+            head_end=head_end,
+            end_point=end_point,
+            color=color,
+            binding_sid=binding,
+        ))
+        return 201, {"status": "created"}
+
+    @route("GET", f"{RESTCONF}/cisco-sr-te-cfp:sr-te/policies/policy={{key}}")
+    async def srte_get(self, query: dict, body: Any, key: str) -> Any:
+        tunnel = self.state.tunnels.get(key)
+        if tunnel is None:
+            head_end, _, rest = key.partition(",")
+            color, _, end_point = rest.partition(",")
+            tunnel = self.state.find_tunnel(head_end=head_end, end_point=end_point, color=int(color or 0))
+        if tunnel is None:
+            return 404, {"error": "unknown policy"}
+        return {"cisco-sr-te-cfp:policy": {
+            "head-end": tunnel.head_end,
+            "tail-end": tunnel.end_point,
+            "color": tunnel.color,
+            "oper-status": "active",
+            "provisioning-state": "provisioned",
+            "binding-sid": tunnel.binding_sid,
+        }}
+
+    @route("DELETE", f"{RESTCONF}/cisco-sr-te-cfp:sr-te/policies/policy={{key}}")
+    async def srte_delete(self, query: dict, body: Any, key: str) -> Any:
+        self.state.remove_tunnel(key)
+        return None
+
+    # ============== Restoration (weights / cleanup) ==============
+
+    @route("PUT", "/api/v1/tunnels/{tunnel_id}/weights")
+    async def update_weights(self, query: dict, body: Any, tunnel_id: str) -> Any:
+        weights = (body or {}).get("weights", {})
+        tunnel = self.state.tunnels.get(tunnel_id)
+        if tunnel is not None:
+            tunnel.weights = weights
+        return {"tunnel_id": tunnel_id, "weights": weights, "updated_at": time.time()}
+
+    @route("GET", "/api/v1/sr-policies/{tunnel_id}")
+    async def restoration_policy(self, query: dict, body: Any, tunnel_id: str) -> Any:
+        tunnel = self.state.tunnels.get(tunnel_id)
+        if tunnel is None:
+            return 404, {"error": "unknown policy"}
+        return {"tunnel_id": tunnel_id, "bsid": tunnel.binding_sid}
+
+    @route("DELETE", "/api/v1/sr-policies/{tunnel_id}", "/api/v1/rsvp-te-tunnels/{tunnel_id}")
+    async def restoration_delete(self, query: dict, body: Any, tunnel_id: str) -> Any:
+        self.state.remove_tunnel(tunnel_id)
+        return None
+
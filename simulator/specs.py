@@ -0,0 +1,202 @@
+"""
+OpenAPI Spec Catalog
+
+Loads every spec in api_specs/ and turns each operation into a route on the
+simulator, mounted under the spec's server base path. Operations without a
+dedicated handler answer with a response body synthesised from the spec's
+response schema (computed once at load time).
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SPEC_DIR = Path(__file__).resolve().parent.parent / "api_specs"
+
+# Specs that do not declare `servers` - base path from the client modules
+SPEC_BASE_PATHS = {
+    "coe_csm_config.yaml": "/crosswork/nbi/optimization/v3/restconf",
+    "coe_optimization_engine.yaml": "/crosswork/nbi/optimization/v3/restconf",
+    "coe_rsvp_te_tunnel_ops.yaml": "/crosswork/nbi/optimization/v3/restconf",
+    "coe_sr_policy_ops.yaml": "/crosswork/nbi/optimization/v3/restconf",
+}
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+MAX_SCHEMA_DEPTH = 6
+
+
+@dataclass
+class SpecOperation:
+    """One (method, path) from a spec"""
+
+    method: str
+    path: str
+    spec: str
+    operation_id: str
+    status_code: int
+    example: Any
+    pattern: Optional[re.Pattern] = field(default=None, repr=False)
+
+
+def _base_path(spec_name: str, spec: dict) -> str:
+    if spec_name in SPEC_BASE_PATHS:
+        return SPEC_BASE_PATHS[spec_name]
+    servers = spec.get("servers") or []
+    if not servers:
+        return ""
+    url = servers[0].get("url", "")
+    # "https://{cnc-host}:{cnc-port}/crosswork/..." or "/crosswork/..."
+    path = urlparse(url.replace("{", "").replace("}", "")).path if "://" in url else url
+    return path.rstrip("/")
+
+
+def compile_path(path: str) -> Optional[re.Pattern]:
+    """Regex for a templated path, None if it has no parameters"""
+    if "{" not in path:
+        return None
+    regex = ""
+    for part in re.split(r"(\{[^}]+\})", path):
+        if part.startswith("{") and part.endswith("}"):
+            regex += r"(?P<%s>[^/]+)" % re.sub(r"\W", "_", part[1:-1])
+        else:
+            regex += re.escape(part)
+    return re.compile(f"^{regex}$")
+
+
+class SchemaExampleBuilder:
+    """Builds a representative instance of a JSON schema"""
+
+    def __init__(self, components: dict):
+        self.schemas = components.get("schemas", {})
+
+    def build(self, schema: Optional[dict], depth: int = 0) -> Any:
+        if not schema or depth > MAX_SCHEMA_DEPTH:
+            return None
+        if "$ref" in schema:
+            name = schema["$ref"].rsplit("/", 1)[-1]
+            target = self.schemas.get(name)
+            return self.build(target, depth + 1) if target else {}
+        if "example" in schema:
+            return schema["example"]
+        if "enum" in schema and schema["enum"]:
+            return schema["enum"][0]
+        for combinator in ("allOf", "oneOf", "anyOf"):
+            if combinator in schema:
+                merged: dict = {}
+                for sub in schema[combinator]:
+                    value = self.build(sub, depth + 1)
+                    if isinstance(value, dict):
+                        merged.update(value)
+                    elif combinator != "allOf":
+                        return value
+                return merged
+
+        schema_type = schema.get("type", "object" if "properties" in schema else None)
+        if schema_type == "object":
+            return {
+                name: self.build(prop, depth + 1)
+                for name, prop in schema.get("properties", {}).items()
+            }
+        if schema_type == "array":
+            item = self.build(schema.get("items"), depth + 1)
+            return [item] if item is not None else []
+        if schema_type == "integer":
+            return schema.get("default", 0)
+        if schema_type == "number":
+            return schema.get("default", 0.0)
+        if schema_type == "boolean":
+            return schema.get("default", False)
+        if schema_type == "string":
+            if "default" in schema:
+                return schema["default"]
+            return {"date-time": "2026-01-01T00:00:00Z", "uuid": "00000000-0000-0000-0000-000000000000"}.get(
+                schema.get("format", ""), "string"
+            )
+        return None
+
+
+def _response_example(operation: dict, builder: SchemaExampleBuilder) -> tuple[int, Any]:
+    responses = operation.get("responses", {})
+    for code in ("200", "201", "202", "204"):
+        if code not in responses:
+            continue
+        content = responses[code].get("content") or {}
+        for media in content.values():
+            if "example" in media:
+                return int(code), media["example"]
+            examples = media.get("examples") or {}
+            for example in examples.values():
+                if isinstance(example, dict) and "value" in example:
+                    return int(code), example["value"]
+            if "schema" in media:
+                return int(code), builder.build(media["schema"])
+        return int(code), None
+    return 200, {}
+
+
+def _load_file(path: Path) -> Optional[dict]:
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    try:
+        import yaml
+    except ImportError:
+        logger.warning("pyyaml not installed, skipping spec", spec=path.name)
+        return None
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+class SpecCatalog:
+    """All operations from api_specs/, indexed for request dispatch"""
+
+    def __init__(self, spec_dir: Optional[Path] = None):
+        self.spec_dir = Path(spec_dir or DEFAULT_SPEC_DIR)
+        self.operations: list[SpecOperation] = []
+
+    def load(self) -> "SpecCatalog":
+        for path in sorted(self.spec_dir.glob("*")):
+            if path.suffix not in (".json", ".yaml", ".yml"):
+                continue
+            try:
+                spec = _load_file(path)
+            except Exception as e:
+                logger.warning("Failed to load spec", spec=path.name, error=str(e))
+                continue
+            if not spec or "paths" not in spec:
+                continue
+
+            base = _base_path(path.name, spec)
+            builder = SchemaExampleBuilder(spec.get("components", {}))
+            for raw_path, item in spec["paths"].items():
+                for method in HTTP_METHODS:
+                    operation = item.get(method)
+                    if operation is None:
+                        continue
+                    status_code, example = _response_example(operation, builder)
+                    full_path = base + raw_path
+                    self.operations.append(
+                        SpecOperation(
+                            method=method.upper(),
+                            path=full_path,
+                            spec=path.name,
+                            operation_id=operation.get("operationId", f"{method}_{raw_path}"),
+                            status_code=status_code,
+                            example=example,
+                            pattern=compile_path(full_path),
+                        )
+                    )
+
+        logger.info(
+            "Loaded API specs",
+            spec_dir=str(self.spec_dir),
+            operations=len(self.operations),
+        )
+        return self
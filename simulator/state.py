@@ -0,0 +1,167 @@
+"""
+Simulator Network State
+
+Mutable state layered over the static SyntheticTopology: degraded links
+(with expiry), tunnels/SR policies created through COE/NSO/RESTCONF, NSO
+jobs and cutover weights. Everything is in-process; run one simulator
+process per load test.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import uuid4
+
+from .topology import SyntheticTopology
+
+
+@dataclass
+class Degradation:
+    until: float
+    latency_ms: float
+    jitter_ms: float
+    loss_pct: float
+
+
+@dataclass
+class Tunnel:
+    tunnel_id: str
+    te_type: str
+    head_end: str
+    end_point: str
+    color: Optional[int] = None
+    binding_sid: Optional[int] = None
+    bandwidth: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    weights: dict[str, int] = field(default_factory=dict)
+
+    def as_coe_entry(self) -> dict[str, Any]:
+        entry = {
+            "head-end": self.head_end,
+            "end-point": self.end_point,
+            "path-name": self.tunnel_id,
+            "operational-status": "up",
+            "admin-status": "up",
+            "signaled-bandwidth": self.bandwidth,
+        }
+        if self.color is not None:
+            entry["color"] = self.color
+        if self.binding_sid is not None:
+            entry["binding-sid"] = self.binding_sid
+        return entry
+
+
+class SimulatorState:
+    """Degraded links, tunnels and NSO jobs"""
+
+    def __init__(self, topology: SyntheticTopology, nso_job_seconds: float = 2.0):
+        self.topology = topology
+        self.nso_job_seconds = nso_job_seconds
+        self.degraded: dict[int, Degradation] = {}
+        self.tunnels: dict[str, Tunnel] = {}
+        self.nso_jobs: dict[str, float] = {}
+        self.tunnels_created = 0
+        self.tunnels_deleted = 0
+
+    # ============== Link degradation ==============
+
+    def degrade(
+        self,
+        link_id: str,
+        duration_seconds: float,
+        latency_ms: float = 120.0,
+        jitter_ms: float = 25.0,
+        loss_pct: float = 2.0,
+    ) -> None:
+        index = self.topology.parse_link(link_id)
+        self.degraded[index] = Degradation(
+            until=time.monotonic() + duration_seconds,
+            latency_ms=latency_ms,
+            jitter_ms=jitter_ms,
+            loss_pct=loss_pct,
+        )
+
+    def clear(self, link_id: str) -> None:
+        self.degraded.pop(self.topology.parse_link(link_id), None)
+
+    def degradation(self, link_index: int) -> Optional[Degradation]:
+        entry = self.degraded.get(link_index)
+        if entry is not None and entry.until <= time.monotonic():
+            del self.degraded[link_index]
+            return None
+        return entry
+
+    def link_state(self, link_index: int) -> dict[str, Any]:
+        """Current delay/loss of a link, including degradation"""
+        metrics = self.topology.link_metrics(link_index)
+        degradation = self.degradation(link_index)
+        return {
+            "link_id": metrics["link_id"],
+            "delay_ms": metrics["delay_ms"] + (degradation.latency_ms if degradation else 0.0),
+            "jitter_ms": degradation.jitter_ms if degradation else 0.2,
+            "packet_loss_pct": degradation.loss_pct if degradation else 0.0,
+            "degraded": degradation is not None,
+        }
+
+    def path_sla(self, source: str, dest: str) -> dict[str, Any]:
+        """PCA-style SLA between two PEs over their primary core link(s)"""
+        topo = self.topology
+        try:
+            src_kind, src = topo.parse_node(source)
+            dst_kind, dst = topo.parse_node(dest)
+        except (KeyError, ValueError):
+            return {"latency_ms": 5.0, "jitter_ms": 0.5, "packet_loss_pct": 0.0}
+        src_homes = set(topo.pe_homes(src)) if src_kind == "pe" else {src}
+        dst_homes = set(topo.pe_homes(dst)) if dst_kind == "pe" else {dst}
+
+        latency, jitter, loss = 2.0, 0.5, 0.0
+        for link_index in list(self.degraded):
+            a, z = topo.core_link_ends(link_index) if link_index < topo.num_core_links else (-1, -1)
+            if (a in src_homes and z in dst_homes) or (z in src_homes and a in dst_homes):
+                degradation = self.degradation(link_index)
+                if degradation:
+                    latency += degradation.latency_ms
+                    jitter = max(jitter, degradation.jitter_ms)
+                    loss = max(loss, degradation.loss_pct)
+        return {"latency_ms": latency, "jitter_ms": jitter, "packet_loss_pct": loss}
+
+    # ============== Tunnels ==============
+
+    def add_tunnel(self, tunnel: Tunnel) -> Tunnel:
+        self.tunnels[tunnel.tunnel_id] = tunnel
+        self.tunnels_created += 1
+        return tunnel
+
+    def remove_tunnel(self, tunnel_id: str) -> Optional[Tunnel]:
+        tunnel = self.tunnels.pop(tunnel_id, None)
+        if tunnel is not None:
+            self.tunnels_deleted += 1
+        return tunnel
+
+    def find_tunnel(self, **match: Any) -> Optional[Tunnel]:
+        for tunnel in self.tunnels.values():
+            if all(getattr(tunnel, k) == v for k, v in match.items()):
+                return tunnel
+        return None
+
+    # ============== NSO jobs ==============
+
+    def start_job(self) -> str:
+        job_id = f"job-{uuid4().hex[:12]}"
+        self.nso_jobs[job_id] = time.monotonic() + self.nso_job_seconds
+        return job_id
+
+    def job_status(self, job_id: str) -> Optional[str]:
+        done_at = self.nso_jobs.get(job_id)
+        if done_at is None:
+            return None
+        return "completed" if time.monotonic() >= done_at else "running"
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "degraded_links": len(self.degraded),
+            "tunnels": len(self.tunnels),
+            "tunnels_created": self.tunnels_created,
+            "tunnels_deleted": self.tunnels_deleted,
+            "nso_jobs": len(self.nso_jobs),
+        }
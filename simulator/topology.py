@@ -0,0 +1,369 @@
+"""
+Synthetic Topology Generator
+
+Deterministic, implicit SP topology sized by configuration (up to the
+350K-device scale) without materialising node or link tables:
+
+- Core: num_p P routers in a ring plus one chord per router to the router
+  `stride` positions away (circulant graph, degree 4).
+- Edge: pe_per_p PEs per P router, each dual-homed to P[i] and P[i+1].
+- Services: service s rides core link s % num_core_links between PEs homed
+  on that link's two ends.
+
+Every attribute (names, loopbacks, metrics, services on a link) is computed
+from an index in O(1), so the simulator starts instantly at any scale.
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+SERVICE_TYPES = ("l3vpn", "l3vpn", "l3vpn", "l2vpn", "evpn")
+SLA_TIERS = ("platinum", "gold", "gold", "silver", "silver", "silver", "bronze")
+TE_TYPES = ("rsvp-te", "sr-mpls", "srv6")
+
+
+def _mix(value: int) -> int:
+    """Cheap integer hash (splitmix-style) for deterministic attributes"""
+    value = (value + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
+def _unit(value: int) -> float:
+    """Deterministic float in [0, 1)"""
+    return (_mix(value) & 0xFFFFFF) / float(0x1000000)
+
+
+@dataclass(frozen=True)
+class Link:
+    index: int
+    link_id: str
+    a: str
+    z: str
+    kind: str  # "core" | "access"
+
+
+class SyntheticTopology:
+    """Implicit P/PE topology with services attached to core links"""
+
+    def __init__(
+        self,
+        devices: int = 10000,
+        pe_per_p: int = 20,
+        services: int = 100000,
+        seed: int = 7,
+        te_type: Optional[str] = None,
+    ):
+        if pe_per_p < 1:
+            raise ValueError("pe_per_p must be >= 1")
+        self.seed = seed
+        self.pe_per_p = pe_per_p
+        self.num_p = max(4, devices // (pe_per_p + 1))
+        self.num_pe = self.num_p * pe_per_p
+        self.num_core_links = 2 * self.num_p
+        self.num_links = self.num_core_links + 2 * self.num_pe
+        self.num_services = services
+        self.stride = max(2, int(math.isqrt(self.num_p)))
+        self.te_type = te_type
+
+    @property
+    def num_devices(self) -> int:
+        return self.num_p + self.num_pe
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "devices": self.num_devices,
+            "p_routers": self.num_p,
+            "pe_routers": self.num_pe,
+            "links": self.num_links,
+            "core_links": self.num_core_links,
+            "services": self.num_services,
+            "chord_stride": self.stride,
+        }
+
+    # ============== Nodes ==============
+
+    def p_name(self, p: int) -> str:
+        return f"P-{p:06d}"
+
+    def pe_name(self, pe: int) -> str:
+        return f"PE-{pe:06d}"
+
+    def parse_node(self, name: str) -> tuple[str, int]:
+        """Node name or loopback IP -> ("p"|"pe", index)"""
+        if name.startswith("PE-"):
+            return "pe", int(name[3:])
+        if name.startswith("P-"):
+            return "p", int(name[2:])
+        octets = name.split(".")
+        if len(octets) == 4 and octets[0] in ("10", "11"):
+            index = (int(octets[1]) << 16) | (int(octets[2]) << 8) | int(octets[3])
+            return ("p" if octets[0] == "10" else "pe"), index
+        raise KeyError(name)
+
+    def loopback(self, kind: str, index: int) -> str:
+        first = 10 if kind == "p" else 11
+        return f"{first}.{(index >> 16) & 0xFF}.{(index >> 8) & 0xFF}.{index & 0xFF}"
+
+    def node_name(self, kind: str, index: int) -> str:
+        return self.p_name(index) if kind == "p" else self.pe_name(index)
+
+    def pe_homes(self, pe: int) -> tuple[int, int]:
+        home = pe % self.num_p
+        return home, (home + 1) % self.num_p
+
+    def node(self, name: str) -> dict[str, Any]:
+        kind, index = self.parse_node(name)
+        if kind == "p" and not 0 <= index < self.num_p or kind == "pe" and not 0 <= index < self.num_pe:
+            raise KeyError(name)
+        return {
+            "node_id": self.node_name(kind, index),
+            "role": kind.upper(),
+            "loopback": self.loopback(kind, index),
+            "prefix_sid": 16000 + (index if kind == "p" else self.num_p + index),
+        }
+
+    # ============== Links ==============
+
+    def link_id(self, index: int) -> str:
+        return f"link-{index:07d}"
+
+    def parse_link(self, link_id: str) -> int:
+        if not link_id.startswith("link-"):
+            raise KeyError(link_id)
+        index = int(link_id[5:])
+        if not 0 <= index < self.num_links:
+            raise KeyError(link_id)
+        return index
+
+    def core_link_ends(self, index: int) -> tuple[int, int]:
+        if index < self.num_p:
+            return index, (index + 1) % self.num_p
+        a = index - self.num_p
+        return a, (a + self.stride) % self.num_p
+
+    def link(self, index: int) -> Link:
+        if index < self.num_core_links:
+            a, z = self.core_link_ends(index)
+            return Link(index, self.link_id(index), self.p_name(a), self.p_name(z), "core")
+        offset = index - self.num_core_links
+        pe, k = divmod(offset, 2)
+        return Link(index, self.link_id(index), self.pe_name(pe), self.p_name(self.pe_homes(pe)[k]), "access")
+
+    def p_links(self, p: int) -> list[tuple[int, int]]:
+        """(core link index, neighbour P) pairs for a P router"""
+        n = self.num_p
+        return [
+            (p, (p + 1) % n),
+            ((p - 1) % n, (p - 1) % n),
+            (n + p, (p + self.stride) % n),
+            (n + (p - self.stride) % n, (p - self.stride) % n),
+        ]
+
+    def node_links(self, name: str) -> list[Link]:
+        kind, index = self.parse_node(name)
+        if kind == "pe":
+            base = self.num_core_links + 2 * index
+            return [self.link(base), self.link(base + 1)]
+        return [self.link(link) for link, _ in self.p_links(index)]
+
+    def link_metrics(self, index: int) -> dict[str, Any]:
+        """Static IGP/TE metrics, delay and capacity of a link"""
+        h = index ^ (self.seed << 40)
+        core = index < self.num_core_links
+        capacity = 100.0 if core else 10.0
+        utilisation = 0.2 + 0.6 * _unit(h + 1)
+        delay_ms = round((1.0 + 9.0 * _unit(h + 2)) if core else 0.5, 3)
+        igp = 10 + int(40 * _unit(h + 3)) if core else 10
+        link = self.link(index)
+        return {
+            "link_id": link.link_id,
+            "a_node": link.a,
+            "z_node": link.z,
+            "igp_metric": igp,
+            "te_metric": igp,
+            "delay_ms": delay_ms,
+            "bandwidth_gbps": capacity,
+            "available_bandwidth_gbps": round(capacity * (1 - utilisation), 2),
+            "utilization_pct": round(utilisation * 100, 1),
+            "srlgs": [int(_mix(h + 4) % 5000)] if core else [],
+        }
+
+    def sample_core_links(self, count: int, salt: int = 0) -> list[str]:
+        """Deterministic spread of distinct core links (load driver helper)"""
+        picked: list[str] = []
+        seen: set[int] = set()
+        i = 0
+        while len(picked) < min(count, self.num_core_links):
+            index = _mix(self.seed + salt * 1_000_003 + i) % self.num_core_links
+            i += 1
+            if index in seen:
+                continue
+            seen.add(index)
+            picked.append(self.link_id(index))
+        return picked
+
+    # ============== Services ==============
+
+    def service_id(self, s: int) -> str:
+        return f"svc-{s:07d}"
+
+    def parse_service(self, service_id: str) -> int:
+        index = int(service_id.rsplit("-", 1)[-1])
+        if not 0 <= index < self.num_services:
+            raise KeyError(service_id)
+        return index
+
+    def service(self, s: int) -> dict[str, Any]:
+        link_index = s % self.num_core_links
+        k = s // self.num_core_links
+        a, z = self.core_link_ends(link_index)
+        src_pe = a + self.num_p * (k % self.pe_per_p)
+        # PE homed on z (P[z-1]'s second home is z too, keep the first-home form)
+        dst_pe = z + self.num_p * ((k + 1) % self.pe_per_p)
+        h = _mix(s ^ (self.seed << 32))
+        service_type = SERVICE_TYPES[h % len(SERVICE_TYPES)]
+        te_type = self.te_type or TE_TYPES[(h >> 8) % len(TE_TYPES)]
+        src, dst = self.pe_name(src_pe), self.pe_name(dst_pe)
+        return {
+            "service_id": self.service_id(s),
+            "service_name": f"{service_type}-{s:07d}",
+            "service_type": service_type,
+            "customer_id": f"cust-{(h >> 16) % 5000:04d}",
+            "customer_name": f"Customer {(h >> 16) % 5000:04d}",
+            "sla_tier": SLA_TIERS[(h >> 24) % len(SLA_TIERS)],
+            "source_pe": src,
+            "destination_pe": dst,
+            "endpoint_a": self.loopback("pe", src_pe),
+            "endpoint_z": self.loopback("pe", dst_pe),
+            "current_path": [src, self.p_name(a), self.p_name(z), dst],
+            "current_path_type": "igp",
+            "current_te_type": te_type,
+            "transport_link": self.link_id(link_index),
+            "auto_protect": True,
+            "redundancy_available": bool((h >> 32) & 1),
+            "oper_status": "up",
+        }
+
+    def services_on_link(self, link_id: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        index = self.parse_link(link_id)
+        if index >= self.num_core_links:
+            return []
+        ids: Iterable[int] = range(index, self.num_services, self.num_core_links)
+        services = []
+        for s in ids:
+            services.append(self.service(s))
+            if limit is not None and len(services) >= limit:
+                break
+        return services
+
+    def count_services_on_link(self, link_id: str) -> int:
+        index = self.parse_link(link_id)
+        if index >= self.num_core_links or index >= self.num_services:
+            return 0
+        return (self.num_services - 1 - index) // self.num_core_links + 1
+
+    # ============== Path computation ==============
+
+    def shortest_path(
+        self,
+        source: str,
+        destination: str,
+        avoid_links: Iterable[str] = (),
+        avoid_nodes: Iterable[str] = (),
+        metric: str = "igp",
+        max_hops: Optional[int] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Dijkstra over the core between the PEs' home routers"""
+        return self._shortest_path(
+            source,
+            destination,
+            frozenset(avoid_links),
+            frozenset(avoid_nodes),
+            metric,
+            max_hops,
+        )
+
+    @lru_cache(maxsize=65536)
+    def _shortest_path(
+        self,
+        source: str,
+        destination: str,
+        avoid_links: frozenset,
+        avoid_nodes: frozenset,
+        metric: str,
+        max_hops: Optional[int],
+    ) -> Optional[dict[str, Any]]:
+        src_kind, src = self.parse_node(source)
+        dst_kind, dst = self.parse_node(destination)
+        avoid_link_idx = {self.parse_link(l) for l in avoid_links if l.startswith("link-")}
+        avoid_p = {self.parse_node(n)[1] for n in avoid_nodes if n.startswith("P-")}
+
+        starts = self.pe_homes(src) if src_kind == "pe" else (src,)
+        targets = set(self.pe_homes(dst) if dst_kind == "pe" else (dst,))
+        key = "delay_ms" if metric in ("delay", "latency") else "igp_metric"
+
+        dist: dict[int, float] = {}
+        prev: dict[int, tuple[int, int]] = {}
+        heap: list[tuple[float, int]] = []
+        for p in starts:
+            if p not in avoid_p:
+                dist[p] = 0.0
+                heap.append((0.0, p))
+        heapq.heapify(heap)
+
+        reached = None
+        while heap:
+            d, p = heapq.heappop(heap)
+            if d > dist.get(p, math.inf):
+                continue
+            if p in targets:
+                reached = p
+                break
+            for link_index, q in self.p_links(p):
+                if link_index in avoid_link_idx or q in avoid_p:
+                    continue
+                nd = d + self.link_metrics(link_index)[key]
+                if nd < dist.get(q, math.inf):
+                    dist[q] = nd
+                    prev[q] = (p, link_index)
+                    heapq.heappush(heap, (nd, q))
+
+        if reached is None:
+            return None
+
+        core_hops: list[tuple[int, int]] = []
+        p = reached
+        while p in prev:
+            parent, link_index = prev[p]
+            core_hops.append((link_index, p))
+            p = parent
+        core_hops.reverse()
+        first_p = p
+
+        nodes = [source] if src_kind == "pe" else []
+        nodes.append(self.p_name(first_p))
+        nodes.extend(self.p_name(q) for _, q in core_hops)
+        if dst_kind == "pe":
+            nodes.append(destination)
+        if max_hops is not None and len(nodes) - 1 > max_hops:
+            return None
+
+        link_ids = [self.link_id(link_index) for link_index, _ in core_hops]
+        metrics = [self.link_metrics(link_index) for link_index, _ in core_hops]
+        return {
+            "segments": nodes,
+            "links": link_ids,
+            "segment_sids": [self.node(n)["prefix_sid"] for n in nodes],
+            "total_hops": len(nodes) - 1,
+            "total_delay_ms": round(sum(m["delay_ms"] for m in metrics), 3),
+            "total_igp_metric": sum(m["igp_metric"] for m in metrics),
+            "total_te_metric": sum(m["te_metric"] for m in metrics),
+            "min_available_bandwidth_gbps": min(
+                (m["available_bandwidth_gbps"] for m in metrics), default=100.0
+            ),
+        }